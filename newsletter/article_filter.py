@@ -3,13 +3,22 @@ Newsletter Generator - Article Filtering and Grouping
 이 모듈은 뉴스 기사를 필터링하고 그룹화하는 기능을 제공합니다.
 """
 
-import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 
-from newsletter_core.public.settings import get_major_news_sources
+from newsletter_core.application.article_dates import article_timestamp
+from newsletter_core.application.article_dedupe import (
+    IncrementalArticleDeduper,
+    find_near_duplicates,
+)
+from newsletter_core.application.article_identity import article_identity
+from newsletter_core.application.keyword_matcher import (
+    DEFAULT_PROXIMITY_WINDOW,
+    compile_keyword_matcher,
+)
+from newsletter_core.application.source_tiers import article_source_tier
 
 from .utils.logger import get_logger
 
@@ -43,21 +52,11 @@ def filter_articles_by_major_sources(
     other_articles = []
 
     for article in articles:
-        source = article.get("source", "")
-
-        # 소스 이름 정규화 (대소문자 무시, 공백 제거)
-        source_norm = source.lower().strip()
-
-        # 티어에 따라 분류
-        if any(
-            major_source.lower() in source_norm
-            for major_source in get_major_news_sources()["tier1"]
-        ):
+        # 수집 시 기록된 티어를 사용 (없으면 컴파일된 분류기로 판별)
+        tier = article_source_tier(article)
+        if tier.key == "tier1":
             tier1_articles.append(article)
-        elif any(
-            major_source.lower() in source_norm
-            for major_source in get_major_news_sources()["tier2"]
-        ):
+        elif tier.key == "tier2":
             tier2_articles.append(article)
         else:
             other_articles.append(article)
@@ -106,53 +105,32 @@ def group_articles_by_keywords(
     grouped_articles: Dict[str, List[Dict[str, Any]]] = {
         keyword: [] for keyword in keywords
     }
-
-    def _tokenize(text: str) -> List[str]:
-        return re.findall(r"[가-힣a-zA-Z0-9]+", text.lower())
-
-    def _tokens_in_context(
-        text_tokens: List[str], tokens: List[str], window: int = 5
-    ) -> bool:
-        if len(tokens) == 1:
-            return tokens[0] in text_tokens
-        positions = []
-        for token in tokens:
-            idxs = [i for i, t in enumerate(text_tokens) if t == token]
-            if not idxs:
-                return False
-            positions.append(idxs)
-        import itertools
-
-        for combo in itertools.product(*positions):
-            if max(combo) - min(combo) <= window:
-                return True
-        return False
+    synonyms = tuple(
+        (keyword, tuple(SYNONYMS[keyword]))
+        for keyword in keywords
+        if keyword in SYNONYMS
+    )
+    matcher = compile_keyword_matcher(
+        tuple(keywords),
+        synonyms,
+        ignore_spaces=True,
+        proximity_window=DEFAULT_PROXIMITY_WINDOW,
+    )
 
     for i, article in enumerate(articles):
-        full_text = f"{article.get('title', '')} {article.get('content', '')}".lower()
-        tokens = _tokenize(full_text)
-        logger.debug(f"Processing article {i + 1}: {full_text[:50]}...")
-
-        for keyword in keywords:
-            variations = SYNONYMS.get(keyword, [keyword])
-            matched = False
-            for variant in variations:
-                v_text = variant.lower()
-                v_tokens = _tokenize(variant)
-                if v_text in full_text or v_text.replace(" ", "") in full_text.replace(
-                    " ", ""
-                ):
-                    matched = True
-                elif _tokens_in_context(tokens, v_tokens):
-                    matched = True
-                if matched:
-                    grouped_articles[keyword].append(article)
-                    logger.debug(
-                        f"Article {i + 1} matched keyword '{keyword}' via variant '{variant}'"
-                    )
-                    break
-            if not matched:
+        full_text = f"{article.get('title', '')} {article.get('content', '')}"
+        logger.debug(f"Processing article {i + 1}: {full_text[:50].lower()}...")
+
+        hits = matcher.match(full_text)
+        for keyword in grouped_articles:
+            hit = hits.get(keyword)
+            if hit is None:
                 logger.debug(f"Article {i + 1} did not match keyword '{keyword}'")
+                continue
+            grouped_articles[keyword].append(article)
+            logger.debug(
+                f"Article {i + 1} matched keyword '{keyword}' via variant '{hit.variant}'"
+            )
 
     for keyword in grouped_articles:
         logger.info(
@@ -172,109 +150,24 @@ def remove_duplicate_articles(articles: List[Dict[str, Any]]) -> List[Dict[str,
         중복이 제거된 기사 목록
     """
     unique_articles = []
-    seen_urls = set()
-    seen_titles: set[str] = set()
-
-    def normalize_url(url: str) -> str:
-        """URL을 정규화하여 중복 검사에 사용"""
-        if not url or url == "#":
-            return ""
-        # 쿼리 파라미터 제거, 프로토콜 통일, www 제거 등
-        import re
-        from urllib.parse import urlparse
-
-        try:
-            parsed = urlparse(url)
-            # 도메인 정규화 (www 제거, 소문자 변환)
-            domain = parsed.netloc.lower()
-            domain = re.sub(r"^www\.", "", domain)
-            # 경로 정규화 (끝의 / 제거)
-            path = parsed.path.rstrip("/")
-            # 정규화된 URL 생성 (쿼리 파라미터 제외)
-            normalized = f"{domain}{path}"
-            return normalized
-        except Exception:
-            return url.lower()
-
-    def normalize_title(title: str) -> str:
-        """제목을 정규화하여 중복 검사에 사용"""
-        if not title:
-            return ""
-        # 특수문자 제거, 공백 정규화, 소문자 변환
-        import re
-
-        normalized = re.sub(r"[^\w\s가-힣]", "", title)
-        normalized = re.sub(r"\s+", " ", normalized).strip().lower()
-        return normalized
+    deduper = IncrementalArticleDeduper()
 
     for article in articles:
-        url = article.get("url", "")
-        title = article.get("title", "")
-
-        # URL과 제목이 모두 없는 경우는 스킵
-        if not url and not title:
-            continue
-
-        # URL 정규화 및 중복 확인
-        normalized_url = normalize_url(url)
-        if normalized_url and normalized_url in seen_urls:
-            console.print(f"[yellow]Skipping duplicate URL: {url}[/yellow]")
-            continue
-
-        # 제목 정규화 및 중복 확인
-        normalized_title = normalize_title(title)
-        if normalized_title and normalized_title in seen_titles:
-            console.print(f"[yellow]Skipping duplicate title: {title}[/yellow]")
-            continue
-
-        # 제목 유사성 검사 (기존 기사들과 비교)
-        is_similar = False
-        if normalized_title:
-            for existing_title in seen_titles:
-                if existing_title:
-                    overlap_ratio = _word_overlap_ratio(
-                        normalized_title, existing_title
-                    )
-
-                    # 겹침 비율이 높더라도 중요한 차별화 단어가 있으면 다른 기사로 처리
-                    differentiating_words = [
-                        "계획",
-                        "발표",
-                        "예정",
-                        "준비",
-                        "검토",
-                        "추진",
-                        "시작",
-                        "완료",
-                        "종료",
-                        "중단",
-                    ]
-                    title_words = set(normalized_title.split())
-                    existing_words = set(existing_title.split())
-
-                    has_differentiating_word = any(
-                        word in title_words or word in existing_words
-                        for word in differentiating_words
-                    )
-
-                    # 겹침 비율이 매우 높고 차별화 단어가 없는 경우에만 중복으로 처리
-                    if overlap_ratio >= 0.99 and not has_differentiating_word:
-                        console.print(
-                            f"[yellow]Skipping similar title: {title}[/yellow]"
-                        )
-                        is_similar = True
-                        break
-
-        if is_similar:
-            continue
-
-        # 중복이 아닌 경우 추가
-        if normalized_url:
-            seen_urls.add(normalized_url)
-        if normalized_title:
-            seen_titles.add(normalized_title)
-
-        unique_articles.append(article)
+        reason = deduper.check(article)
+        if reason is None:
+            unique_articles.append(article)
+        elif reason == "url":
+            console.print(
+                f"[yellow]Skipping duplicate URL: {article.get('url', '')}[/yellow]"
+            )
+        elif reason == "title":
+            console.print(
+                f"[yellow]Skipping duplicate title: {article.get('title', '')}[/yellow]"
+            )
+        elif reason == "similar":
+            console.print(
+                f"[yellow]Skipping similar title: {article.get('title', '')}[/yellow]"
+            )
 
     console.print(
         f"[cyan]Removed {len(articles) - len(unique_articles)} duplicate articles[/cyan]"
@@ -303,22 +196,13 @@ def filter_articles_by_domains(
     # 도메인별 기사 그룹화
     domain_groups: Dict[str, List[Dict[str, Any]]] = {}
 
-    import re
-    from urllib.parse import urlparse
-
     for article in articles:
         url = article.get("url", "")
         if not url or url == "#":
             continue
 
-        # URL에서 도메인 추출
-        try:
-            domain = urlparse(url).netloc
-            # www. 제거
-            domain = re.sub(r"^www\.", "", domain)
-        except Exception:
-            # URL 파싱 실패시 전체 URL 사용
-            domain = url
+        # 수집 시점에 찍힌 정규 호스트 사용 (없으면 URL 전체)
+        domain = article_identity(article).canonical_host or url
 
         if domain not in domain_groups:
             domain_groups[domain] = []
@@ -348,60 +232,34 @@ def filter_articles_by_domains(
     return filtered_articles
 
 
-def _word_overlap_ratio(title1: str, title2: str) -> float:
-    """Compute overlap ratio between two titles based on unique word sets."""
-    tokens1 = set(re.split(r"[\W_]+", title1.lower())) - {""}
-    tokens2 = set(re.split(r"[\W_]+", title2.lower())) - {""}
-    if not tokens1 or not tokens2:
-        return 0.0
-    overlap = tokens1 & tokens2
-    return len(overlap) / min(len(tokens1), len(tokens2))
-
-
 def remove_similar_articles(
     articles: List[Dict[str, Any]], similarity_threshold: float = 0.8
 ) -> List[Dict[str, Any]]:
     """Remove nearly identical articles based on title similarity."""
-    unique_articles: List[Dict[str, Any]] = []
-    for article in articles:
-        title = article.get("title", "")
-        if not title:
-            unique_articles.append(article)
-            continue
-        is_similar = False
-        for kept in unique_articles:
-            kept_title = kept.get("title", "")
-            if (
-                kept_title
-                and _word_overlap_ratio(title, kept_title) >= similarity_threshold
-            ):
-                is_similar = True
-                break
-        if not is_similar:
-            unique_articles.append(article)
+    matches = find_near_duplicates(
+        (article.get("title", "") or "" for article in articles), similarity_threshold
+    )
+    unique_articles = [
+        article for article, match in zip(articles, matches) if match is None
+    ]
     console.print(
         f"[cyan]Removed {len(articles) - len(unique_articles)} similar articles[/cyan]"
     )
     return unique_articles
 
 
-from .date_utils import parse_date_string  # noqa: E402
-
-
 def calculate_article_importance(article: Dict[str, Any]) -> float:
     """Calculate a simple importance score for an article."""
     score = 0.0
-    source = article.get("source", "")
-    if any(s.lower() in source.lower() for s in get_major_news_sources()["tier1"]):
+    tier = article_source_tier(article)
+    if tier.key == "tier1":
         score += 2.0
-    elif any(s.lower() in source.lower() for s in get_major_news_sources()["tier2"]):
+    elif tier.key == "tier2":
         score += 1.0
 
-    date_obj = parse_date_string(article.get("date"))
-    if date_obj:
-        if date_obj.tzinfo is None or date_obj.tzinfo.utcoffset(date_obj) is None:
-            date_obj = date_obj.replace(tzinfo=timezone.utc)
-        age_days = (datetime.now(timezone.utc) - date_obj).total_seconds() / 86400
+    timestamp = article_timestamp(article)
+    if timestamp is not None:
+        age_days = (datetime.now(timezone.utc).timestamp() - timestamp) / 86400
         recency = max(0.0, 30 - age_days) / 30
     else:
         recency = 0.0
@@ -138,7 +138,84 @@ class CentralizedSettings(BaseSettings):
     # 성능 최적화 설정
     enable_fast_mode: bool = Field(False, description="빠른 모드 활성화")
     batch_processing: bool = Field(True, description="배치 처리 활성화")
-    concurrent_requests: int = Field(5, description="동시 요청 수")
+    concurrent_requests: int = Field(5, ge=1, description="동시 요청 수")
+    serper_batch_size: int = Field(
+        0, ge=0, description="Serper 멀티쿼리 배치 크기 (0/1이면 키워드별 개별 요청)"
+    )
+    source_timeout_seconds: float = Field(
+        20.0, gt=0, description="뉴스 소스(피드)별 수집 마감 시간 (초)"
+    )
+    collection_budget_seconds: float = Field(
+        60.0, gt=0, description="전체 뉴스 수집 시간 예산 (초)"
+    )
+    streaming_collection: bool = Field(
+        False, description="키워드 응답 도착 즉시 날짜 필터/중복 제거하는 스트리밍 수집"
+    )
+    stream_buffer_max_articles: int = Field(
+        200, ge=1, description="스트리밍 수집 시 보관할 최신 기사 최대 수"
+    )
+    rss_conditional_get: bool = Field(
+        True, description="RSS 조건부 GET(ETag/Last-Modified) 및 증분 파싱 사용"
+    )
+    rss_index_enabled: bool = Field(False, description="프리페처가 채운 로컬 뉴스 인덱스로 RSS 키워드 조회")
+    rss_index_max_age_seconds: float = Field(
+        1800.0,
+        gt=0,
+        description="로컬 뉴스 인덱스 최대 허용 경과 시간 (초과 시 실시간 수집)",
+    )
+    rss_prefetch_interval_seconds: float = Field(
+        600.0, gt=0, description="RSS 프리페처 폴링 주기 (초)"
+    )
+    rss_index_retention_days: float = Field(
+        30.0, gt=0, description="로컬 뉴스 인덱스 기사 보존 기간 (일)"
+    )
+    search_cache_enabled: bool = Field(True, description="검색 API 응답 캐시 사용")
+    search_cache_ttl_seconds: float = Field(
+        3600.0, gt=0, description="검색 캐시 신선도 유지 시간 (초)"
+    )
+    search_cache_max_entries: int = Field(
+        2000, ge=1, description="검색 캐시 최대 항목 수 (초과 시 LRU 제거)"
+    )
+    search_cache_stale_seconds: float = Field(
+        0.0, ge=0, description="TTL 이후 stale 응답을 제공하며 재검증하는 시간 (초)"
+    )
+    search_cache_bucket_seconds: float = Field(
+        86400.0, ge=0, description="검색 캐시 키 시간 버킷 크기 (초, 0이면 미사용)"
+    )
+    full_text_top_k: int = Field(0, ge=0, description="요약 전 본문을 수집할 상위 기사 수 (0이면 미사용)")
+    full_text_per_domain_limit: int = Field(2, ge=1, description="본문 수집 시 도메인별 동시 요청 수")
+    full_text_deadline_seconds: float = Field(
+        15.0, gt=0, description="본문 일괄 수집 전체 마감 시간 (초)"
+    )
+    article_extractor: Literal["auto", "density", "heuristic"] = Field(
+        "auto", description="기사 본문 추출 엔진 (auto=밀도 기반 + 휴리스틱 폴백)"
+    )
+    article_memory_mode: Literal["off", "downweight", "exclude"] = Field(
+        "downweight", description="이전 호에 발송된 기사 처리 방식 (스케줄/프리셋별)"
+    )
+    article_memory_retention_days: int = Field(
+        30, ge=1, description="발송 기사 기억 보존 기간 (일)"
+    )
+    adaptive_fetch_sizing: bool = Field(
+        True, description="키워드별 과거 수율에 따라 검색 결과 요청 수 조정"
+    )
+    fetch_results_min: int = Field(5, ge=1, le=20, description="적응형 요청 시 키워드별 최소 결과 수")
+    fetch_results_max: int = Field(20, ge=1, le=20, description="적응형 요청 시 키워드별 최대 결과 수")
+    scoring_prefilter_top_k: int = Field(
+        30, ge=0, description="LLM 스코어링 전 1차 선별로 남길 후보 수 (0=사용 안 함)"
+    )
+    scoring_batch_size: int = Field(
+        10, ge=0, description="LLM 스코어링 프롬프트 하나에 묶을 기사 수 (1 이하=개별 평가)"
+    )
+    scoring_batch_token_budget: int = Field(
+        3000, ge=1, description="배치 스코어링 프롬프트당 기사 본문 토큰 예산 (추정치)"
+    )
+    scoring_deadline_seconds: float = Field(
+        90.0, description="동시 스코어링 시간 예산(초), 0 이하면 제한 없음"
+    )
+    scoring_cache_max_age_days: float = Field(
+        30.0, description="LLM 점수 캐시 보존 기간(일), 0 이하면 캐시 사용 안 함"
+    )
 
     # F-14: 테스트 모드 설정
     test_mode: bool = Field(False, description="테스트 모드 활성화")
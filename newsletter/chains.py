@@ -3,24 +3,40 @@ Newsletter Generator - LangChain Chains
 이 모듈은 뉴스레터 생성을 위한 LangChain 체인을 정의합니다.
 """
 
-from typing import Any, cast
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, cast
 
 from langchain_core.runnables import RunnableLambda
 
+from newsletter_core.application.llm_concurrency import resolve_provider_concurrency
+from newsletter_core.public.settings import get_llm_config
+
 from . import chains_prompts
 from .chains_categorization import build_categorization_chain
-from .chains_compact_flow import build_compact_newsletter_result
+from .chains_compact_flow import (
+    build_compact_newsletter_result,
+    prepare_compact_side_content,
+)
 from .chains_composition import create_composition_chain
 from .chains_llm_utils import get_llm as _get_llm
 from .chains_no_articles import handle_no_articles_scenario
 from .chains_prompts import CATEGORIZATION_PROMPT, SUMMARIZATION_PROMPT
-from .chains_rendering import create_rendering_chain
+from .chains_rendering import create_rendering_chain, prepare_detailed_side_content
 from .chains_summarization import build_summarization_chain
 from .utils.logger import get_logger
 
 # 로거 초기화
 logger = get_logger(__name__)
 
+# get_llm()이 기본으로 사용하는 작업 (부가 생성 동시 실행 한도 조회에 사용)
+SIDE_CONTENT_LLM_TASK = "html_generation"
+
+# 요약 결과와 무관한 생성 작업용 공용 실행기 (처음 사용할 때 제공자 한도로 생성)
+_side_content_executor: ThreadPoolExecutor | None = None
+_side_content_executor_lock = threading.Lock()
+
 # 하위 호환성 re-export
 COMPOSITION_PROMPT = chains_prompts.COMPOSITION_PROMPT
 HTML_TEMPLATE = chains_prompts.HTML_TEMPLATE
@@ -47,6 +63,57 @@ def create_summarization_chain(is_compact: bool = False) -> Any:
     )
 
 
+def _side_content_concurrency() -> int:
+    """부가 생성 동시 실행 수 (생성 LLM 제공자의 max_concurrency)"""
+    try:
+        return int(
+            resolve_provider_concurrency(get_llm_config(), SIDE_CONTENT_LLM_TASK)
+        )
+    except Exception as e:
+        logger.warning(f"동시 호출 한도 조회 실패, 부가 생성을 하나씩 실행합니다: {e}")
+        return 1
+
+
+def _get_side_content_executor() -> ThreadPoolExecutor:
+    global _side_content_executor
+    with _side_content_executor_lock:
+        if _side_content_executor is None:
+            _side_content_executor = ThreadPoolExecutor(
+                max_workers=_side_content_concurrency(),
+                thread_name_prefix="side-content",
+            )
+        return _side_content_executor
+
+
+def _side_content_preparer(is_compact: bool) -> Callable[[dict[str, Any]], Any]:
+    prepare: Callable[[dict[str, Any]], Any] = (
+        prepare_compact_side_content if is_compact else prepare_detailed_side_content
+    )
+    return prepare
+
+
+def _start_side_content(data: dict[str, Any], is_compact: bool) -> Future[Any]:
+    """요약 결과와 무관한 생성 작업(주제 추출, 생각해 볼 거리)을 백그라운드로 시작"""
+    return _get_side_content_executor().submit(_side_content_preparer(is_compact), data)
+
+
+def _join_side_content(
+    future: Future[Any], data: dict[str, Any], is_compact: bool
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        if future.cancel():
+            # 다른 요청의 작업에 밀려 아직 시작하지 못했으면 기다리지 않고 직접 실행
+            side_content = _side_content_preparer(is_compact)(data)
+        else:
+            side_content = future.result()
+    except Exception as e:
+        logger.warning(f"부가 생성 작업 실패, 최종 구성 단계에서 다시 생성합니다: {e}")
+        return {}
+    logger.debug(f"부가 생성 작업 대기 시간: {time.perf_counter() - started:.2f}초")
+    return dict(side_content or {})
+
+
 # 전체 파이프라인 구성 (compact 옵션 추가)
 def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
     # 1. 분류 체인
@@ -64,6 +131,7 @@ def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
     # 데이터 흐름 관리 함수
     def manage_data_flow(data: dict[str, Any]) -> dict[str, Any]:
         logger.debug(f"manage_data_flow 호출됨. is_compact={is_compact}")
+        side_future: Future[Any] | None = None
         try:
             # 데이터 유효성 검증
             if "articles" not in data:
@@ -79,6 +147,9 @@ def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
                     handle_no_articles_scenario(data, is_compact),
                 )
 
+            # 0. 주제 추출 등 독립 생성 작업을 분류/요약 단계와 동시에 실행
+            side_future = _start_side_content(data, is_compact)
+
             # 1. 분류 단계 실행
             if is_compact:
                 logger.step("뉴스 카테고리 분류", "categorization")
@@ -96,10 +167,14 @@ def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
             )
 
             if is_compact:
-                return cast(
-                    dict[str, Any],
-                    build_compact_newsletter_result(data, sections_data),
+                compact_result = build_compact_newsletter_result(
+                    data, sections_data, _join_side_content(side_future, data, True)
                 )
+                if sections_data.get("category_latencies"):
+                    compact_result["category_latencies"] = sections_data[
+                        "category_latencies"
+                    ]
+                return cast(dict[str, Any], compact_result)
 
             # Detailed 모드 처리
             if composition_chain is None or rendering_chain is None:
@@ -122,16 +197,22 @@ def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
                 "processed_articles": data.get("processed_articles", []),
                 "email_compatible": data.get("email_compatible", False),
                 "template_style": data.get("template_style", "detailed"),
+                **_join_side_content(side_future, data, False),
             }
 
             html_content, structured_data = rendering_chain.invoke(rendering_data)
             logger.success("Detailed 뉴스레터 생성 완료!")
-            return {
+            detailed_result = {
                 "html": html_content,
                 "structured_data": structured_data,
                 "sections": sections_data.get("sections", []),
                 "mode": "detailed",
             }
+            if sections_data.get("category_latencies"):
+                detailed_result["category_latencies"] = sections_data[
+                    "category_latencies"
+                ]
+            return detailed_result
 
         except Exception as e:
             logger.error(f"데이터 흐름 처리 중 오류 발생: {e}")
@@ -139,6 +220,11 @@ def get_newsletter_chain(is_compact: bool = False) -> RunnableLambda:
 
             traceback.print_exc()
             raise
+        finally:
+            # 이후 단계가 실패하면 아직 시작하지 않은 부가 생성 작업은 취소
+            # (이미 실행 중인 작업은 끝까지 돌고 결과만 버려짐)
+            if side_future is not None:
+                side_future.cancel()
 
     # 최종 체인 반환
     return RunnableLambda(manage_data_flow)
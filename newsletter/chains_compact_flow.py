@@ -76,6 +76,20 @@ R&D 전략기획단 전문위원들을 대상으로, 해당 주제 분야의 빠
         )
 
 
+def prepare_compact_side_content(data: dict[str, Any]) -> dict[str, Any]:
+    """요약 결과와 무관한 생성 작업 (뉴스레터 주제, 생각해 볼 거리)"""
+    keywords = _normalize_keywords(data.get("keywords", []))
+    newsletter_topic = _determine_newsletter_topic(
+        keywords, str(data.get("domain", ""))
+    )
+    return {
+        "newsletter_topic": newsletter_topic,
+        "food_for_thought": _create_food_for_thought_compact(
+            newsletter_topic, keywords
+        ),
+    }
+
+
 def _build_top_articles(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
     if not articles:
         return []
@@ -155,7 +169,9 @@ R&D 전략기획단 전문위원들을 대상으로, 이번 주 뉴스레터의
 
 
 def build_compact_newsletter_result(
-    data: dict[str, Any], sections_data: dict[str, Any]
+    data: dict[str, Any],
+    sections_data: dict[str, Any],
+    side_content: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     config = NewsletterConfig.get_config("compact")
     raw_articles = data.get("articles", [])
@@ -181,8 +197,10 @@ def build_compact_newsletter_result(
 
     template_manager = TemplateManager()
     keywords = _normalize_keywords(data.get("keywords", []))
-    domain = str(data.get("domain", ""))
-    newsletter_topic = _determine_newsletter_topic(keywords, domain)
+    # 요약 단계와 동시에 미리 생성된 결과가 없으면 여기서 생성
+    if not side_content:
+        side_content = prepare_compact_side_content(data)
+    newsletter_topic = side_content["newsletter_topic"]
     current_date = datetime.date.today().strftime("%Y년 %m월 %d일")
     current_time = datetime.datetime.now().strftime("%H:%M")
 
@@ -194,9 +212,7 @@ def build_compact_newsletter_result(
         "generation_date": current_date,
         "generation_time": current_time,
         "search_keywords": ", ".join(keywords),
-        "food_for_thought": {
-            "message": _create_food_for_thought_compact(newsletter_topic, keywords)
-        },
+        "food_for_thought": {"message": side_content["food_for_thought"]},
         "recipient_greeting": "안녕하세요,",
         "closing_message": "다음 주에 더 유익한 정보로 찾아뵙겠습니다.",
         "editor_signature": "편집자 드림",
@@ -41,6 +41,22 @@ def _get_common_theme_from_keywords(keywords: Any) -> str:
     return str(theme)
 
 
+def _needs_theme_extraction(keywords: Any, domain: Any) -> bool:
+    if domain or not keywords:
+        return False
+    if isinstance(keywords, list):
+        return len(keywords) > 1
+    return isinstance(keywords, str) and "," in keywords
+
+
+def prepare_detailed_side_content(data: dict[str, Any]) -> dict[str, Any]:
+    """요약 결과와 무관한 생성 작업 (여러 키워드의 공통 주제 추출)"""
+    keywords = data.get("keywords", "")
+    if not _needs_theme_extraction(keywords, data.get("domain", "")):
+        return {}
+    return {"newsletter_topic": _get_common_theme_from_keywords(keywords)}
+
+
 def _render_with_template(
     data: dict[str, Any],
     template_manager: TemplateManager,
@@ -61,6 +77,9 @@ def _render_with_template(
 
         if domain:
             combined_data["newsletter_topic"] = domain
+        elif data.get("newsletter_topic"):
+            # 요약 단계와 동시에 미리 추출된 공통 주제
+            combined_data["newsletter_topic"] = data["newsletter_topic"]
         elif isinstance(keywords, list) and len(keywords) == 1:
             combined_data["newsletter_topic"] = keywords[0]
         elif isinstance(keywords, list) and len(keywords) > 1:
@@ -91,6 +91,13 @@ def collect(
     no_major_sources_filter: bool = typer.Option(
         False, "--no-major-sources-filter", help="Don't prioritize major news sources."
     ),
+    period: int = typer.Option(
+        14,
+        "--period",
+        "-p",
+        min=1,
+        help="Only keep articles published within this many days.",
+    ),
     log_level: str = typer.Option(
         "WARNING",
         "--log-level",
@@ -114,6 +121,7 @@ def collect(
             filter_duplicates=not no_filter_duplicates,
             group_by_keywords=not no_group_by_keywords,
             use_major_sources_filter=not no_major_sources_filter,
+            news_period_days=period,
         )
 
     # 결과 출력
@@ -199,6 +207,56 @@ def suggest(
         )
 
 
+@app.command()  # type: ignore[untyped-decorator]
+def rerank(
+    scored_file: str = typer.Argument(
+        ..., help="Path to a *_scored_articles.json file saved by a previous run."
+    ),
+    weight: List[str] = typer.Option(
+        [],
+        "--weight",
+        "-w",
+        help="Weight override as key=value, e.g. relevance=0.5 (repeatable).",
+    ),
+    top_n: int = typer.Option(10, "--top-n", min=1, help="Number of articles to show."),
+    output: Optional[str] = typer.Option(
+        None, "--output", help="Optional path to save the re-ranked articles as JSON."
+    ),
+) -> None:
+    """
+    Re-ranks stored scored articles under new weights without calling the LLM.
+    """
+    from newsletter_core.public.scoring import load_scored_articles, rerank_articles
+
+    overrides = {}
+    for item in weight:
+        key, separator, value = item.partition("=")
+        if not separator:
+            console.print(f"[red]Invalid --weight '{item}', expected key=value[/red]")
+            raise typer.Exit(code=1)
+        overrides[key.strip()] = value.strip()
+
+    try:
+        ranked = rerank_articles(
+            load_scored_articles(scored_file), overrides, top_n=top_n
+        )
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Re-ranking failed: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    for rank, article in enumerate(ranked, start=1):
+        console.print(
+            f"{rank:>3}. [bold]{article['priority_score']:6.2f}[/bold] "
+            f"[dim]{article.get('source_tier_name', '')}[/dim] "
+            f"{article.get('title', '')}"
+        )
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(ranked, f, ensure_ascii=False, indent=2)
+        console.print(f"[green]Re-ranked articles saved to {output}[/green]")
+
+
 app.command()(check_config)
 app.command()(check_llm)
 app.command()(test_llm)
@@ -157,6 +157,11 @@ def _build_default_llm_config() -> Dict[str, Any]:
                 "advanced": "claude-opus-4-6",
             },
         },
+        "provider_limits": {
+            "gemini": {"max_concurrency": 4},
+            "openai": {"max_concurrency": 8},
+            "anthropic": {"max_concurrency": 4},
+        },
     }
 
 
@@ -209,6 +214,14 @@ def _clone_major_news_sources() -> Dict[str, list[str]]:
     return {tier: list(sources) for tier, sources in _MAJOR_NEWS_SOURCES.items()}
 
 
+# 설정이 다시 로드될 때마다 증가 (설정에서 컴파일한 캐시의 무효화 기준)
+_config_generation = 0
+
+
+def get_config_generation() -> int:
+    return _config_generation
+
+
 def _validate_email_settings(
     postmark_server_token: str | None,
     email_sender: str | None,
@@ -320,8 +333,10 @@ class ConfigManager:
     @classmethod
     def reset_for_testing(cls, test_env_vars: Dict[str, str] | None = None) -> None:
         """테스트용으로 싱글톤 인스턴스와 캐시를 리셋합니다."""
+        global _config_generation
         cls._instance = None
         cls._config_cache = {}
+        _config_generation += 1
 
         # CentralizedSettings 캐시도 클리어하고 테스트 모드 활성화
         try:
@@ -7,26 +7,76 @@
 
 import re
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional, Tuple
 
-
-def parse_date_string(date_str: Any) -> Optional[datetime]:
-    """
-    다양한 형식의 날짜/시간 문자열을 파싱하여 datetime 객체로 변환합니다.
-    상대 시간을 포함한 다양한 형식을 지원합니다.
-
-    Args:
-        date_str: 변환할 날짜 문자열
-
-    Returns:
-        파싱 성공 시 datetime 객체, 실패 시 None
-    """
-    if not isinstance(date_str, str) or not date_str.strip() or date_str == "날짜 없음":
-        return None
-
-    date_str = date_str.strip()
-    now = datetime.now(timezone.utc)  # Use timezone-aware now for relative dates
-
+# 영어 상대 시간 패턴 (검사 순서 유지: months → weeks → days → hours → minutes)
+_ENGLISH_RELATIVE_PATTERNS = (
+    (re.compile(r"(\d+)\s+months?\s+ago", re.IGNORECASE), timedelta(days=30)),
+    (re.compile(r"(\d+)\s+weeks?\s+ago", re.IGNORECASE), timedelta(weeks=1)),
+    (re.compile(r"(\d+)\s+days?\s+ago", re.IGNORECASE), timedelta(days=1)),
+    (re.compile(r"(\d+)\s+hours?\s+ago", re.IGNORECASE), timedelta(hours=1)),
+    (re.compile(r"(\d+)\s+minutes?\s+ago", re.IGNORECASE), timedelta(minutes=1)),
+)
+
+# F-14: Windows 한글 환경에서 영어 월 이름 파싱 문제 해결
+# locale 설정과 무관하게 영어 월 이름을 처리
+_ENGLISH_MONTH_NAMES = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+# "Oct 15, 2023" 형식
+_ENGLISH_MONTH_DATE_PATTERNS = tuple(
+    (
+        month_name,
+        month_num,
+        re.compile(rf"\b{month_name}\s+(\d{{1,2}}),?\s+(\d{{4}})\b", re.IGNORECASE),
+    )
+    for month_name, month_num in _ENGLISH_MONTH_NAMES.items()
+)
+
+_COMMON_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",  # ISO with microseconds and timezone
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO with timezone
+    "%Y-%m-%dT%H:%M:%S",  # ISO without timezone
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y.%m.%d. %H:%M:%S",  # Added dot after day, space before H:M:S
+    "%Y.%m.%d %H:%M:%S",  # Original
+    "%Y.%m.%d.",  # Format like "2024. 7. 3." (with trailing dot)
+    "%Y. %m. %d.",  # Format like "2024. 7. 3." (with spaces and trailing dot)
+    "%Y.%m.%d",  # Original
+    "%Y-%m-%d",
+    "%Y년 %m월 %d일",  # Korean format "YYYY년 MM월 DD일"
+    "%m/%d/%Y",  # e.g., 04/16/2025
+)
+
+# 절대 날짜 문자열 파싱 결과 캐시 크기 (같은 날짜 문자열이 반복해서 등장함)
+_ABSOLUTE_DATE_CACHE_SIZE = 4096
+
+
+def _parse_relative_date(date_str: str, now: datetime) -> Optional[datetime]:
     # 1. Handle relative Korean dates
     if date_str.endswith("일 전"):  # "X일 전"
         try:
@@ -51,50 +101,18 @@ def parse_date_string(date_str: Any) -> Optional[datetime]:
     elif date_str == "오늘":
         return now
 
-    # 2. Handle relative English dates
-    # 추가: months ago 패턴 처리
-    months_match = re.search(r"(\d+)\s+months?\s+ago", date_str, re.IGNORECASE)
-    if months_match:
-        try:
-            months_ago = int(months_match.group(1))
-            # 한 달을 30일로 근사
-            return now - timedelta(days=months_ago * 30)
-        except ValueError:
-            pass
-
-    # 추가: weeks ago 패턴 처리
-    weeks_match = re.search(r"(\d+)\s+weeks?\s+ago", date_str, re.IGNORECASE)
-    if weeks_match:
-        try:
-            weeks_ago = int(weeks_match.group(1))
-            return now - timedelta(weeks=weeks_ago)
-        except ValueError:
-            pass
-
-    days_match = re.search(r"(\d+)\s+days?\s+ago", date_str, re.IGNORECASE)
-    if days_match:
-        try:
-            days_ago = int(days_match.group(1))
-            return now - timedelta(days=days_ago)
-        except ValueError:
-            pass
+    # 2. Handle relative English dates (months ago는 한 달을 30일로 근사)
+    if "ago" in date_str.lower():
+        for pattern, unit in _ENGLISH_RELATIVE_PATTERNS:
+            match = pattern.search(date_str)
+            if match:
+                return now - unit * int(match.group(1))
 
-    hours_match = re.search(r"(\d+)\s+hours?\s+ago", date_str, re.IGNORECASE)
-    if hours_match:
-        try:
-            hours_ago = int(hours_match.group(1))
-            return now - timedelta(hours=hours_ago)
-        except ValueError:
-            pass
+    return None
 
-    minutes_match = re.search(r"(\d+)\s+minutes?\s+ago", date_str, re.IGNORECASE)
-    if minutes_match:
-        try:
-            minutes_ago = int(minutes_match.group(1))
-            return now - timedelta(minutes=minutes_ago)
-        except ValueError:
-            pass
 
+@lru_cache(maxsize=_ABSOLUTE_DATE_CACHE_SIZE)
+def _parse_absolute_date(date_str: str) -> Optional[datetime]:
     # 3. ISO 8601 format (with or without 'Z')
     try:
         if date_str.endswith("Z") and len(date_str) > 1:
@@ -108,67 +126,21 @@ def parse_date_string(date_str: Any) -> Optional[datetime]:
     except ValueError:
         pass
 
-    # 4. F-14: Windows 한글 환경에서 영어 월 이름 파싱 문제 해결
-    # locale 설정과 무관하게 영어 월 이름을 처리
-    english_month_names = {
-        "jan": 1,
-        "january": 1,
-        "feb": 2,
-        "february": 2,
-        "mar": 3,
-        "march": 3,
-        "apr": 4,
-        "april": 4,
-        "may": 5,
-        "jun": 6,
-        "june": 6,
-        "jul": 7,
-        "july": 7,
-        "aug": 8,
-        "august": 8,
-        "sep": 9,
-        "september": 9,
-        "oct": 10,
-        "october": 10,
-        "nov": 11,
-        "november": 11,
-        "dec": 12,
-        "december": 12,
-    }
-
-    # 영어 월 이름 형식 수동 처리
-    for month_name, month_num in english_month_names.items():
-        if month_name in date_str.lower():
-            # "Oct 15, 2023" 형식 처리
-            pattern = rf"\b{month_name}\s+(\d{{1,2}}),?\s+(\d{{4}})\b"
-            match = re.search(pattern, date_str, re.IGNORECASE)
+    # 4. 영어 월 이름 형식 수동 처리
+    lowered = date_str.lower()
+    for month_name, month_num, pattern in _ENGLISH_MONTH_DATE_PATTERNS:
+        if month_name in lowered:
+            match = pattern.search(date_str)
             if match:
                 day = int(match.group(1))
                 year = int(match.group(2))
                 try:
-                    dt = datetime(year, month_num, day, tzinfo=timezone.utc)
-                    return dt
+                    return datetime(year, month_num, day, tzinfo=timezone.utc)
                 except ValueError:
                     continue
 
     # 5. Try other common formats
-    common_formats = [
-        "%Y-%m-%dT%H:%M:%S.%f%z",  # ISO with microseconds and timezone
-        "%Y-%m-%dT%H:%M:%S%z",  # ISO with timezone
-        "%Y-%m-%dT%H:%M:%S",  # ISO without timezone
-        "%Y-%m-%d %H:%M:%S%z",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y.%m.%d. %H:%M:%S",  # Added dot after day, space before H:M:S
-        "%Y.%m.%d %H:%M:%S",  # Original
-        "%Y.%m.%d.",  # Format like "2024. 7. 3." (with trailing dot)
-        "%Y. %m. %d.",  # Format like "2024. 7. 3." (with spaces and trailing dot)
-        "%Y.%m.%d",  # Original
-        "%Y-%m-%d",
-        "%Y년 %m월 %d일",  # Korean format "YYYY년 MM월 DD일"
-        "%m/%d/%Y",  # e.g., 04/16/2025
-    ]
-
-    for fmt in common_formats:
+    for fmt in _COMMON_DATE_FORMATS:
         try:
             dt = datetime.strptime(date_str, fmt)
             # If parsed successfully but naive, make it timezone-aware (assume UTC)
@@ -178,10 +150,40 @@ def parse_date_string(date_str: Any) -> Optional[datetime]:
         except ValueError:
             continue
 
-    # 5. If we've reached here, we couldn't parse the date
+    # 6. If we've reached here, we couldn't parse the date
     return None
 
 
+def parse_date_string(
+    date_str: Any, now: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    다양한 형식의 날짜/시간 문자열을 파싱하여 datetime 객체로 변환합니다.
+    상대 시간을 포함한 다양한 형식을 지원합니다.
+
+    Args:
+        date_str: 변환할 날짜 문자열
+        now: 상대 시간("3시간 전", "2 days ago")의 기준 시각. 한 번의 실행에서
+            같은 기준 시각을 넘기면 결과가 일관됩니다. 생략하면 현재 시각(UTC).
+
+    Returns:
+        파싱 성공 시 datetime 객체, 실패 시 None
+    """
+    if not isinstance(date_str, str) or not date_str.strip() or date_str == "날짜 없음":
+        return None
+
+    date_str = date_str.strip()
+    if now is None:
+        now = datetime.now(timezone.utc)  # Use timezone-aware now for relative dates
+
+    relative = _parse_relative_date(date_str, now)
+    if relative is not None:
+        return relative
+
+    # 절대 날짜는 기준 시각과 무관하므로 문자열 단위로 캐시
+    return _parse_absolute_date(date_str)
+
+
 def extract_source_and_date(source_date_str: str) -> Tuple[str, Optional[str]]:
     """
     'source, date' 형식의 문자열에서 소스와 날짜를 분리합니다.
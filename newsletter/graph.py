@@ -11,6 +11,19 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 
 from langgraph.graph import END, StateGraph
 
+from newsletter_core.application.article_memory import (
+    apply_article_memory,
+    current_article_memory,
+    record_issue_articles,
+)
+from newsletter_core.application.article_prefilter import (
+    SCORING_STAGE_FIELD,
+    STAGE_PREFILTER,
+    load_prefilter_top_k,
+)
+from newsletter_core.application.article_stream import process_article_stream
+from newsletter_core.application.batch_scoring import load_scoring_batch_size
+from newsletter_core.application.fetch_sizing import record_ranked_articles
 from newsletter_core.application.graph_composition import (
     build_compose_persist_plan,
     build_summarize_result_state,
@@ -20,6 +33,7 @@ from newsletter_core.application.graph_composition import (
 from newsletter_core.application.graph_node_helpers import (
     build_collect_error_state,
     build_collect_keyword_query,
+    build_collect_stream_success_state,
     build_collect_success_state,
     build_compose_error_state,
     build_compose_missing_data_state,
@@ -34,6 +48,7 @@ from newsletter_core.application.graph_node_helpers import (
     filter_articles_for_processing,
     resolve_graph_domain_slug,
     resolve_scoring_domain,
+    resolve_state_articles,
     sort_articles_by_graph_date_desc,
 )
 from newsletter_core.application.graph_workflow import (
@@ -48,6 +63,14 @@ from newsletter_core.application.graph_workflow import (
     route_after_score,
     route_after_summarize,
 )
+from newsletter_core.application.scoring_executor import load_scoring_deadline_seconds
+from newsletter_core.infrastructure.article_content_cache import ArticleContentCache
+from newsletter_core.infrastructure.article_fetcher import (
+    enrich_articles_with_full_text,
+    load_article_fetch_policy,
+)
+from newsletter_core.infrastructure.llm_score_cache import get_llm_score_cache
+from newsletter_core.public.settings import get_setting_value
 
 from .chains import get_newsletter_chain
 from .utils.file_naming import generate_unified_newsletter_filename
@@ -100,6 +123,9 @@ def collect_articles_node(
     try:
         # 기존 Serper API 방식 사용
         keyword_str = build_collect_keyword_query(state["keywords"])
+        if get_setting_value("STREAMING_COLLECTION", False):
+            return collect_articles_streaming(state, keyword_str, start_time)
+
         articles = search_news_articles.invoke(
             {"keywords": keyword_str, "num_results": 10}
         )
@@ -120,6 +146,44 @@ def collect_articles_node(
         )
 
 
+def collect_articles_streaming(
+    state: NewsletterState, keyword_str: str, start_time: float
+) -> NewsletterState:
+    """키워드 응답이 도착하는 대로 날짜 필터/중복 제거를 거쳐 제한된 버퍼에 수집"""
+    from .tools import stream_news_articles
+
+    stream_result = process_article_stream(
+        stream_news_articles(keyword_str, num_results=10),
+        news_period_days=state.get("news_period_days", 7),
+        current_time=datetime.now().astimezone(),
+        max_articles=int(get_setting_value("STREAM_BUFFER_MAX_ARTICLES", 200)),
+    )
+    stats = stream_result.stats
+    logger.info(
+        f"스트리밍 수집: {stats.received}개 수신, 기간 내 {stats.date_kept}개, "
+        f"중복 제거 후 {stats.deduplicated}개, 버퍼 초과 제외 {stats.evicted}개"
+    )
+
+    return build_collect_stream_success_state(
+        state,
+        stream_result=stream_result,
+        elapsed=time.time() - start_time,
+    )
+
+
+def _apply_article_memory(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """이전 호에 발송된 기사를 제외하거나 우선순위를 낮춤 (스케줄/프리셋 실행 시)"""
+    memory = current_article_memory()
+    if memory is None:
+        return articles
+
+    remembered = apply_article_memory(articles)
+    if memory.repeated:
+        action = "제외" if memory.mode == "exclude" else "우선순위 하향"
+        logger.info(f"이전 발송 기사 {memory.repeated}개 {action} ({memory.scope})")
+    return remembered
+
+
 # New node for processing articles
 def process_articles_node(state: NewsletterState) -> NewsletterState:
     """
@@ -130,7 +194,7 @@ def process_articles_node(state: NewsletterState) -> NewsletterState:
     step_brief("기사 처리 중")
     start_time = time.time()
 
-    collected_articles = state.get("collected_articles", [])
+    collected_articles = resolve_state_articles(state, "collected")
     if not collected_articles:
         logger.warning(
             "[yellow]Warning: No articles found to process. Check if collection was successful.[/yellow]"
@@ -158,6 +222,21 @@ def process_articles_node(state: NewsletterState) -> NewsletterState:
     except Exception as e:
         logger.warning(f"Warning: Failed to save raw articles: {e}")
 
+    stream_stats = state.get("article_stream_stats")
+    if stream_stats:
+        # 스트리밍 수집 단계에서 이미 필터링/중복 제거/정렬된 버퍼를 그대로 사용
+        show_filter_brief(stream_stats["received"], stream_stats["date_kept"], "날짜 필터링")
+        show_filter_brief(
+            stream_stats["date_kept"], stream_stats["deduplicated"], "중복 제거"
+        )
+        processed_articles = _apply_article_memory(list(collected_articles))
+        step_result("기사 처리 완료", len(processed_articles))
+        return build_process_success_state(
+            state,
+            processed_articles=processed_articles,
+            elapsed=time.time() - start_time,
+        )
+
     initial_count = len(collected_articles)
     filtered_articles = filter_articles_for_processing(
         collected_articles,
@@ -181,6 +260,7 @@ def process_articles_node(state: NewsletterState) -> NewsletterState:
         )
 
     show_filter_brief(len(filtered_articles), len(deduplicated_articles), "중복 제거")
+    deduplicated_articles = _apply_article_memory(deduplicated_articles)
 
     # 3. 날짜순 정렬
     if not deduplicated_articles:
@@ -210,7 +290,7 @@ def score_articles_node(state: NewsletterState) -> NewsletterState:
     step_brief("기사 스코어링 중")
     start_time = time.time()
 
-    processed_articles = state.get("processed_articles", [])
+    processed_articles = resolve_state_articles(state, "processed")
     if not processed_articles:
         logger.warning("[yellow]No articles to score.[/yellow]")
         return build_score_missing_articles_state(
@@ -228,12 +308,27 @@ def score_articles_node(state: NewsletterState) -> NewsletterState:
         # 도메인/주제 결정
         domain = resolve_scoring_domain(state)
 
-        # 기사 스코어링
+        # 기사 스코어링 (1차 어휘/티어/최신성 선별 후 상위 후보만 LLM 평가)
         ranked_articles = scoring.score_articles(
-            processed_articles, domain, top_n=None, weights=scoring_weights
+            processed_articles,
+            domain,
+            top_n=None,
+            weights=scoring_weights,
+            prefilter_top_k=load_prefilter_top_k(),
+            query=[*state.get("keywords", []), domain],
+            batch_size=load_scoring_batch_size(),
+            concurrency=scoring.load_scoring_concurrency(),
+            deadline_seconds=load_scoring_deadline_seconds(),
+            score_cache=get_llm_score_cache(),
         )
+        prefiltered_out = [
+            article
+            for article in processed_articles
+            if (article.get(SCORING_STAGE_FIELD) or {}).get("stage") == STAGE_PREFILTER
+        ]
 
         step_result("기사 스코어링 완료", len(ranked_articles))
+        record_ranked_articles(ranked_articles)
 
         # 파일 저장
         try:
@@ -249,6 +344,14 @@ def score_articles_node(state: NewsletterState) -> NewsletterState:
                 json.dump(ranked_articles, f, indent=2, ensure_ascii=False)
 
             logger.info(f"Saved scored articles to {scored_path}")
+
+            if prefiltered_out:
+                # 1차 선별에서 제외된 기사도 순위 품질 점검용으로 보관
+                prefiltered_path = scored_path.replace(
+                    "_scored_articles.json", "_prefiltered_articles.json"
+                )
+                with open(prefiltered_path, "w", encoding="utf-8") as f:
+                    json.dump(prefiltered_out, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.warning(f"Warning: Failed to save scored articles: {e}")
 
@@ -267,6 +370,33 @@ def score_articles_node(state: NewsletterState) -> NewsletterState:
         )
 
 
+def enrich_ranked_articles(
+    ranked_articles: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """요약 전에 상위 기사 본문을 일괄 수집해 content를 보강 (FULL_TEXT_TOP_K > 0)"""
+    top_k = int(get_setting_value("FULL_TEXT_TOP_K", 0) or 0)
+    if top_k <= 0:
+        return ranked_articles
+
+    try:
+        enriched, report = enrich_articles_with_full_text(
+            ranked_articles,
+            top_k=top_k,
+            policy=load_article_fetch_policy(),
+            cache=ArticleContentCache(),
+        )
+    except Exception as e:
+        logger.warning(f"기사 본문 보강 실패, 스니펫으로 계속 진행합니다: {e}")
+        return ranked_articles
+
+    logger.info(
+        f"기사 본문 보강: {report.enriched}/{report.requested}개 "
+        f"(캐시 {report.cached}, 실패 {report.failed}, 시간 초과 {report.timed_out}, "
+        f"{report.elapsed_seconds:.1f}초)"
+    )
+    return enriched
+
+
 def summarize_articles_node(state: NewsletterState) -> NewsletterState:
     """
     기사들을 요약하여 뉴스레터를 생성하는 노드
@@ -276,7 +406,7 @@ def summarize_articles_node(state: NewsletterState) -> NewsletterState:
     step_brief("뉴스레터 생성 중")
     start_time = time.time()
 
-    ranked_articles = state.get("ranked_articles", [])
+    ranked_articles = resolve_state_articles(state, "ranked", checkout=False)
     if not ranked_articles:
         logger.warning("[yellow]No articles to summarize.[/yellow]")
         return build_summarize_missing_articles_state(
@@ -285,6 +415,7 @@ def summarize_articles_node(state: NewsletterState) -> NewsletterState:
         )
 
     try:
+        ranked_articles = enrich_ranked_articles(ranked_articles)
         summary_plan = build_summary_invocation_plan(state, ranked_articles)
         newsletter_chain = get_newsletter_chain(is_compact=summary_plan["is_compact"])
 
@@ -297,6 +428,8 @@ def summarize_articles_node(state: NewsletterState) -> NewsletterState:
 
         # 체인 실행
         result = newsletter_chain.invoke(summary_plan["chain_payload"])
+        # 발송 여부는 워커가 판단 (여기서는 이번 호에 포함된 기사만 기록)
+        record_issue_articles(ranked_articles)
 
         if isinstance(result, str):
             logger.info("[yellow]Received HTML string (legacy format)[/yellow]")
@@ -8,11 +8,36 @@ import math
 import os
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage
 
-from newsletter_core.public.settings import get_major_news_sources
+from newsletter_core.application.article_batch import ArticleBatch
+from newsletter_core.application.article_dates import article_timestamp
+from newsletter_core.application.article_identity import article_identity
+from newsletter_core.application.article_prefilter import (
+    SCORING_STAGE_FIELD,
+    STAGE_HEURISTIC,
+    heuristic_scores,
+    prefilter_articles,
+)
+from newsletter_core.application.batch_scoring import (
+    BATCH_SCORE_PROMPT,
+    load_scoring_token_budget,
+    score_in_batches,
+)
+from newsletter_core.application.llm_concurrency import resolve_provider_concurrency
+from newsletter_core.application.scoring_executor import ScoringExecutor
+from newsletter_core.application.source_tiers import (
+    article_source_tier,
+    classify_source,
+)
+from newsletter_core.infrastructure.llm_score_cache import (
+    LlmScoreCache,
+    ScoreCacheKey,
+    prompt_version,
+)
+from newsletter_core.public.settings import get_llm_config
 
 from .chains import get_llm
 from .date_utils import parse_date_string
@@ -28,10 +53,21 @@ DEFAULT_WEIGHTS = {
     "recency": 0.10,
 }
 
+# LLM 응답을 해석할 수 없을 때 사용하는 최저 점수 (캐시에 저장하지 않음)
+FALLBACK_SCORES = {"relevance": 1, "impact": 1, "novelty": 1}
+
+# get_llm()이 기본으로 사용하는 작업 (동시 호출 한도 조회에 사용)
+SCORING_LLM_TASK = "html_generation"
+
 # 로거 초기화
 logger = get_logger()
 
 
+def load_scoring_concurrency() -> int:
+    """Concurrent scoring calls allowed for the scoring LLM's provider."""
+    return int(resolve_provider_concurrency(get_llm_config(), SCORING_LLM_TASK))
+
+
 def load_scoring_weights_from_config(
     config_file: str = "config.yml",
 ) -> Dict[str, float]:
@@ -79,12 +115,12 @@ def load_scoring_weights_from_config(
 
                 if required_keys.issubset(config_keys):
                     # Ensure all values are numeric and sum to 1.0 (approximately)
-                    weights = {k: float(scoring_config[k]) for k in required_keys}
-                    total = sum(weights.values())
+                    file_weights = {k: float(scoring_config[k]) for k in required_keys}
+                    total = sum(file_weights.values())
 
                     if abs(total - 1.0) < 0.01:  # Allow small floating point errors
                         logger.info(f"✅ 스코어링 가중치를 {config_file}에서 로드했습니다.")
-                        return weights
+                        return file_weights
                     else:
                         logger.warning(
                             f"스코어링 가중치의 합이 {total:.3f}이며 1.0이 아닙니다. 기본값을 사용합니다."
@@ -107,68 +143,80 @@ Title: {title}
 Summary: {summary}
 """
 
+# 프롬프트가 바뀌면 캐시된 점수를 재사용하지 않도록 점수 캐시 키에 포함
+SCORE_PROMPT_VERSION = prompt_version(SCORE_PROMPT, BATCH_SCORE_PROMPT)
+
 
 def _get_source_tier(source: str) -> float:
-    """Get source tier score and tier name for display."""
-    if any(s.lower() in source.lower() for s in get_major_news_sources()["tier1"]):
-        return 1.0
-    if any(s.lower() in source.lower() for s in get_major_news_sources()["tier2"]):
-        return 0.6  # 0.8 → 0.6으로 차이 확대
-    return 0.3  # 0.6 → 0.3으로 차이 확대
+    """Get source tier score (tier1 1.0, tier2 0.6, others 0.3)."""
+    return float(classify_source(source).score)
 
 
 def _get_source_tier_info(source: str) -> tuple[float, str]:
     """Get source tier score and tier name for display."""
-    if any(s.lower() in source.lower() for s in get_major_news_sources()["tier1"]):
-        return 1.0, "Tier 1 (주요 언론사)"
-    if any(s.lower() in source.lower() for s in get_major_news_sources()["tier2"]):
-        return 0.6, "Tier 2 (보조 언론사)"
-    return 0.3, "Tier 3 (기타 소스)"
+    tier = classify_source(source)
+    return tier.score, tier.label
+
+
+def _recency_from_timestamp(timestamp: Optional[float]) -> float:
+    if timestamp is None:
+        return 0.0
+    days = (datetime.now(timezone.utc).timestamp() - timestamp) / 86400
+    return math.exp(-days / 14)
 
 
 def _get_recency(date_str: Any) -> float:
     dt = parse_date_string(date_str)
     if not dt:
         return 0.0
-    now = datetime.now(timezone.utc)
     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    days = (now - dt).total_seconds() / 86400
-    return math.exp(-days / 14)
+    return _recency_from_timestamp(dt.timestamp())
 
 
-def _parse_llm_json(text: str) -> Dict[str, float]:
+def _parse_llm_json(text: str) -> Optional[Dict[str, float]]:
+    """Return the scores in ``text``, or ``None`` when the reply has no JSON."""
     match = re.search(r"\{.*\}", text, re.DOTALL)
-    if match:
-        try:
-            return json.loads(match.group(0))  # type: ignore[no-any-return]
-        except Exception as e:
-            handle_exception(e, "점수 JSON 파싱", log_level=logging.INFO)
-            return {"relevance": 1, "impact": 1, "novelty": 1}
-    return {"relevance": 1, "impact": 1, "novelty": 1}
+    if not match:
+        return None
+    try:
+        parsed = json.loads(match.group(0))
+    except Exception as e:
+        handle_exception(e, "점수 JSON 파싱", log_level=logging.INFO)
+        return None
+    return parsed if isinstance(parsed, dict) else None
 
 
-def request_llm_scores(
+def _scoring_domain(domain: str) -> str:
+    # domain이 None이거나 비어있을 때 기본값 사용
+    return domain or "기술 및 산업 동향"
+
+
+def _invoke_text(llm: Any, prompt: str) -> str:
+    result = llm.invoke([HumanMessage(content=prompt)])
+    if isinstance(result, AIMessage):
+        return str(result.content)
+    return str(result)
+
+
+def _request_parsed_scores(
     article: Dict[str, Any], domain: str, llm: Any = None
-) -> Dict[str, float]:
+) -> Optional[Dict[str, float]]:
     if llm is None:
         llm = get_llm(temperature=0)
 
-    # domain이 None이거나 비어있을 때 기본값 사용
-    if not domain:
-        domain = "기술 및 산업 동향"
-
-    prompt = SCORE_PROMPT.replace("<DOMAIN>", domain).format(
+    prompt = SCORE_PROMPT.replace("<DOMAIN>", _scoring_domain(domain)).format(
         title=article.get("title", ""),
         summary=article.get("content") or article.get("snippet", ""),
     )
-    message = HumanMessage(content=prompt)
-    result = llm.invoke([message])
-    if isinstance(result, AIMessage):
-        text = result.content
-    else:
-        text = str(result)
-    return _parse_llm_json(text)
+    return _parse_llm_json(_invoke_text(llm, prompt))
+
+
+def request_llm_scores(
+    article: Dict[str, Any], domain: str, llm: Any = None
+) -> Dict[str, float]:
+    scores = _request_parsed_scores(article, domain, llm=llm)
+    return scores if scores is not None else dict(FALLBACK_SCORES)
 
 
 def calculate_priority_score(
@@ -194,14 +242,14 @@ def calculate_priority_score(
     impact = scores.get("impact", 1) / 5
     novelty = scores.get("novelty", 1) / 5
 
-    # Source tier 정보 저장
-    source_tier_score, source_tier_name = _get_source_tier_info(
-        article.get("source", "")
-    )
+    # Source tier 정보 저장 (수집 시 기록된 티어 재사용)
+    tier = article_source_tier(article)
+    source_tier_score = float(tier.score)
     article["source_tier_score"] = source_tier_score
-    article["source_tier_name"] = source_tier_name
+    article["source_tier_name"] = tier.label
 
-    recency = _get_recency(article.get("date"))
+    # 수집 시 기록된 date_ts 재사용 (없을 때만 파싱)
+    recency = _recency_from_timestamp(article_timestamp(article))
 
     priority = (
         weights["relevance"] * relevance
@@ -220,6 +268,12 @@ def score_articles(
     top_n: Optional[int] = 10,
     weights: Optional[Dict[str, float]] = None,
     llm: Any = None,
+    prefilter_top_k: Optional[int] = None,
+    query: Optional[List[str]] = None,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    deadline_seconds: Optional[float] = None,
+    score_cache: Optional[LlmScoreCache] = None,
 ) -> List[Dict[str, Any]]:
     """Score and rank a list of articles.
 
@@ -231,6 +285,26 @@ def score_articles(
         The newsletter domain/topic.
     top_n : Optional[int]
         Number of top articles to return. ``None`` returns all scored articles.
+    prefilter_top_k : Optional[int]
+        When set, a lexical/tier/recency prefilter ranks all articles first
+        and only the best ``prefilter_top_k`` are scored by the LLM and
+        returned. Every article gets ``scoring_stage`` audit metadata.
+    query : Optional[list of str]
+        Topic and keywords for the prefilter (defaults to ``domain``).
+    batch_size : Optional[int]
+        When greater than 1, up to this many articles share one scoring
+        prompt (see :mod:`newsletter_core.application.batch_scoring`).
+    concurrency : Optional[int]
+        When set, up to this many scoring calls run at once (see
+        :mod:`newsletter_core.application.scoring_executor`). Rate-limited
+        calls back off, and articles not scored within ``deadline_seconds``
+        get heuristic scores instead of LLM scores.
+    deadline_seconds : Optional[float]
+        Time budget for concurrent scoring (``None`` waits for every call).
+    score_cache : Optional[LlmScoreCache]
+        When set, articles already scored for this domain, model and prompt
+        version reuse the cached raw scores instead of calling the LLM, and
+        new LLM scores are written back.
 
     Returns
     -------
@@ -241,31 +315,212 @@ def score_articles(
     if weights is None:
         weights = load_scoring_weights_from_config()
 
-    scored_list = []
-    for article in articles:
-        score = calculate_priority_score(article, domain, weights=weights, llm=llm)
-        article["priority_score"] = score
-        scored_list.append(article)
+    if prefilter_top_k:
+        prefiltered = prefilter_articles(
+            articles,
+            query or [domain or ""],
+            top_k=prefilter_top_k,
+            weights=weights,
+        )
+        if prefiltered.skipped:
+            logger.info(
+                f"1차 선별: {len(articles)}개 중 상위 {len(prefiltered.candidates)}개만 "
+                f"LLM 평가 ({len(prefiltered.skipped)}개 제외)"
+            )
+        articles = prefiltered.candidates
+
+    pending = articles
+    cache_key: Optional[ScoreCacheKey] = None
+    if score_cache is not None and articles:
+        if llm is None:
+            llm = get_llm(temperature=0)
+        cache_key = ScoreCacheKey(
+            domain=_scoring_domain(domain),
+            model=_llm_model_name(llm),
+            prompt_version=SCORE_PROMPT_VERSION,
+        )
+        pending = _apply_cached_scores(articles, score_cache, cache_key)
+
+    executor: Optional[ScoringExecutor[Any]] = None
+    if concurrency and pending:
+        executor = ScoringExecutor(concurrency, deadline_seconds=deadline_seconds)
+        if llm is None:
+            llm = get_llm(temperature=0)
+
+    # 응답을 해석하지 못해 최저 점수를 받은 기사 (캐시 저장 대상에서 제외)
+    unparsed: set[int] = set()
+
+    def score_one(article: Dict[str, Any]) -> Dict[str, float]:
+        scores = _request_parsed_scores(article, domain, llm=llm)
+        if scores is None:
+            unparsed.add(id(article))
+            return dict(FALLBACK_SCORES)
+        return scores
+
+    if batch_size and batch_size > 1 and len(pending) > 1:
+        if llm is None:
+            llm = get_llm(temperature=0)
+        _score_in_batches(pending, domain, llm, batch_size, score_one, executor)
+    elif executor is not None:
+        _score_concurrently(pending, score_one, executor)
+    else:
+        for article in pending:
+            # Save raw scores for later reuse
+            article["scoring"] = score_one(article)
+
+    if executor is not None:
+        report = executor.report
+        logger.info(
+            f"동시 스코어링: 최대 {executor.max_concurrency}개 동시 호출, "
+            f"완료 {report.completed}회, 429 재시도 {report.rate_limited}회, "
+            f"실패 {report.failed}회, 시간 초과 {report.timed_out}회"
+        )
+
+    if score_cache is not None and cache_key is not None:
+        _store_scores(
+            [article for article in pending if id(article) not in unparsed],
+            score_cache,
+            cache_key,
+        )
 
-    scored_list.sort(key=lambda a: a["priority_score"], reverse=True)
+    return rank_scored_articles(articles, top_n=top_n, weights=weights)
 
-    # Tier별 통계 출력
-    tier_stats: Dict[str, Any] = {}
-    for article in scored_list:
-        tier_name = article.get("source_tier_name", "Unknown")
-        if tier_name not in tier_stats:
-            tier_stats[tier_name] = {"count": 0, "scores": []}
-        tier_stats[tier_name]["count"] += 1
-        tier_stats[tier_name]["scores"].append(article["priority_score"])
 
-    logger.info("📊 Source Tier 분포 및 점수 통계:")
-    for tier_name, stats in tier_stats.items():
-        avg_score = (
-            sum(stats["scores"]) / len(stats["scores"]) if stats["scores"] else 0
+def _llm_model_name(llm: Any) -> str:
+    for attr in ("model_name", "model"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(llm).__name__
+
+
+def _apply_cached_scores(
+    articles: List[Dict[str, Any]], cache: LlmScoreCache, key: ScoreCacheKey
+) -> List[Dict[str, Any]]:
+    """Fill cached ``article["scoring"]`` values and return the cache misses."""
+    fingerprints = [article_identity(article).fingerprint for article in articles]
+    try:
+        cached = cache.get_many(fingerprints, key)
+    except Exception as e:
+        logger.warning(f"점수 캐시 조회 실패, 모든 기사를 LLM으로 평가합니다: {e}")
+        return articles
+
+    pending = []
+    for article, fingerprint in zip(articles, fingerprints):
+        if fingerprint in cached:
+            article["scoring"] = cached[fingerprint]
+        else:
+            pending.append(article)
+    if cached:
+        logger.info(
+            f"점수 캐시: {len(articles)}개 중 {len(articles) - len(pending)}개 재사용 "
+            f"(LLM 평가 {len(pending)}개)"
         )
-        logger.info(f"  • {tier_name}: {stats['count']}개 기사, 평균 점수: {avg_score:.1f}")
+    return pending
+
+
+def _store_scores(
+    articles: List[Dict[str, Any]], cache: LlmScoreCache, key: ScoreCacheKey
+) -> None:
+    """Write LLM scores back to the cache (heuristic stand-ins are skipped).
+
+    Callers pass only articles whose LLM reply was parsed; fallback scores
+    for unreadable replies must not outlive the run.
+    """
+    scores = {
+        article_identity(article).fingerprint: article["scoring"]
+        for article in articles
+        if (article.get(SCORING_STAGE_FIELD) or {}).get("stage") != STAGE_HEURISTIC
+    }
+    try:
+        cache.put_many(scores, key)
+    except Exception as e:
+        logger.warning(f"점수 캐시 저장 실패: {e}")
+
+
+def _score_concurrently(
+    articles: List[Dict[str, Any]],
+    score_one: Callable[[Dict[str, Any]], Dict[str, float]],
+    executor: ScoringExecutor[Any],
+) -> None:
+    """Fill ``article["scoring"]`` with per-article calls run concurrently."""
+    results = executor.map(
+        [lambda article=article: score_one(article) for article in articles]
+    )
+    unscored = 0
+    for article, scores in zip(articles, results):
+        if scores is None:
+            unscored += 1
+            scores = heuristic_scores(article)
+        # Save raw scores for later reuse
+        article["scoring"] = scores
+
+    if unscored:
+        logger.warning(f"LLM 평가를 받지 못한 {unscored}개 기사에 휴리스틱 점수를 사용합니다.")
+
+
+def _score_in_batches(
+    articles: List[Dict[str, Any]],
+    domain: str,
+    llm: Any,
+    batch_size: int,
+    score_one: Callable[[Dict[str, Any]], Dict[str, float]],
+    executor: Optional[ScoringExecutor[Any]] = None,
+) -> None:
+    """Fill ``article["scoring"]`` using multi-article prompts."""
+    if llm is None:
+        llm = get_llm(temperature=0)
+
+    scores, report = score_in_batches(
+        articles,
+        _scoring_domain(domain),
+        lambda prompt: _invoke_text(llm, prompt),
+        score_one,
+        batch_size=batch_size,
+        token_budget=load_scoring_token_budget(),
+        run=executor.map if executor is not None else None,
+        unscored=heuristic_scores,
+    )
+    for article, article_scores in zip(articles, scores):
+        # Save raw scores for later reuse
+        article["scoring"] = article_scores
+
+    logger.info(
+        f"배치 스코어링: {len(articles)}개 기사, 요청 {report.prompts}회 "
+        f"(재요청 {len(report.reasked)}개, 개별 평가 {len(report.fallback)}개, "
+        f"휴리스틱 {len(report.unscored)}개)"
+    )
+
+
+def rank_scored_articles(
+    articles: List[Dict[str, Any]],
+    top_n: Optional[int] = 10,
+    weights: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Rank articles that already carry raw ``scoring`` metrics.
+
+    The weighted priority, top-N selection and tier statistics are computed
+    on a columnar :class:`ArticleBatch`, so re-ranking under new weights does
+    not call the LLM again.
+    """
+
+    if weights is None:
+        weights = load_scoring_weights_from_config()
+
+    batch = ArticleBatch.from_articles(articles)
+    scores = batch.priority_scores(weights)
+    for row, article in enumerate(articles):
+        article["priority_score"] = float(scores[row])
+        # Source tier 정보 저장
+        article["source_tier_score"] = float(batch.tier_scores[row])
+        article["source_tier_name"] = batch.tier_labels[row]
 
-    if top_n is None:
-        return scored_list
+    # Tier별 통계 출력
+    logger.info("📊 Source Tier 분포 및 점수 통계:")
+    for tier_name, stats in batch.tier_stats(scores).items():
+        logger.info(
+            f"  • {tier_name}: {stats.count}개 기사, 평균 점수: {stats.mean_score:.1f}"
+        )
 
-    return scored_list[:top_n]
+    ranked: List[Dict[str, Any]] = batch.records(batch.top_n(scores, top_n))
+    return ranked
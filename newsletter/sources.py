@@ -5,22 +5,43 @@ Newsletter Generator - News Sources
 
 import json
 import logging
-import os
-import re
-from datetime import datetime
+import time
+from functools import partial
 from typing import Any, Dict, Final, List, Optional
 
-import feedparser
 import requests  # type: ignore[import-untyped]
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
 from rich.console import Console
-from urllib3.util.retry import Retry
 
-from newsletter_core.public.settings import (
-    get_all_major_news_sources,
-    get_setting_value,
+from newsletter_core.application.article_dates import stamp_article_dates
+from newsletter_core.application.article_identity import (
+    article_identity,
+    stamp_article_identities,
 )
+from newsletter_core.application.keyword_matcher import compile_keyword_matcher
+from newsletter_core.application.source_collection import (
+    SourceCollectionResult,
+    SourceCollectionTask,
+    SourceTaskOutput,
+    run_source_collection,
+)
+from newsletter_core.application.source_tiers import (
+    article_source_tier,
+    stamp_source_tiers,
+)
+from newsletter_core.infrastructure.feed_fetcher import (
+    fetch_feed_entries,
+    resolve_feed_entry_date,
+)
+from newsletter_core.infrastructure.feed_prefetch import (
+    configured_rss_feeds,
+    load_news_index_policy,
+)
+from newsletter_core.infrastructure.feed_state_store import FeedStateStore
+from newsletter_core.infrastructure.http_client import get_http_client
+from newsletter_core.infrastructure.news_index import NewsIndex
+from newsletter_core.infrastructure.search_cache import fetch_with_search_cache
+from newsletter_core.public.settings import get_setting_value
 
 from .date_utils import standardize_date
 from .utils.error_handling import handle_exception
@@ -32,22 +53,6 @@ console = Console()
 
 # 상수 정의
 TIMEOUT_SECONDS: Final[int] = 30
-MAX_RETRIES: Final[int] = 3
-BACKOFF_FACTOR: Final[float] = 0.3
-
-
-def create_requests_session() -> requests.Session:
-    """재시도 로직이 포함된 requests 세션 생성"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[500, 502, 503, 504],
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
 
 
 def fetch_url_content(
@@ -56,15 +61,15 @@ def fetch_url_content(
     method: str = "GET",
     data: Optional[dict] = None,
 ) -> str:
-    """URL에서 컨텐츠를 안전하게 가져옴"""
-    session = create_requests_session()
+    """URL에서 컨텐츠를 안전하게 가져옴 (프로세스 공용 커넥션 풀 사용)"""
+    client = get_http_client()
     try:
         if method.upper() == "POST":
-            response = session.post(
+            response = client.post(
                 url, headers=headers, json=data, timeout=TIMEOUT_SECONDS
             )
         else:
-            response = session.get(url, headers=headers, timeout=TIMEOUT_SECONDS)
+            response = client.get(url, headers=headers, timeout=TIMEOUT_SECONDS)
         response.raise_for_status()
         return response.text  # type: ignore[no-any-return]
     except requests.RequestException as e:
@@ -72,6 +77,11 @@ def fetch_url_content(
         raise
 
 
+def _fetch_json(url: str, **kwargs: Any) -> Any:
+    """URL 응답을 JSON으로 디코딩 (검색 캐시 fetch 콜백용)"""
+    return json.loads(fetch_url_content(url, **kwargs))
+
+
 class NewsSource:
     """기본 뉴스 소스 클래스 - 모든 소스의 기본 인터페이스를 정의"""
 
@@ -88,6 +98,12 @@ class NewsSource:
         """소스 이름을 반환"""
         return self.name
 
+    def collection_tasks(
+        self, keywords: List[str], num_results: int = 10
+    ) -> List[SourceCollectionTask]:
+        """병렬 수집 엔진에 넘길 작업 단위 목록 (기본: 소스 전체가 하나의 작업)"""
+        return [_build_fetch_news_task(self, keywords, num_results)]
+
     def _standardize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """각 소스별 기사 형식을 표준화"""
         # 날짜 정보 추출
@@ -118,6 +134,24 @@ class NewsSource:
         }
 
 
+def _build_fetch_news_task(
+    source: Any, keywords: List[str], num_results: int
+) -> SourceCollectionTask:
+    """fetch_news 기반 소스를 하나의 수집 작업으로 감싼다"""
+
+    def _fetch() -> SourceTaskOutput:
+        articles = source.fetch_news(keywords, num_results)
+        keyword_counts = getattr(source, "_last_keyword_counts", None)
+        return SourceTaskOutput(
+            articles=list(articles),
+            keyword_counts=(
+                dict(keyword_counts) if isinstance(keyword_counts, dict) else {}
+            ),
+        )
+
+    return SourceCollectionTask(name=source.get_source_name(), fetch=_fetch)
+
+
 class SerperAPISource(NewsSource):
     """Serper.dev API를 사용하여 뉴스 기사를 검색하는 소스"""
 
@@ -152,10 +186,15 @@ class SerperAPISource(NewsSource):
             }
 
             try:
-                content = fetch_url_content(
-                    url, headers=headers, method="POST", data=payload
+                results = fetch_with_search_cache(
+                    "serper",
+                    keyword,
+                    num_results,
+                    partial(
+                        _fetch_json, url, headers=headers, method="POST", data=payload
+                    ),
+                    region="kr-ko",
                 )
-                results = json.loads(content)
                 articles_for_keyword = []
 
                 if "news" in results:
@@ -197,9 +236,23 @@ class SerperAPISource(NewsSource):
 class RSSFeedSource(NewsSource):
     """RSS 피드에서 뉴스 기사를 가져오는 소스"""
 
-    def __init__(self, name: str, feed_urls: List[str]):
+    def __init__(
+        self,
+        name: str,
+        feed_urls: List[str],
+        state_store: Optional[FeedStateStore] = None,
+        news_index: Optional[NewsIndex] = None,
+        index_max_age_seconds: float = 1800.0,
+        news_period_days: Optional[int] = None,
+    ):
         super().__init__(name)
         self.feed_urls = feed_urls
+        # 피드별 ETag/Last-Modified/엔트리 상태 저장소 (없으면 매번 전체 다운로드)
+        self.state_store = state_store
+        # 프리페처가 채우는 로컬 뉴스 인덱스 (신선할 때만 네트워크 대신 사용)
+        self.news_index = news_index
+        self.index_max_age_seconds = index_max_age_seconds
+        self.news_period_days = news_period_days
 
     def fetch_news(
         self, keywords: List[str], num_results: int = 10
@@ -208,146 +261,191 @@ class RSSFeedSource(NewsSource):
         all_articles = []
         keyword_article_counts: Dict[str, int] = {}
 
-        for feed_url in self.feed_urls:
-            try:
-                content = fetch_url_content(feed_url)
-                feed = feedparser.parse(content)
+        if self._index_is_fresh():
+            outputs = [self.fetch_from_index(keywords, num_results)]
+        else:
+            outputs = [
+                self.fetch_feed(feed_url, keywords, num_results)
+                for feed_url in self.feed_urls
+            ]
+
+        for output in outputs:
+            all_articles.extend(output.articles)
+            for keyword, count in output.keyword_counts.items():
+                keyword_article_counts[keyword] = (
+                    keyword_article_counts.get(keyword, 0) + count
+                )
 
-                if not feed.entries:
-                    logger.warning(f"피드 {feed_url}에서 기사를 찾을 수 없습니다")
-                    continue
+        # 키워드별 수집한 기사 수 출력
+        for keyword, count in keyword_article_counts.items():
+            logger.info(f"'{keyword}': RSS 피드에서 {count}개의 기사를 수집했습니다")
 
-                logger.info(
-                    f"RSS 피드를 성공적으로 가져왔습니다: {feed_url} - {len(feed.entries)} entries"
+        # 키워드별 수집 결과 저장 (소스별 집계용)
+        self._last_keyword_counts = keyword_article_counts
+        return all_articles
+
+    def collection_tasks(
+        self, keywords: List[str], num_results: int = 10
+    ) -> List[SourceCollectionTask]:
+        """피드별로 독립된 수집 작업을 만들어 느린 피드가 전체를 막지 않도록 함"""
+        if self._index_is_fresh():
+            return [
+                SourceCollectionTask(
+                    name=f"{self.name}:index",
+                    fetch=partial(self.fetch_from_index, keywords, num_results),
                 )
+            ]
+        return [
+            SourceCollectionTask(
+                name=f"{self.name}:{feed_url}",
+                fetch=partial(self.fetch_feed, feed_url, keywords, num_results),
+            )
+            for feed_url in self.feed_urls
+        ]
+
+    def _index_is_fresh(self) -> bool:
+        """로컬 인덱스가 모든 피드에 대해 최신인지 확인 (오래되면 실시간 수집)"""
+        if self.news_index is None:
+            return False
+        try:
+            fresh = self.news_index.is_fresh(self.feed_urls, self.index_max_age_seconds)
+        except Exception as e:
+            logger.warning(f"로컬 뉴스 인덱스 상태 확인 실패, 실시간 수집: {e}")
+            return False
+        if not fresh:
+            logger.info("로컬 뉴스 인덱스가 오래되어 RSS 피드를 직접 가져옵니다")
+        return fresh
+
+    def fetch_from_index(
+        self, keywords: List[str], num_results: int = 10
+    ) -> SourceTaskOutput:
+        """로컬 뉴스 인덱스에서 키워드/기간 조건으로 기사를 조회"""
+        assert self.news_index is not None
+        since_ts = (
+            time.time() - self.news_period_days * 86400
+            if self.news_period_days
+            else None
+        )
+        hits = self.news_index.search(
+            keywords, feed_urls=self.feed_urls, since_ts=since_ts
+        )
 
-                matched_entries = []
+        entries_by_feed: Dict[str, List[Dict[str, Any]]] = {}
+        feed_titles: Dict[str, Optional[str]] = {}
+        for hit in hits:
+            entries_by_feed.setdefault(hit.feed_url, []).append(hit.as_entry())
+            feed_titles[hit.feed_url] = hit.feed_title
 
-                for entry in feed.entries:
-                    # entry가 dict 또는 객체일 수 있으므로 get과 getattr 모두 사용
-                    title = (
-                        entry.get("title", "").lower()
-                        if isinstance(entry, dict)
-                        else getattr(entry, "title", "").lower()
-                    )
-                    description = (
-                        entry.get("description", "").lower()
-                        if isinstance(entry, dict)
-                        else getattr(entry, "description", "").lower()
-                    )
-                    entry_content: Any = (
-                        entry.get("content", None)
-                        if isinstance(entry, dict)
-                        else getattr(entry, "content", None)
-                    )
-                    content_value = ""
-                    if entry_content:
-                        if isinstance(entry_content, list):
-                            content_value = (
-                                entry_content[0].get("value", "")
-                                if isinstance(entry_content[0], dict)
-                                else str(entry_content[0])
-                            )
-                        else:
-                            content_value = str(entry_content)
-                    content_value = content_value.lower()
-
-                    # 키워드 매칭 여부 확인 (title, description, content_value 중 하나라도 포함되면 True)
-                    matched_keyword = False
-                    for keyword in keywords:
-                        keyword_lower = keyword.lower()
-                        # 영문/숫자 키워드는 단어 경계, 한글 등은 단순 포함
-                        if re.fullmatch(r"[a-zA-Z0-9]+", keyword_lower):
-                            keyword_pattern = r"\b" + re.escape(keyword_lower) + r"\b"
-                            match = (
-                                re.search(keyword_pattern, title)
-                                or re.search(keyword_pattern, description)
-                                or re.search(keyword_pattern, content_value)
-                            )
-                        else:
-                            match = bool(  # type: ignore[assignment]
-                                keyword_lower in title
-                                or keyword_lower in description
-                                or keyword_lower in content_value
-                            )
-                        if match:
-                            matched_keyword = True
-                            keyword_article_counts[keyword] += 1
-                            break
-
-                    if matched_keyword:
-                        article = {
-                            "title": entry.get(
-                                "title", getattr(entry, "title", "제목 없음")
-                            ),
-                            "url": entry.get("link", getattr(entry, "link", "#")),
-                            "link": entry.get("link", getattr(entry, "link", "#")),
-                            "snippet": entry.get(
-                                "description",
-                                getattr(entry, "description", "내용 없음"),
-                            ),
-                            "source": (
-                                getattr(feed.feed, "title", self.name)
-                                if hasattr(feed, "feed")
-                                else self.name
-                            ),
-                            "date": self._parse_rss_date(entry),
-                        }
-                        matched_entries.append(article)
+        articles: List[Dict[str, Any]] = []
+        keyword_article_counts: Dict[str, int] = {}
+        for feed_url in self.feed_urls:
+            output = self._match_entries(
+                entries_by_feed.get(feed_url, []),
+                keywords,
+                num_results,
+                feed_titles.get(feed_url),
+            )
+            articles.extend(output.articles)
+            for keyword, count in output.keyword_counts.items():
+                keyword_article_counts[keyword] = (
+                    keyword_article_counts.get(keyword, 0) + count
+                )
 
-                # 각 피드에서 최대 num_results개의 기사만 선택
-                for article in matched_entries[:num_results]:
-                    all_articles.append(self._standardize_article(article))
+        logger.info(f"로컬 뉴스 인덱스에서 {len(hits)}개 후보 중 {len(articles)}개 기사를 선택했습니다")
+        return SourceTaskOutput(
+            articles=articles, keyword_counts=keyword_article_counts
+        )
 
-                logger.info(f"{feed_url}에서 {len(matched_entries)}개의 일치하는 기사를 찾았습니다")
+    def fetch_feed(
+        self, feed_url: str, keywords: List[str], num_results: int = 10
+    ) -> SourceTaskOutput:
+        """단일 RSS 피드에서 키워드와 일치하는 기사를 가져옴 (조건부 GET + 증분 파싱)"""
+        try:
+            fetch_result = fetch_feed_entries(
+                feed_url, store=self.state_store, timeout=TIMEOUT_SECONDS
+            )
 
-            except Exception as e:
-                logger.error(f"RSS 피드 {feed_url}를 가져오는 중 오류가 발생했습니다: {e}")
+            if not fetch_result.entries:
+                logger.warning(f"피드 {feed_url}에서 기사를 찾을 수 없습니다")
+                return SourceTaskOutput(articles=[], keyword_counts={})
 
-        # 키워드별 수집한 기사 수 출력
-        for keyword, count in keyword_article_counts.items():
-            logger.info(f"'{keyword}': RSS 피드에서 {count}개의 기사를 수집했습니다")
+            logger.info(
+                f"RSS 피드를 성공적으로 가져왔습니다: {feed_url} - "
+                f"{len(fetch_result.entries)} entries "
+                f"({fetch_result.status}, 신규 파싱 {fetch_result.parsed_entry_count}건)"
+            )
 
-        # 키워드별 수집 결과 저장 (소스별 집계용)
-        self._last_keyword_counts = keyword_article_counts
-        return all_articles
+            if self.news_index is not None:
+                # 실시간으로 가져온 결과도 인덱스에 반영해 다음 요청에서 재사용
+                try:
+                    self.news_index.index_feed(
+                        feed_url, fetch_result.feed_title, fetch_result.entries
+                    )
+                except Exception as e:
+                    logger.warning(f"로컬 뉴스 인덱스 갱신 실패 ({feed_url}): {e}")
+
+            output = self._match_entries(
+                list(fetch_result.entries),
+                keywords,
+                num_results,
+                fetch_result.feed_title,
+            )
+            logger.info(f"{feed_url}에서 {len(output.articles)}개의 일치하는 기사를 선택했습니다")
+            return output
+
+        except Exception as e:
+            logger.error(f"RSS 피드 {feed_url}를 가져오는 중 오류가 발생했습니다: {e}")
+
+        return SourceTaskOutput(articles=[], keyword_counts={})
+
+    def _match_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        keywords: List[str],
+        num_results: int,
+        feed_title: Optional[str],
+    ) -> SourceTaskOutput:
+        """피드 엔트리 중 키워드와 일치하는 기사를 피드당 최대 num_results개 선택"""
+        keyword_article_counts: Dict[str, int] = {}
+        matched_entries = []
+
+        matcher = compile_keyword_matcher(tuple(keywords))
+
+        for entry in entries:
+            # title, description, content 중 하나라도 키워드를 포함하면 선택
+            # (영문/숫자 키워드는 단어 경계, 한글 등은 단순 포함)
+            text = "\n".join(
+                str(entry.get(field) or "")
+                for field in ("title", "description", "content")
+            )
+            matched_keyword = matcher.first_keyword(text)
+            if matched_keyword is not None:
+                keyword_article_counts[matched_keyword] = (
+                    keyword_article_counts.get(matched_keyword, 0) + 1
+                )
+                matched_entries.append(
+                    {
+                        "title": entry.get("title") or "제목 없음",
+                        "url": entry.get("link") or "#",
+                        "link": entry.get("link") or "#",
+                        "snippet": entry.get("description") or "내용 없음",
+                        "source": feed_title or self.name,
+                        "date": entry.get("date") or "날짜 없음",
+                    }
+                )
+
+        # 각 피드에서 최대 num_results개의 기사만 선택
+        articles = [
+            self._standardize_article(article)
+            for article in matched_entries[:num_results]
+        ]
+        return SourceTaskOutput(
+            articles=articles, keyword_counts=keyword_article_counts
+        )
 
     def _parse_rss_date(self, entry: Any) -> str:
         """RSS 피드 항목의 날짜 정보를 파싱"""
-        # feedparser가 자동으로 파싱한 published_parsed 필드 사용
-        date_field = None
-        # dict 타입 지원
-        if isinstance(entry, dict):
-            for field in ["published_parsed", "updated_parsed", "created_parsed"]:
-                if field in entry and entry[field]:
-                    date_field = entry[field]
-                    break
-            if date_field:
-                try:
-                    dt = datetime(*date_field[:6])
-                    return dt.strftime("%Y-%m-%d")
-                except Exception as e:
-                    handle_exception(e, "날짜 형식 변환", log_level=logging.DEBUG)
-                    # 날짜 변환 실패시 다음 필드 시도
-            for field in ["published", "updated", "created"]:
-                if field in entry and entry[field]:
-                    return entry[field]  # type: ignore[no-any-return]
-        else:
-            for field in ["published_parsed", "updated_parsed", "created_parsed"]:
-                if hasattr(entry, field) and getattr(entry, field):
-                    date_field = getattr(entry, field)
-                    break
-            if date_field:
-                try:
-                    dt = datetime(*date_field[:6])
-                    return dt.strftime("%Y-%m-%d")
-                except Exception as e:
-                    handle_exception(e, "날짜 형식 변환", log_level=logging.DEBUG)
-                    # 날짜 변환 실패시 다음 필드 시도
-            for field in ["published", "updated", "created"]:
-                if hasattr(entry, field) and getattr(entry, field):
-                    return getattr(entry, field)  # type: ignore[no-any-return]
-        return "날짜 없음"
+        return resolve_feed_entry_date(entry)
 
 
 class NaverNewsAPISource(NewsSource):
@@ -379,8 +477,13 @@ class NaverNewsAPISource(NewsSource):
             }
 
             try:
-                content = fetch_url_content(url, headers=headers)
-                results = json.loads(content)
+                results = fetch_with_search_cache(
+                    "naver",
+                    keyword,
+                    num_results,
+                    partial(_fetch_json, url, headers=headers),
+                    region="kr",
+                )
                 articles_for_keyword = []
 
                 if "items" in results and results["items"]:
@@ -425,6 +528,7 @@ class NewsSourceManager:
 
     def __init__(self) -> None:
         self.sources: List[Any] = []
+        self.last_collection_result: Optional[SourceCollectionResult] = None
         # 주요 언론사 설정은 config에서 중앙 관리
 
     def add_source(self, source: NewsSource) -> None:
@@ -435,6 +539,12 @@ class NewsSourceManager:
         self, keywords: Any, num_results_per_source: int = 10
     ) -> List[Dict[str, Any]]:
         """모든 소스에서 뉴스 기사 수집"""
+        return self.collect_all_sources(keywords, num_results_per_source).articles
+
+    def collect_all_sources(
+        self, keywords: Any, num_results_per_source: int = 10
+    ) -> SourceCollectionResult:
+        """모든 소스(및 개별 RSS 피드)를 병렬로 수집하고 소스별 지연/수집량을 보고"""
         if isinstance(keywords, str):
             keywords_list = [k.strip() for k in keywords.split(",")]
         else:
@@ -442,26 +552,62 @@ class NewsSourceManager:
 
         logger.info(f"키워드: {keywords_list}에 대한 뉴스를 수집중입니다")
 
-        all_articles = []
+        tasks: List[SourceCollectionTask] = []
         for source in self.sources:
             logger.info(f"{source.get_source_name()}에서 뉴스를 수집중입니다...")
-            articles = source.fetch_news(keywords_list, num_results_per_source)
-            all_articles.extend(articles)
+            if isinstance(source, NewsSource):
+                tasks.extend(
+                    source.collection_tasks(keywords_list, num_results_per_source)
+                )
+            else:
+                tasks.append(
+                    _build_fetch_news_task(
+                        source, keywords_list, num_results_per_source
+                    )
+                )
 
-        logger.info(f"모든 소스에서 수집한 총 기사 수: {len(all_articles)}")
+        result = run_source_collection(
+            tasks,
+            max_workers=int(get_setting_value("CONCURRENT_REQUESTS", 1) or 1),
+            source_timeout=float(get_setting_value("SOURCE_TIMEOUT_SECONDS", 20.0)),
+            total_budget=float(get_setting_value("COLLECTION_BUDGET_SECONDS", 60.0)),
+        )
+        # 수집 시점에 한 번만 정규 URL/호스트/지문, 언론사 티어, 날짜 타임스탬프를 기록
+        # (이후 단계는 재파싱/재분류하지 않음)
+        stamp_article_identities(result.articles)
+        stamp_source_tiers(result.articles)
+        stamp_article_dates(result.articles)
+        self.last_collection_result = result
+
+        for report in result.reports:
+            if report.status == "ok":
+                logger.info(
+                    f"{report.name}: {report.article_count}개 기사, "
+                    f"{report.elapsed_seconds:.2f}초"
+                )
+            else:
+                logger.warning(
+                    f"{report.name}: 수집 제외 ({report.status}, "
+                    f"{report.elapsed_seconds:.2f}초) - {report.error}"
+                )
 
-        # 키워드별 수집 결과 간략 표시
-        # 키워드별 기사 수 집계
-        keyword_counts: Dict[str, int] = {}
-        for source in self.sources:
-            if hasattr(source, "_last_keyword_counts"):
-                for keyword, count in source._last_keyword_counts.items():
-                    keyword_counts[keyword] = keyword_counts.get(keyword, 0) + count
+        logger.info(
+            f"모든 소스에서 수집한 총 기사 수: {len(result.articles)} "
+            f"({result.elapsed_seconds:.2f}초)"
+        )
 
+        for pool_stats in get_http_client().stats():
+            logger.debug(
+                f"HTTP 커넥션 풀 {pool_stats.host}: 요청 {pool_stats.requests}회, "
+                f"재사용 {pool_stats.pool_hits}회 ({pool_stats.hit_rate:.0%})"
+            )
+
+        # 키워드별 수집 결과 간략 표시
+        keyword_counts = result.keyword_counts
         if keyword_counts:
             show_collection_brief(keyword_counts)
 
-        return all_articles
+        return result
 
     def remove_duplicates(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """중복된 기사 제거"""
@@ -477,16 +623,18 @@ class NewsSourceManager:
             if not url and not title:
                 continue
 
-            # URL 기반 중복 확인
-            if url and url in seen_urls:
+            # 정규 URL 지문 기반 중복 확인
+            identity = article_identity(article)
+            url_key = identity.fingerprint if identity.canonical_url else ""
+            if url_key and url_key in seen_urls:
                 continue
 
             # 제목 기반 중복 확인 (URL이 다르더라도)
             if title and title in seen_titles:
                 continue
 
-            if url:
-                seen_urls.add(url)
+            if url_key:
+                seen_urls.add(url_key)
             if title:
                 seen_titles.add(title)
 
@@ -510,18 +658,12 @@ class NewsSourceManager:
         if not articles:
             return []
 
-        # 주요 언론사 목록 (한국 주요 언론사)
-        major_sources = get_all_major_news_sources()
-
         # 주요 언론사 기사와 기타 기사 분리
         major_articles = []
         other_articles = []
 
         for article in articles:
-            source = article.get("source", "").strip()
-            is_major = any(major_source in source for major_source in major_sources)
-
-            if is_major:
+            if article_source_tier(article).key != "other":
                 major_articles.append(article)
             else:
                 other_articles.append(article)
@@ -560,23 +702,12 @@ class NewsSourceManager:
         }
 
         # 각 기사에 대해 일치하는 모든 키워드 찾기
+        # (영문/숫자 키워드는 단어 경계, 한글 등은 단순 포함)
+        matcher = compile_keyword_matcher(tuple(keywords))
         for article in articles:
-            title = article.get("title", "").lower()
-            content = article.get("content", "").lower()
-
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-
-                # 영문/숫자 키워드는 단어 경계, 한글 등은 단순 포함
-                if re.fullmatch(r"[a-zA-Z0-9]+", keyword_lower):
-                    keyword_pattern = r"\b" + re.escape(keyword_lower) + r"\b"
-                    if re.search(keyword_pattern, title) or re.search(
-                        keyword_pattern, content
-                    ):
-                        grouped_articles[keyword].append(article)
-                else:
-                    if keyword_lower in title or keyword_lower in content:
-                        grouped_articles[keyword].append(article)
+            text = f"{article.get('title', '')}\n{article.get('content', '')}"
+            for keyword in matcher.match(text):
+                grouped_articles[keyword].append(article)
 
         # 각 키워드 그룹에서 중복 제거
         for keyword in grouped_articles:
@@ -591,7 +722,9 @@ class NewsSourceManager:
 
 
 # 기본 뉴스 소스 설정 함수
-def configure_default_sources() -> NewsSourceManager:
+def configure_default_sources(
+    news_period_days: Optional[int] = None,
+) -> NewsSourceManager:
     """기본 뉴스 소스를 구성"""
     manager = NewsSourceManager()
 
@@ -605,20 +738,32 @@ def configure_default_sources() -> NewsSourceManager:
     ):
         manager.add_source(NaverNewsAPISource())
 
-    # 기본 RSS 피드 추가
-    default_feeds = [
-        # 국내 주요 언론사 RSS 피드
-        "https://www.yonhapnewstv.co.kr/feed/",  # 연합뉴스TV
-        "https://www.hani.co.kr/rss/",  # 한겨레
-        "https://rss.donga.com/total.xml",  # 동아일보
-        "https://www.khan.co.kr/rss/rssdata/total_news.xml",  # 경향신문
-    ]
-
-    # 환경 변수에서 추가 RSS 피드 URL 가져오기
-    additional_feeds = os.environ.get("ADDITIONAL_RSS_FEEDS", "").split(",")
-    feeds = default_feeds + [feed for feed in additional_feeds if feed.strip()]
+    # 기본 RSS 피드 + 환경 변수(ADDITIONAL_RSS_FEEDS)의 추가 피드
+    feeds = configured_rss_feeds()
 
     if feeds:
-        manager.add_source(RSSFeedSource("DefaultRSSFeeds", feeds))
+        state_store = None
+        if get_setting_value("RSS_CONDITIONAL_GET", True):
+            try:
+                state_store = FeedStateStore()
+            except Exception as e:
+                handle_exception(e, "RSS 피드 상태 저장소 초기화", log_level=logging.WARNING)
+        index_policy = load_news_index_policy()
+        news_index = None
+        if index_policy.enabled:
+            try:
+                news_index = NewsIndex()
+            except Exception as e:
+                handle_exception(e, "로컬 뉴스 인덱스 초기화", log_level=logging.WARNING)
+        manager.add_source(
+            RSSFeedSource(
+                "DefaultRSSFeeds",
+                feeds,
+                state_store=state_store,
+                news_index=news_index,
+                index_max_age_seconds=index_policy.max_age_seconds,
+                news_period_days=news_period_days,
+            )
+        )
 
     return manager
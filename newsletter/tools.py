@@ -5,25 +5,32 @@ Newsletter Generator - Custom Tools
 
 import logging
 import os
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, Iterator, List, cast
 
 import markdownify
-import requests  # type: ignore[import-untyped]
-from bs4 import BeautifulSoup
 from langchain.prompts import PromptTemplate
 from langchain.tools import tool
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.tools import ToolException
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from newsletter_core.application.article_extraction import resolve_article_extractor
+from newsletter_core.application.fetch_sizing import (
+    record_fetched_articles,
+    resolve_fetch_sizes,
+)
 from newsletter_core.application.tools_search_flow import (
     SerperKeywordFailure,
     SerperKeywordReport,
     SerperLogMessage,
+    build_serper_batch_plans,
     build_serper_failure_log_messages,
     build_serper_keyword_log_messages,
     build_serper_search_plans,
+    execute_serper_batch_plans,
     execute_serper_search_plan,
+    execute_serper_search_plans,
+    iter_serper_search_plans,
     summarize_serper_search_reports,
 )
 from newsletter_core.application.tools_support import (
@@ -33,8 +40,10 @@ from newsletter_core.application.tools_support import (
     resolve_search_request,
     sanitize_filename,
 )
+from newsletter_core.infrastructure.http_client import get_http_client
 from newsletter_core.infrastructure.tools_search_runtime import (
-    execute_serper_search_request,
+    execute_cached_serper_batch_request,
+    execute_cached_serper_search_request,
 )
 from newsletter_core.public.settings import get_setting_value
 
@@ -67,18 +76,39 @@ def search_news_articles(keywords: str, num_results: int = 10) -> List[Dict]:
 
     search_request = resolve_search_request(keywords, num_results)
     search_plans = build_serper_search_plans(
-        search_request, api_key=get_setting_value("SERPER_API_KEY")
+        search_request,
+        api_key=get_setting_value("SERPER_API_KEY"),
+        num_results_by_keyword=resolve_fetch_sizes(
+            search_request.keywords, search_request.num_results
+        ),
     )
     keyword_reports: list[SerperKeywordReport] = []
+    max_workers = int(get_setting_value("CONCURRENT_REQUESTS", 1) or 1)
+    batch_size = int(get_setting_value("SERPER_BATCH_SIZE", 0) or 0)
 
     logger.info("\nStarting article collection process:")
     for search_plan in search_plans:
-        logger.info(f"Searching articles for keyword: '{search_plan.keyword}'")
-        keyword_result = execute_serper_search_plan(
-            search_plan,
-            executor=execute_serper_search_request,
+        logger.info(
+            f"Searching articles for keyword: '{search_plan.keyword}' "
+            f"(num={search_plan.num_results})"
         )
 
+    # 키워드별 요청을 병렬(또는 멀티쿼리 배치)로 실행하되 결과는 키워드 순서를 유지
+    if batch_size > 1 and len(search_plans) > 1:
+        keyword_results = execute_serper_batch_plans(
+            build_serper_batch_plans(search_plans, batch_size=batch_size),
+            executor=execute_cached_serper_batch_request,
+            max_workers=max_workers,
+        )
+    else:
+        keyword_results = execute_serper_search_plans(
+            search_plans,
+            executor=execute_cached_serper_search_request,
+            max_workers=max_workers,
+            plan_runner=execute_serper_search_plan,
+        )
+
+    for keyword_result in keyword_results:
         if isinstance(keyword_result, SerperKeywordFailure):
             _emit_serper_log_messages(
                 list(build_serper_failure_log_messages(keyword_result))
@@ -88,6 +118,7 @@ def search_news_articles(keywords: str, num_results: int = 10) -> List[Dict]:
         _emit_serper_log_messages(
             list(build_serper_keyword_log_messages(keyword_result))
         )
+        record_fetched_articles(keyword_result.keyword, keyword_result.articles)
         keyword_reports.append(keyword_result)
 
     search_summary = summarize_serper_search_reports(keyword_reports)
@@ -104,6 +135,52 @@ def search_news_articles(keywords: str, num_results: int = 10) -> List[Dict]:
     return cast(List[Dict], search_summary.all_articles)
 
 
+def stream_news_articles(keywords: str, num_results: int = 10) -> Iterator[Dict]:
+    """
+    Yield Serper articles keyword by keyword as each response arrives.
+
+    Unlike ``search_news_articles`` the results are not accumulated, so the
+    caller can filter and deduplicate while slower keyword requests are still
+    in flight. Articles are yielded in completion order, not keyword order.
+    """
+    if not get_setting_value("SERPER_API_KEY"):
+        raise ToolException("SERPER_API_KEY not found. Please set it in the .env file.")
+
+    search_request = resolve_search_request(keywords, num_results)
+    search_plans = build_serper_search_plans(
+        search_request,
+        api_key=get_setting_value("SERPER_API_KEY"),
+        num_results_by_keyword=resolve_fetch_sizes(
+            search_request.keywords, search_request.num_results
+        ),
+    )
+    keyword_article_counts: Dict[str, int] = {}
+
+    for keyword_result in iter_serper_search_plans(
+        search_plans,
+        executor=execute_cached_serper_search_request,
+        max_workers=int(get_setting_value("CONCURRENT_REQUESTS", 1) or 1),
+        plan_runner=execute_serper_search_plan,
+    ):
+        if isinstance(keyword_result, SerperKeywordFailure):
+            _emit_serper_log_messages(
+                list(build_serper_failure_log_messages(keyword_result))
+            )
+            continue
+
+        _emit_serper_log_messages(
+            list(build_serper_keyword_log_messages(keyword_result))
+        )
+        keyword_article_counts[keyword_result.keyword] = keyword_result.article_count
+        record_fetched_articles(keyword_result.keyword, keyword_result.articles)
+        yield from keyword_result.articles
+
+    if any(keyword_article_counts.values()):
+        show_collection_brief(keyword_article_counts)
+    else:
+        logger.warning("⚠️  수집된 기사가 없습니다")
+
+
 @tool  # type: ignore[untyped-decorator]
 def fetch_article_content(url: str) -> Dict[str, Any]:
     """
@@ -120,83 +197,17 @@ def fetch_article_content(url: str) -> Dict[str, Any]:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url, headers=headers, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # 타이틀 추출
-        title = soup.title.text.strip() if soup.title else "제목 없음"
-
-        # 메인 콘텐츠 추출 시도 (다양한 방법으로)
-        content = ""
-
-        # 메타 설명 추출
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            content += meta_desc.get("content") + "\n\n"
-
-        # article 태그 찾기
-        article_tag = soup.find("article")
-        if article_tag:
-            # 불필요한 요소 제거
-            for tag in article_tag.find_all(
-                ["script", "style", "nav", "footer", "aside"]
-            ):
-                tag.decompose()
-
-            content += article_tag.get_text(separator="\n", strip=True)
-        else:
-            # 본문으로 추정되는 태그들 찾기
-            for tag_name in ["div", "section"]:
-                for attr in ["id", "class"]:
-                    for keyword in [
-                        "content",
-                        "article",
-                        "main",
-                        "body",
-                        "entry",
-                        "post",
-                    ]:
-                        main_content = soup.find(
-                            tag_name,
-                            {
-                                attr: lambda x: (
-                                    x and keyword in x.lower() if x else False
-                                )
-                            },
-                        )
-                        if main_content:
-                            # 불필요한 요소 제거
-                            for tag in main_content.find_all(
-                                ["script", "style", "nav", "footer", "aside"]
-                            ):
-                                tag.decompose()
-
-                            content += main_content.get_text(separator="\n", strip=True)
-                            break
-                    if content:
-                        break
-                if content:
-                    break
-
-        # 본문을 찾지 못한 경우 전체 텍스트 사용
-        if not content:
-            # 불필요한 요소 제거
-            for tag in soup.find_all(["script", "style", "nav", "footer", "aside"]):
-                tag.decompose()
-
-            content = (
-                soup.body.get_text(separator="\n", strip=True)
-                if soup.body
-                else "내용을 추출할 수 없습니다."
-            )
+        extract = resolve_article_extractor(get_setting_value("ARTICLE_EXTRACTOR"))
+        extracted = extract(response.content)
 
         # 결과 반환
         return {
-            "title": title,
+            "title": extracted.title,
             "url": url,
-            "content": content[:5000],  # 컨텐츠 길이 제한 (토큰 절약)
+            "content": extracted.content,  # 컨텐츠 길이 제한 (토큰 절약)
         }
 
     except Exception as e:
@@ -360,8 +371,9 @@ def validate_and_refine_keywords(
     for keyword in keywords:
         try:
             # 키워드로 테스트 검색 (invoke 메서드 사용)
+            # 실제 수집과 동일한 결과 수로 검색해 검색 캐시 항목을 공유
             test_results = search_news_articles.invoke(
-                {"keywords": keyword, "num_results": 5}
+                {"keywords": keyword, "num_results": 10}
             )
 
             if len(test_results) >= min_results_per_keyword:
@@ -0,0 +1,106 @@
+"""Parse-once date normalization for collected articles.
+
+Each article's ``date`` string is parsed once at ingest and stamped as an
+epoch timestamp under ``date_ts``. Relative dates ("3시간 전", "2 days ago")
+are resolved against one reference time per run, so every stage of the run
+sees the same instant. Date filtering, sorting, recency scoring and
+importance ranking read the stamp instead of re-parsing the string.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, MutableMapping
+from datetime import datetime, timezone
+from typing import Any, Final, TypeVar
+
+from newsletter.date_utils import parse_date_string
+
+DATE_TIMESTAMP_FIELD: Final[str] = "date_ts"
+
+_MISSING_DATE_VALUES: Final[frozenset[str]] = frozenset({"", "날짜 없음"})
+
+
+def is_missing_date(value: Any) -> bool:
+    """Return True for the legacy "no date" markers (empty or ``날짜 없음``)."""
+
+    return not value or value in _MISSING_DATE_VALUES
+
+
+def timestamp_to_datetime(timestamp: float | None) -> datetime | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+class ArticleDateNormalizer:
+    """Resolve article dates against a single reference time."""
+
+    def __init__(self, reference_time: datetime | None = None) -> None:
+        if reference_time is None:
+            reference_time = datetime.now(timezone.utc)
+        elif reference_time.tzinfo is None:
+            reference_time = reference_time.replace(tzinfo=timezone.utc)
+        self.reference_time = reference_time
+
+    def parse_timestamp(self, date_value: Any) -> float | None:
+        if is_missing_date(date_value):
+            return None
+        parsed = parse_date_string(date_value, now=self.reference_time)
+        return None if parsed is None else parsed.timestamp()
+
+    def timestamp(self, article: Mapping[str, Any]) -> float | None:
+        """Return the stamped timestamp, parsing ``date`` only if unstamped."""
+
+        if DATE_TIMESTAMP_FIELD in article:
+            stamped = article[DATE_TIMESTAMP_FIELD]
+            return None if stamped is None else float(stamped)
+        return self.parse_timestamp(article.get("date"))
+
+    def stamp(self, article: MutableMapping[str, Any]) -> float | None:
+        """Write ``date_ts`` onto *article* (``None`` when missing/unparseable)."""
+
+        timestamp = self.timestamp(article)
+        article[DATE_TIMESTAMP_FIELD] = timestamp
+        return timestamp
+
+
+def article_timestamp(
+    article: Mapping[str, Any], reference_time: datetime | None = None
+) -> float | None:
+    """Return the epoch timestamp of *article*, using the stamp if present."""
+
+    return ArticleDateNormalizer(reference_time).timestamp(article)
+
+
+def article_datetime(
+    article: Mapping[str, Any], reference_time: datetime | None = None
+) -> datetime | None:
+    """Return the UTC datetime of *article*, using the stamp if present."""
+
+    return timestamp_to_datetime(article_timestamp(article, reference_time))
+
+
+_ArticlesT = TypeVar("_ArticlesT", bound=Iterable[MutableMapping[str, Any]])
+
+
+def stamp_article_dates(
+    articles: _ArticlesT, reference_time: datetime | None = None
+) -> _ArticlesT:
+    """Stamp every article in place against one reference time."""
+
+    normalizer = ArticleDateNormalizer(reference_time)
+    for article in articles:
+        if isinstance(article, MutableMapping):
+            normalizer.stamp(article)
+    return articles
+
+
+__all__ = [
+    "ArticleDateNormalizer",
+    "DATE_TIMESTAMP_FIELD",
+    "article_datetime",
+    "article_timestamp",
+    "is_missing_date",
+    "stamp_article_dates",
+    "timestamp_to_datetime",
+]
@@ -0,0 +1,194 @@
+"""Incremental duplicate detection shared by batch and streaming processing."""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections.abc import Iterable, Mapping
+from typing import Any, Final, Literal
+
+from newsletter_core.application.article_identity import (
+    article_identity,
+    normalize_article_title,
+)
+
+DuplicateReason = Literal["empty", "url", "title", "similar"]
+
+# 겹침 비율이 높아도 이 단어가 있으면 후속/별개 기사로 취급
+DIFFERENTIATING_WORDS: Final[frozenset[str]] = frozenset(
+    {
+        "계획",
+        "발표",
+        "예정",
+        "준비",
+        "검토",
+        "추진",
+        "시작",
+        "완료",
+        "종료",
+        "중단",
+    }
+)
+
+SIMILAR_TITLE_THRESHOLD: Final[float] = 0.99
+
+_TOKEN_SPLIT_RE: Final[re.Pattern[str]] = re.compile(r"[\W_]+")
+
+
+def title_tokens(title: str) -> frozenset[str]:
+    """Split a title into the unique lowercase word set used for overlap checks."""
+
+    return frozenset(_TOKEN_SPLIT_RE.split(title.lower())) - {""}
+
+
+class NearDuplicateIndex:
+    """Find earlier titles whose word overlap coefficient reaches a threshold.
+
+    The overlap coefficient ``|A & B| / min(|A|, |B|)`` is what the legacy
+    pairwise loops computed. Instead of scanning every earlier title, tokens
+    are put in one fixed global order and each title is indexed by its
+    *prefix*: the first ``|B| - k(|B|) + 1`` tokens, where ``k(n)`` is the
+    smallest overlap that can reach the threshold for a set of size ``n``.
+    Two sets with at least ``k`` shared tokens must share a token inside
+    the prefix of the smaller one, so only titles hit through a prefix are
+    verified. At the default 0.99 threshold the prefix is a single token, so
+    lookups touch a handful of candidates instead of every earlier title.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = float(threshold)
+        self._entries: list[frozenset[str]] = []
+        self._prefix_postings: dict[str, list[int]] = {}
+        self._token_postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _required_overlap(self, size: int) -> int:
+        return max(1, math.ceil(self.threshold * size - 1e-9))
+
+    def _prefix(self, tokens: frozenset[str]) -> list[str]:
+        ordered = sorted(tokens, key=_token_order)
+        return ordered[: len(tokens) - self._required_overlap(len(tokens)) + 1]
+
+    def find(self, tokens: frozenset[str]) -> int | None:
+        """Return the id of an earlier near-duplicate of ``tokens``, if any."""
+
+        if not tokens:
+            return None
+        size = len(tokens)
+        candidates: set[int] = set()
+        # 이전 제목이 더 작거나 같으면 그 prefix 토큰이 현재 제목에 있어야 함
+        for token in tokens:
+            for entry_id in self._prefix_postings.get(token, ()):
+                if len(self._entries[entry_id]) <= size:
+                    candidates.add(entry_id)
+        # 이전 제목이 더 크면 현재 제목의 prefix 토큰이 그 제목에 있어야 함
+        for token in self._prefix(tokens):
+            for entry_id in self._token_postings.get(token, ()):
+                if len(self._entries[entry_id]) > size:
+                    candidates.add(entry_id)
+
+        for entry_id in sorted(candidates):
+            entry = self._entries[entry_id]
+            overlap = len(tokens & entry) / min(size, len(entry))
+            if overlap >= self.threshold:
+                return entry_id
+        return None
+
+    def add(self, tokens: frozenset[str]) -> int:
+        """Index ``tokens`` and return the id assigned to them."""
+
+        entry_id = len(self._entries)
+        self._entries.append(tokens)
+        for token in self._prefix(tokens) if tokens else ():
+            self._prefix_postings.setdefault(token, []).append(entry_id)
+        for token in tokens:
+            self._token_postings.setdefault(token, []).append(entry_id)
+        return entry_id
+
+
+def _token_order(token: str) -> tuple[int, str]:
+    # 실행마다 달라지지 않는 고정 전역 순서 (prefix 필터링 전제)
+    return zlib.crc32(token.encode("utf-8")), token
+
+
+def find_near_duplicates(titles: Iterable[str], threshold: float) -> list[int | None]:
+    """Map each title to the index of the first kept title it duplicates."""
+
+    index = NearDuplicateIndex(threshold)
+    kept_positions: list[int] = []
+    matches: list[int | None] = []
+    for position, title in enumerate(titles):
+        tokens = title_tokens(title)
+        entry_id = index.find(tokens)
+        if entry_id is None:
+            index.add(tokens)
+            kept_positions.append(position)
+            matches.append(None)
+        else:
+            matches.append(kept_positions[entry_id])
+    return matches
+
+
+class IncrementalArticleDeduper:
+    """Admit articles one at a time, remembering only fingerprints and titles.
+
+    The rules match the legacy ``remove_duplicate_articles`` pass: canonical
+    URL fingerprint, exact normalized title, then word-overlap similarity with
+    the differentiating-word exception. Titles are tokenized once and the
+    similarity check goes through a ``NearDuplicateIndex``. No article bodies
+    are retained, so the state stays small while a collection stream is
+    still running.
+    """
+
+    def __init__(self) -> None:
+        self._seen_fingerprints: set[str] = set()
+        self._seen_titles: set[str] = set()
+        self._similar_titles = NearDuplicateIndex(SIMILAR_TITLE_THRESHOLD)
+
+    def __len__(self) -> int:
+        return len(self._seen_titles)
+
+    def check(self, article: Mapping[str, Any]) -> DuplicateReason | None:
+        """Return why ``article`` is a duplicate, or ``None`` and remember it."""
+
+        url = article.get("url", "")
+        title = article.get("title", "")
+        if not url and not title:
+            return "empty"
+
+        identity = article_identity(article)
+        fingerprint = identity.fingerprint if identity.canonical_url else ""
+        if fingerprint and fingerprint in self._seen_fingerprints:
+            return "url"
+
+        normalized_title = normalize_article_title(title)
+        if normalized_title and normalized_title in self._seen_titles:
+            return "title"
+
+        # 차별화 단어가 있는 제목은 유사도 비교 대상에서 양방향 모두 제외
+        tokens = title_tokens(normalized_title)
+        differentiated = not DIFFERENTIATING_WORDS.isdisjoint(normalized_title.split())
+        if not differentiated and self._similar_titles.find(tokens) is not None:
+            return "similar"
+
+        if fingerprint:
+            self._seen_fingerprints.add(fingerprint)
+        if normalized_title:
+            self._seen_titles.add(normalized_title)
+            if not differentiated and tokens:
+                self._similar_titles.add(tokens)
+        return None
+
+
+__all__ = [
+    "DIFFERENTIATING_WORDS",
+    "DuplicateReason",
+    "IncrementalArticleDeduper",
+    "NearDuplicateIndex",
+    "SIMILAR_TITLE_THRESHOLD",
+    "find_near_duplicates",
+    "title_tokens",
+]
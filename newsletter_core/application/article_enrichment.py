@@ -0,0 +1,95 @@
+"""Selection and merge rules for full-text enrichment of ranked articles."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from newsletter_core.application.article_extraction import ExtractedArticle
+from newsletter_core.application.article_identity import article_identity
+
+
+@dataclass(frozen=True)
+class EnrichmentTarget:
+    """One ranked article whose page should be fetched for full text."""
+
+    index: int
+    url: str
+    canonical_url: str
+    fingerprint: str
+
+
+@dataclass(frozen=True)
+class FullTextEnrichmentReport:
+    """Outcome counters for one enrichment pass."""
+
+    requested: int
+    cached: int
+    fetched: int
+    failed: int
+    timed_out: int
+    elapsed_seconds: float
+
+    @property
+    def enriched(self) -> int:
+        return self.cached + self.fetched
+
+
+def _article_url(article: Mapping[str, Any]) -> str:
+    return str(article.get("url") or article.get("link") or "").strip()
+
+
+def select_enrichment_targets(
+    articles: Sequence[Mapping[str, Any]],
+    *,
+    top_k: int,
+) -> tuple[EnrichmentTarget, ...]:
+    """Pick the first ``top_k`` fetchable articles, one target per fingerprint."""
+
+    targets: list[EnrichmentTarget] = []
+    seen: set[str] = set()
+    for index, article in enumerate(articles):
+        if len(targets) >= top_k:
+            break
+        url = _article_url(article)
+        if not url.lower().startswith(("http://", "https://")):
+            continue
+        identity = article_identity(article)
+        if identity.fingerprint in seen:
+            continue
+        seen.add(identity.fingerprint)
+        targets.append(
+            EnrichmentTarget(index, url, identity.canonical_url, identity.fingerprint)
+        )
+    return tuple(targets)
+
+
+def apply_full_text(
+    articles: Sequence[Mapping[str, Any]],
+    targets: Sequence[EnrichmentTarget],
+    extracted: Mapping[str, ExtractedArticle],
+) -> list[dict[str, Any]]:
+    """Return article copies whose ``content`` carries the extracted full text.
+
+    ``extracted`` maps article fingerprints to extraction results.
+    """
+
+    enriched = [dict(article) for article in articles]
+    for target in targets:
+        page = extracted.get(target.fingerprint)
+        if page is None or not page.content.strip():
+            continue
+        article = enriched[target.index]
+        if len(page.content) > len(str(article.get("content") or "")):
+            article["content"] = page.content
+            article["full_text"] = True
+    return enriched
+
+
+__all__ = [
+    "EnrichmentTarget",
+    "FullTextEnrichmentReport",
+    "apply_full_text",
+    "select_enrichment_targets",
+]
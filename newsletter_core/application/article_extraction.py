@@ -0,0 +1,305 @@
+"""Main-content extraction engines for fetched article HTML."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_CONTENT_MAX_CHARS: Final[int] = 5000
+DEFAULT_ARTICLE_EXTRACTOR: Final[str] = "auto"
+
+_NOISE_TAGS: Final[tuple[str, ...]] = ("script", "style", "nav", "footer", "aside")
+_CONTAINER_TAGS: Final[tuple[str, ...]] = ("div", "section")
+_CONTAINER_ATTRS: Final[tuple[str, ...]] = ("id", "class")
+_CONTAINER_KEYWORDS: Final[tuple[str, ...]] = (
+    "content",
+    "article",
+    "main",
+    "body",
+    "entry",
+    "post",
+)
+
+_DENSITY_NOISE_TAGS: Final[tuple[str, ...]] = (
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "nav",
+    "footer",
+    "aside",
+    "header",
+    "form",
+    "iframe",
+    "button",
+    "select",
+)
+_DENSITY_BLOCK_TAGS: Final[frozenset[str]] = frozenset(
+    {"article", "body", "div", "main", "section", "td"}
+)
+_DENSITY_MIN_CHARS: Final[int] = 200
+# 본문 텍스트에서 줄을 바꾸는 블록 요소 (그 밖의 인라인 요소는 같은 줄로 이어 붙임)
+_LINE_BREAK_TAGS: Final[frozenset[str]] = frozenset(
+    {
+        "address",
+        "article",
+        "blockquote",
+        "br",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "figure",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "hr",
+        "li",
+        "main",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ExtractedArticle:
+    """Title and main text extracted from one article page."""
+
+    title: str
+    content: str
+
+
+def _strip_noise(node: object) -> None:
+    for tag in node.find_all(list(_NOISE_TAGS)):  # type: ignore[attr-defined]
+        tag.decompose()
+
+
+ArticleExtractor = Callable[[bytes | str], ExtractedArticle]
+
+
+def extract_article_content_heuristic(html: bytes | str) -> ExtractedArticle:
+    """Extract title and body text with the legacy BeautifulSoup heuristic."""
+
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.text.strip() if soup.title else "제목 없음"
+
+    content = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc and meta_desc.get("content"):
+        content += str(meta_desc.get("content")) + "\n\n"
+
+    article_tag = soup.find("article")
+    if article_tag:
+        _strip_noise(article_tag)
+        content += article_tag.get_text(separator="\n", strip=True)
+    else:
+        # article 태그가 없으면 본문으로 추정되는 컨테이너를 순서대로 탐색
+        for tag_name in _CONTAINER_TAGS:
+            for attr in _CONTAINER_ATTRS:
+                for keyword in _CONTAINER_KEYWORDS:
+                    main_content = soup.find(
+                        tag_name,
+                        {
+                            attr: lambda x, keyword=keyword: (
+                                x and keyword in x.lower() if x else False
+                            )
+                        },
+                    )
+                    if main_content:
+                        _strip_noise(main_content)
+                        content += main_content.get_text(separator="\n", strip=True)
+                        break
+                if content:
+                    break
+            if content:
+                break
+
+    if not content:
+        _strip_noise(soup)
+        content = (
+            soup.body.get_text(separator="\n", strip=True)
+            if soup.body
+            else "내용을 추출할 수 없습니다."
+        )
+
+    return ExtractedArticle(title=title, content=content[:ARTICLE_CONTENT_MAX_CHARS])
+
+
+def _direct_text_length(element: Any) -> int:
+    length = len((element.text or "").strip())
+    for child in element:
+        length += len((child.tail or "").strip())
+    return length
+
+
+def _block_text(block: Any) -> str:
+    """Text of *block*, one line per block element, inline text kept joined."""
+
+    lines: list[str] = []
+    pending: list[str] = []
+
+    def flush() -> None:
+        line = " ".join("".join(pending).split())
+        if line:
+            lines.append(line)
+        pending.clear()
+
+    for event, element in etree.iterwalk(block, events=("start", "end")):
+        breaks_line = element.tag in _LINE_BREAK_TAGS
+        if event == "start":
+            if breaks_line:
+                flush()
+            if isinstance(element.tag, str) and element.text:
+                pending.append(element.text)
+        else:
+            if breaks_line:
+                flush()
+            if element is not block and element.tail:
+                pending.append(element.tail)
+    flush()
+    return "\n".join(lines)
+
+
+def extract_article_content_density(html: bytes | str) -> ExtractedArticle | None:
+    """Pick the block with the densest non-link text in one pass over the tree.
+
+    Every element credits its own (non-tail) text to its nearest block ancestor
+    and half of it to that block's parent block; anchor text counts against the
+    block instead, so link lists and menus sink. Returns ``None`` when no block
+    carries enough text, letting callers fall back to the heuristic.
+    """
+
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    title = (root.findtext(".//title") or "").strip() or "제목 없음"
+    meta_desc = root.xpath('string(//meta[@name="description"]/@content)').strip()
+    etree.strip_elements(root, etree.Comment, *_DENSITY_NOISE_TAGS, with_tail=False)
+
+    block_of: dict[Any, Any] = {}
+    in_link: dict[Any, bool] = {}
+    scores: dict[Any, float] = {}
+    for element in root.iter(etree.Element):
+        parent = element.getparent()
+        is_block = element.tag in _DENSITY_BLOCK_TAGS
+        block = element if is_block else block_of.get(parent, root)
+        block_of[element] = block
+        linked = element.tag == "a" or in_link.get(parent, False)
+        in_link[element] = linked
+
+        length = _direct_text_length(element)
+        if not length:
+            continue
+        weight = -length if linked else length
+        scores[block] = scores.get(block, 0.0) + weight
+        outer = block_of.get(block.getparent())
+        if outer is not None:
+            scores[outer] = scores.get(outer, 0.0) + weight / 2
+
+    if not scores:
+        return None
+    best, best_score = max(scores.items(), key=lambda item: item[1])
+    if best_score < _DENSITY_MIN_CHARS:
+        return None
+
+    body = _block_text(best)
+    content = f"{meta_desc}\n\n{body}" if meta_desc else body
+    return ExtractedArticle(title=title, content=content[:ARTICLE_CONTENT_MAX_CHARS])
+
+
+def extract_article_content_auto(html: bytes | str) -> ExtractedArticle:
+    """Use the density engine, falling back to the heuristic when it abstains."""
+
+    return extract_article_content_density(html) or extract_article_content_heuristic(
+        html
+    )
+
+
+def extract_article_content_density_only(html: bytes | str) -> ExtractedArticle:
+    """Use the density engine alone; pages it abstains on get empty content."""
+
+    extracted = extract_article_content_density(html)
+    if extracted is not None:
+        return extracted
+    try:
+        title = lxml.html.document_fromstring(html).findtext(".//title") or ""
+    except (etree.ParserError, ValueError):
+        title = ""
+    return ExtractedArticle(title=title.strip() or "제목 없음", content="")
+
+
+ARTICLE_EXTRACTORS: Final[dict[str, ArticleExtractor]] = {
+    "auto": extract_article_content_auto,
+    "density": extract_article_content_density_only,
+    "heuristic": extract_article_content_heuristic,
+}
+
+
+@lru_cache(maxsize=None)
+def _warn_unknown_extractor(name: str) -> None:
+    # 기사마다 호출되므로 같은 이름은 한 번만 경고
+    logger.warning(
+        "Unknown ARTICLE_EXTRACTOR %r; using %r (available: %s)",
+        name,
+        DEFAULT_ARTICLE_EXTRACTOR,
+        ", ".join(sorted(ARTICLE_EXTRACTORS)),
+    )
+
+
+def resolve_article_extractor(name: str | None = None) -> ArticleExtractor:
+    """Return the registered extractor for *name*, defaulting to ``auto``."""
+
+    key = str(name or DEFAULT_ARTICLE_EXTRACTOR).strip().lower()
+    extractor = ARTICLE_EXTRACTORS.get(key)
+    if extractor is None:
+        _warn_unknown_extractor(key)
+        return ARTICLE_EXTRACTORS[DEFAULT_ARTICLE_EXTRACTOR]
+    return extractor
+
+
+def extract_article_content(html: bytes | str) -> ExtractedArticle:
+    """Extract title and main text with the legacy heuristic.
+
+    Kept on the heuristic so existing callers see no change; use
+    :func:`resolve_article_extractor` to follow ``ARTICLE_EXTRACTOR``.
+    """
+
+    return extract_article_content_heuristic(html)
+
+
+__all__ = [
+    "ARTICLE_CONTENT_MAX_CHARS",
+    "ARTICLE_EXTRACTORS",
+    "ArticleExtractor",
+    "DEFAULT_ARTICLE_EXTRACTOR",
+    "ExtractedArticle",
+    "extract_article_content",
+    "extract_article_content_auto",
+    "extract_article_content_density",
+    "extract_article_content_density_only",
+    "extract_article_content_heuristic",
+    "resolve_article_extractor",
+]
@@ -0,0 +1,281 @@
+"""Stable identity helpers for collected articles.
+
+Every collected article is stamped once at ingest with a canonical URL, the
+canonical host and a fingerprint; later stages (dedupe, source policies,
+content/score caches) read those fields instead of re-parsing URLs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Iterable, Mapping, MutableMapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CANONICAL_URL_FIELD: Final[str] = "canonical_url"
+CANONICAL_HOST_FIELD: Final[str] = "canonical_host"
+FINGERPRINT_FIELD: Final[str] = "fingerprint"
+
+_TRACKING_PARAMS: Final[frozenset[str]] = frozenset(
+    {
+        "_ga",
+        "_hsenc",
+        "_hsmi",
+        "amp",
+        "cmpid",
+        "dclid",
+        "fbclid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "ocid",
+        "ref",
+        "spm",
+        "yclid",
+    }
+)
+_DEFAULT_PORTS: Final[dict[str, int]] = {"http": 80, "https": 443}
+# Subdomains that serve the same article as the bare host.
+_ALIAS_HOST_PREFIXES: Final[tuple[str, ...]] = ("www.", "m.", "mobile.", "amp.")
+_AMP_CACHE_SUFFIX: Final[str] = ".cdn.ampproject.org"
+# (host, path) -> query parameter carrying the real target of a redirect link.
+_REDIRECT_PARAMS: Final[dict[tuple[str, str], tuple[str, ...]]] = {
+    ("google.com", "/url"): ("url", "q"),
+    ("news.google.com", "/url"): ("url", "q"),
+    ("link.naver.com", "/bridge"): ("url",),
+}
+_MAX_UNWRAP_DEPTH: Final[int] = 3
+
+_NAVER_NEWS_HOSTS: Final[frozenset[str]] = frozenset(
+    {"news.naver.com", "n.news.naver.com"}
+)
+_NAVER_ARTICLE_PATH_RE: Final[re.Pattern[str]] = re.compile(
+    r"^/(?:mnews/)?article/(\d+)/(\d+)"
+)
+_NAVER_READ_PATHS: Final[frozenset[str]] = frozenset(
+    {"/main/read.naver", "/main/read.nhn", "/read.nhn", "/read.naver"}
+)
+_DAUM_NEWS_HOSTS: Final[frozenset[str]] = frozenset(
+    {"v.daum.net", "news.v.daum.net", "news.daum.net"}
+)
+_DAUM_ARTICLE_PATH_RE: Final[re.Pattern[str]] = re.compile(r"^/v/(\w+)")
+_TITLE_NOISE_RE: Final[re.Pattern[str]] = re.compile(r"[^\w\s가-힣]")
+_WHITESPACE_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class ArticleIdentity:
+    """Canonical URL, host and fingerprint that identify one article."""
+
+    canonical_url: str
+    canonical_host: str
+    fingerprint: str
+
+
+def _is_tracking_param(name: str, value: str) -> bool:
+    lowered = name.lower()
+    if lowered == "outputtype":
+        return value.lower() == "amp"
+    return lowered.startswith("utm_") or lowered in _TRACKING_PARAMS
+
+
+@lru_cache(maxsize=4096)
+def canonical_host(host: str) -> str:
+    """Lowercase *host* and drop ``www``/mobile/AMP alias subdomains."""
+
+    normalized = host.strip().lower().rstrip(".")
+    changed = True
+    while changed:
+        changed = False
+        for prefix in _ALIAS_HOST_PREFIXES:
+            rest = normalized[len(prefix) :]
+            if normalized.startswith(prefix) and "." in rest:
+                normalized = rest
+                changed = True
+    return normalized
+
+
+def _unwrap_amp_cache(host: str, path: str) -> str | None:
+    # https://www-example-com.cdn.ampproject.org/c/s/www.example.com/a -> https://www.example.com/a
+    if not host.endswith(_AMP_CACHE_SUFFIX):
+        return None
+    match = re.match(r"^/[cv]/(s/)?(.+)$", path)
+    if not match:
+        return None
+    return ("https://" if match.group(1) else "http://") + match.group(2)
+
+
+def _unwrap_redirect(host: str, path: str, query: list[tuple[str, str]]) -> str | None:
+    names = _REDIRECT_PARAMS.get((host, path))
+    if not names:
+        return None
+    values = dict(query)
+    for name in names:
+        target = values.get(name, "")
+        if target.lower().startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def _portal_article_url(host: str, path: str, query: dict[str, str]) -> str | None:
+    if host in _NAVER_NEWS_HOSTS:
+        match = _NAVER_ARTICLE_PATH_RE.match(path)
+        if match:
+            return f"https://n.news.naver.com/article/{match[1]}/{match[2]}"
+        if path in _NAVER_READ_PATHS and query.get("oid") and query.get("aid"):
+            return f"https://n.news.naver.com/article/{query['oid']}/{query['aid']}"
+    if host in _DAUM_NEWS_HOSTS:
+        match = _DAUM_ARTICLE_PATH_RE.match(path)
+        if match:
+            return f"https://v.daum.net/v/{match[1]}"
+    return None
+
+
+def _strip_amp_path(path: str) -> str:
+    if path.startswith("/amp/"):
+        path = path[4:]
+    if path.endswith("/amp"):
+        path = path[:-4] or "/"
+    return path
+
+
+@lru_cache(maxsize=8192)
+def _canonicalize(raw: str, depth: int) -> str:
+    try:
+        parts = urlsplit(raw)
+        port = parts.port
+    except ValueError:
+        return raw
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return raw
+
+    host = canonical_host(parts.hostname)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if depth < _MAX_UNWRAP_DEPTH:
+        target = _unwrap_amp_cache(host, parts.path) or _unwrap_redirect(
+            host, parts.path, query
+        )
+        if target:
+            return _canonicalize(target, depth + 1)
+    portal_url = _portal_article_url(host, parts.path, dict(query))
+    if portal_url:
+        return portal_url
+
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = _strip_amp_path(parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    canonical_query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in query
+            if not _is_tracking_param(name, value)
+        )
+    )
+    return urlunsplit((scheme, host, path, canonical_query, ""))
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize an article URL so every link to the same story compares equal.
+
+    Lowercases the host and drops ``www``/mobile/AMP subdomains, tracking
+    parameters, fragments, AMP paths and trailing slashes; unwraps AMP-cache
+    and redirect links; and rewrites Naver/Daum article links to one form.
+    """
+
+    return _canonicalize(str(url or "").strip(), 0)
+
+
+def normalize_article_title(title: str) -> str:
+    """Strip punctuation, collapse whitespace and lowercase an article title."""
+
+    normalized = _TITLE_NOISE_RE.sub("", str(title or ""))
+    return _WHITESPACE_RE.sub(" ", normalized).strip().lower()
+
+
+def url_fingerprint(canonical_url: str) -> str:
+    """Return a stable scheme-independent hash of a canonical URL."""
+
+    _, separator, rest = canonical_url.partition("://")
+    key = rest if separator else canonical_url
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _article_url(article: Mapping[str, Any]) -> str:
+    url = str(article.get("url") or article.get("link") or "").strip()
+    return "" if url == "#" else url
+
+
+def article_identity(article: Mapping[str, Any]) -> ArticleIdentity:
+    """Return the stamped identity of *article*, computing it if unstamped."""
+
+    stamped_url = article.get(CANONICAL_URL_FIELD)
+    stamped_fingerprint = article.get(FINGERPRINT_FIELD)
+    if stamped_fingerprint and stamped_url is not None:
+        return ArticleIdentity(
+            canonical_url=str(stamped_url),
+            canonical_host=str(article.get(CANONICAL_HOST_FIELD) or ""),
+            fingerprint=str(stamped_fingerprint),
+        )
+
+    url = _article_url(article)
+    canonical_url = canonicalize_url(url) if url else ""
+    if canonical_url:
+        try:
+            host = urlsplit(canonical_url).hostname or ""
+        except ValueError:
+            host = ""
+        return ArticleIdentity(canonical_url, host, url_fingerprint(canonical_url))
+
+    title_key = "title:" + normalize_article_title(str(article.get("title") or ""))
+    return ArticleIdentity(
+        canonical_url="",
+        canonical_host="",
+        fingerprint=hashlib.sha256(title_key.encode("utf-8")).hexdigest(),
+    )
+
+
+def stamp_article_identity(article: MutableMapping[str, Any]) -> ArticleIdentity:
+    """Write ``canonical_url``/``canonical_host``/``fingerprint`` onto *article*."""
+
+    identity = article_identity(article)
+    article[CANONICAL_URL_FIELD] = identity.canonical_url
+    article[CANONICAL_HOST_FIELD] = identity.canonical_host
+    article[FINGERPRINT_FIELD] = identity.fingerprint
+    return identity
+
+
+_ArticlesT = TypeVar("_ArticlesT", bound=Iterable[MutableMapping[str, Any]])
+
+
+def stamp_article_identities(articles: _ArticlesT) -> _ArticlesT:
+    """Stamp every article in place and return the same collection."""
+
+    for article in articles:
+        if isinstance(article, MutableMapping):
+            stamp_article_identity(article)
+    return articles
+
+
+__all__ = [
+    "ArticleIdentity",
+    "CANONICAL_HOST_FIELD",
+    "CANONICAL_URL_FIELD",
+    "FINGERPRINT_FIELD",
+    "article_identity",
+    "canonical_host",
+    "canonicalize_url",
+    "normalize_article_title",
+    "stamp_article_identities",
+    "stamp_article_identity",
+    "url_fingerprint",
+]
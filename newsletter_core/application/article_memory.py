@@ -0,0 +1,141 @@
+"""Cross-issue memory of articles already delivered by a schedule or preset.
+
+A recurring schedule keeps finding the articles it sent in earlier issues.
+``ArticleMemory`` wraps a batch lookup over the fingerprints of articles
+delivered in the same scope (schedule or preset) within the retention
+window. The process step either drops those articles or marks them so the
+priority score is down-weighted. The articles handed to summarization are
+recorded as the issue's articles; the caller persists them as delivered only
+once the issue actually reaches readers (sent, or approved for delivery).
+
+The memory is bound to the running generation with ``use_article_memory``.
+Graph nodes pick it up through ``current_article_memory`` without any change
+to the graph's public signatures.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Final, Literal, cast
+
+from newsletter_core.application.article_identity import article_identity
+from newsletter_core.public.settings import get_setting_value
+
+ArticleMemoryMode = Literal["off", "downweight", "exclude"]
+SeenLookup = Callable[[Sequence[str]], Iterable[str]]
+
+PREVIOUSLY_DELIVERED_FIELD: Final[str] = "previously_delivered"
+REPEAT_DELIVERY_FACTOR: Final[float] = 0.5
+DEFAULT_RETENTION_DAYS: Final[int] = 30
+
+_MODES: Final[frozenset[str]] = frozenset({"off", "downweight", "exclude"})
+
+
+def load_article_memory_mode() -> ArticleMemoryMode:
+    mode = str(get_setting_value("ARTICLE_MEMORY_MODE", "downweight")).lower()
+    return cast(ArticleMemoryMode, mode if mode in _MODES else "downweight")
+
+
+def load_article_memory_retention_days() -> int:
+    retention = int(
+        get_setting_value("ARTICLE_MEMORY_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+    )
+    return max(1, retention)
+
+
+def _fingerprint(article: Mapping[str, Any]) -> str:
+    return article_identity(article).fingerprint
+
+
+@dataclass
+class ArticleMemory:
+    """Seen-article lookup and issue log for one generation run.
+
+    ``lookup`` receives every candidate fingerprint at once and returns the
+    ones already delivered in this scope; it is called once per ``apply``.
+    """
+
+    scope: str
+    lookup: SeenLookup
+    mode: ArticleMemoryMode = "downweight"
+    repeated: int = 0
+    issue_fingerprints: list[str] = field(default_factory=list)
+
+    def apply(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Drop or mark articles delivered in earlier issues."""
+
+        self.repeated = 0
+        if self.mode == "off" or not articles:
+            return articles
+        fingerprints = [_fingerprint(article) for article in articles]
+        seen = set(self.lookup(list(dict.fromkeys(fingerprints))))
+        if not seen:
+            return articles
+
+        kept: list[dict[str, Any]] = []
+        for article, fingerprint in zip(articles, fingerprints):
+            if fingerprint not in seen:
+                kept.append(article)
+                continue
+            self.repeated += 1
+            if self.mode == "downweight":
+                article[PREVIOUSLY_DELIVERED_FIELD] = True
+                kept.append(article)
+        return kept
+
+    def record_issue(self, articles: Iterable[Mapping[str, Any]]) -> None:
+        """Remember the articles that went into this issue (not yet delivered)."""
+
+        self.issue_fingerprints = list(
+            dict.fromkeys(_fingerprint(article) for article in articles)
+        )
+
+
+_active_memory: ContextVar[ArticleMemory | None] = ContextVar(
+    "article_memory", default=None
+)
+
+
+@contextmanager
+def use_article_memory(memory: ArticleMemory | None) -> Iterator[None]:
+    """Bind *memory* to the generation running in the current context."""
+
+    token = _active_memory.set(memory)
+    try:
+        yield
+    finally:
+        _active_memory.reset(token)
+
+
+def current_article_memory() -> ArticleMemory | None:
+    return _active_memory.get()
+
+
+def apply_article_memory(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    memory = current_article_memory()
+    return articles if memory is None else memory.apply(articles)
+
+
+def record_issue_articles(articles: Iterable[Mapping[str, Any]]) -> None:
+    memory = current_article_memory()
+    if memory is not None:
+        memory.record_issue(articles)
+
+
+__all__ = [
+    "ArticleMemory",
+    "ArticleMemoryMode",
+    "DEFAULT_RETENTION_DAYS",
+    "PREVIOUSLY_DELIVERED_FIELD",
+    "REPEAT_DELIVERY_FACTOR",
+    "SeenLookup",
+    "apply_article_memory",
+    "current_article_memory",
+    "load_article_memory_mode",
+    "load_article_memory_retention_days",
+    "record_issue_articles",
+    "use_article_memory",
+]
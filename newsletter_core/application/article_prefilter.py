@@ -0,0 +1,206 @@
+"""Stage-one ranking that runs before LLM scoring.
+
+Only the top handful of ranked articles reach the newsletter, so scoring
+every processed article with the LLM wastes most of the calls. The
+prefilter ranks all articles without any LLM call. It combines three
+signals:
+
+- BM25 relevance of title and snippet to the topic and keywords;
+- source tier;
+- recency.
+
+It then hands only the top ``top_k`` articles to the LLM scorer. Hangul runs
+are tokenized as character bigrams, so particles and compound nouns
+("반도체가", "AI반도체") still match the query terms.
+
+Every article is stamped with a ``scoring_stage`` record holding its stage,
+its prefilter score and its rank, so ranking quality can be audited
+afterwards. Articles the LLM could not score in time get heuristic scores
+derived from the same lexical relevance and are marked ``heuristic``.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final
+
+import numpy as np
+
+from newsletter_core.application.article_batch import ArticleBatch, FloatArray
+from newsletter_core.public.settings import get_setting_value
+
+SCORING_STAGE_FIELD: Final[str] = "scoring_stage"
+STAGE_LLM: Final[str] = "llm"
+STAGE_PREFILTER: Final[str] = "prefilter"
+STAGE_HEURISTIC: Final[str] = "heuristic"
+DEFAULT_PREFILTER_TOP_K: Final[int] = 30
+
+BM25_K1: Final[float] = 1.2
+BM25_B: Final[float] = 0.75
+# Title tokens are counted this many times (a minimal BM25F).
+TITLE_BOOST: Final[int] = 2
+
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"[0-9a-z]+|[가-힣]+")
+_DEFAULT_WEIGHTS: Final[Mapping[str, float]] = {
+    "relevance": 0.4,
+    "source_tier": 0.1,
+    "recency": 0.1,
+}
+
+
+def load_prefilter_top_k() -> int:
+    """LLM candidate count from settings (0 disables the prefilter)."""
+
+    return max(
+        0, int(get_setting_value("SCORING_PREFILTER_TOP_K", DEFAULT_PREFILTER_TOP_K))
+    )
+
+
+def lexical_tokens(text: str) -> list[str]:
+    """Lowercased ASCII words plus Hangul character bigrams."""
+
+    tokens: list[str] = []
+    for match in _TOKEN_PATTERN.finditer(str(text or "").lower()):
+        token = match.group(0)
+        if token.isascii() or len(token) == 1:
+            tokens.append(token)
+        else:
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+    return tokens
+
+
+def _document_tokens(article: Mapping[str, Any]) -> list[str]:
+    title = lexical_tokens(str(article.get("title") or ""))
+    body = lexical_tokens(str(article.get("snippet") or article.get("content") or ""))
+    return title * TITLE_BOOST + body
+
+
+def bm25_scores(
+    documents: Sequence[Sequence[str]], query_terms: Iterable[str]
+) -> FloatArray:
+    """Okapi BM25 of each tokenized document against the query tokens."""
+
+    size = len(documents)
+    terms = list(dict.fromkeys(query_terms))
+    if not size or not terms:
+        return np.zeros(size)
+
+    term_index = {term: column for column, term in enumerate(terms)}
+    frequencies = np.zeros((size, len(terms)))
+    lengths = np.empty(size)
+    for row, tokens in enumerate(documents):
+        lengths[row] = len(tokens)
+        for term, count in Counter(tokens).items():
+            column = term_index.get(term)
+            if column is not None:
+                frequencies[row, column] = count
+
+    document_frequency = np.count_nonzero(frequencies, axis=0)
+    idf = np.log1p((size - document_frequency + 0.5) / (document_frequency + 0.5))
+    average_length = float(lengths.mean()) or 1.0
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length)
+    saturated = frequencies * (BM25_K1 + 1) / (frequencies + norm[:, None])
+    return np.asarray(saturated @ idf, dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class PrefilterResult:
+    """Articles sent to the LLM (best first) and the ones held back."""
+
+    candidates: list[dict[str, Any]]
+    skipped: list[dict[str, Any]]
+
+
+def prefilter_articles(
+    articles: Sequence[dict[str, Any]],
+    query: Iterable[str],
+    *,
+    top_k: int,
+    weights: Mapping[str, float] | None = None,
+    now: datetime | None = None,
+) -> PrefilterResult:
+    """Rank *articles* without the LLM and keep the best ``top_k``.
+
+    The relevance, source tier and recency weights of the scoring weights
+    are reused (renormalized), and articles down-weighted by the article
+    memory keep that penalty. Each article gets a ``scoring_stage`` record.
+    """
+
+    if not articles:
+        return PrefilterResult([], [])
+
+    query_tokens = [token for text in query for token in lexical_tokens(text)]
+    lexical = bm25_scores([_document_tokens(a) for a in articles], query_tokens)
+    peak = float(lexical.max())
+    if peak > 0:
+        lexical = lexical / peak
+
+    batch = ArticleBatch.from_articles(articles)
+    weights = weights or _DEFAULT_WEIGHTS
+    relevance_w = float(weights.get("relevance", 0.0))
+    tier_w = float(weights.get("source_tier", 0.0))
+    recency_w = float(weights.get("recency", 0.0))
+    total_w = relevance_w + tier_w + recency_w
+    if not math.isfinite(total_w) or total_w <= 0:
+        relevance_w, tier_w, recency_w, total_w = 1.0, 0.0, 0.0, 1.0
+
+    scores = np.round(
+        (
+            relevance_w * lexical
+            + tier_w * batch.tier_scores
+            + recency_w * batch.recency(now)
+        )
+        / total_w
+        * batch.repeat_factors,
+        4,
+    )
+
+    ranked_rows = batch.top_n(scores, None)
+    candidates: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    for rank, row in enumerate(ranked_rows, start=1):
+        article = batch.articles[int(row)]
+        selected = top_k <= 0 or rank <= top_k
+        article[SCORING_STAGE_FIELD] = {
+            "stage": STAGE_LLM if selected else STAGE_PREFILTER,
+            "prefilter_score": float(scores[row]),
+            "prefilter_rank": rank,
+            "lexical_relevance": round(float(lexical[row]), 4),
+        }
+        (candidates if selected else skipped).append(article)
+    return PrefilterResult(candidates, skipped)
+
+
+def heuristic_scores(article: dict[str, Any]) -> dict[str, float]:
+    """Stand-in LLM scores for an article the LLM did not score.
+
+    Relevance maps the prefilter's lexical relevance onto the 1-5 scale;
+    impact and novelty get the floor value the LLM parser also falls back
+    to. The article's ``scoring_stage`` is marked ``heuristic``.
+    """
+
+    stage = dict(article.get(SCORING_STAGE_FIELD) or {})
+    lexical = float(stage.get("lexical_relevance") or 0.0)
+    stage["stage"] = STAGE_HEURISTIC
+    article[SCORING_STAGE_FIELD] = stage
+    return {"relevance": round(1 + 4 * lexical, 2), "impact": 1, "novelty": 1}
+
+
+__all__ = [
+    "DEFAULT_PREFILTER_TOP_K",
+    "PrefilterResult",
+    "SCORING_STAGE_FIELD",
+    "STAGE_HEURISTIC",
+    "STAGE_LLM",
+    "STAGE_PREFILTER",
+    "bm25_scores",
+    "heuristic_scores",
+    "lexical_tokens",
+    "load_prefilter_top_k",
+    "prefilter_articles",
+]
@@ -0,0 +1,162 @@
+"""Compact per-run storage for collected articles.
+
+``Article`` is a slotted record for the fields every stage reads, with
+source, host and tier names interned and duplicate text (a ``content`` equal
+to the ``snippet``, a ``link`` equal to the ``url``) held once. An
+``ArticleStore`` owns the records of one generation run and hands out
+integer IDs, so graph state carries ID lists rather than lists of dicts.
+
+Nodes still work on plain dicts: ``records`` materializes them for one
+step and ``commit`` writes the step's output back and returns the IDs. Keys
+the slotted fields do not cover are kept in ``extra``, and each record
+remembers its key order, so ``to_dict`` returns the dict that went in.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Final
+
+_INTERNED_FIELDS: Final[frozenset[str]] = frozenset(
+    {"source", "canonical_host", "source_tier", "source_tier_name"}
+)
+
+
+@dataclass(slots=True, eq=False)
+class Article:
+    """One collected article; ``layout`` is the original key order."""
+
+    id: int
+    layout: tuple[str, ...]
+    title: Any = None
+    url: Any = None
+    link: Any = None
+    source: Any = None
+    date: Any = None
+    snippet: Any = None
+    content: Any = None
+    canonical_url: Any = None
+    canonical_host: Any = None
+    fingerprint: Any = None
+    source_tier: Any = None
+    source_tier_score: Any = None
+    source_tier_name: Any = None
+    date_ts: Any = None
+    scoring: Any = None
+    priority_score: Any = None
+    extra: dict[str, Any] | None = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.layout:
+            return default
+        if key in _SLOT_FIELDS:
+            return getattr(self, key)
+        return (self.extra or {})[key]
+
+    def to_dict(self) -> dict[str, Any]:
+        extra = self.extra or {}
+        return {
+            key: getattr(self, key) if key in _SLOT_FIELDS else extra[key]
+            for key in self.layout
+        }
+
+
+_SLOT_FIELDS: Final[frozenset[str]] = frozenset(
+    name for name in Article.__slots__ if name not in {"id", "layout", "extra"}
+)
+
+
+class ArticleStore:
+    """Articles of one generation run, addressed by integer ID."""
+
+    def __init__(self) -> None:
+        self._articles: list[Article] = []
+        self._layouts: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._checked_out: dict[int, tuple[int, dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def _build(self, article_id: int, record: Mapping[str, Any]) -> Article:
+        layout = tuple(record)
+        layout = self._layouts.setdefault(layout, layout)
+        article = Article(article_id, layout)
+        extra: dict[str, Any] = {}
+        for key, value in record.items():
+            if key not in _SLOT_FIELDS:
+                extra[key] = value
+                continue
+            if key in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(article, key, value)
+
+        if article.content is not None and article.content == article.snippet:
+            article.content = article.snippet
+        if article.link is not None and article.link == article.url:
+            article.link = article.url
+        article.extra = extra or None
+        return article
+
+    def add(self, record: Mapping[str, Any]) -> int:
+        article_id = len(self._articles)
+        self._articles.append(self._build(article_id, record))
+        return article_id
+
+    def add_many(self, records: Iterable[Mapping[str, Any]]) -> list[int]:
+        return [self.add(record) for record in records]
+
+    def get(self, article_id: int) -> Article:
+        return self._articles[article_id]
+
+    def record(self, article_id: int) -> dict[str, Any]:
+        """Materialize one article as a dict and remember it for ``commit``."""
+
+        record = self._articles[article_id].to_dict()
+        self._checked_out[id(record)] = (article_id, record)
+        return record
+
+    def records(self, article_ids: Iterable[int]) -> list[dict[str, Any]]:
+        return [self.record(article_id) for article_id in article_ids]
+
+    def iter_records(self, article_ids: Iterable[int]) -> Iterator[dict[str, Any]]:
+        """Yield dicts one at a time without tracking them (read-only use)."""
+
+        for article_id in article_ids:
+            yield self._articles[article_id].to_dict()
+
+    def commit(self, records: Sequence[Mapping[str, Any]]) -> list[int]:
+        """Write a step's output back and return its article IDs in order.
+
+        Dicts handed out by ``records`` keep their ID and replace the stored
+        article with their (possibly mutated) contents; any other dict is
+        added as a new article. Outstanding checkouts are released.
+        """
+
+        article_ids: list[int] = []
+        for record in records:
+            checked_out = self._checked_out.get(id(record))
+            if checked_out is not None and checked_out[1] is record:
+                article_id = checked_out[0]
+                self._articles[article_id] = self._build(article_id, record)
+            else:
+                article_id = self.add(record)
+            article_ids.append(article_id)
+        self._checked_out.clear()
+        return article_ids
+
+
+def articles_to_dicts(
+    store: ArticleStore, article_ids: Iterable[int]
+) -> list[dict[str, Any]]:
+    """Public-boundary conversion: plain dicts, detached from the store."""
+
+    return list(store.iter_records(article_ids))
+
+
+__all__ = [
+    "Article",
+    "ArticleStore",
+    "articles_to_dicts",
+]
@@ -0,0 +1,176 @@
+"""Streaming collection pipeline feeding the legacy graph process step.
+
+Sources yield articles as their responses land; each article is stamped,
+date-filtered and deduplicated immediately and then kept in a bounded
+newest-first buffer. The process step therefore receives an already-filtered
+list, and filtering work overlaps with the network waits of slower sources.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, MutableMapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Final, Literal
+
+from newsletter_core.application.article_dates import (
+    ArticleDateNormalizer,
+    is_missing_date,
+    timestamp_to_datetime,
+)
+from newsletter_core.application.article_dedupe import IncrementalArticleDeduper
+from newsletter_core.application.article_identity import stamp_article_identity
+from newsletter_core.application.source_tiers import stamp_source_tier
+
+ArticleRecord = dict[str, Any]
+DateBucket = Literal["recent", "missing", "unparseable", "expired"]
+
+# 날짜 없는 기사는 날짜 있는 기사 뒤, 그중 "날짜 없음"이 "파싱 실패"보다 앞 (기존 순서 유지)
+_UNDATED_RANK: Final[dict[str, int]] = {"missing": 1, "unparseable": 0}
+
+
+class IncrementalDateFilter:
+    """Classify articles against a fixed cutoff one at a time."""
+
+    def __init__(self, *, news_period_days: int, current_time: datetime) -> None:
+        self.cutoff = current_time - timedelta(days=news_period_days)
+        self._cutoff_timestamp = self.cutoff.timestamp()
+        self._normalizer = ArticleDateNormalizer(current_time)
+
+    def classify(
+        self, article: MutableMapping[str, Any]
+    ) -> tuple[DateBucket, datetime | None]:
+        """Stamp ``date_ts`` and return the date bucket and parsed date."""
+
+        timestamp = self._normalizer.stamp(article)
+        if is_missing_date(article.get("date")):
+            return "missing", None
+        if timestamp is None:
+            return "unparseable", None
+        parsed_date = timestamp_to_datetime(timestamp)
+        if timestamp >= self._cutoff_timestamp:
+            return "recent", parsed_date
+        return "expired", parsed_date
+
+
+@dataclass
+class ArticleStreamStats:
+    """Counters for one streaming collection run."""
+
+    received: int = 0
+    expired: int = 0
+    duplicates: int = 0
+    evicted: int = 0
+    peak_buffered: int = 0
+    duplicate_reasons: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def date_kept(self) -> int:
+        return self.received - self.expired
+
+    @property
+    def deduplicated(self) -> int:
+        return self.date_kept - self.duplicates
+
+
+class BoundedArticleBuffer:
+    """Keep at most ``max_articles`` articles, evicting the oldest first.
+
+    Ordering matches ``sort_articles_by_graph_date_desc`` applied to the
+    legacy filter output: dated articles newest first, then missing dates,
+    then unparseable dates, ties broken by arrival order.
+    """
+
+    def __init__(self, max_articles: int) -> None:
+        self.max_articles = max(1, int(max_articles))
+        self._heap: list[tuple[tuple[int, float, int, int], ArticleRecord]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(
+        self, article: ArticleRecord, bucket: DateBucket, parsed: datetime | None
+    ) -> ArticleRecord | None:
+        """Add ``article`` and return whichever article was evicted, if any."""
+
+        if parsed is not None:
+            key = (1, parsed.timestamp(), 0, -self._sequence)
+        else:
+            key = (0, 0.0, _UNDATED_RANK.get(bucket, 0), -self._sequence)
+        self._sequence += 1
+
+        entry = (key, article)
+        if len(self._heap) < self.max_articles:
+            heapq.heappush(self._heap, entry)
+            return None
+        evicted = heapq.heappushpop(self._heap, entry)
+        return evicted[1]
+
+    def drain(self) -> list[ArticleRecord]:
+        """Return buffered articles newest first and empty the buffer."""
+
+        entries = sorted(self._heap, key=lambda entry: entry[0], reverse=True)
+        self._heap = []
+        return [article for _, article in entries]
+
+
+@dataclass(frozen=True)
+class ArticleStreamResult:
+    """Filtered, deduplicated and date-sorted articles from a stream."""
+
+    articles: list[ArticleRecord]
+    stats: ArticleStreamStats
+
+
+def process_article_stream(
+    articles: Iterable[ArticleRecord],
+    *,
+    news_period_days: int,
+    current_time: datetime,
+    max_articles: int,
+) -> ArticleStreamResult:
+    """Consume an article stream through the incremental filter and deduper.
+
+    Only fingerprints, normalized titles and the bounded buffer are held, so
+    peak memory does not grow with the number of raw search results.
+    """
+
+    date_filter = IncrementalDateFilter(
+        news_period_days=news_period_days, current_time=current_time
+    )
+    deduper = IncrementalArticleDeduper()
+    buffer = BoundedArticleBuffer(max_articles)
+    stats = ArticleStreamStats()
+
+    for article in articles:
+        stats.received += 1
+        bucket, parsed = date_filter.classify(article)
+        if bucket == "expired":
+            stats.expired += 1
+            continue
+
+        stamp_article_identity(article)
+        reason = deduper.check(article)
+        if reason is not None:
+            stats.duplicates += 1
+            stats.duplicate_reasons[reason] = stats.duplicate_reasons.get(reason, 0) + 1
+            continue
+
+        stamp_source_tier(article)
+        if buffer.push(article, bucket, parsed) is not None:
+            stats.evicted += 1
+        stats.peak_buffered = max(stats.peak_buffered, len(buffer))
+
+    return ArticleStreamResult(articles=buffer.drain(), stats=stats)
+
+
+__all__ = [
+    "ArticleStreamResult",
+    "ArticleStreamStats",
+    "BoundedArticleBuffer",
+    "DateBucket",
+    "IncrementalDateFilter",
+    "process_article_stream",
+]
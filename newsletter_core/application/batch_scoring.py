@@ -0,0 +1,307 @@
+"""Batched multi-article LLM scoring.
+
+Per-article scoring sends the full instructions once per article, so 40
+articles cost 40 sequential round trips. Batched scoring packs several
+articles into one prompt, keeping each prompt under a rough token budget,
+and asks for a JSON array of ``{id, relevance, impact, novelty}`` objects.
+
+The reply is parsed leniently. Code fences and surrounding prose are
+ignored, and objects are still recovered when the array itself is broken.
+Each entry is validated against the IDs that were asked for. Articles whose
+entry is missing or invalid are re-asked together in a smaller batch.
+Articles that still fail are then scored one by one through the legacy
+per-article path, so every article ends up with the same
+``{"relevance", "impact", "novelty"}`` dict as before.
+
+By default prompts are sent one after another. A *run* callable (such as
+``ScoringExecutor.map``) can send them concurrently instead. It returns
+``None`` for calls that failed or missed the deadline, and those articles
+are scored by the *unscored* fallback.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Final
+
+from newsletter_core.public.settings import get_setting_value
+
+SCORE_KEYS: Final[tuple[str, ...]] = ("relevance", "impact", "novelty")
+DEFAULT_BATCH_SIZE: Final[int] = 10
+DEFAULT_TOKEN_BUDGET: Final[int] = 3000
+SUMMARY_CHAR_LIMIT: Final[int] = 500
+
+BATCH_SCORE_PROMPT = """
+You are a professional news editor. Evaluate each article below for the newsletter topic <DOMAIN>.
+Return only a JSON array with exactly one object per article, using the ids as given:
+[{{"id": 1, "relevance": 1-5, "impact": 1-5, "novelty": 1-5}}, ...]
+
+{articles}
+"""
+
+_ARRAY_PATTERN: Final[re.Pattern[str]] = re.compile(r"\[.*\]", re.DOTALL)
+_OBJECT_PATTERN: Final[re.Pattern[str]] = re.compile(r"\{[^{}]*\}")
+
+ScoreInvoker = Callable[[str], str]
+SingleScorer = Callable[[dict[str, Any]], dict[str, float]]
+CallRunner = Callable[[Sequence[Callable[[], Any]]], Sequence[Any]]
+
+
+def load_scoring_batch_size() -> int:
+    """Articles per scoring prompt from settings (``<= 1`` scores one by one)."""
+
+    return max(0, int(get_setting_value("SCORING_BATCH_SIZE", DEFAULT_BATCH_SIZE)))
+
+
+def load_scoring_token_budget() -> int:
+    return max(
+        1, int(get_setting_value("SCORING_BATCH_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET))
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 ASCII characters or 1 other character per token."""
+
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def format_batch_entry(article_id: int, article: Mapping[str, Any]) -> str:
+    summary = str(article.get("content") or article.get("snippet") or "")
+    if len(summary) > SUMMARY_CHAR_LIMIT:
+        summary = summary[:SUMMARY_CHAR_LIMIT] + "..."
+    return (
+        f"[id={article_id}]\n"
+        f"Title: {article.get('title', '')}\n"
+        f"Summary: {summary}"
+    )
+
+
+def pack_batches(
+    entries: Sequence[tuple[int, str]], *, max_articles: int, token_budget: int
+) -> Iterator[list[tuple[int, str]]]:
+    """Group ``(id, entry)`` pairs by article count and token budget.
+
+    An entry larger than the budget still gets a batch of its own.
+    """
+
+    batch: list[tuple[int, str]] = []
+    used = 0
+    for article_id, entry in entries:
+        cost = estimate_tokens(entry)
+        if batch and (len(batch) >= max_articles or used + cost > token_budget):
+            yield batch
+            batch, used = [], 0
+        batch.append((article_id, entry))
+        used += cost
+    if batch:
+        yield batch
+
+
+def _valid_scores(item: Mapping[str, Any]) -> dict[str, float] | None:
+    scores: dict[str, float] = {}
+    for key in SCORE_KEYS:
+        value = item.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if not math.isfinite(value) or not 1 <= value <= 5:
+            return None
+        scores[key] = value
+    return scores
+
+
+def _candidate_objects(text: str) -> list[Any]:
+    array_match = _ARRAY_PATTERN.search(text)
+    if array_match:
+        try:
+            parsed = json.loads(array_match.group(0))
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, list):
+            return parsed
+
+    objects: list[Any] = []
+    for match in _OBJECT_PATTERN.finditer(text):
+        try:
+            objects.append(json.loads(match.group(0)))
+        except ValueError:
+            continue
+    return objects
+
+
+def parse_batch_scores(
+    text: str, requested_ids: Sequence[int]
+) -> dict[int, dict[str, float]]:
+    """Valid scores keyed by requested ID; anything else is left out.
+
+    A reply for a single article may omit the ``id``.
+    """
+
+    wanted = set(requested_ids)
+    results: dict[int, dict[str, float]] = {}
+    for item in _candidate_objects(text):
+        if not isinstance(item, Mapping):
+            continue
+        raw_id = item.get("id")
+        if raw_id is None and len(wanted) == 1:
+            raw_id = next(iter(wanted))
+        try:
+            article_id = int(raw_id)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+        if article_id not in wanted or article_id in results:
+            continue
+        scores = _valid_scores(item)
+        if scores is not None:
+            results[article_id] = scores
+    return results
+
+
+@dataclass
+class BatchScoringReport:
+    """How the articles of one ``score_in_batches`` call were scored."""
+
+    prompts: int = 0
+    failed_prompts: int = 0
+    batched: int = 0
+    reasked: list[int] = field(default_factory=list)
+    fallback: list[int] = field(default_factory=list)
+    unscored: list[int] = field(default_factory=list)
+
+
+def _invoke_or_none(invoke: ScoreInvoker, prompt: str) -> str | None:
+    try:
+        return invoke(prompt)
+    except Exception:
+        # the batch's articles are re-asked, then scored one by one
+        return None
+
+
+def _ask(
+    entries: Sequence[tuple[int, str]],
+    domain: str,
+    invoke: ScoreInvoker,
+    *,
+    max_articles: int,
+    token_budget: int,
+    report: BatchScoringReport,
+    run: CallRunner | None,
+) -> dict[int, dict[str, float]]:
+    batches = list(
+        pack_batches(entries, max_articles=max_articles, token_budget=token_budget)
+    )
+    prompts = [
+        BATCH_SCORE_PROMPT.replace("<DOMAIN>", domain).format(
+            articles="\n\n".join(entry for _, entry in batch)
+        )
+        for batch in batches
+    ]
+    report.prompts += len(prompts)
+    if run is None:
+        replies = [_invoke_or_none(invoke, prompt) for prompt in prompts]
+    else:
+        replies = list(run([partial(invoke, prompt) for prompt in prompts]))
+
+    results: dict[int, dict[str, float]] = {}
+    for batch, reply in zip(batches, replies):
+        if reply is None:
+            report.failed_prompts += 1
+            continue
+        results.update(
+            parse_batch_scores(reply, [article_id for article_id, _ in batch])
+        )
+    return results
+
+
+def score_in_batches(
+    articles: Sequence[dict[str, Any]],
+    domain: str,
+    invoke: ScoreInvoker,
+    single: SingleScorer,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    run: CallRunner | None = None,
+    unscored: SingleScorer | None = None,
+) -> tuple[list[dict[str, float]], BatchScoringReport]:
+    """Scores for *articles* in input order, plus how they were obtained.
+
+    *invoke* sends one prompt and returns the reply text. *single* is the
+    per-article scorer, used only for articles the batches could not score.
+    When *run* is given, prompts and per-article calls go through it and
+    *unscored* scores the articles it returned no result for.
+    """
+
+    if run is not None and unscored is None:
+        raise ValueError("unscored is required when run is given")
+
+    report = BatchScoringReport()
+    entries = [
+        (article_id, format_batch_entry(article_id, article))
+        for article_id, article in enumerate(articles, start=1)
+    ]
+    results = _ask(
+        entries,
+        domain,
+        invoke,
+        max_articles=batch_size,
+        token_budget=token_budget,
+        report=report,
+        run=run,
+    )
+    report.batched = len(results)
+
+    missing = [entry for entry in entries if entry[0] not in results]
+    if missing:
+        report.reasked = [article_id for article_id, _ in missing]
+        results.update(
+            _ask(
+                missing,
+                domain,
+                invoke,
+                max_articles=max(1, batch_size // 2),
+                token_budget=token_budget,
+                report=report,
+                run=run,
+            )
+        )
+
+    fallback = [
+        (article_id, article)
+        for article_id, article in enumerate(articles, start=1)
+        if article_id not in results
+    ]
+    report.fallback = [article_id for article_id, _ in fallback]
+    if run is None:
+        singles = [single(article) for _, article in fallback]
+    else:
+        singles = list(run([partial(single, article) for _, article in fallback]))
+    for (article_id, article), article_scores in zip(fallback, singles):
+        if article_scores is None and unscored is not None:
+            report.unscored.append(article_id)
+            article_scores = unscored(article)
+        results[article_id] = article_scores
+
+    scores = [results[article_id] for article_id in range(1, len(articles) + 1)]
+    return scores, report
+
+
+__all__ = [
+    "BATCH_SCORE_PROMPT",
+    "BatchScoringReport",
+    "CallRunner",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_TOKEN_BUDGET",
+    "estimate_tokens",
+    "format_batch_entry",
+    "load_scoring_batch_size",
+    "load_scoring_token_budget",
+    "pack_batches",
+    "parse_batch_scores",
+    "score_in_batches",
+]
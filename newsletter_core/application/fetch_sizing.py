@@ -0,0 +1,200 @@
+"""Per-keyword fetch sizing from historical yield.
+
+Collection asks the search API for the same number of results for every
+keyword, but the share that survives date filtering, deduplication, source
+policies and article memory differs a lot between keywords. A
+``FetchYieldTracker`` records, per keyword, how many fetched articles made
+it into the ranked list of a run. The caller persists those counts per
+scope (schedule, preset or ad-hoc runs) and loads them for the next run.
+
+``FetchSizingPolicy`` turns that history into a request size. The
+historical yield is smoothed towards ``reference_yield`` so that a single
+run cannot swing the size. A keyword that is filtered down hard then gets
+more results, one that reliably over-delivers gets fewer, and the size is
+clamped so that no keyword is starved. Keywords without history keep the
+requested size.
+
+The tracker is bound to the running generation with ``use_fetch_tracker``
+and picked up by the search tools and graph nodes, like the article memory.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from newsletter_core.application.article_identity import article_identity
+from newsletter_core.public.settings import get_setting_value
+
+YieldLookup = Callable[[Sequence[str]], Mapping[str, tuple[float, float]]]
+
+DEFAULT_MIN_RESULTS: Final[int] = 5
+DEFAULT_MAX_RESULTS: Final[int] = 20
+REFERENCE_YIELD: Final[float] = 0.5
+PRIOR_WEIGHT: Final[float] = 10.0
+# Stored totals are multiplied by this on every update so recent runs dominate.
+YIELD_HISTORY_DECAY: Final[float] = 0.7
+
+_MIN_YIELD: Final[float] = 0.05
+
+
+@dataclass(frozen=True)
+class KeywordYield:
+    """Fetched vs. ranked article counts for one keyword (possibly decayed)."""
+
+    keyword: str
+    fetched: float
+    kept: float
+
+    @property
+    def ratio(self) -> float:
+        return self.kept / self.fetched if self.fetched > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class FetchSizingPolicy:
+    """Map a keyword's yield history to a per-keyword result count."""
+
+    min_results: int = DEFAULT_MIN_RESULTS
+    max_results: int = DEFAULT_MAX_RESULTS
+    reference_yield: float = REFERENCE_YIELD
+    prior_weight: float = PRIOR_WEIGHT
+
+    def smoothed_yield(self, history: KeywordYield) -> float:
+        prior = self.reference_yield * self.prior_weight
+        return (history.kept + prior) / (history.fetched + self.prior_weight)
+
+    def size_for(self, base: int, history: KeywordYield | None) -> int:
+        """Size that keeps ``base * reference_yield`` survivors, clamped."""
+
+        if history is None or history.fetched <= 0:
+            return base
+        target = base * self.reference_yield
+        size = math.ceil(target / max(self.smoothed_yield(history), _MIN_YIELD))
+        return max(self.min_results, min(self.max_results, size))
+
+
+def load_fetch_sizing_policy() -> FetchSizingPolicy | None:
+    """Policy from settings, or ``None`` when adaptive sizing is disabled."""
+
+    if not get_setting_value("ADAPTIVE_FETCH_SIZING", True):
+        return None
+    max_results = max(
+        1, int(get_setting_value("FETCH_RESULTS_MAX", DEFAULT_MAX_RESULTS))
+    )
+    min_results = int(get_setting_value("FETCH_RESULTS_MIN", DEFAULT_MIN_RESULTS))
+    return FetchSizingPolicy(
+        min_results=max(1, min(min_results, max_results)),
+        max_results=max_results,
+    )
+
+
+def _fingerprint(article: Mapping[str, Any]) -> str:
+    return article_identity(article).fingerprint
+
+
+@dataclass
+class FetchYieldTracker:
+    """Yield history, request sizes and this run's fetch/rank outcome.
+
+    ``lookup`` receives the keywords of a search request at once and returns
+    their stored ``(fetched, kept)`` totals; it is called once per request.
+    """
+
+    scope: str
+    lookup: YieldLookup
+    policy: FetchSizingPolicy = field(default_factory=FetchSizingPolicy)
+    requested: dict[str, int] = field(default_factory=dict)
+    _fetched: dict[str, set[str]] = field(default_factory=dict, repr=False)
+    _ranked: set[str] | None = field(default=None, repr=False)
+
+    def sizes(self, keywords: Sequence[str], base: int) -> dict[str, int]:
+        """Per-keyword result counts for one search request."""
+
+        history = self.lookup(list(dict.fromkeys(keywords)))
+        sizes: dict[str, int] = {}
+        for keyword in keywords:
+            totals = history.get(keyword)
+            keyword_yield = KeywordYield(keyword, *totals) if totals else None
+            sizes[keyword] = self.policy.size_for(base, keyword_yield)
+        self.requested.update(sizes)
+        return sizes
+
+    def record_fetched(
+        self, keyword: str, articles: Iterable[Mapping[str, Any]]
+    ) -> None:
+        fetched = self._fetched.setdefault(keyword, set())
+        fetched.update(_fingerprint(article) for article in articles)
+
+    def record_ranked(self, articles: Iterable[Mapping[str, Any]]) -> None:
+        self._ranked = {_fingerprint(article) for article in articles}
+
+    def yields(self) -> list[KeywordYield]:
+        """This run's per-keyword yield; empty until ranking has finished."""
+
+        if self._ranked is None:
+            return []
+        return [
+            KeywordYield(keyword, len(fetched), len(fetched & self._ranked))
+            for keyword, fetched in self._fetched.items()
+        ]
+
+
+_active_tracker: ContextVar[FetchYieldTracker | None] = ContextVar(
+    "fetch_yield_tracker", default=None
+)
+
+
+@contextmanager
+def use_fetch_tracker(tracker: FetchYieldTracker | None) -> Iterator[None]:
+    """Bind *tracker* to the generation running in the current context."""
+
+    token = _active_tracker.set(tracker)
+    try:
+        yield
+    finally:
+        _active_tracker.reset(token)
+
+
+def current_fetch_tracker() -> FetchYieldTracker | None:
+    return _active_tracker.get()
+
+
+def resolve_fetch_sizes(keywords: Sequence[str], base: int) -> dict[str, int] | None:
+    tracker = current_fetch_tracker()
+    return None if tracker is None else tracker.sizes(keywords, base)
+
+
+def record_fetched_articles(
+    keyword: str, articles: Iterable[Mapping[str, Any]]
+) -> None:
+    tracker = current_fetch_tracker()
+    if tracker is not None:
+        tracker.record_fetched(keyword, articles)
+
+
+def record_ranked_articles(articles: Iterable[Mapping[str, Any]]) -> None:
+    tracker = current_fetch_tracker()
+    if tracker is not None:
+        tracker.record_ranked(articles)
+
+
+__all__ = [
+    "DEFAULT_MAX_RESULTS",
+    "DEFAULT_MIN_RESULTS",
+    "FetchSizingPolicy",
+    "FetchYieldTracker",
+    "KeywordYield",
+    "YIELD_HISTORY_DECAY",
+    "YieldLookup",
+    "current_fetch_tracker",
+    "load_fetch_sizing_policy",
+    "record_fetched_articles",
+    "record_ranked_articles",
+    "resolve_fetch_sizes",
+    "use_fetch_tracker",
+]
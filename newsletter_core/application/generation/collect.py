@@ -1,6 +1,6 @@
 # flake8: noqa
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 from rich.console import Console
@@ -19,6 +19,7 @@ def collect_articles(
     filter_duplicates: bool = True,
     group_by_keywords: bool = True,
     use_major_sources_filter: bool = True,
+    news_period_days: Optional[int] = None,
 ) -> Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
     """
     Collect news articles from multiple sources based on keywords.
@@ -35,12 +36,13 @@ def collect_articles(
         filter_duplicates: Whether to filter duplicate articles (default: True)
         group_by_keywords: Whether to group articles by keywords (default: True)
         use_major_sources_filter: Whether to prioritize major news sources (default: True)
+        news_period_days: Date window applied when RSS is answered from the local news index (default: None)
 
     Returns:
         List of article dictionaries with standardized format, or a dictionary of articles grouped by keywords
     """
     # 다양한 뉴스 소스를 관리하는 매니저 생성
-    source_manager = configure_default_sources()
+    source_manager = configure_default_sources(news_period_days=news_period_days)
 
     if not source_manager.sources:
         console.print(
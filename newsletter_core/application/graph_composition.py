@@ -80,12 +80,16 @@ def build_summarize_result_state(
         article_count=plan["article_count"],
         generated_at=generated_at,
     )
+    category_latencies = (
+        result.get("category_latencies") if isinstance(result, dict) else None
+    )
     return build_summarize_success_state(
         state,
         newsletter_html=newsletter_html,
         category_summaries=category_summaries,
         newsletter_topic=newsletter_topic,
         elapsed=elapsed,
+        category_latencies=category_latencies or None,
     )
 
 
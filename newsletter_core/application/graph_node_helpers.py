@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, cast
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Literal, Optional, cast
 
-from newsletter_core.application.graph_workflow import (
-    NewsletterState,
-    parse_graph_article_date,
+from newsletter_core.application.article_dates import (
+    ArticleDateNormalizer,
+    is_missing_date,
+    stamp_article_dates,
 )
+from newsletter_core.application.article_identity import stamp_article_identities
+from newsletter_core.application.article_store import ArticleStore, articles_to_dicts
+from newsletter_core.application.article_stream import ArticleStreamResult
+from newsletter_core.application.graph_workflow import NewsletterState
+from newsletter_core.application.source_tiers import stamp_source_tiers
 
 ArticleRecord = Dict[str, Any]
+ArticleStage = Literal["collected", "processed", "ranked"]
 
 _COMPOSE_FALLBACK_HTML = "<html><body>Newsletter generation failed</body></html>"
 
@@ -31,6 +38,45 @@ def _with_step_time(
     return cast(NewsletterState, updated_state)
 
 
+def resolve_article_store(state: NewsletterState) -> ArticleStore:
+    """Return the run's article store, creating one for hand-built states."""
+    store = state.get("article_store")
+    return store if store is not None else ArticleStore()
+
+
+def resolve_state_articles(
+    state: NewsletterState,
+    stage: ArticleStage,
+    *,
+    checkout: bool = True,
+) -> List[ArticleRecord]:
+    """Materialize the articles of one stage as dicts.
+
+    States built by the graph hold article IDs into ``article_store``; states
+    seeded by callers may still carry plain dict lists, which are used as-is.
+    ``checkout=False`` returns detached copies for read-only use.
+    """
+    values = cast(Dict[str, Any], state)
+    article_ids = values.get(f"{stage}_article_ids")
+    store = state.get("article_store")
+    if article_ids is not None and store is not None:
+        if checkout:
+            return store.records(article_ids)
+        return articles_to_dicts(store, article_ids)
+    return list(values.get(f"{stage}_articles") or [])
+
+
+def _article_updates(
+    state: NewsletterState, stage: ArticleStage, articles: List[ArticleRecord]
+) -> Dict[str, Any]:
+    store = resolve_article_store(state)
+    return {
+        "article_store": store,
+        f"{stage}_article_ids": store.commit(articles),
+        f"{stage}_articles": None,
+    }
+
+
 def build_collect_keyword_query(keywords: List[str]) -> str:
     """Build the legacy Serper query string from graph keywords."""
     return ", ".join(keywords)
@@ -56,13 +102,46 @@ def build_collect_success_state(
     articles: List[ArticleRecord],
     elapsed: float,
 ) -> NewsletterState:
-    """Update graph state after successful article collection."""
+    """Update graph state after collection, stamping identity, tier and date once."""
     return _with_step_time(
         state,
         step_name="collect_articles",
         elapsed=elapsed,
         updates={
-            "collected_articles": articles,
+            **_article_updates(
+                state,
+                "collected",
+                stamp_article_dates(
+                    stamp_source_tiers(stamp_article_identities(articles))
+                ),
+            ),
+            "status": "processing",
+        },
+    )
+
+
+def build_collect_stream_success_state(
+    state: NewsletterState,
+    *,
+    stream_result: ArticleStreamResult,
+    elapsed: float,
+) -> NewsletterState:
+    """Update graph state after streaming collection with prefiltered articles."""
+    stats = stream_result.stats
+    return _with_step_time(
+        state,
+        step_name="collect_articles",
+        elapsed=elapsed,
+        updates={
+            **_article_updates(state, "collected", stream_result.articles),
+            "article_stream_stats": {
+                "received": stats.received,
+                "date_kept": stats.date_kept,
+                "deduplicated": stats.deduplicated,
+                "evicted": stats.evicted,
+                "peak_buffered": stats.peak_buffered,
+                "duplicate_reasons": dict(stats.duplicate_reasons),
+            },
             "status": "processing",
         },
     )
@@ -81,6 +160,7 @@ def build_collect_error_state(
         elapsed=elapsed,
         updates={
             "collected_articles": [],
+            "collected_article_ids": [],
             "error": error_message,
             "status": "error",
         },
@@ -97,20 +177,20 @@ def filter_articles_for_processing(
     articles_within_date_range: List[ArticleRecord] = []
     articles_with_missing_date: List[ArticleRecord] = []
     articles_with_unparseable_date: List[ArticleRecord] = []
-    cutoff_date = current_time - timedelta(days=news_period_days)
+    normalizer = ArticleDateNormalizer(current_time)
+    cutoff_timestamp = (current_time - timedelta(days=news_period_days)).timestamp()
 
     for article in collected_articles:
-        date_str = article.get("date")
-        if not date_str or date_str == "날짜 없음":
+        if is_missing_date(article.get("date")):
             articles_with_missing_date.append(article)
             continue
 
-        parsed_date = parse_graph_article_date(date_str)
-        if parsed_date is None:
+        timestamp = normalizer.timestamp(article)
+        if timestamp is None:
             articles_with_unparseable_date.append(article)
             continue
 
-        if parsed_date >= cutoff_date:
+        if timestamp >= cutoff_timestamp:
             articles_within_date_range.append(article)
 
     return (
@@ -123,13 +203,14 @@ def filter_articles_for_processing(
 def sort_articles_by_graph_date_desc(
     articles: List[ArticleRecord],
 ) -> List[ArticleRecord]:
-    """Sort articles by parsed graph date, newest first."""
-    return sorted(
-        articles,
-        key=lambda article: parse_graph_article_date(article.get("date", ""))
-        or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
+    """Sort articles by their (stamped) graph date, newest first."""
+    normalizer = ArticleDateNormalizer()
+
+    def _sort_key(article: ArticleRecord) -> float:
+        timestamp = normalizer.timestamp(article)
+        return float("-inf") if timestamp is None else timestamp
+
+    return sorted(articles, key=_sort_key, reverse=True)
 
 
 def build_process_missing_articles_state(state: NewsletterState) -> NewsletterState:
@@ -139,6 +220,7 @@ def build_process_missing_articles_state(state: NewsletterState) -> NewsletterSt
         {
             **state,
             "processed_articles": [],
+            "processed_article_ids": [],
             "status": "error",
             "error": "수집된 기사가 없습니다.",
         },
@@ -157,7 +239,7 @@ def build_process_success_state(
         step_name="process_articles",
         elapsed=elapsed,
         updates={
-            "processed_articles": processed_articles,
+            **_article_updates(state, "processed", processed_articles),
             "status": "scoring",
         },
     )
@@ -175,6 +257,7 @@ def build_score_missing_articles_state(
         elapsed=elapsed,
         updates={
             "ranked_articles": [],
+            "ranked_article_ids": [],
             "status": "error",
             "error": "스코어링할 기사가 없습니다.",
         },
@@ -198,7 +281,7 @@ def build_score_success_state(
         step_name="score_articles",
         elapsed=elapsed,
         updates={
-            "ranked_articles": ranked_articles,
+            **_article_updates(state, "ranked", ranked_articles),
             "status": "scoring_complete",
         },
     )
@@ -217,6 +300,7 @@ def build_score_error_state(
         elapsed=elapsed,
         updates={
             "ranked_articles": [],
+            "ranked_article_ids": [],
             "status": "error",
             "error": error_message,
         },
@@ -254,18 +338,22 @@ def build_summarize_success_state(
     category_summaries: Dict[str, Any],
     newsletter_topic: str,
     elapsed: float,
+    category_latencies: Optional[List[Dict[str, Any]]] = None,
 ) -> NewsletterState:
     """Update graph state after summary generation succeeds."""
+    updates: Dict[str, Any] = {
+        "newsletter_html": newsletter_html,
+        "category_summaries": category_summaries,
+        "newsletter_topic": newsletter_topic,
+        "status": "summarizing_complete",
+    }
+    if category_latencies is not None:
+        updates["category_latencies"] = category_latencies
     return _with_step_time(
         state,
         step_name="summarize",
         elapsed=elapsed,
-        updates={
-            "newsletter_html": newsletter_html,
-            "category_summaries": category_summaries,
-            "newsletter_topic": newsletter_topic,
-            "status": "summarizing_complete",
-        },
+        updates=updates,
     )
 
 
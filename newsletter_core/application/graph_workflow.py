@@ -6,10 +6,16 @@ from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 from newsletter.date_utils import parse_date_string
+from newsletter_core.application.article_store import ArticleStore
 
 
 class NewsletterState(TypedDict):
-    """Shared workflow state for newsletter generation."""
+    """Shared workflow state for newsletter generation.
+
+    Articles live once in ``article_store``; the ``*_article_ids`` lists
+    reference them by ID. The ``*_articles`` dict lists are only read as
+    input when a caller seeds the state with plain dicts.
+    """
 
     keywords: List[str]
     news_period_days: int
@@ -19,8 +25,14 @@ class NewsletterState(TypedDict):
     collected_articles: Optional[List[Dict[str, Any]]]
     processed_articles: Optional[List[Dict[str, Any]]]
     ranked_articles: Optional[List[Dict[str, Any]]]
+    article_store: Optional[ArticleStore]
+    collected_article_ids: Optional[List[int]]
+    processed_article_ids: Optional[List[int]]
+    ranked_article_ids: Optional[List[int]]
+    article_stream_stats: Optional[Dict[str, Any]]
     article_summaries: Optional[Dict[str, Any]]
     category_summaries: Optional[Dict[str, Any]]
+    category_latencies: Optional[List[Dict[str, Any]]]
     newsletter_topic: Optional[str]
     newsletter_html: Optional[str]
     error: Optional[str]
@@ -51,7 +63,8 @@ def route_after_process(
     """Route after processing based on processed article availability."""
     if state.get("status") == "error":
         return "handle_error"
-    return "score_articles" if state.get("processed_articles") else "handle_error"
+    has_articles = state.get("processed_article_ids") or state.get("processed_articles")
+    return "score_articles" if has_articles else "handle_error"
 
 
 def route_after_score(
@@ -97,8 +110,14 @@ def build_initial_graph_state(
         "collected_articles": None,
         "processed_articles": None,
         "ranked_articles": None,
+        "article_store": ArticleStore(),
+        "collected_article_ids": None,
+        "processed_article_ids": None,
+        "ranked_article_ids": None,
+        "article_stream_stats": None,
         "article_summaries": None,
         "category_summaries": None,
+        "category_latencies": None,
         "newsletter_html": None,
         "error": None,
         "status": "collecting",
@@ -189,6 +208,8 @@ def build_generation_info(
         "step_times": final_state.get("step_times", {}),
         "total_time": final_state.get("total_time"),
     }
+    if final_state.get("category_latencies"):
+        generation_info["category_latencies"] = final_state["category_latencies"]
     if cost_summary:
         generation_info["cost_summary"] = cost_summary
     return generation_info
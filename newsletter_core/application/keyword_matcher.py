@@ -0,0 +1,295 @@
+"""Multi-pattern keyword matching for article grouping and RSS filtering.
+
+``KeywordMatcher`` compiles every keyword and synonym variant into one
+Aho-Corasick automaton so a single pass over an article answers which
+keywords it mentions and where. Hangul (and other non-ASCII) variants keep
+substring semantics; ASCII variants only match at word boundaries, where a
+boundary is any character that is not an ASCII letter or digit so Korean
+particles such as ``HBM을`` still count. Multi-token variants can fall back
+to a proximity check over a positional token index.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import merge
+from typing import Final
+
+DEFAULT_PROXIMITY_WINDOW: Final[int] = 5
+
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"[가-힣a-zA-Z0-9]+")
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One keyword occurrence; ``start``/``end`` index the lower-cased text."""
+
+    keyword: str
+    variant: str
+    start: int
+    end: int
+    proximity: bool = False
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    keyword_index: int
+    variant: str
+    length: int
+    word_boundary: bool
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class PositionalTokenIndex:
+    """Token -> sorted positions map for proximity checks on one text."""
+
+    def __init__(self, text: str) -> None:
+        self._positions: dict[str, list[int]] = {}
+        self._spans: list[tuple[int, int]] = []
+        for position, match in enumerate(_TOKEN_PATTERN.finditer(text.lower())):
+            self._positions.setdefault(match.group(), []).append(position)
+            self._spans.append(match.span())
+
+    def contains(self, token: str) -> bool:
+        return token in self._positions
+
+    def window(self, tokens: Sequence[str], window: int) -> tuple[int, int] | None:
+        """Return the character span of the tightest window holding every token.
+
+        Equivalent to checking every combination of token positions for
+        ``max - min <= window``, but done as a sliding window over the merged
+        position lists in ``O(n log k)``.
+        """
+
+        required = list(dict.fromkeys(tokens))
+        postings = [self._positions.get(token) for token in required]
+        if not required or any(not positions for positions in postings):
+            return None
+
+        counts = [0] * len(required)
+        covered = 0
+        queue: deque[tuple[int, int]] = deque()
+        best: tuple[int, int] | None = None
+        merged = merge(
+            *(
+                [(position, token_index) for position in positions or ()]
+                for token_index, positions in enumerate(postings)
+            )
+        )
+        for position, token_index in merged:
+            queue.append((position, token_index))
+            if counts[token_index] == 0:
+                covered += 1
+            counts[token_index] += 1
+            while queue and counts[queue[0][1]] > 1:
+                counts[queue.popleft()[1]] -= 1
+            if covered == len(required):
+                first = queue[0][0]
+                if position - first <= window and (
+                    best is None or position - first < best[1] - best[0]
+                ):
+                    best = (first, position)
+        if best is None:
+            return None
+        return self._spans[best[0]][0], self._spans[best[1]][1]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a keyword set and its synonym variants.
+
+    Args:
+        keywords: Keywords in priority order.
+        synonyms: Optional keyword -> variants mapping; a keyword without an
+            entry matches only itself.
+        ignore_spaces: Also match variants with spaces removed against the
+            text with spaces removed (``AI 반도체`` vs ``AI반도체``).
+        ascii_word_boundaries: Require word boundaries around ASCII variants;
+            ``False`` gives plain substring semantics for every variant.
+        proximity_window: Token distance for the multi-token fallback;
+            ``None`` disables it.
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        synonyms: Mapping[str, Sequence[str]] | None = None,
+        *,
+        ignore_spaces: bool = False,
+        ascii_word_boundaries: bool = True,
+        proximity_window: int | None = None,
+    ) -> None:
+        self.keywords: tuple[str, ...] = tuple(keywords)
+        self.ignore_spaces = ignore_spaces
+        self.ascii_word_boundaries = ascii_word_boundaries
+        self.proximity_window = proximity_window
+        self._keyword_positions: dict[str, int] = {}
+        for position, keyword in enumerate(self.keywords):
+            self._keyword_positions.setdefault(keyword, position)
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[_Pattern]] = [[]]
+        self._proximity_variants: list[tuple[int, str, tuple[str, ...]]] = []
+
+        for keyword in dict.fromkeys(self.keywords):
+            variants = (synonyms or {}).get(keyword) or [keyword]
+            for variant in dict.fromkeys(variants):
+                self._add_variant(self._keyword_positions[keyword], variant)
+        self._build_failure_links()
+
+    def _add_variant(self, keyword_index: int, variant: str) -> None:
+        text = variant.lower()
+        if self.ignore_spaces:
+            text = text.replace(" ", "")
+        if not text:
+            return
+
+        state = 0
+        for char in text:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(
+            _Pattern(
+                keyword_index=keyword_index,
+                variant=variant,
+                length=len(text),
+                word_boundary=self.ascii_word_boundaries and text.isascii(),
+            )
+        )
+
+        tokens = tuple(_tokenize(variant))
+        if self.proximity_window is not None and len(tokens) > 1:
+            self._proximity_variants.append((keyword_index, variant, tokens))
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    def iter_hits(self, text: str) -> Iterable[KeywordHit]:
+        """Yield every boundary-respecting occurrence in one pass over ``text``."""
+
+        lowered = text.lower()
+        offsets: list[int] = []
+        state = 0
+        for index, char in enumerate(lowered):
+            if self.ignore_spaces and char == " ":
+                continue
+            offsets.append(index)
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._outputs[state]:
+                start = offsets[-pattern.length]
+                if pattern.word_boundary and (
+                    (start > 0 and _is_ascii_word_char(lowered[start - 1]))
+                    or (
+                        index + 1 < len(lowered)
+                        and _is_ascii_word_char(lowered[index + 1])
+                    )
+                ):
+                    continue
+                yield KeywordHit(
+                    keyword=self.keywords[pattern.keyword_index],
+                    variant=pattern.variant,
+                    start=start,
+                    end=index + 1,
+                )
+
+    def match(self, text: str) -> dict[str, KeywordHit]:
+        """Return the first hit per matching keyword, in keyword order."""
+
+        first_hits: dict[int, KeywordHit] = {}
+        for hit in self.iter_hits(text):
+            first_hits.setdefault(self._keyword_positions[hit.keyword], hit)
+
+        pending = [
+            variant
+            for variant in self._proximity_variants
+            if variant[0] not in first_hits
+        ]
+        if pending and self.proximity_window is not None:
+            index = PositionalTokenIndex(text)
+            for position, variant, tokens in pending:
+                if position in first_hits:
+                    continue
+                span = index.window(tokens, self.proximity_window)
+                if span is not None:
+                    first_hits[position] = KeywordHit(
+                        keyword=self.keywords[position],
+                        variant=variant,
+                        start=span[0],
+                        end=span[1],
+                        proximity=True,
+                    )
+
+        return {
+            self.keywords[position]: first_hits[position]
+            for position in sorted(first_hits)
+        }
+
+    def first_keyword(self, text: str) -> str | None:
+        """Return the highest-priority keyword found in ``text``, if any."""
+
+        best: int | None = None
+        for hit in self.iter_hits(text):
+            position = self._keyword_positions[hit.keyword]
+            if best is None or position < best:
+                best = position
+                if best == 0:
+                    break
+        return None if best is None else self.keywords[best]
+
+
+@lru_cache(maxsize=64)
+def compile_keyword_matcher(
+    keywords: tuple[str, ...],
+    synonyms: tuple[tuple[str, tuple[str, ...]], ...] = (),
+    *,
+    ignore_spaces: bool = False,
+    ascii_word_boundaries: bool = True,
+    proximity_window: int | None = None,
+) -> KeywordMatcher:
+    """Build (or reuse) a matcher for a hashable keyword/synonym set."""
+
+    return KeywordMatcher(
+        keywords,
+        dict(synonyms),
+        ignore_spaces=ignore_spaces,
+        ascii_word_boundaries=ascii_word_boundaries,
+        proximity_window=proximity_window,
+    )
+
+
+__all__ = [
+    "DEFAULT_PROXIMITY_WINDOW",
+    "KeywordHit",
+    "KeywordMatcher",
+    "PositionalTokenIndex",
+    "compile_keyword_matcher",
+]
@@ -0,0 +1,42 @@
+"""Per-provider limits on concurrent LLM calls.
+
+``llm_settings.provider_limits`` maps a provider name to its
+``max_concurrency``. Any stage that fans LLM calls out over a thread pool
+(article scoring, category summarization) sizes the pool from the provider
+that serves its task, so every stage respects the same configured limit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Final
+
+from newsletter_core.application.llm_factory import resolve_task_model_config
+
+# Used when ``llm_settings.provider_limits`` has no entry for the provider.
+DEFAULT_PROVIDER_CONCURRENCY: Final[Mapping[str, int]] = {
+    "gemini": 4,
+    "openai": 8,
+    "anthropic": 4,
+}
+_FALLBACK_CONCURRENCY: Final[int] = 2
+
+
+def resolve_provider_concurrency(llm_config: Mapping[str, Any], task: str) -> int:
+    """``max_concurrency`` of the provider that serves *task*."""
+
+    provider = resolve_task_model_config(llm_config, task).get("provider")
+    limits = llm_config.get("provider_limits")
+    entry = limits.get(provider) if isinstance(limits, Mapping) else None
+    if isinstance(entry, Mapping):
+        try:
+            return max(1, int(entry["max_concurrency"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+    return DEFAULT_PROVIDER_CONCURRENCY.get(str(provider), _FALLBACK_CONCURRENCY)
+
+
+__all__ = [
+    "DEFAULT_PROVIDER_CONCURRENCY",
+    "resolve_provider_concurrency",
+]
@@ -0,0 +1,220 @@
+"""Bounded-concurrency executor for LLM scoring calls.
+
+Scoring one article (or one batch prompt) at a time makes the wall time the
+sum of every LLM latency. ``ScoringExecutor`` runs the calls on a thread
+pool. The pool size is the caller's choice (usually the provider limit from
+:mod:`newsletter_core.application.llm_concurrency`), and results are returned in input order
+whatever order the calls finish in.
+
+The deadline is counted from the executor's creation, so several ``map``
+calls (batch prompts, then their re-asks) share one time budget.
+
+A rate-limited call (HTTP 429 or a provider "resource exhausted" error) is
+retried with exponential backoff. The backoff also pauses every other
+worker through a shared gate, so the pool slows down as a whole instead of
+each worker hammering the provider. Once the deadline passes, calls that
+have not started are cancelled and the results of calls still running are
+ignored. Such slots come back as ``None`` so the caller can fall back to a
+heuristic score.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Final, Generic, TypeVar
+
+from newsletter_core.public.settings import get_setting_value
+
+T = TypeVar("T")
+
+DEFAULT_DEADLINE_SECONDS: Final[float] = 90.0
+DEFAULT_RATE_LIMIT_RETRIES: Final[int] = 3
+BASE_BACKOFF_SECONDS: Final[float] = 1.0
+MAX_BACKOFF_SECONDS: Final[float] = 30.0
+
+_RATE_LIMIT_MARKERS: Final[tuple[str, ...]] = (
+    "429",
+    "rate limit",
+    "ratelimit",
+    "resource exhausted",
+    "resourceexhausted",
+    "too many requests",
+)
+
+
+def load_scoring_deadline_seconds() -> float | None:
+    """Scoring deadline from settings (``0`` or less means no deadline)."""
+
+    deadline = float(
+        get_setting_value("SCORING_DEADLINE_SECONDS", DEFAULT_DEADLINE_SECONDS)
+    )
+    return deadline if deadline > 0 else None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Best-effort 429 detection across the OpenAI/Anthropic/Gemini clients."""
+
+    for source in (exc, getattr(exc, "response", None)):
+        if getattr(source, "status_code", None) == 429:
+            return True
+    text = f"{type(exc).__name__} {exc}".lower()
+    return any(marker in text for marker in _RATE_LIMIT_MARKERS)
+
+
+class _BackoffGate:
+    """Shared pause that every worker honours before starting a call."""
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def delay(self) -> float:
+        with self._lock:
+            return max(0.0, self._resume_at - self._clock())
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, self._clock() + seconds)
+
+
+@dataclass
+class ExecutorReport:
+    """Outcome counts of one ``ScoringExecutor.map`` call."""
+
+    completed: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    timed_out: int = 0
+
+
+@dataclass(frozen=True)
+class _Failure:
+    error: BaseException
+
+
+class ScoringExecutor(Generic[T]):
+    """Run zero-argument calls concurrently, in order, under a deadline."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        deadline_seconds: float | None = DEFAULT_DEADLINE_SECONDS,
+        max_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+        base_backoff: float = BASE_BACKOFF_SECONDS,
+        max_backoff: float = MAX_BACKOFF_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.deadline_seconds = deadline_seconds
+        self.max_retries = max(0, int(max_retries))
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._deadline_at = (
+            None if deadline_seconds is None else clock() + deadline_seconds
+        )
+        self.report = ExecutorReport()
+        self.errors: list[BaseException] = []
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline (``None`` without a deadline)."""
+
+        if self._deadline_at is None:
+            return None
+        return max(0.0, self._deadline_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.base_backoff * (2**attempt))
+        return float(delay * (0.5 + random.random() / 2))
+
+    def _run(
+        self,
+        call: Callable[[], T],
+        gate: _BackoffGate,
+        stop: threading.Event,
+    ) -> T | _Failure | None:
+        attempt = 0
+        while not stop.is_set():
+            wait_for = gate.delay()
+            if wait_for > 0:
+                self._sleep(wait_for)
+                continue
+            try:
+                return call()
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt >= self.max_retries:
+                    return _Failure(exc)
+                gate.pause(self._backoff(attempt))
+                attempt += 1
+                with self._lock:
+                    self.report.rate_limited += 1
+        return None
+
+    def map(self, calls: Sequence[Callable[[], T]]) -> list[T | None]:
+        """Results in input order; ``None`` for failed or timed-out calls.
+
+        ``report`` and ``errors`` accumulate over every call of the executor.
+        """
+
+        results: list[T | None] = [None] * len(calls)
+        if not calls:
+            return results
+        if self.expired:
+            self.report.timed_out += len(calls)
+            return results
+
+        gate = _BackoffGate(self._clock)
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(calls)),
+            thread_name_prefix="llm-scoring",
+        )
+        try:
+            futures: dict[Future[T | _Failure | None], int] = {
+                pool.submit(self._run, call, gate, stop): index
+                for index, call in enumerate(calls)
+            }
+            pending = set(futures)
+            while pending:
+                timeout = self.remaining()
+                if timeout == 0.0:
+                    break
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    outcome = future.result()
+                    if isinstance(outcome, _Failure):
+                        self.report.failed += 1
+                        self.errors.append(outcome.error)
+                    elif outcome is not None:
+                        results[futures[future]] = outcome
+                        self.report.completed += 1
+            self.report.timed_out += len(pending)
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
+
+
+__all__ = [
+    "DEFAULT_DEADLINE_SECONDS",
+    "ExecutorReport",
+    "ScoringExecutor",
+    "is_rate_limit_error",
+    "load_scoring_deadline_seconds",
+]
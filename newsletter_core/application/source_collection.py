@@ -0,0 +1,195 @@
+"""Parallel collection engine for the legacy news source manager."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Final, Literal
+
+_POLL_INTERVAL_SECONDS: Final[float] = 0.05
+
+SourceCollectionStatus = Literal["ok", "error", "timeout", "skipped"]
+
+
+@dataclass(frozen=True)
+class SourceTaskOutput:
+    """Articles and per-keyword yield produced by one collection task."""
+
+    articles: list[dict[str, Any]]
+    keyword_counts: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SourceCollectionTask:
+    """One independently schedulable unit of source collection work."""
+
+    name: str
+    fetch: Callable[[], SourceTaskOutput]
+
+
+@dataclass(frozen=True)
+class SourceCollectionReport:
+    """Latency and yield of one collection task."""
+
+    name: str
+    status: SourceCollectionStatus
+    elapsed_seconds: float
+    article_count: int = 0
+    keyword_counts: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class SourceCollectionResult:
+    """Partial-result aware outcome of a parallel collection run."""
+
+    articles: list[dict[str, Any]]
+    reports: tuple[SourceCollectionReport, ...]
+    elapsed_seconds: float
+    budget_exhausted: bool
+
+    @property
+    def keyword_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for report in self.reports:
+            for keyword, count in report.keyword_counts.items():
+                counts[keyword] = counts.get(keyword, 0) + count
+        return counts
+
+    @property
+    def dropped_sources(self) -> tuple[str, ...]:
+        return tuple(report.name for report in self.reports if report.status != "ok")
+
+
+def run_source_collection(
+    tasks: Sequence[SourceCollectionTask],
+    *,
+    max_workers: int,
+    source_timeout: float,
+    total_budget: float,
+    clock: Callable[[], float] = time.monotonic,
+) -> SourceCollectionResult:
+    """Run collection tasks in parallel, dropping ones that miss their deadline.
+
+    Each task gets ``source_timeout`` seconds from the moment it starts and the
+    whole run is capped at ``total_budget`` seconds. Tasks that miss either
+    deadline are reported as ``timeout`` (or ``skipped`` when they never
+    started) and their late results are discarded; articles from finished
+    tasks are returned in task order.
+    """
+
+    begin = clock()
+    if not tasks:
+        return SourceCollectionResult(
+            articles=[], reports=(), elapsed_seconds=0.0, budget_exhausted=False
+        )
+
+    started_at: dict[int, float] = {}
+    outputs: dict[int, SourceTaskOutput] = {}
+    reports: dict[int, SourceCollectionReport] = {}
+
+    def _run(index: int) -> tuple[SourceTaskOutput, float]:
+        started_at[index] = clock()
+        output = tasks[index].fetch()
+        return output, clock() - started_at[index]
+
+    workers = min(max(1, int(max_workers)), len(tasks))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news-source")
+    futures: dict[Future[tuple[SourceTaskOutput, float]], int] = {
+        pool.submit(_run, index): index for index in range(len(tasks))
+    }
+    pending = set(futures)
+    budget_deadline = begin + max(0.0, float(total_budget))
+    budget_exhausted = False
+
+    try:
+        while pending:
+            now = clock()
+            for future in list(pending):
+                index = futures[future]
+                started = started_at.get(index)
+                if (
+                    started is not None
+                    and not future.done()
+                    and now - started >= source_timeout
+                ):
+                    pending.discard(future)
+                    reports[index] = SourceCollectionReport(
+                        name=tasks[index].name,
+                        status="timeout",
+                        elapsed_seconds=now - started,
+                        error=f"source deadline of {source_timeout:g}s exceeded",
+                    )
+            if not pending:
+                break
+            if now >= budget_deadline:
+                budget_exhausted = True
+                break
+
+            running_deadlines = [
+                started_at[futures[future]] + source_timeout
+                for future in pending
+                if futures[future] in started_at
+            ]
+            next_deadline = min([budget_deadline, *running_deadlines])
+            timeout = min(max(0.0, next_deadline - now), _POLL_INTERVAL_SECONDS)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                pending.discard(future)
+                index = futures[future]
+                try:
+                    output, elapsed = future.result()
+                except Exception as exc:  # noqa: BLE001 - isolate one source failure
+                    reports[index] = SourceCollectionReport(
+                        name=tasks[index].name,
+                        status="error",
+                        elapsed_seconds=clock() - started_at.get(index, begin),
+                        error=str(exc),
+                    )
+                    continue
+                outputs[index] = output
+                reports[index] = SourceCollectionReport(
+                    name=tasks[index].name,
+                    status="ok",
+                    elapsed_seconds=elapsed,
+                    article_count=len(output.articles),
+                    keyword_counts=dict(output.keyword_counts),
+                )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    end = clock()
+    for future in pending:
+        index = futures[future]
+        started = started_at.get(index)
+        reports[index] = SourceCollectionReport(
+            name=tasks[index].name,
+            status="skipped" if started is None else "timeout",
+            elapsed_seconds=0.0 if started is None else end - started,
+            error="collection budget exhausted",
+        )
+
+    return SourceCollectionResult(
+        articles=[
+            article
+            for index in range(len(tasks))
+            if index in outputs
+            for article in outputs[index].articles
+        ],
+        reports=tuple(reports[index] for index in range(len(tasks))),
+        elapsed_seconds=end - begin,
+        budget_exhausted=budget_exhausted,
+    )
+
+
+__all__ = [
+    "SourceCollectionReport",
+    "SourceCollectionResult",
+    "SourceCollectionStatus",
+    "SourceCollectionTask",
+    "SourceTaskOutput",
+    "run_source_collection",
+]
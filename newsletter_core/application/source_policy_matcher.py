@@ -0,0 +1,293 @@
+"""Compiled source allow/block policies.
+
+Policies are normalized once and compiled into two indexes. Dotted patterns
+(``reuters.com``) go into a trie keyed by reversed host labels, so a host is
+checked against every dotted pattern in one walk over its own labels. Bare
+patterns (``reuters``) keep substring semantics and share one Aho-Corasick
+automaton. Compiled policies are cached by the version stamp of the policy
+source (the ``source_policies`` table), and every lookup reports the rule
+that decided it.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Final
+from urllib.parse import urlparse
+
+from newsletter_core.application.article_identity import CANONICAL_HOST_FIELD
+from newsletter_core.application.keyword_matcher import KeywordMatcher
+
+POLICY_ALLOW: Final[str] = "allow"
+POLICY_BLOCK: Final[str] = "block"
+
+_SCHEME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^https?://")
+_WWW_PATTERN: Final[re.Pattern[str]] = re.compile(r"^www\.")
+_VERSIONED_CACHE_LIMIT: Final[int] = 16
+
+
+def normalize_source_pattern(value: str) -> str:
+    """Normalize a domain/source pattern for allow/block list matching."""
+    normalized = str(value or "").strip().lower()
+    normalized = _SCHEME_PATTERN.sub("", normalized)
+    normalized = normalized.split("/", 1)[0]
+    normalized = _WWW_PATTERN.sub("", normalized)
+    return normalized
+
+
+def article_source_candidates(article: Mapping[str, Any]) -> tuple[str, ...]:
+    """Normalized source name and host of *article*, stamped host first."""
+
+    candidates: list[str] = []
+    stamped_host = normalize_source_pattern(
+        str(article.get(CANONICAL_HOST_FIELD, "") or "")
+    )
+    if stamped_host:
+        candidates.append(stamped_host)
+    else:
+        url = str(article.get("url", "") or "").strip()
+        if url and url != "#":
+            try:
+                domain = normalize_source_pattern(urlparse(url).netloc or url)
+            except ValueError:
+                domain = normalize_source_pattern(url)
+            if domain:
+                candidates.append(domain)
+
+    source = normalize_source_pattern(str(article.get("source", "") or ""))
+    if source and source not in candidates:
+        candidates.append(source)
+    return tuple(candidates)
+
+
+@dataclass(frozen=True)
+class SourcePolicyRule:
+    """One normalized policy pattern and whether it allows or blocks."""
+
+    policy_type: str
+    pattern: str
+
+
+@dataclass(frozen=True)
+class SourcePolicyDecision:
+    """Outcome for one article.
+
+    ``rule`` is the policy that matched (the blocking rule for blocked
+    articles, the allowing rule for allowlisted ones). It is ``None`` when no
+    policy applies or the article missed every allowlist entry.
+    """
+
+    allowed: bool
+    reason: str
+    rule: SourcePolicyRule | None = None
+    candidate: str | None = None
+
+
+_NO_POLICY: Final[SourcePolicyDecision] = SourcePolicyDecision(True, "no_policy")
+_NOT_BLOCKED: Final[SourcePolicyDecision] = SourcePolicyDecision(True, "not_blocked")
+_NOT_ALLOWLISTED: Final[SourcePolicyDecision] = SourcePolicyDecision(
+    False, "not_allowlisted"
+)
+
+
+@dataclass
+class _SuffixNode:
+    children: dict[str, _SuffixNode] = field(default_factory=dict)
+    rule: SourcePolicyRule | None = None
+
+
+class _PolicyIndex:
+    """Suffix trie for dotted patterns plus an automaton for bare ones.
+
+    A dotted pattern matches a host equal to it or ending in ``.pattern``,
+    which is the same as the host's labels ending with the pattern's labels.
+    A bare pattern matches anywhere inside the host or source name.
+    """
+
+    def __init__(self, policy_type: str, patterns: Sequence[str]) -> None:
+        self._root = _SuffixNode()
+        self.rules: tuple[SourcePolicyRule, ...] = tuple(
+            SourcePolicyRule(policy_type, pattern) for pattern in patterns
+        )
+        self._bare_rules: dict[str, SourcePolicyRule] = {}
+        for rule in self.rules:
+            if "." in rule.pattern:
+                self._insert(rule)
+            else:
+                self._bare_rules[rule.pattern] = rule
+        self._bare = (
+            KeywordMatcher(list(self._bare_rules), ascii_word_boundaries=False)
+            if self._bare_rules
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def _insert(self, rule: SourcePolicyRule) -> None:
+        node = self._root
+        for label in reversed(rule.pattern.split(".")):
+            node = node.children.setdefault(label, _SuffixNode())
+        if node.rule is None:
+            node.rule = rule
+
+    def _match_suffix(self, candidate: str) -> SourcePolicyRule | None:
+        node = self._root
+        matched: SourcePolicyRule | None = None
+        for label in reversed(candidate.split(".")):
+            next_node = node.children.get(label)
+            if next_node is None:
+                break
+            node = next_node
+            if node.rule is not None:
+                matched = node.rule
+        return matched
+
+    def match(self, candidate: str) -> SourcePolicyRule | None:
+        """Return the most specific dotted rule, else the first bare rule."""
+
+        rule = self._match_suffix(candidate)
+        if rule is None and self._bare is not None:
+            keyword = self._bare.first_keyword(candidate)
+            if keyword is not None:
+                rule = self._bare_rules[keyword]
+        return rule
+
+
+@dataclass(frozen=True)
+class SourcePolicyResult:
+    """Articles that passed, plus the decision for every dropped article."""
+
+    kept: list[dict[str, Any]]
+    dropped: list[tuple[dict[str, Any], SourcePolicyDecision]]
+
+    def drop_counts(self) -> dict[str, int]:
+        """Dropped articles per deciding rule (``allow:*`` for allowlist misses)."""
+
+        counts: dict[str, int] = {}
+        for _, decision in self.dropped:
+            key = (
+                f"{decision.rule.policy_type}:{decision.rule.pattern}"
+                if decision.rule is not None
+                else f"{POLICY_ALLOW}:*"
+            )
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+class CompiledSourcePolicies:
+    """Normalized allow/block lists compiled for repeated evaluation."""
+
+    def __init__(
+        self,
+        allowlist: Iterable[str] | None = None,
+        blocklist: Iterable[str] | None = None,
+    ) -> None:
+        self.allowlist = _normalize_patterns(allowlist)
+        self.blocklist = _normalize_patterns(blocklist)
+        self._allow = _PolicyIndex(POLICY_ALLOW, self.allowlist)
+        self._block = _PolicyIndex(POLICY_BLOCK, self.blocklist)
+
+    def __bool__(self) -> bool:
+        return bool(self._allow or self._block)
+
+    def decide(self, article: Mapping[str, Any]) -> SourcePolicyDecision:
+        """Block rules win; with an allowlist, an allow rule must match."""
+
+        if not self:
+            return _NO_POLICY
+        candidates = article_source_candidates(article)
+        if self._block:
+            for candidate in candidates:
+                rule = self._block.match(candidate)
+                if rule is not None:
+                    return SourcePolicyDecision(False, "blocked", rule, candidate)
+        if not self._allow:
+            return _NOT_BLOCKED
+        for candidate in candidates:
+            rule = self._allow.match(candidate)
+            if rule is not None:
+                return SourcePolicyDecision(True, "allowlisted", rule, candidate)
+        return _NOT_ALLOWLISTED
+
+    def evaluate(self, articles: Iterable[dict[str, Any]]) -> SourcePolicyResult:
+        kept: list[dict[str, Any]] = []
+        dropped: list[tuple[dict[str, Any], SourcePolicyDecision]] = []
+        for article in articles:
+            decision = self.decide(article)
+            if decision.allowed:
+                kept.append(article)
+            else:
+                dropped.append((article, decision))
+        return SourcePolicyResult(kept=kept, dropped=dropped)
+
+    def filter(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not self:
+            return articles
+        return [article for article in articles if self.decide(article).allowed]
+
+
+def _normalize_patterns(patterns: Iterable[str] | None) -> tuple[str, ...]:
+    normalized = (normalize_source_pattern(item) for item in (patterns or ()) if item)
+    return tuple(dict.fromkeys(pattern for pattern in normalized if pattern))
+
+
+@lru_cache(maxsize=64)
+def _compile_unversioned(
+    allowlist: tuple[str, ...], blocklist: tuple[str, ...]
+) -> CompiledSourcePolicies:
+    return CompiledSourcePolicies(allowlist, blocklist)
+
+
+_versioned_cache: dict[
+    Hashable, tuple[tuple[str, ...], tuple[str, ...], CompiledSourcePolicies]
+] = {}
+_versioned_lock = threading.Lock()
+
+
+def compile_source_policies(
+    allowlist: Iterable[str] | None = None,
+    blocklist: Iterable[str] | None = None,
+    *,
+    version: Hashable | None = None,
+) -> CompiledSourcePolicies:
+    """Build (or reuse) compiled policies.
+
+    With a *version* stamp the compiled object is reused for as long as the
+    stamp and the raw lists are unchanged, so callers that load policies
+    from the database recompile only after the table changes.
+    """
+
+    allow = tuple(allowlist or ())
+    block = tuple(blocklist or ())
+    if version is None:
+        return _compile_unversioned(allow, block)
+
+    with _versioned_lock:
+        cached = _versioned_cache.get(version)
+        if cached is not None and cached[0] == allow and cached[1] == block:
+            return cached[2]
+
+    compiled = CompiledSourcePolicies(allow, block)
+    with _versioned_lock:
+        if len(_versioned_cache) >= _VERSIONED_CACHE_LIMIT:
+            _versioned_cache.pop(next(iter(_versioned_cache)))
+        _versioned_cache[version] = (allow, block, compiled)
+    return compiled
+
+
+__all__ = [
+    "CompiledSourcePolicies",
+    "POLICY_ALLOW",
+    "POLICY_BLOCK",
+    "SourcePolicyDecision",
+    "SourcePolicyResult",
+    "SourcePolicyRule",
+    "article_source_candidates",
+    "compile_source_policies",
+    "normalize_source_pattern",
+]
@@ -0,0 +1,154 @@
+"""Compiled source-tier classification for collected articles.
+
+The major news source lists are compiled once into a substring automaton.
+Lookups are memoized by normalized source name, and the compiled classifier
+is rebuilt only when the config generation changes. Articles are stamped
+with their tier at ingest, so filtering and scoring read the stamped fields
+instead of classifying again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Final, TypeVar
+
+from newsletter_core.application.keyword_matcher import KeywordMatcher
+from newsletter_core.public.settings import (
+    get_config_generation,
+    get_major_news_sources,
+)
+
+SOURCE_TIER_FIELD: Final[str] = "source_tier"
+SOURCE_TIER_SCORE_FIELD: Final[str] = "source_tier_score"
+SOURCE_TIER_NAME_FIELD: Final[str] = "source_tier_name"
+
+_MEMO_LIMIT: Final[int] = 4096
+
+
+@dataclass(frozen=True)
+class SourceTier:
+    """Tier key, scoring weight and display label of one news source."""
+
+    key: str
+    score: float
+    label: str
+
+
+TIER1: Final[SourceTier] = SourceTier("tier1", 1.0, "Tier 1 (주요 언론사)")
+TIER2: Final[SourceTier] = SourceTier("tier2", 0.6, "Tier 2 (보조 언론사)")
+OTHER_TIER: Final[SourceTier] = SourceTier("other", 0.3, "Tier 3 (기타 소스)")
+
+_TIERS_BY_KEY: Final[dict[str, SourceTier]] = {
+    tier.key: tier for tier in (TIER1, TIER2, OTHER_TIER)
+}
+
+
+def _normalize_source(source: Any) -> str:
+    return str(source or "").lower().strip()
+
+
+class SourceTierClassifier:
+    """Classify a source name by substring match against tiered name lists.
+
+    A source belongs to the first tier that has a name contained in the
+    source (case-insensitive), which matches the legacy linear scan.
+    """
+
+    def __init__(self, tiers: Mapping[str, Sequence[str]]) -> None:
+        tier_keys = [key for key in ("tier1", "tier2") if tiers.get(key)]
+        self._matcher = KeywordMatcher(
+            tier_keys,
+            {key: list(tiers[key]) for key in tier_keys},
+            ascii_word_boundaries=False,
+        )
+        self._memo: dict[str, SourceTier] = {}
+
+    def classify(self, source: Any) -> SourceTier:
+        normalized = _normalize_source(source)
+        tier = self._memo.get(normalized)
+        if tier is not None:
+            return tier
+
+        key = self._matcher.first_keyword(normalized) if normalized else None
+        tier = _TIERS_BY_KEY[key] if key else OTHER_TIER
+        if len(self._memo) >= _MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[normalized] = tier
+        return tier
+
+
+_classifier_lock = threading.Lock()
+_cached_classifier: tuple[int, SourceTierClassifier] | None = None
+
+
+def get_source_tier_classifier() -> SourceTierClassifier:
+    """Return the classifier for the current config, compiling it if needed."""
+
+    global _cached_classifier
+    generation = get_config_generation()
+    cached = _cached_classifier
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    with _classifier_lock:
+        if _cached_classifier is None or _cached_classifier[0] != generation:
+            _cached_classifier = (
+                generation,
+                SourceTierClassifier(get_major_news_sources()),
+            )
+        return _cached_classifier[1]
+
+
+def classify_source(source: Any) -> SourceTier:
+    """Classify a source name with the shared classifier."""
+
+    return get_source_tier_classifier().classify(source)
+
+
+def article_source_tier(article: Mapping[str, Any]) -> SourceTier:
+    """Return the stamped tier of *article*, classifying it if unstamped."""
+
+    stamped = _TIERS_BY_KEY.get(str(article.get(SOURCE_TIER_FIELD) or ""))
+    if stamped is not None:
+        return stamped
+    return classify_source(article.get("source"))
+
+
+def stamp_source_tier(article: MutableMapping[str, Any]) -> SourceTier:
+    """Write ``source_tier``/``source_tier_score``/``source_tier_name``."""
+
+    tier = classify_source(article.get("source"))
+    article[SOURCE_TIER_FIELD] = tier.key
+    article[SOURCE_TIER_SCORE_FIELD] = tier.score
+    article[SOURCE_TIER_NAME_FIELD] = tier.label
+    return tier
+
+
+_ArticlesT = TypeVar("_ArticlesT", bound=Iterable[MutableMapping[str, Any]])
+
+
+def stamp_source_tiers(articles: _ArticlesT) -> _ArticlesT:
+    """Stamp every article in place and return the same collection."""
+
+    for article in articles:
+        if isinstance(article, MutableMapping):
+            stamp_source_tier(article)
+    return articles
+
+
+__all__ = [
+    "OTHER_TIER",
+    "SOURCE_TIER_FIELD",
+    "SOURCE_TIER_NAME_FIELD",
+    "SOURCE_TIER_SCORE_FIELD",
+    "SourceTier",
+    "SourceTierClassifier",
+    "TIER1",
+    "TIER2",
+    "article_source_tier",
+    "classify_source",
+    "get_source_tier_classifier",
+    "stamp_source_tier",
+    "stamp_source_tiers",
+]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any, Final, Literal, cast
 
 from newsletter_core.application.tools_support import (
+    MAX_SERPER_RESULTS,
     ParsedSerperResponse,
     SearchRequest,
     build_serper_payload,
@@ -29,6 +31,16 @@ class SerperSearchPlan:
     payload: str
 
 
+@dataclass(frozen=True)
+class SerperBatchPlan:
+    """Multi-query request data packing several keyword plans into one POST."""
+
+    search_plans: tuple[SerperSearchPlan, ...]
+    url: str
+    headers: dict[str, str]
+    payload: str
+
+
 @dataclass(frozen=True)
 class SerperDebugEntry:
     """Raw-response debug details preserved for legacy logging."""
@@ -105,30 +117,66 @@ class SerperSearchResponseDecodeError(Exception):
 
 
 SerperSearchExecutor = Callable[[SerperSearchPlan], Mapping[str, Any]]
+SerperBatchExecutor = Callable[[SerperBatchPlan], Sequence[Any]]
+SerperSearchResult = SerperKeywordReport | SerperKeywordFailure
+SerperPlanRunner = Callable[..., SerperSearchResult]
 
 
 def build_serper_search_plans(
     search_request: SearchRequest,
     *,
     api_key: str,
+    num_results_by_keyword: Mapping[str, int] | None = None,
 ) -> tuple[SerperSearchPlan, ...]:
-    """Build stable per-keyword request plans for the legacy wrapper."""
+    """Build stable per-keyword request plans for the legacy wrapper.
+
+    ``num_results_by_keyword`` overrides the request size of individual
+    keywords (adaptive fetch sizing); the Serper cap still applies.
+    """
+
+    sizes = num_results_by_keyword or {}
+
+    def _num_results(keyword: str) -> int:
+        size = int(sizes.get(keyword, search_request.num_results))
+        return max(1, min(size, MAX_SERPER_RESULTS))
 
     return tuple(
         SerperSearchPlan(
             keyword=keyword,
-            num_results=search_request.num_results,
+            num_results=_num_results(keyword),
             url=_SERPER_NEWS_URL,
             headers={
                 "X-API-KEY": api_key,
                 "Content-Type": "application/json",
             },
-            payload=build_serper_payload(keyword, search_request.num_results),
+            payload=build_serper_payload(keyword, _num_results(keyword)),
         )
         for keyword in search_request.keywords
     )
 
 
+def build_serper_batch_plans(
+    search_plans: Sequence[SerperSearchPlan],
+    *,
+    batch_size: int,
+) -> tuple[SerperBatchPlan, ...]:
+    """Pack per-keyword plans into Serper multi-query requests, keeping order."""
+
+    size = max(1, int(batch_size))
+    batch_plans: list[SerperBatchPlan] = []
+    for start in range(0, len(search_plans), size):
+        chunk = tuple(search_plans[start : start + size])
+        batch_plans.append(
+            SerperBatchPlan(
+                search_plans=chunk,
+                url=chunk[0].url,
+                headers=chunk[0].headers,
+                payload="[" + ", ".join(plan.payload for plan in chunk) + "]",
+            )
+        )
+    return tuple(batch_plans)
+
+
 def _build_debug_entries(
     results: Mapping[str, Any],
 ) -> tuple[SerperDebugEntry, ...]:
@@ -175,6 +223,147 @@ def execute_serper_search_plan(
             response_text=exc.response_text,
         )
 
+    return _build_keyword_report(search_plan, results)
+
+
+def execute_serper_search_plans(
+    search_plans: Sequence[SerperSearchPlan],
+    *,
+    executor: SerperSearchExecutor,
+    max_workers: int = 1,
+    plan_runner: SerperPlanRunner = execute_serper_search_plan,
+) -> tuple[SerperSearchResult, ...]:
+    """Execute keyword plans with bounded fan-out, returning results in plan order."""
+
+    workers = min(max(1, int(max_workers)), len(search_plans))
+    if workers <= 1:
+        return tuple(plan_runner(plan, executor=executor) for plan in search_plans)
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="serper-search"
+    ) as pool:
+        return tuple(
+            pool.map(lambda plan: plan_runner(plan, executor=executor), search_plans)
+        )
+
+
+def iter_serper_search_plans(
+    search_plans: Sequence[SerperSearchPlan],
+    *,
+    executor: SerperSearchExecutor,
+    max_workers: int = 1,
+    plan_runner: SerperPlanRunner = execute_serper_search_plan,
+) -> Iterator[SerperSearchResult]:
+    """Yield keyword results as soon as each request finishes (completion order)."""
+
+    workers = min(max(1, int(max_workers)), len(search_plans))
+    if workers <= 1:
+        for plan in search_plans:
+            yield plan_runner(plan, executor=executor)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="serper-search"
+    ) as pool:
+        futures = [
+            pool.submit(plan_runner, plan, executor=executor) for plan in search_plans
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def execute_serper_batch_plan(
+    batch_plan: SerperBatchPlan,
+    *,
+    executor: SerperBatchExecutor,
+) -> tuple[SerperSearchResult, ...]:
+    """Execute one multi-query plan and split the response back per keyword."""
+
+    def _fail_all(
+        error_kind: Literal["request", "json"],
+        message: str,
+        response_text: str | None = None,
+    ) -> tuple[SerperSearchResult, ...]:
+        return tuple(
+            SerperKeywordFailure(
+                keyword=plan.keyword,
+                error_kind=error_kind,
+                message=message,
+                response_text=response_text,
+            )
+            for plan in batch_plan.search_plans
+        )
+
+    try:
+        batch_results = executor(batch_plan)
+    except SerperSearchRequestError as exc:
+        return _fail_all("request", str(exc))
+    except SerperSearchResponseDecodeError as exc:
+        return _fail_all("json", str(exc), exc.response_text)
+
+    if not isinstance(batch_results, Sequence) or len(batch_results) != len(
+        batch_plan.search_plans
+    ):
+        return _fail_all(
+            "json",
+            "Serper batch response does not match the number of queries.",
+            json.dumps(batch_results, ensure_ascii=False, default=str)[:300],
+        )
+
+    keyword_results: list[SerperSearchResult] = []
+    for plan, results in zip(batch_plan.search_plans, batch_results):
+        if not isinstance(results, Mapping):
+            keyword_results.append(
+                SerperKeywordFailure(
+                    keyword=plan.keyword,
+                    error_kind="json",
+                    message="Serper batch entry is not a JSON object.",
+                    response_text=str(results)[:300],
+                )
+            )
+            continue
+        keyword_results.append(_build_keyword_report(plan, results))
+    return tuple(keyword_results)
+
+
+def execute_serper_batch_plans(
+    batch_plans: Sequence[SerperBatchPlan],
+    *,
+    executor: SerperBatchExecutor,
+    max_workers: int = 1,
+) -> tuple[SerperSearchResult, ...]:
+    """Execute multi-query plans with bounded fan-out, flattened in keyword order."""
+
+    workers = min(max(1, int(max_workers)), len(batch_plans))
+    if workers <= 1:
+        batch_results = [
+            execute_serper_batch_plan(batch_plan, executor=executor)
+            for batch_plan in batch_plans
+        ]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="serper-batch"
+        ) as pool:
+            batch_results = list(
+                pool.map(
+                    lambda batch_plan: execute_serper_batch_plan(
+                        batch_plan, executor=executor
+                    ),
+                    batch_plans,
+                )
+            )
+
+    return tuple(result for results in batch_results for result in results)
+
+
+def _build_keyword_report(
+    search_plan: SerperSearchPlan,
+    results: Mapping[str, Any],
+) -> SerperKeywordReport:
     return SerperKeywordReport(
         keyword=search_plan.keyword,
         parsed_response=parse_serper_response(results, search_plan.num_results),
@@ -319,18 +508,27 @@ def build_serper_failure_log_messages(
 
 
 __all__ = [
+    "SerperBatchExecutor",
+    "SerperBatchPlan",
     "SerperDebugEntry",
     "SerperKeywordFailure",
     "SerperKeywordReport",
     "SerperLogMessage",
     "SerperSearchExecutor",
+    "SerperPlanRunner",
     "SerperSearchPlan",
     "SerperSearchRequestError",
     "SerperSearchResponseDecodeError",
+    "SerperSearchResult",
     "SerperSearchSummary",
+    "build_serper_batch_plans",
     "build_serper_failure_log_messages",
     "build_serper_keyword_log_messages",
     "build_serper_search_plans",
+    "execute_serper_batch_plan",
+    "execute_serper_batch_plans",
     "execute_serper_search_plan",
+    "execute_serper_search_plans",
+    "iter_serper_search_plans",
     "summarize_serper_search_reports",
 ]
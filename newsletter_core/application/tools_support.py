@@ -8,7 +8,7 @@ from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, cast
 
-_MAX_SERPER_RESULTS = 20
+MAX_SERPER_RESULTS = 20
 
 
 @dataclass(frozen=True)
@@ -32,7 +32,7 @@ def resolve_search_request(
     keywords: str,
     num_results: int,
     *,
-    max_results: int = _MAX_SERPER_RESULTS,
+    max_results: int = MAX_SERPER_RESULTS,
 ) -> SearchRequest:
     """Normalize the legacy search request without changing its semantics."""
 
@@ -195,6 +195,7 @@ def resolve_filename_theme(
 
 
 __all__ = [
+    "MAX_SERPER_RESULTS",
     "ParsedSerperResponse",
     "SearchRequest",
     "build_serper_payload",
@@ -0,0 +1,109 @@
+"""Content cache for extracted article text, addressed by article fingerprint."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from newsletter_core.application.article_extraction import ExtractedArticle
+from newsletter_core.infrastructure.sqlite_support import (
+    default_state_db_path,
+    state_db,
+)
+
+DEFAULT_ARTICLE_CONTENT_DB = "article_content.db"
+DEFAULT_MAX_AGE_SECONDS = 7 * 86400.0
+
+
+class ArticleContentCache:
+    """SQLite store so an article shared by several newsletters is parsed once."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = str(db_path or default_state_db_path(DEFAULT_ARTICLE_CONTENT_DB))
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        with state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS article_content (
+                    url_key TEXT PRIMARY KEY,
+                    canonical_url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_article_content_fetched "
+                "ON article_content(fetched_at)"
+            )
+
+    def get_many(self, fingerprints: Iterable[str]) -> dict[str, ExtractedArticle]:
+        """Return fresh cached extractions keyed by article fingerprint."""
+
+        keys = set(fingerprints)
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        with state_db(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT url_key, title, content FROM article_content "
+                f"WHERE fetched_at > ? AND url_key IN ({placeholders})",
+                (self._clock() - self.max_age_seconds, *keys),
+            ).fetchall()
+        return {
+            row["url_key"]: ExtractedArticle(row["title"], row["content"])
+            for row in rows
+        }
+
+    def put(
+        self, fingerprint: str, canonical_url: str, article: ExtractedArticle
+    ) -> None:
+        """Upsert one extraction and delete rows older than ``max_age_seconds``."""
+
+        content_hash = hashlib.sha256(article.content.encode("utf-8")).hexdigest()
+        now = self._clock()
+        with self._lock, state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO article_content (
+                    url_key, canonical_url, title, content, content_hash, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    title = excluded.title,
+                    content = excluded.content,
+                    content_hash = excluded.content_hash,
+                    fetched_at = excluded.fetched_at
+                """,
+                (
+                    fingerprint,
+                    canonical_url,
+                    article.title,
+                    article.content,
+                    content_hash,
+                    now,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM article_content WHERE fetched_at <= ?",
+                (now - self.max_age_seconds,),
+            )
+
+
+__all__ = [
+    "DEFAULT_ARTICLE_CONTENT_DB",
+    "DEFAULT_MAX_AGE_SECONDS",
+    "ArticleContentCache",
+]
@@ -0,0 +1,217 @@
+"""Async bulk page fetcher used to enrich top-ranked articles with full text."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+from urllib.parse import urlsplit
+
+import httpx
+
+from newsletter_core.application.article_enrichment import (
+    FullTextEnrichmentReport,
+    apply_full_text,
+    select_enrichment_targets,
+)
+from newsletter_core.application.article_extraction import (
+    ArticleExtractor,
+    resolve_article_extractor,
+)
+from newsletter_core.infrastructure.article_content_cache import ArticleContentCache
+from newsletter_core.public.settings import get_setting_value
+
+PageFetchStatus = Literal["ok", "error", "timeout"]
+
+_DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class ArticleFetchPolicy:
+    """Concurrency caps and deadlines for one bulk fetch."""
+
+    max_concurrency: int = 8
+    per_domain_limit: int = 2
+    deadline_seconds: float = 15.0
+    request_timeout: float = 10.0
+    user_agent: str = _DEFAULT_USER_AGENT
+
+
+@dataclass(frozen=True)
+class PageFetchResult:
+    """Raw page body (or failure reason) for one URL."""
+
+    url: str
+    status: PageFetchStatus
+    body: bytes = b""
+    error: str | None = None
+
+
+def load_article_fetch_policy() -> ArticleFetchPolicy:
+    """Build the bulk fetch policy from ``FULL_TEXT_*`` and concurrency settings."""
+
+    defaults = ArticleFetchPolicy()
+    return ArticleFetchPolicy(
+        max_concurrency=int(
+            get_setting_value("CONCURRENT_REQUESTS", defaults.max_concurrency)
+        ),
+        per_domain_limit=int(
+            get_setting_value("FULL_TEXT_PER_DOMAIN_LIMIT", defaults.per_domain_limit)
+        ),
+        deadline_seconds=float(
+            get_setting_value("FULL_TEXT_DEADLINE_SECONDS", defaults.deadline_seconds)
+        ),
+    )
+
+
+async def fetch_pages_async(
+    urls: Sequence[str],
+    *,
+    policy: ArticleFetchPolicy | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> dict[str, PageFetchResult]:
+    """Fetch pages concurrently under global/per-domain caps and one deadline."""
+
+    active_policy = policy or ArticleFetchPolicy()
+    global_limit = asyncio.Semaphore(max(1, active_policy.max_concurrency))
+    domain_limits: dict[str, asyncio.Semaphore] = {}
+    results: dict[str, PageFetchResult] = {}
+
+    async def _fetch(client: httpx.AsyncClient, url: str) -> None:
+        domain = (urlsplit(url).hostname or "").lower()
+        domain_limit = domain_limits.setdefault(
+            domain, asyncio.Semaphore(max(1, active_policy.per_domain_limit))
+        )
+        async with domain_limit, global_limit:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                results[url] = PageFetchResult(url, "ok", body=response.content)
+            except (httpx.HTTPError, ValueError) as exc:
+                results[url] = PageFetchResult(url, "error", error=str(exc))
+
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    async with httpx.AsyncClient(
+        headers={"User-Agent": active_policy.user_agent},
+        timeout=active_policy.request_timeout,
+        follow_redirects=True,
+        transport=transport,
+    ) as client:
+        tasks = [asyncio.create_task(_fetch(client, url)) for url in unique_urls]
+        _done, pending = await asyncio.wait(
+            tasks, timeout=active_policy.deadline_seconds
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for url in unique_urls:
+        results.setdefault(
+            url, PageFetchResult(url, "timeout", error="deadline exceeded")
+        )
+    return results
+
+
+def fetch_pages(
+    urls: Sequence[str],
+    *,
+    policy: ArticleFetchPolicy | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> dict[str, PageFetchResult]:
+    """Synchronous entry point; runs on a helper thread if a loop is active."""
+
+    def _run() -> dict[str, PageFetchResult]:
+        return asyncio.run(fetch_pages_async(urls, policy=policy, transport=transport))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run()
+
+    box: dict[str, Any] = {}
+
+    def _target() -> None:
+        try:
+            box["result"] = _run()
+        except BaseException as exc:  # pragma: no cover - re-raised below
+            box["error"] = exc
+
+    worker = threading.Thread(target=_target, name="article-fetch", daemon=True)
+    worker.start()
+    worker.join()
+    if "error" in box:
+        raise box["error"]
+    return box["result"]  # type: ignore[no-any-return]
+
+
+def enrich_articles_with_full_text(
+    articles: Sequence[Mapping[str, Any]],
+    *,
+    top_k: int,
+    policy: ArticleFetchPolicy | None = None,
+    cache: ArticleContentCache | None = None,
+    extractor: ArticleExtractor | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> tuple[list[dict[str, Any]], FullTextEnrichmentReport]:
+    """Attach extracted page text to the top ``top_k`` articles, cache first."""
+
+    started = time.monotonic()
+    extract = extractor or resolve_article_extractor(
+        get_setting_value("ARTICLE_EXTRACTOR")
+    )
+    targets = select_enrichment_targets(articles, top_k=top_k)
+    extracted = cache.get_many(t.fingerprint for t in targets) if cache else {}
+    cached_count = len(extracted)
+
+    missing = [t for t in targets if t.fingerprint not in extracted]
+    pages = fetch_pages([t.url for t in missing], policy=policy, transport=transport)
+
+    fetched = failed = timed_out = 0
+    for target in missing:
+        page = pages[target.url]
+        if page.status == "timeout":
+            timed_out += 1
+            continue
+        if page.status != "ok":
+            failed += 1
+            continue
+        try:
+            article = extract(page.body)
+        except Exception:
+            failed += 1
+            continue
+        extracted[target.fingerprint] = article
+        fetched += 1
+        if cache is not None:
+            cache.put(target.fingerprint, target.canonical_url, article)
+
+    report = FullTextEnrichmentReport(
+        requested=len(targets),
+        cached=cached_count,
+        fetched=fetched,
+        failed=failed,
+        timed_out=timed_out,
+        elapsed_seconds=time.monotonic() - started,
+    )
+    return apply_full_text(articles, targets, extracted), report
+
+
+__all__ = [
+    "ArticleFetchPolicy",
+    "PageFetchResult",
+    "PageFetchStatus",
+    "enrich_articles_with_full_text",
+    "fetch_pages",
+    "fetch_pages_async",
+    "load_article_fetch_policy",
+]
@@ -0,0 +1,230 @@
+"""Conditional-GET RSS fetcher that only parses entries it has not seen yet."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final, Literal
+
+import feedparser
+
+from newsletter_core.infrastructure.feed_state_store import FeedState, FeedStateStore
+from newsletter_core.infrastructure.http_client import get_http_client
+
+FEED_TIMEOUT_SECONDS: Final[float] = 30.0
+
+_ENTRY_BLOCK_RE: Final[re.Pattern[bytes]] = re.compile(
+    rb"<(item|entry)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE
+)
+
+FeedFetchStatus = Literal["fetched", "not_modified", "unchanged"]
+
+
+@dataclass(frozen=True)
+class FeedFetchResult:
+    """Normalized entries for one feed plus how much work the fetch needed."""
+
+    feed_url: str
+    status: FeedFetchStatus
+    feed_title: str | None
+    entries: tuple[dict[str, Any], ...]
+    parsed_entry_count: int
+
+
+def _entry_value(entry: Any, name: str, default: Any = None) -> Any:
+    if isinstance(entry, Mapping):
+        return entry.get(name, default)
+    return getattr(entry, name, default)
+
+
+def resolve_feed_entry_date(entry: Any) -> str:
+    """Return ``YYYY-MM-DD`` from parsed feed dates, else the raw date string."""
+
+    for name in ("published_parsed", "updated_parsed", "created_parsed"):
+        parsed = _entry_value(entry, name)
+        if parsed:
+            try:
+                return datetime(*parsed[:6]).strftime("%Y-%m-%d")
+            except (TypeError, ValueError):
+                break
+    for name in ("published", "updated", "created"):
+        raw = _entry_value(entry, name)
+        if raw:
+            return str(raw)
+    return "날짜 없음"
+
+
+def normalize_feed_entry(entry: Any, entry_key: str) -> dict[str, Any]:
+    """Flatten one feedparser entry into the JSON-friendly shape we persist."""
+
+    content = _entry_value(entry, "content")
+    content_value = ""
+    if content:
+        if isinstance(content, list):
+            first = content[0]
+            content_value = (
+                first.get("value", "") if isinstance(first, Mapping) else str(first)
+            )
+        else:
+            content_value = str(content)
+
+    return {
+        "entry_key": entry_key,
+        "title": _entry_value(entry, "title", ""),
+        "link": _entry_value(entry, "link", "#"),
+        "description": _entry_value(entry, "description", ""),
+        "content": content_value,
+        "date": resolve_feed_entry_date(entry),
+    }
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _split_entry_blocks(body: bytes) -> list[re.Match[bytes]]:
+    return list(_ENTRY_BLOCK_RE.finditer(body))
+
+
+def _parse_feed(
+    body: bytes,
+    previous: FeedState | None,
+) -> tuple[str | None, tuple[dict[str, Any], ...], int]:
+    """Parse only unseen ``<item>``/``<entry>`` blocks, reusing stored ones."""
+
+    known = {
+        str(entry.get("entry_key")): entry
+        for entry in (previous.entries if previous else ())
+    }
+    blocks = _split_entry_blocks(body)
+    block_keys = [_hash(match.group(0)) for match in blocks]
+    new_indexes = [index for index, key in enumerate(block_keys) if key not in known]
+
+    if blocks and previous is not None and not new_indexes:
+        return previous.feed_title, tuple(known[key] for key in block_keys), 0
+
+    if blocks:
+        # Re-wrap only the new blocks in the original envelope so namespaces and
+        # channel metadata still resolve.
+        reduced = (
+            body[: blocks[0].start()]
+            + b"".join(blocks[index].group(0) for index in new_indexes)
+            + body[blocks[-1].end() :]
+        )
+        parsed = feedparser.parse(reduced)
+        if len(parsed.entries) == len(new_indexes):
+            fresh = {
+                block_keys[index]: normalize_feed_entry(entry, block_keys[index])
+                for index, entry in zip(new_indexes, parsed.entries)
+            }
+            entries = tuple(known.get(key) or fresh[key] for key in block_keys)
+            title = _entry_value(parsed.feed, "title") or (
+                previous.feed_title if previous else None
+            )
+            return title, entries, len(new_indexes)
+
+    # Unknown layout or a block the parser rejected: parse the whole document.
+    parsed = feedparser.parse(body)
+    if len(parsed.entries) == len(blocks):
+        # Keep the block-hash keys so the next fetch can still go incremental.
+        entry_keys = block_keys
+    else:
+        entry_keys = [
+            _hash(
+                repr((_entry_value(entry, "id"), _entry_value(entry, "link"))).encode(
+                    "utf-8"
+                )
+            )
+            for entry in parsed.entries
+        ]
+    entries = tuple(
+        normalize_feed_entry(entry, key)
+        for entry, key in zip(parsed.entries, entry_keys)
+    )
+    return _entry_value(parsed.feed, "title"), entries, len(entries)
+
+
+def fetch_feed_entries(
+    feed_url: str,
+    *,
+    store: FeedStateStore | None = None,
+    timeout: float = FEED_TIMEOUT_SECONDS,
+) -> FeedFetchResult:
+    """Fetch one feed with ``If-None-Match``/``If-Modified-Since`` validators."""
+
+    previous = store.get(feed_url) if store is not None else None
+    headers: dict[str, str] = {}
+    if previous is not None and previous.entries:
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+    response = get_http_client().get(feed_url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and previous is not None:
+        if store is not None:
+            previous = store.touch(previous)
+        return FeedFetchResult(
+            feed_url=feed_url,
+            status="not_modified",
+            feed_title=previous.feed_title,
+            entries=previous.entries,
+            parsed_entry_count=0,
+        )
+
+    response.raise_for_status()
+    body: bytes = response.content
+    content_hash = _hash(body)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if (
+        previous is not None
+        and previous.entries
+        and content_hash == previous.content_hash
+    ):
+        if store is not None:
+            previous = store.touch(previous, etag=etag, last_modified=last_modified)
+        return FeedFetchResult(
+            feed_url=feed_url,
+            status="unchanged",
+            feed_title=previous.feed_title,
+            entries=previous.entries,
+            parsed_entry_count=0,
+        )
+
+    feed_title, entries, parsed_count = _parse_feed(body, previous)
+    if store is not None:
+        store.put(
+            FeedState(
+                feed_url=feed_url,
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=content_hash,
+                feed_title=feed_title,
+                entries=entries,
+                fetched_at=time.time(),
+            )
+        )
+    return FeedFetchResult(
+        feed_url=feed_url,
+        status="fetched",
+        feed_title=feed_title,
+        entries=entries,
+        parsed_entry_count=parsed_count,
+    )
+
+
+__all__ = [
+    "FEED_TIMEOUT_SECONDS",
+    "FeedFetchResult",
+    "FeedFetchStatus",
+    "fetch_feed_entries",
+    "normalize_feed_entry",
+    "resolve_feed_entry_date",
+]
@@ -0,0 +1,157 @@
+"""Background RSS prefetch that keeps the local news index warm."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Final, Literal
+
+from newsletter_core.infrastructure.feed_fetcher import (
+    FeedFetchResult,
+    fetch_feed_entries,
+)
+from newsletter_core.infrastructure.feed_state_store import FeedStateStore
+from newsletter_core.infrastructure.news_index import NewsIndex
+from newsletter_core.public.settings import get_setting_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RSS_FEEDS: Final[tuple[str, ...]] = (
+    # 국내 주요 언론사 RSS 피드
+    "https://www.yonhapnewstv.co.kr/feed/",  # 연합뉴스TV
+    "https://www.hani.co.kr/rss/",  # 한겨레
+    "https://rss.donga.com/total.xml",  # 동아일보
+    "https://www.khan.co.kr/rss/rssdata/total_news.xml",  # 경향신문
+)
+
+FeedPrefetchStatus = Literal["fetched", "not_modified", "unchanged", "error"]
+
+
+@dataclass(frozen=True)
+class NewsIndexPolicy:
+    """When collection may answer from the index and how long it keeps rows."""
+
+    enabled: bool = False
+    max_age_seconds: float = 1800.0
+    prefetch_interval_seconds: float = 600.0
+    retention_days: float = 30.0
+
+
+@dataclass(frozen=True)
+class FeedPrefetchReport:
+    """Outcome of refreshing one feed into the index."""
+
+    feed_url: str
+    status: FeedPrefetchStatus
+    entry_count: int = 0
+    indexed_count: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+
+def configured_rss_feeds() -> list[str]:
+    """Return the default feeds plus any ``ADDITIONAL_RSS_FEEDS`` entries."""
+
+    additional = str(get_setting_value("ADDITIONAL_RSS_FEEDS", "") or "")
+    return list(DEFAULT_RSS_FEEDS) + [
+        feed.strip() for feed in additional.split(",") if feed.strip()
+    ]
+
+
+def load_news_index_policy() -> NewsIndexPolicy:
+    """Read the news index policy from centralized settings."""
+
+    return NewsIndexPolicy(
+        enabled=bool(get_setting_value("RSS_INDEX_ENABLED", False)),
+        max_age_seconds=float(get_setting_value("RSS_INDEX_MAX_AGE_SECONDS", 1800.0)),
+        prefetch_interval_seconds=float(
+            get_setting_value("RSS_PREFETCH_INTERVAL_SECONDS", 600.0)
+        ),
+        retention_days=float(get_setting_value("RSS_INDEX_RETENTION_DAYS", 30.0)),
+    )
+
+
+def prefetch_feeds(
+    feed_urls: Sequence[str],
+    *,
+    index: NewsIndex,
+    state_store: FeedStateStore | None = None,
+    fetch: Callable[..., FeedFetchResult] = fetch_feed_entries,
+) -> list[FeedPrefetchReport]:
+    """Refresh every feed into *index*; one failing feed does not stop the rest."""
+
+    reports: list[FeedPrefetchReport] = []
+    for feed_url in feed_urls:
+        started = time.monotonic()
+        try:
+            result = fetch(feed_url, store=state_store)
+            indexed = index.index_feed(feed_url, result.feed_title, result.entries)
+        except Exception as exc:
+            logger.warning("Feed prefetch failed for %s: %s", feed_url, exc)
+            reports.append(
+                FeedPrefetchReport(
+                    feed_url=feed_url,
+                    status="error",
+                    elapsed_seconds=time.monotonic() - started,
+                    error=str(exc),
+                )
+            )
+            continue
+        reports.append(
+            FeedPrefetchReport(
+                feed_url=feed_url,
+                status=result.status,
+                entry_count=len(result.entries),
+                indexed_count=indexed,
+                elapsed_seconds=time.monotonic() - started,
+            )
+        )
+    return reports
+
+
+def run_feed_prefetcher(
+    *,
+    feed_urls: Sequence[str] | None = None,
+    policy: NewsIndexPolicy | None = None,
+    index: NewsIndex | None = None,
+    state_store: FeedStateStore | None = None,
+    stop_event: threading.Event | None = None,
+    once: bool = False,
+    on_cycle: Callable[[list[FeedPrefetchReport]], None] | None = None,
+) -> None:
+    """Poll feeds into the index every ``prefetch_interval_seconds`` until stopped."""
+
+    policy = policy or load_news_index_policy()
+    index = index or NewsIndex()
+    state_store = state_store or FeedStateStore()
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        urls = list(feed_urls) if feed_urls is not None else configured_rss_feeds()
+        try:
+            reports = prefetch_feeds(urls, index=index, state_store=state_store)
+            index.prune(policy.retention_days * 86400.0)
+        except Exception:
+            if once:
+                raise
+            logger.exception("Feed prefetch cycle failed")
+        else:
+            if on_cycle is not None:
+                on_cycle(reports)
+        if once:
+            return
+        stop_event.wait(policy.prefetch_interval_seconds)
+
+
+__all__ = [
+    "DEFAULT_RSS_FEEDS",
+    "FeedPrefetchReport",
+    "FeedPrefetchStatus",
+    "NewsIndexPolicy",
+    "configured_rss_feeds",
+    "load_news_index_policy",
+    "prefetch_feeds",
+    "run_feed_prefetcher",
+]
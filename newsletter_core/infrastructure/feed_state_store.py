@@ -0,0 +1,110 @@
+"""Persistent per-feed validator and entry state for incremental RSS ingest."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from newsletter_core.infrastructure.sqlite_support import (
+    default_state_db_path,
+    state_db,
+)
+
+DEFAULT_FEED_STATE_DB = "feed_state.db"
+
+
+@dataclass(frozen=True)
+class FeedState:
+    """HTTP validators, body hash and normalized entries from the last fetch."""
+
+    feed_url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    feed_title: str | None = None
+    entries: tuple[dict[str, Any], ...] = field(default_factory=tuple)
+    fetched_at: float = 0.0
+
+    @property
+    def entry_keys(self) -> frozenset[str]:
+        return frozenset(str(entry.get("entry_key", "")) for entry in self.entries)
+
+
+class FeedStateStore:
+    """SQLite-backed store keyed by feed URL."""
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = str(db_path or default_state_db_path(DEFAULT_FEED_STATE_DB))
+        self._lock = threading.Lock()
+        with self._lock, state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT,
+                    feed_title TEXT,
+                    entries JSON NOT NULL DEFAULT '[]',
+                    fetched_at REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+
+    def get(self, feed_url: str) -> FeedState | None:
+        with state_db(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT * FROM feed_state WHERE feed_url = ?", (feed_url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return FeedState(
+            feed_url=row["feed_url"],
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            content_hash=row["content_hash"],
+            feed_title=row["feed_title"],
+            entries=tuple(json.loads(row["entries"] or "[]")),
+            fetched_at=float(row["fetched_at"] or 0.0),
+        )
+
+    def put(self, state: FeedState) -> None:
+        with self._lock, state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO feed_state (
+                    feed_url, etag, last_modified, content_hash, feed_title,
+                    entries, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(feed_url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    feed_title = excluded.feed_title,
+                    entries = excluded.entries,
+                    fetched_at = excluded.fetched_at
+                """,
+                (
+                    state.feed_url,
+                    state.etag,
+                    state.last_modified,
+                    state.content_hash,
+                    state.feed_title,
+                    json.dumps(list(state.entries), ensure_ascii=False),
+                    state.fetched_at,
+                ),
+            )
+
+    def touch(self, state: FeedState, **changes: Any) -> FeedState:
+        """Persist a refreshed fetch time (and optional validator changes)."""
+
+        refreshed = replace(state, fetched_at=time.time(), **changes)
+        self.put(refreshed)
+        return refreshed
+
+
+__all__ = ["DEFAULT_FEED_STATE_DB", "FeedState", "FeedStateStore"]
@@ -0,0 +1,128 @@
+"""Process-wide pooled HTTP client shared by every outbound fetch."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+
+
+@dataclass(frozen=True)
+class HttpClientPolicy:
+    """Keep-alive, retry and per-host connection limits for the shared client."""
+
+    pool_connections: int = 32
+    pool_maxsize: int = 8
+    pool_block: bool = True
+    max_retries: int = 3
+    backoff_factor: float = 0.3
+    status_forcelist: tuple[int, ...] = (500, 502, 503, 504)
+    timeout: float = 30.0
+
+
+@dataclass(frozen=True)
+class HostPoolStats:
+    """Connection reuse counters for one live host pool."""
+
+    host: str
+    requests: int
+    connections_opened: int
+
+    @property
+    def pool_hits(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.pool_hits / self.requests if self.requests else 0.0
+
+
+class PooledHttpClient:
+    """``requests`` session wrapper with per-host keep-alive pools and retries."""
+
+    def __init__(self, policy: HttpClientPolicy | None = None) -> None:
+        self.policy = policy or HttpClientPolicy()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.policy.pool_connections,
+            pool_maxsize=self.policy.pool_maxsize,
+            pool_block=self.policy.pool_block,
+            max_retries=Retry(
+                total=self.policy.max_retries,
+                backoff_factor=self.policy.backoff_factor,
+                status_forcelist=list(self.policy.status_forcelist),
+                raise_on_status=False,
+            ),
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self.policy.timeout)
+        return self._session.request(method=method, url=url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> tuple[HostPoolStats, ...]:
+        """Return reuse counters for host pools currently kept alive."""
+
+        totals: dict[str, list[int]] = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            counters = totals.setdefault(host, [0, 0])
+            counters[0] += int(getattr(pool, "num_requests", 0))
+            counters[1] += int(getattr(pool, "num_connections", 0))
+
+        return tuple(
+            HostPoolStats(host=host, requests=counts[0], connections_opened=counts[1])
+            for host, counts in sorted(totals.items())
+        )
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_client: PooledHttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHttpClient:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PooledHttpClient()
+    return _client
+
+
+def reset_http_client() -> None:
+    """Close and forget the shared client (tests and post-fork workers)."""
+
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
+__all__ = [
+    "HostPoolStats",
+    "HttpClientPolicy",
+    "PooledHttpClient",
+    "get_http_client",
+    "reset_http_client",
+]
@@ -0,0 +1,182 @@
+"""Persistent cache of raw LLM article scores.
+
+``article["scoring"]`` keeps the raw ``relevance/impact/novelty`` values so
+articles can be re-weighted without another LLM call. This cache keeps those
+values across runs. Entries are keyed by article fingerprint, scoring
+domain, model and prompt version. Changing the model or editing a scoring
+prompt therefore never serves stale scores.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from newsletter_core.infrastructure.sqlite_support import (
+    default_state_db_path,
+    state_db,
+)
+from newsletter_core.public.settings import get_setting_value
+
+DEFAULT_LLM_SCORE_DB = "llm_scores.db"
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_version(*prompts: str) -> str:
+    """Short digest of the prompt texts, used as the cache's prompt version."""
+
+    digest = hashlib.sha256("\x1f".join(prompts).encode("utf-8")).hexdigest()
+    return digest[:12]
+
+
+@dataclass(frozen=True)
+class ScoreCacheKey:
+    """Everything besides the article that determines an LLM score."""
+
+    domain: str
+    model: str
+    prompt_version: str
+
+
+class LlmScoreCache:
+    """SQLite store so an article is scored by the LLM once per topic and model."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        max_age_seconds: float = DEFAULT_MAX_AGE_DAYS * 86400,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = str(db_path or default_state_db_path(DEFAULT_LLM_SCORE_DB))
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        with state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_scores (
+                    fingerprint TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    scores TEXT NOT NULL,
+                    scored_at REAL NOT NULL,
+                    PRIMARY KEY (fingerprint, domain, model, prompt_version)
+                )
+                """
+            )
+
+    def get_many(
+        self, fingerprints: Iterable[str], key: ScoreCacheKey
+    ) -> dict[str, dict[str, float]]:
+        """Return fresh cached scores keyed by article fingerprint."""
+
+        fingerprints = set(fingerprints)
+        if not fingerprints:
+            return {}
+        with state_db(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT fingerprint, scores FROM llm_scores
+                WHERE domain = ? AND model = ? AND prompt_version = ?
+                  AND scored_at > ?
+                  AND fingerprint IN (SELECT value FROM json_each(?))
+                """,
+                (
+                    key.domain,
+                    key.model,
+                    key.prompt_version,
+                    self._clock() - self.max_age_seconds,
+                    json.dumps(sorted(fingerprints)),
+                ),
+            ).fetchall()
+        return {row["fingerprint"]: json.loads(row["scores"]) for row in rows}
+
+    def put_many(
+        self, scores: Mapping[str, Mapping[str, Any]], key: ScoreCacheKey
+    ) -> int:
+        """Store raw scores keyed by fingerprint; returns the number written."""
+
+        if not scores:
+            return 0
+        now = self._clock()
+        with self._lock, state_db(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO llm_scores (
+                    fingerprint, domain, model, prompt_version, scores, scored_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(fingerprint, domain, model, prompt_version) DO UPDATE SET
+                    scores = excluded.scores,
+                    scored_at = excluded.scored_at
+                """,
+                [
+                    (
+                        fingerprint,
+                        key.domain,
+                        key.model,
+                        key.prompt_version,
+                        json.dumps(dict(values), sort_keys=True),
+                        now,
+                    )
+                    for fingerprint, values in scores.items()
+                ],
+            )
+            conn.execute(
+                "DELETE FROM llm_scores WHERE scored_at <= ?",
+                (now - self.max_age_seconds,),
+            )
+        return len(scores)
+
+
+_shared_cache: LlmScoreCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_score_cache() -> LlmScoreCache | None:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+
+    global _shared_cache
+    max_age_days = float(
+        get_setting_value("SCORING_CACHE_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS)
+    )
+    if max_age_days <= 0:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = LlmScoreCache(max_age_seconds=max_age_days * 86400)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("LLM score cache unavailable: %s", exc)
+                return None
+        return _shared_cache
+
+
+def reset_llm_score_cache() -> None:
+    """Drop the process-wide cache so the next call re-reads settings."""
+
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+__all__ = [
+    "DEFAULT_LLM_SCORE_DB",
+    "DEFAULT_MAX_AGE_DAYS",
+    "LlmScoreCache",
+    "ScoreCacheKey",
+    "get_llm_score_cache",
+    "prompt_version",
+    "reset_llm_score_cache",
+]
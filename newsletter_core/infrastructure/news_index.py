@@ -0,0 +1,318 @@
+"""Local SQLite FTS5 index of prefetched RSS articles for keyword lookups."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Final
+
+from newsletter_core.infrastructure.sqlite_support import (
+    default_state_db_path,
+    state_db,
+)
+
+DEFAULT_NEWS_INDEX_DB: Final[str] = "news_index.db"
+DEFAULT_SEARCH_LIMIT: Final[int] = 500
+# The trigram tokenizer cannot match terms shorter than three characters
+# (common for Korean keywords such as "반도"), so those use LIKE instead.
+_TRIGRAM_MIN_CHARS: Final[int] = 3
+
+
+@dataclass(frozen=True)
+class IndexedArticle:
+    """One normalized feed entry as stored in the local news index."""
+
+    entry_key: str
+    feed_url: str
+    feed_title: str | None
+    title: str
+    link: str
+    description: str
+    content: str
+    date: str
+    published_ts: float | None
+
+    def as_entry(self) -> dict[str, Any]:
+        """Return the entry in the same shape ``fetch_feed_entries`` yields."""
+
+        return {
+            "entry_key": self.entry_key,
+            "title": self.title,
+            "link": self.link,
+            "description": self.description,
+            "content": self.content,
+            "date": self.date,
+        }
+
+
+def entry_published_ts(date_value: Any) -> float | None:
+    """Return a UTC epoch for a feed entry date string, or ``None``."""
+
+    raw = str(date_value or "").strip()
+    if not raw:
+        return None
+    parsed: datetime | None = None
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(raw)
+        except (TypeError, ValueError, IndexError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class NewsIndex:
+    """Articles plus per-feed refresh times, searchable by keyword and date."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = str(db_path or default_state_db_path(DEFAULT_NEWS_INDEX_DB))
+        self._clock = clock
+        self._lock = threading.Lock()
+        with self._lock, state_db(self.db_path) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS news_articles (
+                    id INTEGER PRIMARY KEY,
+                    entry_key TEXT NOT NULL UNIQUE,
+                    feed_url TEXT NOT NULL,
+                    feed_title TEXT,
+                    title TEXT NOT NULL DEFAULT '',
+                    link TEXT NOT NULL DEFAULT '',
+                    description TEXT NOT NULL DEFAULT '',
+                    content TEXT NOT NULL DEFAULT '',
+                    date TEXT NOT NULL DEFAULT '',
+                    published_ts REAL,
+                    indexed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_articles_feed
+                    ON news_articles (feed_url, published_ts);
+                CREATE VIRTUAL TABLE IF NOT EXISTS news_articles_fts USING fts5(
+                    title, description, content,
+                    content='news_articles', content_rowid='id',
+                    tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS news_articles_ai
+                AFTER INSERT ON news_articles BEGIN
+                    INSERT INTO news_articles_fts (rowid, title, description, content)
+                    VALUES (new.id, new.title, new.description, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS news_articles_ad
+                AFTER DELETE ON news_articles BEGIN
+                    INSERT INTO news_articles_fts (
+                        news_articles_fts, rowid, title, description, content
+                    ) VALUES ('delete', old.id, old.title, old.description, old.content);
+                END;
+                CREATE TABLE IF NOT EXISTS news_index_feeds (
+                    feed_url TEXT PRIMARY KEY,
+                    feed_title TEXT,
+                    entry_count INTEGER NOT NULL DEFAULT 0,
+                    refreshed_at REAL NOT NULL
+                );
+                """
+            )
+
+    def index_feed(
+        self,
+        feed_url: str,
+        feed_title: str | None,
+        entries: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Insert entries not indexed yet and mark the feed as refreshed now."""
+
+        now = self._clock()
+        rows = [
+            (
+                str(entry.get("entry_key") or entry.get("link") or ""),
+                feed_url,
+                feed_title,
+                str(entry.get("title") or ""),
+                str(entry.get("link") or ""),
+                str(entry.get("description") or ""),
+                str(entry.get("content") or ""),
+                str(entry.get("date") or ""),
+                entry_published_ts(entry.get("date")),
+                now,
+            )
+            for entry in entries
+        ]
+        rows = [row for row in rows if row[0]]
+        with self._lock, state_db(self.db_path) as conn:
+            known = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT entry_key FROM news_articles WHERE feed_url = ?",
+                    (feed_url,),
+                )
+            }
+            fresh = [row for row in rows if row[0] not in known]
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO news_articles (
+                    entry_key, feed_url, feed_title, title, link, description,
+                    content, date, published_ts, indexed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                fresh,
+            )
+            conn.execute(
+                """
+                INSERT INTO news_index_feeds (
+                    feed_url, feed_title, entry_count, refreshed_at
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT(feed_url) DO UPDATE SET
+                    feed_title = excluded.feed_title,
+                    entry_count = excluded.entry_count,
+                    refreshed_at = excluded.refreshed_at
+                """,
+                (feed_url, feed_title, len(rows), now),
+            )
+        return len(fresh)
+
+    def refreshed_at(self, feed_urls: Sequence[str]) -> dict[str, float]:
+        """Return the last refresh time for each indexed feed among *feed_urls*."""
+
+        if not feed_urls:
+            return {}
+        placeholders = ", ".join("?" for _ in feed_urls)
+        with state_db(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT feed_url, refreshed_at FROM news_index_feeds "
+                f"WHERE feed_url IN ({placeholders})",
+                tuple(feed_urls),
+            ).fetchall()
+        return {row["feed_url"]: float(row["refreshed_at"]) for row in rows}
+
+    def is_fresh(self, feed_urls: Sequence[str], max_age_seconds: float) -> bool:
+        """True when every feed was refreshed within ``max_age_seconds``."""
+
+        refreshed = self.refreshed_at(feed_urls)
+        cutoff = self._clock() - max_age_seconds
+        return bool(feed_urls) and all(
+            refreshed.get(url, 0.0) >= cutoff for url in feed_urls
+        )
+
+    def search(
+        self,
+        keywords: Sequence[str],
+        *,
+        feed_urls: Sequence[str] | None = None,
+        since_ts: float | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[IndexedArticle]:
+        """Return newest-first articles containing any keyword.
+
+        Matching is case-insensitive substring search over title, description
+        and content; callers apply their own word-boundary rules on top.
+        Undated articles are kept when ``since_ts`` is set so the downstream
+        date filter stays the single place that decides about them.
+        """
+
+        terms = [k.strip() for k in keywords if k and k.strip()]
+        if not terms:
+            return []
+
+        long_terms = [t for t in terms if len(t) >= _TRIGRAM_MIN_CHARS]
+        short_terms = [t for t in terms if len(t) < _TRIGRAM_MIN_CHARS]
+        match_clauses: list[str] = []
+        params: list[Any] = []
+        if long_terms:
+            match_clauses.append(
+                "a.id IN (SELECT rowid FROM news_articles_fts "
+                "WHERE news_articles_fts MATCH ?)"
+            )
+            params.append(" OR ".join(_fts_phrase(t) for t in long_terms))
+        for term in short_terms:
+            match_clauses.append(
+                "(a.title LIKE ? ESCAPE '\\' OR a.description LIKE ? ESCAPE '\\' "
+                "OR a.content LIKE ? ESCAPE '\\')"
+            )
+            params.extend([_like_pattern(term)] * 3)
+
+        where = [f"({' OR '.join(match_clauses)})"]
+        if feed_urls is not None:
+            if not feed_urls:
+                return []
+            where.append(f"a.feed_url IN ({', '.join('?' for _ in feed_urls)})")
+            params.extend(feed_urls)
+        if since_ts is not None:
+            where.append("(a.published_ts IS NULL OR a.published_ts >= ?)")
+            params.append(since_ts)
+        params.append(limit)
+
+        with state_db(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT a.* FROM news_articles AS a "
+                f"WHERE {' AND '.join(where)} "
+                "ORDER BY a.published_ts IS NULL, a.published_ts DESC, a.id DESC "
+                "LIMIT ?",
+                params,
+            ).fetchall()
+        return [
+            IndexedArticle(
+                entry_key=row["entry_key"],
+                feed_url=row["feed_url"],
+                feed_title=row["feed_title"],
+                title=row["title"],
+                link=row["link"],
+                description=row["description"],
+                content=row["content"],
+                date=row["date"],
+                published_ts=row["published_ts"],
+            )
+            for row in rows
+        ]
+
+    def prune(self, retention_seconds: float) -> int:
+        """Drop articles indexed longer than ``retention_seconds`` ago."""
+
+        cutoff = self._clock() - retention_seconds
+        with self._lock, state_db(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM news_articles WHERE indexed_at < ?", (cutoff,)
+            )
+        return int(cursor.rowcount or 0)
+
+    def stats(self) -> dict[str, Any]:
+        """Return article/feed counts and the oldest feed refresh time."""
+
+        with state_db(self.db_path) as conn:
+            articles = conn.execute("SELECT COUNT(*) FROM news_articles").fetchone()
+            feeds = conn.execute(
+                "SELECT COUNT(*), MIN(refreshed_at) FROM news_index_feeds"
+            ).fetchone()
+        return {
+            "articles": int(articles[0]),
+            "feeds": int(feeds[0]),
+            "oldest_refresh_at": feeds[1],
+        }
+
+
+__all__ = [
+    "DEFAULT_NEWS_INDEX_DB",
+    "DEFAULT_SEARCH_LIMIT",
+    "IndexedArticle",
+    "NewsIndex",
+    "entry_published_ts",
+]
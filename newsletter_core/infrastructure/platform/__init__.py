@@ -11,6 +11,7 @@ from newsletter_core.infrastructure.platform._paths import (
     resolve_database_path,
     resolve_env_file_path,
     resolve_project_root,
+    resolve_state_dir,
     resolve_static_dir,
     resolve_template_dir,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "resolve_template_dir",
     "resolve_static_dir",
     "resolve_database_path",
+    "resolve_state_dir",
     "resolve_project_root",
     "resolve_env_file_path",
 ]
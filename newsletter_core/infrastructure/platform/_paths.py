@@ -120,6 +120,13 @@ def resolve_database_path(_web_file: Optional[str] = None) -> str:
     )
 
 
+def resolve_state_dir(_web_file: Optional[str] = None) -> str:
+    """Return the directory for generation-side SQLite state (caches, indexes)."""
+    if _is_frozen():
+        return str(Path(sys.executable).resolve().parent / "state")
+    return str(_resolve_project_root(_web_file) / ".local" / "state" / "newsletter")
+
+
 def resolve_project_root(_web_file: Optional[str] = None) -> str:
     return str(_resolve_project_root(_web_file))
 
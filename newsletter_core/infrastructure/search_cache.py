@@ -0,0 +1,386 @@
+"""Disk-backed TTL cache for news search API responses (Serper, Naver)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from newsletter_core.infrastructure.sqlite_support import (
+    default_state_db_path,
+    state_db,
+)
+from newsletter_core.public.settings import get_setting_value
+
+DEFAULT_SEARCH_CACHE_DB = "search_cache.db"
+
+SearchCacheState = Literal["fresh", "stale", "miss"]
+
+_COUNTER_NAMES = ("hits", "stale_hits", "misses", "refreshes", "evictions", "errors")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchCachePolicy:
+    """Freshness, size and revalidation limits for the search cache."""
+
+    ttl_seconds: float = 3600.0
+    max_entries: int = 2000
+    stale_while_revalidate_seconds: float = 0.0
+    bucket_seconds: float = 86400.0
+
+
+@dataclass(frozen=True)
+class SearchCacheKey:
+    """Identity of one cached search response."""
+
+    provider: str
+    query: str
+    num_results: int
+    region: str
+    bucket: int
+
+    @property
+    def digest(self) -> str:
+        raw = json.dumps(
+            [self.provider, self.query, self.num_results, self.region, self.bucket],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class SearchCacheStats:
+    """Cumulative cache counters (shared across processes via the database)."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+    errors: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+def normalize_search_query(query: str) -> str:
+    """Fold width, case and whitespace so equivalent queries share one entry."""
+
+    normalized = unicodedata.normalize("NFKC", str(query or ""))
+    return _WHITESPACE_RE.sub(" ", normalized).strip().casefold()
+
+
+class SearchResultCache:
+    """SQLite-backed LRU cache with TTL and optional stale-while-revalidate."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        *,
+        policy: SearchCachePolicy | None = None,
+        clock: Callable[[], float] = time.time,
+        refresh_executor: Executor | None = None,
+    ) -> None:
+        self.db_path = str(db_path or default_state_db_path(DEFAULT_SEARCH_CACHE_DB))
+        self.policy = policy or SearchCachePolicy()
+        self._clock = clock
+        self._refresh_executor = refresh_executor
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        with state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    payload JSON NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed "
+                "ON search_cache(accessed_at)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache_counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+
+    def key_for(
+        self, provider: str, query: str, num_results: int, *, region: str = ""
+    ) -> SearchCacheKey:
+        bucket_seconds = self.policy.bucket_seconds
+        bucket = int(self._clock() // bucket_seconds) if bucket_seconds > 0 else 0
+        return SearchCacheKey(
+            provider=provider,
+            query=normalize_search_query(query),
+            num_results=int(num_results),
+            region=region.lower(),
+            bucket=bucket,
+        )
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute(
+            """
+            INSERT INTO search_cache_counters (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+            """,
+            (name, amount),
+        )
+
+    def lookup(self, key: SearchCacheKey) -> tuple[SearchCacheState, Any]:
+        """Return the cache state for *key* and the stored payload, if usable."""
+
+        now = self._clock()
+        with self._lock, state_db(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT payload, stored_at FROM search_cache WHERE cache_key = ?",
+                (key.digest,),
+            ).fetchone()
+            age = now - float(row["stored_at"]) if row is not None else None
+            state: SearchCacheState = "miss"
+            if age is not None and age < self.policy.ttl_seconds:
+                state = "fresh"
+            elif age is not None and age < (
+                self.policy.ttl_seconds + self.policy.stale_while_revalidate_seconds
+            ):
+                state = "stale"
+
+            if state == "miss":
+                self._bump(conn, "misses")
+                return state, None
+
+            conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE cache_key = ?",
+                (now, key.digest),
+            )
+            self._bump(conn, "hits" if state == "fresh" else "stale_hits")
+            return state, json.loads(row["payload"])
+
+    def store(self, key: SearchCacheKey, value: Any) -> None:
+        """Upsert one payload and evict expired or least recently used rows."""
+
+        now = self._clock()
+        horizon = self.policy.ttl_seconds + self.policy.stale_while_revalidate_seconds
+        with self._lock, state_db(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO search_cache (
+                    cache_key, provider, query, payload, stored_at, accessed_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    payload = excluded.payload,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (
+                    key.digest,
+                    key.provider,
+                    key.query,
+                    json.dumps(value, ensure_ascii=False),
+                    now,
+                    now,
+                ),
+            )
+            evicted = conn.execute(
+                "DELETE FROM search_cache WHERE stored_at <= ?", (now - horizon,)
+            ).rowcount
+            overflow = (
+                conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+                - self.policy.max_entries
+            )
+            if overflow > 0:
+                evicted += conn.execute(
+                    """
+                    DELETE FROM search_cache WHERE cache_key IN (
+                        SELECT cache_key FROM search_cache
+                        ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,),
+                ).rowcount
+            if evicted:
+                self._bump(conn, "evictions", evicted)
+
+    def get_or_fetch(self, key: SearchCacheKey, fetch: Callable[[], T]) -> T:
+        """Serve *key* from cache, fetching (and storing) it on a miss."""
+
+        try:
+            state, value = self.lookup(key)
+        except sqlite3.Error as exc:
+            self._record_error(exc)
+            return fetch()
+
+        if state == "stale":
+            self.schedule_refresh(key, fetch)
+        if state != "miss":
+            return value  # type: ignore[no-any-return]
+
+        value = fetch()
+        try:
+            self.store(key, value)
+        except sqlite3.Error as exc:
+            self._record_error(exc)
+        return value
+
+    def schedule_refresh(self, key: SearchCacheKey, fetch: Callable[[], Any]) -> None:
+        """Revalidate a stale entry in the background (at most once at a time)."""
+
+        with self._lock:
+            if key.digest in self._refreshing:
+                return
+            self._refreshing.add(key.digest)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="search-cache-refresh"
+                )
+            executor = self._refresh_executor
+
+        def _refresh() -> None:
+            try:
+                self.store(key, fetch())
+                with state_db(self.db_path) as conn:
+                    self._bump(conn, "refreshes")
+            except Exception as exc:
+                self._record_error(exc)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key.digest)
+
+        executor.submit(_refresh)
+
+    def _record_error(self, exc: BaseException) -> None:
+        logger.warning("Search cache operation failed: %s", exc)
+        try:
+            with state_db(self.db_path) as conn:
+                self._bump(conn, "errors")
+        except sqlite3.Error:
+            pass
+
+    def stats(self) -> SearchCacheStats:
+        with state_db(self.db_path) as conn:
+            counters = dict(
+                conn.execute("SELECT name, value FROM search_cache_counters").fetchall()
+            )
+            entries = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return SearchCacheStats(
+            **{name: int(counters.get(name, 0)) for name in _COUNTER_NAMES},
+            entries=int(entries),
+        )
+
+    def clear(self) -> None:
+        with self._lock, state_db(self.db_path) as conn:
+            conn.execute("DELETE FROM search_cache")
+            conn.execute("DELETE FROM search_cache_counters")
+
+
+_shared_cache: SearchResultCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def load_search_cache_policy() -> SearchCachePolicy:
+    """Build the cache policy from ``SEARCH_CACHE_*`` settings."""
+
+    defaults = SearchCachePolicy()
+    return SearchCachePolicy(
+        ttl_seconds=float(
+            get_setting_value("SEARCH_CACHE_TTL_SECONDS", defaults.ttl_seconds)
+        ),
+        max_entries=int(
+            get_setting_value("SEARCH_CACHE_MAX_ENTRIES", defaults.max_entries)
+        ),
+        stale_while_revalidate_seconds=float(
+            get_setting_value(
+                "SEARCH_CACHE_STALE_SECONDS", defaults.stale_while_revalidate_seconds
+            )
+        ),
+        bucket_seconds=float(
+            get_setting_value("SEARCH_CACHE_BUCKET_SECONDS", defaults.bucket_seconds)
+        ),
+    )
+
+
+def get_search_cache() -> SearchResultCache | None:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+
+    global _shared_cache
+    if not get_setting_value("SEARCH_CACHE_ENABLED", True):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = SearchResultCache(policy=load_search_cache_policy())
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Search cache unavailable: %s", exc)
+                return None
+        return _shared_cache
+
+
+def reset_search_cache() -> None:
+    """Drop the process-wide cache so the next call re-reads settings."""
+
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+def fetch_with_search_cache(
+    provider: str,
+    query: str,
+    num_results: int,
+    fetch: Callable[[], T],
+    *,
+    region: str = "",
+    cache: SearchResultCache | None = None,
+) -> T:
+    """Run *fetch* through the search cache when one is configured."""
+
+    active_cache = cache or get_search_cache()
+    if active_cache is None:
+        return fetch()
+    key = active_cache.key_for(provider, query, num_results, region=region)
+    return active_cache.get_or_fetch(key, fetch)
+
+
+__all__ = [
+    "DEFAULT_SEARCH_CACHE_DB",
+    "SearchCacheKey",
+    "SearchCachePolicy",
+    "SearchCacheState",
+    "SearchCacheStats",
+    "SearchResultCache",
+    "fetch_with_search_cache",
+    "get_search_cache",
+    "load_search_cache_policy",
+    "normalize_search_query",
+    "reset_search_cache",
+]
@@ -0,0 +1,46 @@
+"""Shared SQLite connection helpers for generation-side state stores."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from newsletter_core.infrastructure.platform._paths import resolve_state_dir
+
+
+def default_state_db_path(file_name: str) -> str:
+    """Return the default on-disk location for one named state database."""
+
+    return str(Path(resolve_state_dir()) / file_name)
+
+
+def connect_state_db(db_path: str | Path) -> sqlite3.Connection:
+    """Open a WAL-mode connection suitable for short, concurrent transactions."""
+
+    path = str(db_path)
+    if path != ":memory:" and not path.startswith("file:"):
+        Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    if path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+@contextmanager
+def state_db(db_path: str | Path) -> Iterator[sqlite3.Connection]:
+    """Yield a connection that commits on success and is always closed."""
+
+    conn = connect_state_db(db_path)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+__all__ = ["connect_state_db", "default_state_db_path", "state_db"]
@@ -9,14 +9,28 @@ from typing import Any, cast
 import requests  # type: ignore[import-untyped]
 
 from newsletter_core.application.tools_search_flow import (
+    SerperBatchPlan,
     SerperSearchPlan,
     SerperSearchRequestError,
     SerperSearchResponseDecodeError,
+    build_serper_batch_plans,
+)
+from newsletter_core.infrastructure.http_client import get_http_client
+from newsletter_core.infrastructure.search_cache import (
+    SearchCacheKey,
+    SearchResultCache,
+    get_search_cache,
 )
 
 SerperRequestCallable = Callable[..., Any]
 
 
+def send_serper_request(**kwargs: Any) -> Any:
+    """Send one raw Serper request over the shared pooled HTTP client."""
+
+    return get_http_client().request(**kwargs)
+
+
 def build_serper_request_kwargs(search_plan: SerperSearchPlan) -> dict[str, Any]:
     """Preserve the legacy raw request shape for one Serper search plan."""
 
@@ -47,7 +61,7 @@ def execute_serper_search_request(
 ) -> dict[str, Any]:
     """Execute one Serper search plan through the infrastructure boundary."""
 
-    request_callable = request or requests.request
+    request_callable = request or send_serper_request
     try:
         response = request_callable(**build_serper_request_kwargs(search_plan))
         response.raise_for_status()
@@ -57,9 +71,107 @@ def execute_serper_search_request(
     return decode_serper_response_json(response)
 
 
+def execute_serper_batch_request(
+    batch_plan: SerperBatchPlan,
+    *,
+    request: SerperRequestCallable | None = None,
+) -> list[Any]:
+    """Execute one Serper multi-query plan through the infrastructure boundary."""
+
+    request_callable = request or send_serper_request
+    try:
+        response = request_callable(
+            method="POST",
+            url=batch_plan.url,
+            headers=batch_plan.headers,
+            data=batch_plan.payload,
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException as exc:
+        raise SerperSearchRequestError(str(exc)) from exc
+
+    return cast(list[Any], decode_serper_response_json(response))
+
+
+def _serper_cache_key(
+    cache: SearchResultCache, search_plan: SerperSearchPlan
+) -> SearchCacheKey:
+    region = str(json.loads(search_plan.payload).get("gl", ""))
+    return cache.key_for(
+        "serper", search_plan.keyword, search_plan.num_results, region=region
+    )
+
+
+def execute_cached_serper_search_request(
+    search_plan: SerperSearchPlan,
+    *,
+    request: SerperRequestCallable | None = None,
+    cache: SearchResultCache | None = None,
+) -> dict[str, Any]:
+    """Serve one Serper search from the response cache, fetching on a miss."""
+
+    active_cache = cache or get_search_cache()
+    if active_cache is None:
+        return execute_serper_search_request(search_plan, request=request)
+
+    return active_cache.get_or_fetch(
+        _serper_cache_key(active_cache, search_plan),
+        lambda: execute_serper_search_request(search_plan, request=request),
+    )
+
+
+def execute_cached_serper_batch_request(
+    batch_plan: SerperBatchPlan,
+    *,
+    request: SerperRequestCallable | None = None,
+    cache: SearchResultCache | None = None,
+) -> list[Any]:
+    """Send only the cache-missing queries of a multi-query plan to Serper."""
+
+    active_cache = cache or get_search_cache()
+    if active_cache is None:
+        return execute_serper_batch_request(batch_plan, request=request)
+
+    keys = [_serper_cache_key(active_cache, plan) for plan in batch_plan.search_plans]
+    results: list[Any] = [None] * len(keys)
+    missing: list[int] = []
+    for index, (key, plan) in enumerate(zip(keys, batch_plan.search_plans)):
+        state, value = active_cache.lookup(key)
+        if state == "miss":
+            missing.append(index)
+            continue
+        if state == "stale":
+            active_cache.schedule_refresh(
+                key,
+                lambda plan=plan: execute_serper_search_request(plan, request=request),
+            )
+        results[index] = value
+
+    if not missing:
+        return results
+
+    missing_plans = [batch_plan.search_plans[index] for index in missing]
+    (missing_batch,) = build_serper_batch_plans(
+        missing_plans, batch_size=len(missing_plans)
+    )
+    fetched = execute_serper_batch_request(missing_batch, request=request)
+    for index, value in zip(missing, fetched):
+        results[index] = value
+        if isinstance(value, dict):
+            active_cache.store(keys[index], value)
+    # A short response is surfaced as-is so the flow reports the mismatch.
+    if len(fetched) != len(missing):
+        return fetched
+    return results
+
+
 __all__ = [
     "SerperRequestCallable",
     "build_serper_request_kwargs",
     "decode_serper_response_json",
+    "execute_cached_serper_batch_request",
+    "execute_cached_serper_search_request",
+    "execute_serper_batch_request",
     "execute_serper_search_request",
+    "send_serper_request",
 ]
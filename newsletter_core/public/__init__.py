@@ -1,3 +1,14 @@
 """Public API surface for newsletter_core."""
 
-__all__ = ["generation", "settings", "lifecycle", "source_policies", "platform"]
+__all__ = [
+    "generation",
+    "settings",
+    "lifecycle",
+    "source_policies",
+    "platform",
+    "search_cache",
+    "news_index",
+    "article_memory",
+    "fetch_sizing",
+    "scoring",
+]
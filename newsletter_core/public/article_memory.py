@@ -0,0 +1,25 @@
+"""Public hooks for the per-schedule/preset delivered-article memory."""
+
+from __future__ import annotations
+
+from newsletter_core.application.article_memory import (
+    ArticleMemory,
+    SeenLookup,
+    load_article_memory_mode,
+    load_article_memory_retention_days,
+)
+
+
+def build_article_memory(scope: str, lookup: SeenLookup) -> ArticleMemory | None:
+    """Create the memory for one run, or ``None`` when the feature is off."""
+    mode = load_article_memory_mode()
+    if mode == "off" or not scope:
+        return None
+    return ArticleMemory(scope=scope, lookup=lookup, mode=mode)
+
+
+__all__ = [
+    "ArticleMemory",
+    "build_article_memory",
+    "load_article_memory_retention_days",
+]
@@ -0,0 +1,27 @@
+"""Public hooks for adaptive per-keyword fetch sizing."""
+
+from __future__ import annotations
+
+from newsletter_core.application.fetch_sizing import (
+    YIELD_HISTORY_DECAY,
+    FetchYieldTracker,
+    KeywordYield,
+    YieldLookup,
+    load_fetch_sizing_policy,
+)
+
+
+def build_fetch_tracker(scope: str, lookup: YieldLookup) -> FetchYieldTracker | None:
+    """Create the tracker for one run, or ``None`` when sizing is disabled."""
+    policy = load_fetch_sizing_policy()
+    if policy is None or not scope:
+        return None
+    return FetchYieldTracker(scope=scope, lookup=lookup, policy=policy)
+
+
+__all__ = [
+    "FetchYieldTracker",
+    "KeywordYield",
+    "YIELD_HISTORY_DECAY",
+    "build_fetch_tracker",
+]
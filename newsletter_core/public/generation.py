@@ -11,7 +11,12 @@ from unittest.mock import patch
 
 from langchain.tools import tool
 
-from newsletter_core.public.source_policies import filter_articles_by_source_policies
+from newsletter_core.application.article_memory import ArticleMemory, use_article_memory
+from newsletter_core.application.fetch_sizing import (
+    FetchYieldTracker,
+    use_fetch_tracker,
+)
+from newsletter_core.public.source_policies import compile_source_policies
 
 
 class NewsletterGenerationError(Exception):
@@ -22,6 +27,10 @@ class GenerationStats(TypedDict, total=False):
     step_times: Dict[str, float]
     total_time: float
     cost_summary: Dict[str, Any]
+    source_policy_drops: Dict[str, int]
+    article_memory: Dict[str, Any]
+    fetch_sizing: Dict[str, Any]
+    category_latencies: List[Dict[str, Any]]
 
 
 class NewsletterResult(TypedDict):
@@ -43,6 +52,9 @@ class GenerateNewsletterRequest:
     suggest_count: int = 10
     source_allowlist: Optional[List[str]] = None
     source_blocklist: Optional[List[str]] = None
+    source_policy_version: Optional[str] = None
+    article_memory: Optional[ArticleMemory] = None
+    fetch_tracker: Optional[FetchYieldTracker] = None
 
 
 class _LazyModuleProxy:
@@ -112,8 +124,11 @@ def _resolve_keywords(request: GenerateNewsletterRequest) -> List[str]:
 def _build_filtered_search_tool(
     allowlist: List[str] | None,
     blocklist: List[str] | None,
+    version: str | None = None,
+    drop_counts: Dict[str, int] | None = None,
 ) -> Any:
     original_search_tool = tools.search_news_articles
+    policies = compile_source_policies(allowlist, blocklist, version=version)
 
     @tool
     def filtered_search_news_articles(
@@ -123,12 +138,11 @@ def _build_filtered_search_tool(
         articles = original_search_tool.invoke(
             {"keywords": keywords, "num_results": num_results}
         )
-        filtered: List[Dict[str, Any]] = filter_articles_by_source_policies(
-            articles,
-            allowlist=allowlist or [],
-            blocklist=blocklist or [],
-        )
-        return filtered
+        result = policies.evaluate(articles)
+        if drop_counts is not None:
+            for rule, count in result.drop_counts().items():
+                drop_counts[rule] = drop_counts.get(rule, 0) + count
+        return result.kept
 
     return filtered_search_news_articles
 
@@ -136,6 +150,7 @@ def _build_filtered_search_tool(
 def generate_newsletter(request: GenerateNewsletterRequest) -> NewsletterResult:
     """Generate newsletter HTML and return a stable response schema."""
     keywords = _resolve_keywords(request)
+    source_policy_drops: Dict[str, int] = {}
 
     search_tool_override = (
         patch.object(
@@ -144,6 +159,8 @@ def generate_newsletter(request: GenerateNewsletterRequest) -> NewsletterResult:
             _build_filtered_search_tool(
                 request.source_allowlist,
                 request.source_blocklist,
+                request.source_policy_version,
+                source_policy_drops,
             ),
         )
         if request.source_allowlist or request.source_blocklist
@@ -151,7 +168,11 @@ def generate_newsletter(request: GenerateNewsletterRequest) -> NewsletterResult:
     )
 
     try:
-        with search_tool_override:
+        with (
+            search_tool_override,
+            use_article_memory(request.article_memory),
+            use_fetch_tracker(request.fetch_tracker),
+        ):
             html_or_error, status = graph.generate_newsletter(
                 keywords,
                 news_period_days=request.period,
@@ -169,6 +190,26 @@ def generate_newsletter(request: GenerateNewsletterRequest) -> NewsletterResult:
     }
     if info.get("cost_summary"):
         stats["cost_summary"] = info["cost_summary"]
+    if info.get("category_latencies"):
+        stats["category_latencies"] = info["category_latencies"]
+    if source_policy_drops:
+        stats["source_policy_drops"] = source_policy_drops
+    if request.article_memory is not None:
+        stats["article_memory"] = {
+            "scope": request.article_memory.scope,
+            "mode": request.article_memory.mode,
+            "repeated": request.article_memory.repeated,
+            "issue_articles": len(request.article_memory.issue_fingerprints),
+        }
+    if request.fetch_tracker is not None:
+        stats["fetch_sizing"] = {
+            "scope": request.fetch_tracker.scope,
+            "requested": dict(request.fetch_tracker.requested),
+            "yields": {
+                item.keyword: {"fetched": item.fetched, "kept": item.kept}
+                for item in request.fetch_tracker.yields()
+            },
+        }
 
     input_params: Dict[str, Any] = {
         "keywords": keywords,
@@ -0,0 +1,34 @@
+"""Public entry points for the RSS prefetch daemon and news index status."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from newsletter_core.infrastructure.feed_prefetch import (
+    FeedPrefetchReport,
+    configured_rss_feeds,
+    load_news_index_policy,
+    run_feed_prefetcher,
+)
+from newsletter_core.infrastructure.news_index import NewsIndex
+
+
+def get_news_index_status() -> dict[str, Any]:
+    """Return index size, freshness of the configured feeds and the policy."""
+    policy = load_news_index_policy()
+    index = NewsIndex()
+    feeds = configured_rss_feeds()
+    return {
+        **index.stats(),
+        "fresh": index.is_fresh(feeds, policy.max_age_seconds),
+        "policy": asdict(policy),
+    }
+
+
+__all__ = [
+    "FeedPrefetchReport",
+    "get_news_index_status",
+    "load_news_index_policy",
+    "run_feed_prefetcher",
+]
@@ -0,0 +1,95 @@
+"""Public API for re-ranking already scored articles under new weights.
+
+Scored articles keep their raw LLM ``scoring`` metrics, so trying different
+``config.yml`` weights only recomputes the weighted priority in-process.
+No LLM call is made. Recency is measured against the current time.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Mapping
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+SCORED_ARTICLES_DIR = Path("output") / "intermediate_processing"
+SCORED_ARTICLES_SUFFIX = "_scored_articles.json"
+WEIGHT_KEYS = ("relevance", "impact", "novelty", "source_tier", "recency")
+
+
+def _scoring_module() -> Any:
+    return import_module("newsletter.scoring")
+
+
+def resolve_weights(overrides: Mapping[str, Any] | None = None) -> dict[str, float]:
+    """Configured scoring weights with *overrides* applied.
+
+    Raises ``ValueError`` for unknown keys and negative or non-numeric values.
+    """
+
+    weights = dict(_scoring_module().load_scoring_weights_from_config())
+    for key, raw in (overrides or {}).items():
+        if key not in WEIGHT_KEYS:
+            raise ValueError(f"Unknown scoring weight: {key}")
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            raise ValueError(f"Scoring weight {key} must be a number") from None
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"Scoring weight {key} must be a non-negative number")
+        weights[key] = value
+    return weights
+
+
+def scored_articles_path(file_name: str) -> Path:
+    """Resolve a ``*_scored_articles.json`` file name in the intermediate dir."""
+
+    name = str(file_name or "")
+    if Path(name).name != name or not name.endswith(SCORED_ARTICLES_SUFFIX):
+        raise ValueError(f"Expected a *{SCORED_ARTICLES_SUFFIX} file name")
+    return SCORED_ARTICLES_DIR / name
+
+
+def load_scored_articles(path: str | Path) -> list[dict[str, Any]]:
+    """Load a stored scored-articles JSON list."""
+
+    with open(path, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    if not isinstance(articles, list) or not all(
+        isinstance(article, dict) for article in articles
+    ):
+        raise ValueError(f"{path} is not a list of articles")
+    return articles
+
+
+def rerank_articles(
+    articles: list[dict[str, Any]],
+    weights: Mapping[str, Any] | None = None,
+    top_n: int | None = None,
+) -> list[dict[str, Any]]:
+    """Rank articles by their stored raw scores under *weights*.
+
+    Articles without raw ``scoring`` metrics are left out.
+    """
+
+    scored = [
+        article for article in articles if isinstance(article.get("scoring"), Mapping)
+    ]
+    if not scored:
+        raise ValueError("No articles carry raw scoring metrics")
+    ranked: list[dict[str, Any]] = _scoring_module().rank_scored_articles(
+        scored, top_n=top_n, weights=resolve_weights(weights)
+    )
+    return ranked
+
+
+__all__ = [
+    "SCORED_ARTICLES_DIR",
+    "WEIGHT_KEYS",
+    "load_scored_articles",
+    "rerank_articles",
+    "resolve_weights",
+    "scored_articles_path",
+]
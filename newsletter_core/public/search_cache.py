@@ -0,0 +1,23 @@
+"""Public read-only view of the search response cache for ops endpoints."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from newsletter_core.infrastructure.search_cache import get_search_cache
+
+
+def get_search_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters, entry count and policy of the search cache."""
+    cache = get_search_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        **cache.stats().as_dict(),
+        "policy": asdict(cache.policy),
+    }
+
+
+__all__ = ["get_search_cache_stats"]
@@ -10,6 +10,7 @@ from newsletter.centralized_settings import (
     get_settings,
     is_running_in_pytest,
 )
+from newsletter.config_manager import get_config_generation as _get_config_generation
 from newsletter.config_manager import get_config_manager as _get_config_manager
 from newsletter.config_manager import get_llm_config as _get_llm_config
 from newsletter.config_manager import get_major_news_sources as _get_major_news_sources
@@ -69,6 +70,11 @@ def get_major_news_sources() -> dict[str, Any]:
     return _get_major_news_sources()
 
 
+def get_config_generation() -> int:
+    """Return a counter that changes whenever the config is reloaded."""
+    return _get_config_generation()
+
+
 def get_all_major_news_sources() -> list[str]:
     sources = get_major_news_sources()
     return [*sources["tier1"], *sources["tier2"]]
@@ -109,6 +115,7 @@ config_manager = _LazyConfigManager()
 __all__ = [
     "config_manager",
     "get_all_major_news_sources",
+    "get_config_generation",
     "get_config_manager",
     "get_email_config",
     "get_llm_config",
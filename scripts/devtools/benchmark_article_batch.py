@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark per-article priority scoring against the columnar ArticleBatch.
+
+Builds synthetic scored articles (stamped dates, mixed source tiers, raw LLM
+scores). It then times a weight-only re-rank done article by article, as
+``calculate_priority_score`` does, against ``ArticleBatch.priority_scores``
+plus ``top_n``, and checks that both pick the same top articles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from newsletter_core.application.article_batch import ArticleBatch  # noqa: E402
+from newsletter_core.application.article_dates import stamp_article_dates  # noqa: E402
+from newsletter_core.application.source_tiers import stamp_source_tiers  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+_SOURCES = ("조선일보", "연합뉴스", "뉴스1", "전자신문", "개인 블로그", "Medium")
+_WEIGHTS = {
+    "relevance": 0.40,
+    "impact": 0.25,
+    "novelty": 0.15,
+    "source_tier": 0.10,
+    "recency": 0.10,
+}
+
+
+def synthetic_articles(count: int, seed: int, now: datetime) -> list[dict]:
+    rng = random.Random(seed)
+    articles = [
+        {
+            "title": f"기사 {index}",
+            "source": rng.choice(_SOURCES),
+            "date": (now - timedelta(hours=rng.randint(0, 24 * 30))).isoformat(),
+            "scoring": {
+                "relevance": rng.randint(1, 5),
+                "impact": rng.randint(1, 5),
+                "novelty": rng.randint(1, 5),
+            },
+        }
+        for index in range(count)
+    ]
+    return stamp_article_dates(stamp_source_tiers(articles), now)
+
+
+def scalar_rank(articles: list[dict], now: datetime, top_n: int) -> list[int]:
+    """Per-article weighted sum and full sort, as the dict pipeline did."""
+
+    now_ts = now.timestamp()
+    scored = []
+    for row, article in enumerate(articles):
+        scoring = article["scoring"]
+        days = (now_ts - article["date_ts"]) / 86400
+        priority = (
+            _WEIGHTS["relevance"] * scoring["relevance"] / 5
+            + _WEIGHTS["impact"] * scoring["impact"] / 5
+            + _WEIGHTS["novelty"] * scoring["novelty"] / 5
+            + _WEIGHTS["source_tier"] * article["source_tier_score"]
+            + _WEIGHTS["recency"] * math.exp(-days / 14)
+        ) * 100
+        scored.append((round(priority, 4), row))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [row for _, row in scored[:top_n]]
+
+
+def batch_rank(batch: ArticleBatch, now: datetime, top_n: int) -> list[int]:
+    return batch.top_n(batch.priority_scores(_WEIGHTS, now), top_n).tolist()
+
+
+def _timed(func, *args):  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run(sizes: list[int], top_n: int, seed: int) -> int:
+    now = datetime.now(timezone.utc)
+    print(f"top_n={top_n}")
+    print(
+        "| articles | build batch (ms) | scalar re-rank (ms) "
+        "| batch re-rank (ms) | speedup | same top-N |"
+    )
+    print("|---:|---:|---:|---:|---:|:---:|")
+    mismatched = False
+    for size in sizes:
+        articles = synthetic_articles(size, seed, now)
+        batch, build_time = _timed(ArticleBatch.from_articles, articles)
+        scalar, scalar_time = _timed(scalar_rank, articles, now, top_n)
+        vectorized, batch_time = _timed(batch_rank, batch, now, top_n)
+        same = scalar == vectorized
+        mismatched = mismatched or not same
+        print(
+            f"| {size:,} | {build_time * 1000:,.1f} | {scalar_time * 1000:,.1f} "
+            f"| {batch_time * 1000:,.2f} | {scalar_time / batch_time:,.0f}x "
+            f"| {'yes' if same else 'NO'} |"
+        )
+    return 1 if mismatched else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    return run(args.sizes, args.top_n, args.seed)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark article main-content extractors over a saved HTML corpus.
+
+Reports pages/sec per engine and token-level agreement (F1) of each engine
+against the legacy BeautifulSoup heuristic, so a corpus of saved Korean news
+pages can show whether the fast path changes what gets summarized.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from newsletter_core.application.article_extraction import (  # noqa: E402
+    ExtractedArticle,
+    extract_article_content_auto,
+    extract_article_content_density,
+    extract_article_content_heuristic,
+)
+
+DEFAULT_CORPUS = REPO_ROOT / "tests" / "test_data" / "article_html"
+
+
+def _density_or_empty(html: bytes | str) -> ExtractedArticle:
+    return extract_article_content_density(html) or ExtractedArticle("", "")
+
+
+ENGINES = {
+    "heuristic": extract_article_content_heuristic,
+    "density": _density_or_empty,
+    "auto": extract_article_content_auto,
+}
+
+
+def token_f1(reference: str, candidate: str) -> float:
+    """Return the bag-of-tokens F1 between two extracted texts."""
+
+    ref_tokens = reference.split()
+    cand_tokens = candidate.split()
+    if not ref_tokens and not cand_tokens:
+        return 1.0
+    if not ref_tokens or not cand_tokens:
+        return 0.0
+    remaining: dict[str, int] = {}
+    for token in ref_tokens:
+        remaining[token] = remaining.get(token, 0) + 1
+    overlap = 0
+    for token in cand_tokens:
+        if remaining.get(token, 0) > 0:
+            remaining[token] -= 1
+            overlap += 1
+    if not overlap:
+        return 0.0
+    precision = overlap / len(cand_tokens)
+    recall = overlap / len(ref_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def load_corpus(corpus: Path) -> list[tuple[str, bytes]]:
+    return [(path.name, path.read_bytes()) for path in sorted(corpus.glob("*.htm*"))]
+
+
+def run(corpus: Path, repeat: int) -> int:
+    pages = load_corpus(corpus)
+    if not pages:
+        print(f"no HTML pages found under {corpus}", file=sys.stderr)
+        return 1
+
+    outputs: dict[str, list[str]] = {}
+    print(f"corpus: {corpus} ({len(pages)} pages, repeat={repeat})")
+    print("| engine | pages/sec | mean F1 vs heuristic |")
+    print("|---|---:|---:|")
+    for name, engine in ENGINES.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            results = [engine(html).content for _, html in pages]
+        elapsed = time.perf_counter() - started
+        outputs[name] = results
+        rate = len(pages) * repeat / elapsed if elapsed else float("inf")
+        agreement = sum(
+            token_f1(ref, cand) for ref, cand in zip(outputs["heuristic"], results)
+        ) / len(pages)
+        print(f"| {name} | {rate:,.1f} | {agreement:.3f} |")
+
+    print()
+    print("| page | density F1 | auto F1 |")
+    print("|---|---:|---:|")
+    for index, (page_name, _) in enumerate(pages):
+        reference = outputs["heuristic"][index]
+        print(
+            f"| {page_name} "
+            f"| {token_f1(reference, outputs['density'][index]):.3f} "
+            f"| {token_f1(reference, outputs['auto'][index]):.3f} |"
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    return run(args.corpus, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Measure article memory for side-by-side generations: dict lists vs store.
+
+Simulates several generations held in one worker at the same time. Each run
+collects synthetic articles (Serper-shaped, stamped at ingest, with content
+equal to the snippet), keeps a processed subset and a scored/ranked subset.
+The dict variant holds the three stage lists the graph state used to carry
+(sharing the same dicts). The store variant holds one ``ArticleStore`` per run plus ID lists.
+Peak traced allocation is reported per variant.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from newsletter_core.application.article_dates import stamp_article_dates  # noqa: E402
+from newsletter_core.application.article_identity import (  # noqa: E402
+    stamp_article_identities,
+)
+from newsletter_core.application.article_store import ArticleStore  # noqa: E402
+from newsletter_core.application.source_tiers import stamp_source_tiers  # noqa: E402
+
+_SOURCES = ("조선일보", "연합뉴스", "뉴스1", "전자신문", "개인 블로그", "Medium")
+
+
+def collect(count: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    articles = []
+    for index in range(count):
+        url = f"https://news{rng.randint(0, 20)}.example.com/article/{seed}/{index}"
+        snippet = f"기사 {index} 요약 " + "본문 " * rng.randint(40, 120)
+        articles.append(
+            {
+                "title": f"기사 {index} 제목",
+                "url": url,
+                "link": "".join(url),
+                "snippet": snippet,
+                "content": "".join(snippet),
+                "source": "".join(rng.choice(_SOURCES)),
+                "date": f"2026-03-{rng.randint(1, 28):02d}",
+            }
+        )
+    return stamp_article_dates(stamp_source_tiers(stamp_article_identities(articles)))
+
+
+def _score(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    for article in articles:
+        article["scoring"] = {"relevance": 4, "impact": 3, "novelty": 2}
+        article["priority_score"] = 55.0
+    return articles
+
+
+def dict_runs(runs: int, count: int) -> list[Any]:
+    held = []
+    for run in range(runs):
+        collected = collect(count, run)
+        processed = collected[: count * 3 // 4]
+        ranked = _score(processed[: count // 2])
+        held.append((collected, processed, ranked))
+    return held
+
+
+def store_runs(runs: int, count: int) -> list[Any]:
+    held = []
+    for run in range(runs):
+        store = ArticleStore()
+        collected_ids = store.commit(collect(count, run))
+        records = store.records(collected_ids)
+        processed_ids = store.commit(records[: count * 3 // 4])
+        records = store.records(processed_ids)
+        ranked_ids = store.commit(_score(records[: count // 2]))
+        held.append((store, collected_ids, processed_ids, ranked_ids))
+    return held
+
+
+def _peak(func: Callable[[int, int], list[Any]], runs: int, count: int) -> int:
+    tracemalloc.start()
+    held = func(runs, count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return peak
+
+
+def run(runs: int, sizes: list[int]) -> int:
+    print(f"concurrent runs={runs}")
+    print("| articles/run | dict lists peak (MiB) | article store peak (MiB) | saved |")
+    print("|---:|---:|---:|---:|")
+    for size in sizes:
+        dict_peak = _peak(dict_runs, runs, size)
+        store_peak = _peak(store_runs, runs, size)
+        print(
+            f"| {size:,} | {dict_peak / 2**20:,.1f} | {store_peak / 2**20:,.1f} "
+            f"| {1 - store_peak / dict_peak:.0%} |"
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=4)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000])
+    args = parser.parse_args(argv)
+    return run(args.runs, args.sizes)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
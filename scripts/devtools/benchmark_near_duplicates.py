@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark title near-duplicate detection from 1k to 50k articles.
+
+Compares the prefix-filtered ``NearDuplicateIndex`` used by
+``remove_duplicate_articles``/``remove_similar_articles`` against the
+legacy pairwise scan over a synthetic corpus of Korean/English news titles
+with injected near-duplicates, and checks both make identical decisions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from newsletter_core.application.article_dedupe import (  # noqa: E402
+    DIFFERENTIATING_WORDS,
+    SIMILAR_TITLE_THRESHOLD,
+    IncrementalArticleDeduper,
+    find_near_duplicates,
+    title_tokens,
+)
+from newsletter_core.application.article_identity import (  # noqa: E402
+    normalize_article_title,
+)
+
+DEFAULT_SIZES = (1_000, 5_000, 10_000, 20_000, 50_000)
+
+_WORDS = (
+    "반도체 삼성 SK하이닉스 HBM 수출 증가 감소 정부 AI 인공지능 배터리 전기차 "
+    "LG 현대차 투자 공장 미국 중국 관세 규제 금리 한국은행 코스피 주가 실적 "
+    "분기 영업이익 데이터센터 엔비디아 애플 구글 클라우드 스타트업 플랫폼 "
+    "카카오 네이버 통신 5G 6G 로봇 자율주행 바이오 신약 임상 원전 수소 태양광 "
+    "chip memory export growth policy market launch deal merger foundry"
+).split() + sorted(DIFFERENTIATING_WORDS)
+
+
+def synthetic_titles(count: int, duplicate_ratio: float, seed: int) -> list[str]:
+    """Build ``count`` titles where roughly ``duplicate_ratio`` are rewrites."""
+
+    rng = random.Random(seed)
+    vocabulary = _WORDS + [f"키워드{index}" for index in range(count // 4 + 50)]
+    titles: list[str] = []
+    for _ in range(count):
+        if titles and rng.random() < duplicate_ratio:
+            words = rng.choice(titles).split()
+            rng.shuffle(words)
+            titles.append(" ".join(words) + rng.choice(("", "!", " …", "?")))
+            continue
+        titles.append(" ".join(rng.sample(vocabulary, rng.randint(5, 12))))
+    return titles
+
+
+def legacy_similar_flags(titles: list[str], threshold: float) -> list[bool]:
+    """Pairwise overlap scan as ``remove_similar_articles`` did before."""
+
+    kept: list[frozenset[str]] = []
+    flags: list[bool] = []
+    for title in titles:
+        tokens = title_tokens(title)
+        similar = bool(tokens) and any(
+            seen and len(tokens & seen) / min(len(tokens), len(seen)) >= threshold
+            for seen in kept
+        )
+        if not similar:
+            kept.append(tokens)
+        flags.append(similar)
+    return flags
+
+
+def legacy_dedupe_flags(titles: list[str]) -> list[bool]:
+    """Pairwise scan with the differentiating-word exception (old dedupe)."""
+
+    seen_titles: list[str] = []
+    seen_set: set[str] = set()
+    flags: list[bool] = []
+    for title in titles:
+        normalized = normalize_article_title(title)
+        duplicate = normalized in seen_set
+        if not duplicate and normalized:
+            title_words = set(normalized.split())
+            tokens = title_tokens(normalized)
+            for existing in seen_titles:
+                existing_tokens = title_tokens(existing)
+                if not tokens or not existing_tokens:
+                    continue
+                ratio = len(tokens & existing_tokens) / min(
+                    len(tokens), len(existing_tokens)
+                )
+                differentiated = any(
+                    word in title_words or word in set(existing.split())
+                    for word in DIFFERENTIATING_WORDS
+                )
+                if ratio >= SIMILAR_TITLE_THRESHOLD and not differentiated:
+                    duplicate = True
+                    break
+        if not duplicate and normalized:
+            seen_titles.append(normalized)
+            seen_set.add(normalized)
+        flags.append(duplicate)
+    return flags
+
+
+def indexed_dedupe_flags(titles: list[str]) -> list[bool]:
+    deduper = IncrementalArticleDeduper()
+    return [deduper.check({"title": title}) in ("title", "similar") for title in titles]
+
+
+def indexed_similar_flags(titles: list[str], threshold: float) -> list[bool]:
+    return [match is not None for match in find_near_duplicates(titles, threshold)]
+
+
+def _timed(func, *args):  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run(sizes: list[int], legacy_max: int, duplicate_ratio: float, seed: int) -> int:
+    print(f"duplicate ratio={duplicate_ratio}, legacy pairwise up to {legacy_max}")
+    print(
+        "| articles | dedupe indexed (ms) | dedupe legacy (ms) "
+        "| similar@0.8 indexed (ms) | similar@0.8 legacy (ms) | same decisions |"
+    )
+    print("|---:|---:|---:|---:|---:|:---:|")
+    mismatched = False
+    for size in sizes:
+        titles = synthetic_titles(size, duplicate_ratio, seed)
+        dedupe, dedupe_time = _timed(indexed_dedupe_flags, titles)
+        similar, similar_time = _timed(indexed_similar_flags, titles, 0.8)
+
+        legacy_cells = ["-", "-"]
+        same = "n/a"
+        if size <= legacy_max:
+            legacy_dedupe, legacy_dedupe_time = _timed(legacy_dedupe_flags, titles)
+            legacy_similar, legacy_similar_time = _timed(
+                legacy_similar_flags, titles, 0.8
+            )
+            legacy_cells = [
+                f"{legacy_dedupe_time * 1000:,.0f}",
+                f"{legacy_similar_time * 1000:,.0f}",
+            ]
+            agrees = legacy_dedupe == dedupe and legacy_similar == similar
+            mismatched = mismatched or not agrees
+            same = "yes" if agrees else "NO"
+
+        print(
+            f"| {size:,} | {dedupe_time * 1000:,.0f} | {legacy_cells[0]} "
+            f"| {similar_time * 1000:,.0f} | {legacy_cells[1]} | {same} |"
+        )
+    return 1 if mismatched else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--legacy-max", type=int, default=2_000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    return run(args.sizes, args.legacy_max, args.duplicate_ratio, args.seed)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
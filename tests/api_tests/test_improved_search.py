@@ -7,12 +7,17 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 # 테스트할 모듈 임포트
 from newsletter.tools import search_news_articles  # noqa: E402
 
+# 모의 응답이 공유 검색 캐시에 남지 않도록 테스트마다 임시 캐시 DB 사용
+pytestmark = pytest.mark.usefixtures("isolated_search_cache")
+
 
 class TestImprovedSearch(unittest.TestCase):
     """개선된 검색 기능 테스트 케이스"""
@@ -29,7 +34,7 @@ class TestImprovedSearch(unittest.TestCase):
         else:
             os.environ.pop("SERPER_API_KEY", None)
 
-    @patch("newsletter_core.infrastructure.tools_search_runtime.requests.request")
+    @patch("newsletter_core.infrastructure.tools_search_runtime.send_serper_request")
     def test_improved_search_functionality(self, mock_request):
         """수정된 search_news_articles 함수의 기본 기능 테스트"""
         # 모의(mock) API 응답 설정
@@ -86,7 +91,7 @@ class TestImprovedSearch(unittest.TestCase):
                     first_article[field], "", f"기사의 {field} 필드가 비어 있습니다"
                 )
 
-    @patch("newsletter_core.infrastructure.tools_search_runtime.requests.request")
+    @patch("newsletter_core.infrastructure.tools_search_runtime.send_serper_request")
     def test_multiple_keywords(self, mock_request):
         """여러 키워드로 검색하는 기능 테스트"""
         # 모의(mock) API 응답 설정 (키워드별로 다른 응답을 줄 수 있도록 side_effect 사용 가능)
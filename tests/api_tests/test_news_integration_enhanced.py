@@ -8,6 +8,8 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -17,6 +19,9 @@ from newsletter_core.application.generation.collect import (  # noqa: E402
     collect_articles,
 )
 
+# 모의 응답이 공유 검색 캐시에 남지 않도록 테스트마다 임시 캐시 DB 사용
+pytestmark = pytest.mark.usefixtures("isolated_search_cache")
+
 
 class TestNewsIntegrationEnhanced(unittest.TestCase):
     """도구와 수집 모듈 간의 통합 테스트 케이스"""
@@ -32,7 +37,7 @@ class TestNewsIntegrationEnhanced(unittest.TestCase):
             os.environ.pop("SERPER_API_KEY", None)
 
     @patch("newsletter.sources.NewsSourceManager.fetch_all_sources")
-    @patch("newsletter.tools.requests.request")
+    @patch("newsletter_core.infrastructure.tools_search_runtime.send_serper_request")
     def test_news_collection_integration(
         self, mock_tools_request, mock_collect_fetch_all
     ):
@@ -146,7 +151,7 @@ class TestNewsIntegrationEnhanced(unittest.TestCase):
             self.fail(f"collect_articles 함수 실행 중 예외 발생: {e}")
 
     @patch("newsletter.sources.NewsSourceManager.fetch_all_sources")
-    @patch("newsletter.tools.requests.request")
+    @patch("newsletter_core.infrastructure.tools_search_runtime.send_serper_request")
     def test_results_format_compatibility(
         self, mock_tools_request, mock_collect_fetch_all
     ):
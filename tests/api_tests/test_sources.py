@@ -117,7 +117,7 @@ class TestSerperAPISource(unittest.TestCase):
 
 
 class TestRSSFeedSource(unittest.TestCase):
-    @patch("newsletter.sources.feedparser.parse")
+    @patch("newsletter_core.infrastructure.feed_fetcher.feedparser.parse")
     def test_fetch_news(self, mock_parse):
         """RSSFeedSource의 fetch_news 메서드 테스트"""
         # RSS 피드 모의 객체 설정
@@ -159,7 +159,7 @@ class TestRSSFeedSource(unittest.TestCase):
         self.assertEqual(articles[0]["source"], "Test RSS Feed")
         self.assertEqual(articles[0]["date"], "2023-05-20")
 
-    @patch("newsletter.sources.feedparser.parse")
+    @patch("newsletter_core.infrastructure.feed_fetcher.feedparser.parse")
     def test_feed_error(self, mock_parse):
         """RSS 피드 오류 처리 테스트"""
         # 오류 상태 설정
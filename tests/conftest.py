@@ -249,6 +249,45 @@ def remove_duplicate_articles(articles: List[Dict[str, Any]]) -> List[Dict[str,
     return unique_articles
 
 
+@pytest.fixture
+def restore_newsletter_modules():
+    """모듈 캐시를 비우고 재임포트하는 테스트 이후 원래 newsletter 모듈 객체를 복원"""
+    saved = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == "newsletter" or name.startswith(("newsletter.", "newsletter_core"))
+    }
+    yield
+    sys.modules.update(saved)
+
+
+@pytest.fixture
+def restore_settings_test_mode():
+    """enable_test_mode/disable_test_mode로 바꾼 설정 테스트 모드를 테스트마다 원복"""
+    settings_module = sys.modules.get("newsletter.centralized_settings")
+    if settings_module is None:
+        yield
+        return
+
+    test_mode = settings_module._test_mode
+    test_env_vars = dict(settings_module._test_env_vars)
+    yield
+    settings_module._test_mode = test_mode
+    settings_module._test_env_vars = test_env_vars
+    settings_module.clear_settings_cache()
+
+
+@pytest.fixture
+def isolated_search_cache(monkeypatch, tmp_path):
+    """검색 응답 캐시를 켠 채 테스트별 임시 DB로 교체 (모의 응답 재사용 방지)"""
+    from newsletter_core.infrastructure import search_cache
+
+    cache = search_cache.SearchResultCache(tmp_path / "search_cache.db")
+    monkeypatch.setenv("SEARCH_CACHE_ENABLED", "true")
+    monkeypatch.setattr(search_cache, "_shared_cache", cache)
+    return cache
+
+
 @pytest.fixture
 def mock_google_ai():
     """Google Generative AI Mock 픽스처"""
@@ -66,8 +66,9 @@ def test_get_newsletter_chain_compact_skips_detailed_path(
     monkeypatch.setattr(
         chains,
         "build_compact_newsletter_result",
-        lambda data, sections: compact_result,
+        lambda data, sections, side_content: compact_result,
     )
+    monkeypatch.setattr(chains, "prepare_compact_side_content", lambda data: {})
 
     payload = {"articles": [{"title": "A"}], "keywords": "AI"}
     result = chains.get_newsletter_chain(is_compact=True).invoke(payload)
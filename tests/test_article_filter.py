@@ -180,6 +180,34 @@ class TestArticleFilter(unittest.TestCase):
             f"Duplicate titles still exist: {duplicate_titles}",
         )
 
+    @patch("newsletter.article_filter.console")
+    def test_remove_duplicate_articles_matches_canonical_url_variants(
+        self, mock_console
+    ):
+        """정규 URL이 같은 모바일/추적 파라미터 변형은 하나만 남긴다"""
+        articles = [
+            {
+                "title": "첫 번째 기사",
+                "url": "https://n.news.naver.com/mnews/article/001/0000000001?sid=105",
+            },
+            {
+                "title": "모바일 링크",
+                "url": "https://m.news.naver.com/read.nhn?oid=001&aid=0000000001",
+            },
+            {
+                "title": "다른 쿼리의 기사",
+                "url": "https://example.com/view?id=2&utm_source=rss",
+            },
+            {"title": "또 다른 기사", "url": "https://example.com/view?id=3"},
+        ]
+
+        result = remove_duplicate_articles(articles)
+
+        self.assertEqual(
+            [article["title"] for article in result],
+            ["첫 번째 기사", "다른 쿼리의 기사", "또 다른 기사"],
+        )
+
     @patch("newsletter.article_filter.console")
     def test_filter_articles_by_domains(self, mock_console):
         """Test filtering articles by domains."""
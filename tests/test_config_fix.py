@@ -5,21 +5,25 @@
 
 import os
 import sys
+
 import pytest
 
 # 테스트 환경 설정
 os.environ["TESTING"] = "1"
 os.environ["MOCK_MODE"] = "true"
 
-# 모듈 캐시 클리어
-modules_to_clear = [
-    "newsletter.config_manager",
-    "newsletter.centralized_settings",
-    "newsletter",
-]
-for module in modules_to_clear:
-    if module in sys.modules:
-        del sys.modules[module]
+
+@pytest.fixture(autouse=True)
+def clear_config_modules(restore_newsletter_modules):
+    """모듈 캐시 클리어 - 원래 모듈은 restore_newsletter_modules가 테스트 후 복원"""
+    modules_to_clear = [
+        "newsletter.config_manager",
+        "newsletter.centralized_settings",
+        "newsletter",
+    ]
+    for module in modules_to_clear:
+        if module in sys.modules:
+            del sys.modules[module]
 
 
 def test_config_manager_import():
@@ -357,6 +357,9 @@ class TestEmailCompatibilityIntegration:
         ), patch(
             "newsletter.chains.build_compact_newsletter_result",
             return_value=compact_result,
+        ), patch(
+            "newsletter.chains.prepare_compact_side_content",
+            return_value={},
         ):
             newsletter_chain = get_newsletter_chain(is_compact=True)
             result = newsletter_chain.invoke(mock_articles_data)
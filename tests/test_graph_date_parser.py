@@ -9,12 +9,17 @@ import sys
 import unittest
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # graph.py에서 날짜 파싱 함수 import
 from newsletter.graph import parse_article_date_for_graph
 
+# setUp/tearDown의 disable_test_mode()가 다른 모듈로 새지 않도록 원복
+pytestmark = pytest.mark.usefixtures("restore_settings_test_mode")
+
 
 class TestGraphDateParser(unittest.TestCase):
     """그래프 날짜 파싱 기능 테스트 케이스"""
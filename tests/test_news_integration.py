@@ -8,6 +8,8 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -19,6 +21,9 @@ from newsletter_core.application.generation.collect import (  # noqa: E402
     collect_articles,
 )
 
+# 모의 응답이 공유 검색 캐시에 남지 않도록 테스트마다 임시 캐시 DB 사용
+pytestmark = pytest.mark.usefixtures("isolated_search_cache")
+
 
 class TestNewsIntegration(unittest.TestCase):
     """뉴스 수집 통합 테스트 케이스"""
@@ -8,12 +8,17 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # tools 모듈에서 뉴스 검색 함수 import
 from newsletter.tools import search_news_articles  # noqa: E402
 
+# 모의 응답이 공유 검색 캐시에 남지 않도록 테스트마다 임시 캐시 DB 사용
+pytestmark = pytest.mark.usefixtures("isolated_search_cache")
+
 
 class TestSerperApi(unittest.TestCase):
     """Serper.dev 뉴스 API 호출 테스트 케이스"""
@@ -55,7 +60,7 @@ class TestSerperApi(unittest.TestCase):
 class TestSerperApiMock(unittest.TestCase):
     """Serper.dev API 모의 호출 테스트"""
 
-    @patch("newsletter_core.infrastructure.tools_search_runtime.requests.request")
+    @patch("newsletter_core.infrastructure.tools_search_runtime.send_serper_request")
     def test_search_news_articles_api_call(self, mock_request):
         """search_news_articles 함수가 올바른 API 호출을 하는지 테스트합니다"""
         # 모의 응답 생성
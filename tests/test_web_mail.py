@@ -30,8 +30,9 @@ pytestmark = [pytest.mark.unit, pytest.mark.email, pytest.mark.mock_api]
 class TestWebMail:
     """Test web mail functionality"""
 
-    def setup_method(self):
-        """Setup test environment"""
+    @pytest.fixture(autouse=True)
+    def setup_mail_environment(self, restore_newsletter_modules):
+        """Setup test environment (cleared modules are restored after each test)"""
         # Set test environment variables
         os.environ["TESTING"] = "1"
         os.environ["MOCK_MODE"] = "true"
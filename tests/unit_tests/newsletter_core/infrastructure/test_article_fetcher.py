@@ -0,0 +1,116 @@
+"""Unit tests for newsletter_core.infrastructure.article_fetcher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from newsletter_core.application.article_extraction import ExtractedArticle
+from newsletter_core.infrastructure.article_content_cache import ArticleContentCache
+from newsletter_core.infrastructure.article_fetcher import (
+    ArticleFetchPolicy,
+    enrich_articles_with_full_text,
+    fetch_pages,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def _page(text: str) -> bytes:
+    return f"<html><body><article><p>{text}</p></article></body></html>".encode()
+
+
+def test_fetch_pages_caps_concurrency_per_domain() -> None:
+    in_flight: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, content=_page(request.url.path))
+
+    urls = [f"https://{host}.example/{n}" for host in ("a", "b") for n in range(4)]
+    results = fetch_pages(
+        urls,
+        policy=ArticleFetchPolicy(max_concurrency=8, per_domain_limit=2),
+        transport=httpx.MockTransport(handler),
+    )
+
+    assert {result.status for result in results.values()} == {"ok"}
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+def test_fetch_pages_reports_errors_and_deadline_timeouts() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/slow":
+            await asyncio.sleep(5)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"ok")
+
+    results = fetch_pages(
+        ["https://a.example/ok", "https://a.example/missing", "https://b.example/slow"],
+        policy=ArticleFetchPolicy(deadline_seconds=0.2),
+        transport=httpx.MockTransport(handler),
+    )
+
+    assert results["https://a.example/ok"].body == b"ok"
+    assert results["https://a.example/missing"].status == "error"
+    assert results["https://b.example/slow"].status == "timeout"
+
+
+def test_enrich_articles_reuses_content_cache_by_fingerprint(tmp_path) -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, content=_page("전체 본문 " + request.url.path))
+
+    cache = ArticleContentCache(tmp_path / "article_content.db")
+    transport = httpx.MockTransport(handler)
+    articles = [
+        {"title": "A", "url": "https://news.example/a?utm_source=rss"},
+        {"title": "B", "url": "https://news.example/b"},
+        {"title": "C", "url": "https://news.example/c"},
+    ]
+
+    first, first_report = enrich_articles_with_full_text(
+        articles, top_k=2, cache=cache, transport=transport
+    )
+    second, second_report = enrich_articles_with_full_text(
+        [{"title": "A2", "url": "https://www.news.example/a/"}],
+        top_k=2,
+        cache=cache,
+        transport=transport,
+    )
+
+    assert [article.get("content") for article in first] == [
+        "전체 본문 /a",
+        "전체 본문 /b",
+        None,
+    ]
+    assert (first_report.fetched, first_report.cached) == (2, 0)
+    assert second[0]["content"] == "전체 본문 /a"
+    assert (second_report.fetched, second_report.cached) == (0, 1)
+    assert len(requests) == 2
+
+
+def test_content_cache_deletes_expired_rows_on_put(tmp_path) -> None:
+    now = [1_000.0]
+    cache = ArticleContentCache(
+        tmp_path / "article_content.db", max_age_seconds=60, clock=lambda: now[0]
+    )
+    cache.put("old", "https://news.example/old", ExtractedArticle("old", "본문"))
+    now[0] += 61
+    cache.put("new", "https://news.example/new", ExtractedArticle("new", "본문"))
+
+    assert set(cache.get_many(["old", "new"])) == {"new"}
+    now[0] -= 61
+    # 만료된 행은 읽기에서 걸러지는 데 그치지 않고 삭제됨
+    assert set(cache.get_many(["old", "new"])) == {"new"}
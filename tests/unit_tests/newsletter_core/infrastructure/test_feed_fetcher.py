@@ -0,0 +1,153 @@
+"""Unit tests for newsletter_core.infrastructure.feed_fetcher."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from newsletter_core.infrastructure import feed_fetcher
+from newsletter_core.infrastructure.feed_state_store import FeedStateStore
+
+pytestmark = [pytest.mark.unit]
+
+FEED_URL = "https://feed.example/rss"
+
+
+def _item(index: int) -> str:
+    return (
+        f"<item><title>기사 {index}</title><link>https://feed.example/{index}</link>"
+        "<description>desc</description>"
+        "<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate></item>"
+    )
+
+
+def _feed(*indexes: int) -> bytes:
+    items = "".join(_item(index) for index in indexes)
+    body = f"<rss><channel><title>Example Feed</title>{items}</channel></rss>"
+    return body.encode("utf-8")
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes, etag: str | None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.responses: list[_FakeResponse] = []
+        self.sent_headers: list[dict[str, str]] = []
+
+    def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.sent_headers.append(dict(kwargs.get("headers") or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def client(monkeypatch) -> _FakeClient:
+    fake = _FakeClient()
+    monkeypatch.setattr(feed_fetcher, "get_http_client", lambda: fake)
+    return fake
+
+
+def test_fetch_feed_entries_uses_validators_and_serves_not_modified(
+    client: _FakeClient, tmp_path
+) -> None:
+    store = FeedStateStore(tmp_path / "feed_state.db")
+    client.responses = [
+        _FakeResponse(200, _feed(1, 2), '"v1"'),
+        _FakeResponse(304, b"", None),
+    ]
+
+    first = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+    second = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+
+    assert first.status == "fetched"
+    assert first.feed_title == "Example Feed"
+    assert first.parsed_entry_count == 2
+    assert [entry["title"] for entry in first.entries] == ["기사 1", "기사 2"]
+    assert first.entries[0]["date"] == "2026-03-02"
+    assert client.sent_headers[0] == {}
+    assert client.sent_headers[1] == {"If-None-Match": '"v1"'}
+    assert second.status == "not_modified"
+    assert second.parsed_entry_count == 0
+    assert second.entries == first.entries
+
+
+def test_fetch_feed_entries_skips_parsing_for_identical_body(
+    client: _FakeClient, tmp_path, monkeypatch
+) -> None:
+    store = FeedStateStore(tmp_path / "feed_state.db")
+    client.responses = [
+        _FakeResponse(200, _feed(1), None),
+        _FakeResponse(200, _feed(1), None),
+    ]
+    feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+
+    def fail_parse(*_args: Any, **_kwargs: Any) -> None:
+        raise AssertionError("unchanged feeds must not be parsed")
+
+    monkeypatch.setattr(feed_fetcher.feedparser, "parse", fail_parse)
+    result = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+
+    assert result.status == "unchanged"
+    assert [entry["title"] for entry in result.entries] == ["기사 1"]
+
+
+def test_fetch_feed_entries_parses_only_new_items(
+    client: _FakeClient, tmp_path
+) -> None:
+    store = FeedStateStore(tmp_path / "feed_state.db")
+    client.responses = [
+        _FakeResponse(200, _feed(1, 2), None),
+        _FakeResponse(200, _feed(3, 1, 2), None),
+    ]
+
+    feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+    result = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+
+    assert result.status == "fetched"
+    assert result.parsed_entry_count == 1
+    assert [entry["title"] for entry in result.entries] == [
+        "기사 3",
+        "기사 1",
+        "기사 2",
+    ]
+    stored = store.get(FEED_URL)
+    assert stored is not None
+    assert len(stored.entry_keys) == 3
+
+
+def test_full_parse_fallback_keeps_keys_for_the_next_incremental_fetch(
+    client: _FakeClient, tmp_path, monkeypatch
+) -> None:
+    store = FeedStateStore(tmp_path / "feed_state.db")
+    refreshed = _feed(1, 2).replace(b"Example Feed", b"Example Feed (updated)")
+    client.responses = [
+        _FakeResponse(200, _feed(1, 2), None),
+        _FakeResponse(200, refreshed, None),
+    ]
+    real_parse = feed_fetcher.feedparser.parse
+    calls: list[bytes] = []
+
+    def reject_one_block(body: bytes) -> Any:
+        parsed = real_parse(body)
+        calls.append(body)
+        if len(calls) == 1:
+            # 부분 파싱에서 블록 하나가 누락되어 전체 파싱으로 대체되는 상황
+            parsed["entries"] = parsed["entries"][:1]
+        return parsed
+
+    monkeypatch.setattr(feed_fetcher.feedparser, "parse", reject_one_block)
+    first = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+    second = feed_fetcher.fetch_feed_entries(FEED_URL, store=store)
+
+    assert first.parsed_entry_count == 2
+    assert second.status == "fetched"
+    assert second.parsed_entry_count == 0
+    assert second.entries == first.entries
@@ -0,0 +1,93 @@
+"""Unit tests for newsletter_core.infrastructure.http_client."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from newsletter_core.infrastructure import http_client
+from newsletter_core.infrastructure.http_client import (
+    HttpClientPolicy,
+    PooledHttpClient,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        return
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_http_client_reuses_keep_alive_connections(local_server: str) -> None:
+    client = PooledHttpClient(HttpClientPolicy(timeout=5))
+    try:
+        for _ in range(3):
+            response = client.get(f"{local_server}/feed")
+            assert response.text == "ok"
+
+        (stats,) = client.stats()
+    finally:
+        client.close()
+
+    assert stats.host == local_server
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.pool_hits == 2
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+@pytest.fixture
+def fresh_shared_client() -> Iterator[None]:
+    http_client.reset_http_client()
+    yield
+    http_client.reset_http_client()
+
+
+@pytest.mark.usefixtures("fresh_shared_client")
+def test_get_http_client_is_process_wide_and_resettable() -> None:
+    first = http_client.get_http_client()
+
+    assert http_client.get_http_client() is first
+
+    http_client.reset_http_client()
+    assert http_client.get_http_client() is not first
+
+
+def test_pooled_http_client_applies_default_timeout(monkeypatch) -> None:
+    client = PooledHttpClient(HttpClientPolicy(timeout=7))
+    captured: dict[str, object] = {}
+
+    def fake_request(**kwargs: object) -> str:
+        captured.update(kwargs)
+        return "response"
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+
+    assert client.post("https://example.com", json={"q": 1}) == "response"
+    assert captured["method"] == "POST"
+    assert captured["timeout"] == 7
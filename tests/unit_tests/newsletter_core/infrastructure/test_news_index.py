@@ -0,0 +1,140 @@
+"""Unit tests for newsletter_core.infrastructure.news_index and feed_prefetch."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from newsletter_core.infrastructure.feed_fetcher import FeedFetchResult
+from newsletter_core.infrastructure.feed_prefetch import prefetch_feeds
+from newsletter_core.infrastructure.news_index import NewsIndex, entry_published_ts
+
+pytestmark = [pytest.mark.unit]
+
+FEED_A = "https://feed-a.example/rss"
+FEED_B = "https://feed-b.example/rss"
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc).timestamp()
+
+
+def _entry(key: str, title: str, date: str = "2026-03-09") -> dict[str, Any]:
+    return {
+        "entry_key": key,
+        "title": title,
+        "link": f"https://news.example/{key}",
+        "description": "",
+        "content": "",
+        "date": date,
+    }
+
+
+@pytest.fixture
+def clock() -> list[float]:
+    return [NOW]
+
+
+@pytest.fixture
+def index(tmp_path, clock) -> NewsIndex:
+    return NewsIndex(tmp_path / "news_index.db", clock=lambda: clock[0])
+
+
+def test_index_feed_inserts_only_unseen_entries(index: NewsIndex) -> None:
+    assert index.index_feed(FEED_A, "A", [_entry("1", "반도체 투자")]) == 1
+    assert (
+        index.index_feed(FEED_A, "A", [_entry("1", "반도체 투자"), _entry("2", "AI 규제")])
+        == 1
+    )
+    assert index.stats()["articles"] == 2
+
+
+def test_search_matches_trigram_and_short_korean_terms(index: NewsIndex) -> None:
+    index.index_feed(
+        FEED_A,
+        "A",
+        [
+            _entry("1", "삼성전자 반도체 투자 확대"),
+            _entry("2", "AI 규제 법안 통과"),
+            _entry("3", "주말 날씨"),
+        ],
+    )
+
+    assert [hit.entry_key for hit in index.search(["반도체"])] == ["1"]
+    assert [hit.entry_key for hit in index.search(["ai"])] == ["2"]
+    assert sorted(hit.entry_key for hit in index.search(["반도체", "법안"])) == [
+        "1",
+        "2",
+    ]
+    assert index.search(["100%"]) == []
+
+
+def test_search_applies_feed_and_date_window(index: NewsIndex) -> None:
+    index.index_feed(
+        FEED_A,
+        "A",
+        [
+            _entry("old", "반도체 과거 기사", "2026-02-01"),
+            _entry("new", "반도체 최신 기사", "Mon, 09 Mar 2026 10:00:00 GMT"),
+            _entry("undated", "반도체 날짜 없음", "날짜 없음"),
+        ],
+    )
+    index.index_feed(FEED_B, "B", [_entry("b", "반도체 다른 피드")])
+
+    hits = index.search(["반도체"], feed_urls=[FEED_A], since_ts=NOW - 7 * 86400)
+
+    assert [hit.entry_key for hit in hits] == ["new", "undated"]
+    assert hits[0].feed_title == "A"
+
+
+def test_is_fresh_requires_every_feed_within_max_age(index, clock) -> None:
+    index.index_feed(FEED_A, "A", [])
+    assert index.is_fresh([FEED_A], 60) is True
+    assert index.is_fresh([FEED_A, FEED_B], 60) is False
+
+    clock[0] += 120
+    assert index.is_fresh([FEED_A], 60) is False
+
+
+def test_prune_drops_articles_past_retention(index, clock) -> None:
+    index.index_feed(FEED_A, "A", [_entry("1", "반도체 투자")])
+    clock[0] += 10 * 86400
+    index.index_feed(FEED_A, "A", [_entry("2", "반도체 수출")])
+
+    assert index.prune(5 * 86400) == 1
+    assert [hit.entry_key for hit in index.search(["반도체"])] == ["2"]
+
+
+def test_entry_published_ts_handles_feed_date_shapes() -> None:
+    assert (
+        entry_published_ts("2026-03-09")
+        == datetime(2026, 3, 9, tzinfo=timezone.utc).timestamp()
+    )
+    assert (
+        entry_published_ts("Mon, 09 Mar 2026 00:00:00 GMT")
+        == datetime(2026, 3, 9, tzinfo=timezone.utc).timestamp()
+    )
+    assert entry_published_ts("날짜 없음") is None
+
+
+def test_prefetch_feeds_indexes_each_feed_and_isolates_failures(
+    index: NewsIndex,
+) -> None:
+    def _fetch(feed_url: str, *, store: Any = None) -> FeedFetchResult:
+        if feed_url == FEED_B:
+            raise RuntimeError("boom")
+        return FeedFetchResult(
+            feed_url=feed_url,
+            status="fetched",
+            feed_title="A",
+            entries=(_entry("1", "반도체 투자"),),
+            parsed_entry_count=1,
+        )
+
+    reports = prefetch_feeds([FEED_A, FEED_B], index=index, fetch=_fetch)
+
+    assert [(r.status, r.indexed_count) for r in reports] == [
+        ("fetched", 1),
+        ("error", 0),
+    ]
+    assert reports[1].error == "boom"
+    assert index.refreshed_at([FEED_A, FEED_B]).keys() == {FEED_A}
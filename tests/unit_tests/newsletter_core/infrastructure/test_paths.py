@@ -11,6 +11,7 @@ from newsletter_core.infrastructure.platform._paths import (
     resolve_database_path,
     resolve_env_file_path,
     resolve_project_root,
+    resolve_state_dir,
     resolve_static_dir,
     resolve_template_dir,
 )
@@ -119,6 +120,18 @@ class TestPathResolution:
 
         assert db_path.startswith(project_root)
 
+    def test_resolve_state_dir_under_project_root(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        web_file = _setup_dev_web_dir(tmp_path)
+        monkeypatch.delattr(sys, "frozen", raising=False)
+        monkeypatch.delattr(sys, "_MEIPASS", raising=False)
+
+        project_root = resolve_project_root(str(web_file))
+        state_dir = resolve_state_dir(str(web_file))
+
+        assert state_dir == str(Path(project_root) / ".local" / "state" / "newsletter")
+
     def test_resolve_env_file_path_under_project_root(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
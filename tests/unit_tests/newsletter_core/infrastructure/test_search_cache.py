@@ -0,0 +1,157 @@
+"""Unit tests for newsletter_core.infrastructure.search_cache."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from newsletter_core.application.tools_search_flow import (
+    build_serper_batch_plans,
+    build_serper_search_plans,
+)
+from newsletter_core.application.tools_support import SearchRequest
+from newsletter_core.infrastructure.search_cache import (
+    SearchCachePolicy,
+    SearchResultCache,
+    fetch_with_search_cache,
+)
+from newsletter_core.infrastructure.tools_search_runtime import (
+    execute_cached_serper_batch_request,
+    execute_cached_serper_search_request,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeResponse:
+    def __init__(self, payload: Any) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return self._payload
+
+
+def _cache(tmp_path, clock: _Clock, **policy: Any) -> SearchResultCache:
+    return SearchResultCache(
+        tmp_path / "search_cache.db",
+        policy=SearchCachePolicy(**policy),
+        clock=clock,
+    )
+
+
+def test_normalized_queries_share_one_entry_and_count_hits(tmp_path) -> None:
+    cache = _cache(tmp_path, _Clock())
+    calls: list[str] = []
+
+    def fetch() -> dict[str, Any]:
+        calls.append("fetch")
+        return {"news": [{"title": "AI"}]}
+
+    first = fetch_with_search_cache("serper", "AI  반도체", 10, fetch, cache=cache)
+    second = fetch_with_search_cache("serper", " ai 반도체", 10, fetch, cache=cache)
+    other_num = fetch_with_search_cache("serper", "AI 반도체", 5, fetch, cache=cache)
+
+    assert first == second == other_num == {"news": [{"title": "AI"}]}
+    assert calls == ["fetch", "fetch"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_entries_expire_after_ttl_and_time_bucket(tmp_path) -> None:
+    clock = _Clock(now=86_400.0 * 10)
+    cache = _cache(tmp_path, clock, ttl_seconds=60, bucket_seconds=86_400)
+    key = cache.key_for("naver", "AI", 10, region="kr")
+    cache.store(key, {"items": []})
+
+    clock.now += 30
+    assert cache.lookup(key)[0] == "fresh"
+    clock.now += 31
+    assert cache.lookup(key)[0] == "miss"
+    assert cache.key_for("naver", "AI", 10, region="kr") == key
+    clock.now += 86_400
+    assert cache.key_for("naver", "AI", 10, region="kr") != key
+
+
+def test_store_evicts_least_recently_used_entries(tmp_path) -> None:
+    clock = _Clock()
+    cache = _cache(tmp_path, clock, max_entries=2)
+    keys = [cache.key_for("serper", query, 10) for query in ("a", "b", "c")]
+
+    cache.store(keys[0], {"q": "a"})
+    clock.now += 1
+    cache.store(keys[1], {"q": "b"})
+    clock.now += 1
+    cache.lookup(keys[0])
+    clock.now += 1
+    cache.store(keys[2], {"q": "c"})
+
+    assert cache.lookup(keys[0])[0] == "fresh"
+    assert cache.lookup(keys[1])[0] == "miss"
+    assert cache.stats().evictions == 1
+
+
+def test_stale_entries_are_served_while_revalidating(tmp_path) -> None:
+    clock = _Clock()
+    executor = ThreadPoolExecutor(max_workers=1)
+    cache = SearchResultCache(
+        tmp_path / "search_cache.db",
+        policy=SearchCachePolicy(ttl_seconds=60, stale_while_revalidate_seconds=600),
+        clock=clock,
+        refresh_executor=executor,
+    )
+    key = cache.key_for("serper", "AI", 10)
+    cache.store(key, {"version": 1})
+    clock.now += 120
+
+    served = cache.get_or_fetch(key, lambda: {"version": 2})
+    executor.shutdown(wait=True)
+
+    assert served == {"version": 1}
+    assert cache.lookup(key) == ("fresh", {"version": 2})
+    stats = cache.stats()
+    assert (stats.stale_hits, stats.refreshes) == (1, 1)
+
+
+def test_cached_serper_requests_share_entries_across_single_and_batch(
+    tmp_path,
+) -> None:
+    cache = _cache(tmp_path, _Clock())
+    plans = build_serper_search_plans(
+        SearchRequest(keywords=("AI", "반도체"), num_results=10), api_key="key"
+    )
+    sent: list[Any] = []
+
+    def request(**kwargs: Any) -> _FakeResponse:
+        body = json.loads(kwargs["data"])
+        sent.append(body)
+        if isinstance(body, list):
+            return _FakeResponse([{"news": [{"title": item["q"]}]} for item in body])
+        return _FakeResponse({"news": [{"title": body["q"]}]})
+
+    single = execute_cached_serper_search_request(
+        plans[0], request=request, cache=cache
+    )
+    (batch_plan,) = build_serper_batch_plans(plans, batch_size=2)
+    batch = execute_cached_serper_batch_request(
+        batch_plan, request=request, cache=cache
+    )
+
+    assert single == {"news": [{"title": "AI"}]}
+    assert batch == [{"news": [{"title": "AI"}]}, {"news": [{"title": "반도체"}]}]
+    assert [item["q"] for item in sent[1]] == ["반도체"]
+    assert cache.stats().hits == 1
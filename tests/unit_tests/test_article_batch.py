@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from newsletter.scoring import DEFAULT_WEIGHTS, rank_scored_articles
+from newsletter_core.application.article_batch import ArticleBatch
+from newsletter_core.application.article_dates import stamp_article_dates
+
+pytestmark = [pytest.mark.unit]
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _articles() -> list[dict]:
+    return stamp_article_dates(
+        [
+            {
+                "title": "A",
+                "source": "조선일보",
+                "date": "2026-03-10",
+                "scoring": {"relevance": 5, "impact": 4, "novelty": 3},
+            },
+            {
+                "title": "B",
+                "source": "뉴스1",
+                "date": "2026-02-01",
+                "scoring": {"relevance": 5, "impact": 5, "novelty": 5},
+            },
+            {"title": "C", "source": "블로그", "date": "날짜 없음"},
+            {
+                "title": "D",
+                "source": "블로그",
+                "date": "2026-03-11",
+                "scoring": {"relevance": "bad", "impact": 2},
+            },
+        ],
+        NOW,
+    )
+
+
+def _scalar_priority(article: dict, weights: dict, tier_score: float) -> float:
+    scoring = article.get("scoring") or {}
+
+    def _value(key: str) -> float:
+        try:
+            return float(scoring.get(key, 1))
+        except (TypeError, ValueError):
+            return 1.0
+
+    ts = article.get("date_ts")
+    recency = 0.0 if ts is None else math.exp(-(NOW.timestamp() - ts) / 86400 / 14)
+    return round(
+        (
+            weights["relevance"] * _value("relevance") / 5
+            + weights["impact"] * _value("impact") / 5
+            + weights["novelty"] * _value("novelty") / 5
+            + weights["source_tier"] * tier_score
+            + weights["recency"] * recency
+        )
+        * 100,
+        4,
+    )
+
+
+def test_priority_scores_match_scalar_formula() -> None:
+    articles = _articles()
+    batch = ArticleBatch.from_articles(articles)
+
+    scores = batch.priority_scores(DEFAULT_WEIGHTS, now=NOW)
+
+    assert batch.tier_scores.tolist() == [1.0, 0.6, 0.3, 0.3]
+    assert np.isnan(batch.timestamps[2])
+    assert scores.tolist() == [
+        _scalar_priority(article, DEFAULT_WEIGHTS, tier)
+        for article, tier in zip(articles, batch.tier_scores)
+    ]
+
+
+def test_top_n_keeps_input_order_for_ties_at_the_cutoff() -> None:
+    batch = ArticleBatch.from_articles([{"title": str(i)} for i in range(6)])
+    scores = np.array([1.0, 3.0, 2.0, 3.0, 2.0, 2.0])
+
+    assert batch.top_n(scores, 3).tolist() == [1, 3, 2]
+    assert batch.top_n(scores, None).tolist() == [1, 3, 2, 4, 5, 0]
+    assert batch.top_n(scores, 0).tolist() == []
+
+
+def test_tier_stats_are_grouped_best_tier_first() -> None:
+    batch = ArticleBatch.from_articles(_articles())
+    stats = batch.tier_stats(np.array([10.0, 20.0, 30.0, 50.0]))
+
+    assert list(stats) == [
+        "Tier 1 (주요 언론사)",
+        "Tier 2 (보조 언론사)",
+        "Tier 3 (기타 소스)",
+    ]
+    assert (stats["Tier 3 (기타 소스)"].count, stats["Tier 3 (기타 소스)"].mean_score) == (
+        2,
+        40.0,
+    )
+
+
+def test_rank_scored_articles_reranks_under_new_weights_without_llm() -> None:
+    articles = _articles()
+    tier_heavy = {
+        "relevance": 0.0,
+        "impact": 0.0,
+        "novelty": 0.0,
+        "source_tier": 1.0,
+        "recency": 0.0,
+    }
+    novelty_heavy = dict(tier_heavy, source_tier=0.0, novelty=1.0)
+
+    by_tier = rank_scored_articles(articles, top_n=2, weights=tier_heavy)
+    by_novelty = rank_scored_articles(articles, top_n=2, weights=novelty_heavy)
+
+    assert [a["title"] for a in by_tier] == ["A", "B"]
+    assert [a["title"] for a in by_novelty] == ["B", "A"]
+    assert articles[0]["source_tier_name"] == "Tier 1 (주요 언론사)"
+    assert articles[1]["priority_score"] == 100.0
+
+
+def test_recency_decays_with_fourteen_day_constant() -> None:
+    batch = ArticleBatch.from_articles(
+        stamp_article_dates([{"date": (NOW - timedelta(days=14)).isoformat()}], NOW)
+    )
+
+    assert math.isclose(batch.recency(NOW)[0], math.exp(-1))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import newsletter_core.application.article_dates as article_dates_module
+from newsletter.date_utils import _parse_absolute_date, parse_date_string
+from newsletter_core.application.article_dates import (
+    DATE_TIMESTAMP_FIELD,
+    article_datetime,
+    stamp_article_dates,
+)
+from newsletter_core.application.graph_node_helpers import (
+    filter_articles_for_processing,
+    sort_articles_by_graph_date_desc,
+)
+
+pytestmark = [pytest.mark.unit]
+
+REFERENCE = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def test_relative_dates_resolve_against_one_reference_time() -> None:
+    articles = stamp_article_dates(
+        [
+            {"date": "3시간 전"},
+            {"date": "2 days ago"},
+            {"date": "2026-03-01"},
+            {"date": "날짜 없음"},
+            {"date": "not-a-date"},
+        ],
+        REFERENCE,
+    )
+
+    assert [article[DATE_TIMESTAMP_FIELD] for article in articles] == [
+        (REFERENCE - timedelta(hours=3)).timestamp(),
+        (REFERENCE - timedelta(days=2)).timestamp(),
+        datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp(),
+        None,
+        None,
+    ]
+
+
+def test_stamped_timestamp_is_used_without_reparsing(monkeypatch) -> None:
+    article = stamp_article_dates([{"date": "2026-03-10"}], REFERENCE)[0]
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("stamped article date was parsed again")
+
+    monkeypatch.setattr(article_dates_module, "parse_date_string", _fail)
+
+    assert article_datetime(article) == datetime(2026, 3, 10, tzinfo=timezone.utc)
+    assert sort_articles_by_graph_date_desc([article]) == [article]
+    assert filter_articles_for_processing(
+        [article], news_period_days=7, current_time=REFERENCE
+    ) == [article]
+
+
+def test_absolute_date_strings_are_memoized() -> None:
+    parse_date_string("Mar 9, 2026")
+    hits = _parse_absolute_date.cache_info().hits
+
+    assert parse_date_string("Mar 9, 2026") == datetime(2026, 3, 9, tzinfo=timezone.utc)
+    assert _parse_absolute_date.cache_info().hits == hits + 1
+
+
+def test_parse_date_string_accepts_explicit_reference_time() -> None:
+    assert parse_date_string("어제", now=REFERENCE) == REFERENCE - timedelta(days=1)
+    assert parse_date_string("3 weeks ago", now=REFERENCE) == REFERENCE - timedelta(
+        weeks=3
+    )
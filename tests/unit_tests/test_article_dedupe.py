@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from newsletter_core.application.article_dedupe import (
+    NearDuplicateIndex,
+    find_near_duplicates,
+    title_tokens,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def _pairwise_matches(titles: list[str], threshold: float) -> list[bool]:
+    kept: list[frozenset[str]] = []
+    matches: list[bool] = []
+    for title in titles:
+        tokens = title_tokens(title)
+        similar = bool(tokens) and any(
+            seen and len(tokens & seen) / min(len(tokens), len(seen)) >= threshold
+            for seen in kept
+        )
+        if not similar:
+            kept.append(tokens)
+        matches.append(similar)
+    return matches
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.99])
+def test_find_near_duplicates_agrees_with_pairwise_scan(threshold: float) -> None:
+    rng = random.Random(threshold)
+    vocabulary = [f"w{index}" for index in range(40)] + ["반도체", "AI", "수출"]
+    titles: list[str] = []
+    for _ in range(400):
+        if titles and rng.random() < 0.3:
+            words = rng.choice(titles).split()
+            rng.shuffle(words)
+            titles.append(" ".join(words[: rng.randint(1, len(words))]))
+        else:
+            titles.append(" ".join(rng.sample(vocabulary, rng.randint(1, 9))))
+
+    indexed = [match is not None for match in find_near_duplicates(titles, threshold)]
+
+    assert indexed == _pairwise_matches(titles, threshold)
+
+
+def test_near_duplicate_index_matches_contained_titles_both_ways() -> None:
+    index = NearDuplicateIndex(0.99)
+    index.add(title_tokens("삼성 HBM 양산 돌입"))
+
+    assert index.find(title_tokens("HBM 양산")) == 0
+    assert index.find(title_tokens("삼성 HBM 양산 돌입 본격화")) == 0
+    assert index.find(title_tokens("SK HBM 양산")) is None
+    assert index.find(frozenset()) is None
+
+
+def test_find_near_duplicates_points_at_first_kept_title() -> None:
+    assert find_near_duplicates(["a b c", "", "x y", "c b a", "y x z"], 0.8) == [
+        None,
+        None,
+        None,
+        0,
+        2,
+    ]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from newsletter_core.application.article_enrichment import (
+    apply_full_text,
+    select_enrichment_targets,
+)
+from newsletter_core.application.article_extraction import (
+    ExtractedArticle,
+    extract_article_content,
+)
+from newsletter_core.application.article_identity import canonicalize_url
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def test_canonicalize_url_drops_tracking_and_normalizes_host() -> None:
+    assert (
+        canonicalize_url(
+            "HTTPS://www.News.example:443/a/b/?utm_source=x&id=2&fbclid=y&a=1#top"
+        )
+        == "https://news.example/a/b?a=1&id=2"
+    )
+    assert canonicalize_url("not a url") == "not a url"
+
+
+def test_select_enrichment_targets_takes_top_k_unique_fetchable_urls() -> None:
+    articles = [
+        {"url": "https://a.example/1?utm_medium=rss"},
+        {"url": "#"},
+        {"url": "https://a.example/1"},
+        {"link": "https://b.example/2"},
+        {"url": "https://c.example/3"},
+    ]
+
+    targets = select_enrichment_targets(articles, top_k=2)
+
+    assert [(t.index, t.canonical_url) for t in targets] == [
+        (0, "https://a.example/1"),
+        (3, "https://b.example/2"),
+    ]
+
+
+def test_apply_full_text_only_replaces_shorter_content() -> None:
+    articles = [
+        {"url": "https://a.example/1", "snippet": "짧은 요약"},
+        {"url": "https://b.example/2", "content": "이미 충분히 긴 본문 내용"},
+    ]
+    targets = select_enrichment_targets(articles, top_k=2)
+
+    enriched = apply_full_text(
+        articles,
+        targets,
+        {
+            targets[0].fingerprint: ExtractedArticle("A", "전체 기사 본문"),
+            targets[1].fingerprint: ExtractedArticle("B", "짧음"),
+        },
+    )
+
+    assert enriched[0]["content"] == "전체 기사 본문"
+    assert enriched[0]["full_text"] is True
+    assert enriched[1]["content"] == "이미 충분히 긴 본문 내용"
+    assert "content" not in articles[0]
+
+
+def test_extract_article_content_prefers_article_tag_and_strips_noise() -> None:
+    html = (
+        "<html><head><title> 제목 </title>"
+        '<meta name="description" content="요약"></head><body>'
+        "<nav>메뉴</nav><article><p>본문 첫 문단</p><script>x()</script>"
+        "<aside>광고</aside><p>둘째 문단</p></article></body></html>"
+    )
+
+    extracted = extract_article_content(html)
+
+    assert extracted.title == "제목"
+    assert extracted.content == "요약\n\n본문 첫 문단\n둘째 문단"
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from newsletter_core.application.article_extraction import (
+    extract_article_content_auto,
+    extract_article_content_density,
+    extract_article_content_density_only,
+    extract_article_content_heuristic,
+    resolve_article_extractor,
+)
+
+pytestmark = [pytest.mark.unit]
+
+FIXTURE_DIR = Path(__file__).resolve().parents[1] / "test_data" / "article_html"
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURE_DIR / name).read_bytes()
+
+
+def test_density_picks_body_over_related_link_lists() -> None:
+    extracted = extract_article_content_density(_fixture("br_article_body.html"))
+
+    assert extracted is not None
+    assert extracted.title.startswith("반도체 장비 투자 3년 만에 반등")
+    assert extracted.content.startswith("국내 반도체 장비 투자가 3년 만에")
+    assert "용인 클러스터 전력·용수 인프라" in extracted.content
+    assert "관련기사" not in extracted.content
+    assert "많이 본 뉴스" not in extracted.content
+    assert "대표전화" not in extracted.content
+
+
+@pytest.mark.parametrize(
+    ("fixture", "expected", "unexpected"),
+    [
+        ("paragraph_divs.html", "수익성 회복까지는 시간이", "봄맞이 구독 이벤트"),
+        ("table_layout.html", "최대 3억 원의 시설 구축비", "귀농 귀촌 박람회"),
+    ],
+)
+def test_density_recovers_bodies_the_heuristic_misses(
+    fixture: str, expected: str, unexpected: str
+) -> None:
+    html = _fixture(fixture)
+
+    extracted = extract_article_content_density(html)
+
+    assert extracted is not None
+    assert expected in extracted.content
+    assert unexpected not in extracted.content
+    heuristic = extract_article_content_heuristic(html)
+    assert expected not in heuristic.content or unexpected in heuristic.content
+
+
+def test_density_keeps_inline_text_on_its_sentence_line() -> None:
+    extracted = extract_article_content_density(_fixture("table_layout.html"))
+
+    assert extracted is not None
+    lines = extracted.content.splitlines()
+    assert ('농업기술원 관계자는 "데이터 기반 재배가 자리 잡으면서 청년 농가의 ' '정착률도 크게 높아졌다"고 말했다.') in lines[-2]
+    assert "데이터 기반 재배" not in lines
+
+
+def test_density_agrees_with_heuristic_on_article_tag_pages() -> None:
+    html = _fixture("article_tag_paragraphs.html")
+
+    density = extract_article_content_density(html)
+
+    assert density is not None
+    assert density.content == extract_article_content_heuristic(html).content
+
+
+def test_auto_falls_back_to_heuristic_when_density_abstains() -> None:
+    html = (
+        "<html><head><title>짧은 글</title></head><body>"
+        '<div class="content"><p>한 줄 본문</p></div></body></html>'
+    )
+
+    assert extract_article_content_density(html) is None
+    assert extract_article_content_auto(html).content == "한 줄 본문"
+
+
+def test_resolve_article_extractor_defaults_to_auto(caplog) -> None:
+    assert resolve_article_extractor("heuristic") is extract_article_content_heuristic
+    assert resolve_article_extractor(" AUTO ") is extract_article_content_auto
+    assert resolve_article_extractor(None) is extract_article_content_auto
+    assert resolve_article_extractor("density") is extract_article_content_density_only
+
+    with caplog.at_level("WARNING"):
+        assert resolve_article_extractor("densty") is extract_article_content_auto
+    assert "densty" in caplog.text
+
+
+def test_density_only_engine_returns_empty_content_when_it_abstains() -> None:
+    html = (
+        "<html><head><title>짧은 글</title></head><body>"
+        '<div class="content"><p>한 줄 본문</p></div></body></html>'
+    )
+
+    extracted = extract_article_content_density_only(html)
+
+    assert extracted.title == "짧은 글"
+    assert extracted.content == ""
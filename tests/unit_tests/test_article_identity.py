@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+from newsletter_core.application.article_identity import (
+    article_identity,
+    canonical_host,
+    canonicalize_url,
+    stamp_article_identities,
+)
+from newsletter_core.public.source_policies import filter_articles_by_source_policies
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://m.news.naver.com/read.nhn?mode=LSD&oid=001&aid=0012345678",
+            "https://n.news.naver.com/article/001/0012345678",
+        ),
+        (
+            "https://n.news.naver.com/mnews/article/001/0012345678?sid=105",
+            "https://n.news.naver.com/article/001/0012345678",
+        ),
+        (
+            "https://news.naver.com/main/read.naver?oid=001&aid=0012345678",
+            "https://n.news.naver.com/article/001/0012345678",
+        ),
+        (
+            "https://m.news.daum.net/v/20260302101500123?f=o",
+            "https://v.daum.net/v/20260302101500123",
+        ),
+        (
+            "https://www-example-com.cdn.ampproject.org/c/s/www.example.com/n/1/amp",
+            "https://example.com/n/1",
+        ),
+        (
+            "https://www.google.com/url?q=https://amp.example.com/amp/n/1?utm_medium=x",
+            "https://example.com/n/1",
+        ),
+        (
+            "https://mobile.example.com/n/1?outputType=amp&id=3",
+            "https://example.com/n/1?id=3",
+        ),
+    ],
+)
+def test_canonicalize_url_collapses_portal_amp_mobile_and_redirect_links(
+    url: str, expected: str
+) -> None:
+    assert canonicalize_url(url) == expected
+
+
+def test_canonical_host_keeps_short_hosts_intact() -> None:
+    assert canonical_host("WWW.M.Example.COM.") == "example.com"
+    assert canonical_host("m.com") == "m.com"
+
+
+def test_fingerprint_ignores_scheme_and_falls_back_to_title() -> None:
+    http = article_identity({"url": "http://example.com/a"})
+    https = article_identity({"link": "https://www.example.com/a/"})
+    untitled_url = article_identity({"url": "#", "title": "AI 반도체, 투자 확대!"})
+
+    assert http.fingerprint == https.fingerprint
+    assert https.canonical_host == "example.com"
+    assert untitled_url.canonical_url == ""
+    assert untitled_url.fingerprint == (
+        article_identity({"title": "ai 반도체 투자 확대"}).fingerprint
+    )
+
+
+def test_stamped_identity_is_reused_downstream() -> None:
+    articles = stamp_article_identities(
+        [{"title": "A", "url": "https://m.blocked.example/news/1", "source": "X"}]
+    )
+
+    assert articles[0]["canonical_host"] == "blocked.example"
+    assert (
+        filter_articles_by_source_policies(articles, blocklist=["blocked.example"])
+        == []
+    )
+
+    articles[0]["url"] = "https://other.example/changed"
+    assert article_identity(articles[0]).canonical_host == "blocked.example"
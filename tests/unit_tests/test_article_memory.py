@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from newsletter_core.application.article_batch import ArticleBatch
+from newsletter_core.application.article_identity import stamp_article_identities
+from newsletter_core.application.article_memory import (
+    PREVIOUSLY_DELIVERED_FIELD,
+    ArticleMemory,
+    apply_article_memory,
+    record_issue_articles,
+    use_article_memory,
+)
+
+WEB_DIR = Path(__file__).resolve().parents[2] / "web"
+if str(WEB_DIR) not in sys.path:
+    sys.path.insert(0, str(WEB_DIR))
+
+import db_core  # noqa: E402
+from db_article_memory import find_delivered_fingerprints  # noqa: E402
+from db_article_memory import (  # noqa: E402
+    record_delivered_articles as persist_delivered_articles,
+)
+from db_state import (  # noqa: E402
+    DELIVERY_STATUS_DRAFT,
+    DELIVERY_STATUS_PENDING_APPROVAL,
+    DELIVERY_STATUS_SEND_FAILED,
+    ensure_database_schema,
+)
+from routes_approval import register_approval_routes  # noqa: E402
+
+from tasks import generate_newsletter_task  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _articles() -> list[dict]:
+    return stamp_article_identities(
+        [
+            {"title": title, "url": f"https://news.example.com/{title}"}
+            for title in "ABC"
+        ]
+    )
+
+
+def test_memory_marks_or_drops_repeats_with_one_batch_lookup() -> None:
+    articles = _articles()
+    calls: list[list[str]] = []
+
+    def _lookup(fingerprints):
+        calls.append(list(fingerprints))
+        return {articles[1]["fingerprint"]}
+
+    downweight = ArticleMemory("schedule:daily", _lookup)
+    exclude = ArticleMemory("schedule:daily", _lookup, mode="exclude")
+
+    with use_article_memory(downweight):
+        kept = apply_article_memory(articles)
+    assert [a["title"] for a in kept] == ["A", "B", "C"]
+    assert [a.get(PREVIOUSLY_DELIVERED_FIELD) for a in kept] == [None, True, None]
+
+    assert [a["title"] for a in exclude.apply(_articles())] == ["A", "C"]
+    assert exclude.repeated == 1
+    assert len(calls) == 2 and len(calls[0]) == 3
+    assert apply_article_memory(articles) is articles
+
+
+def test_repeat_delivery_halves_the_priority_score() -> None:
+    articles = [{"title": "A"}, {"title": "A", PREVIOUSLY_DELIVERED_FIELD: True}]
+    weights = dict.fromkeys(
+        ("relevance", "impact", "novelty", "source_tier", "recency"), 0.2
+    )
+
+    scores = ArticleBatch.from_articles(articles).priority_scores(weights, now=NOW)
+
+    assert scores[1] == pytest.approx(scores[0] / 2, abs=1e-4)
+
+
+def test_delivered_fingerprints_respect_scope_and_retention(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+    persist_delivered_articles(
+        db_path,
+        "schedule:a",
+        ["old"],
+        job_id="job-1",
+        retention_days=30,
+        now=NOW - timedelta(days=10),
+    )
+    persist_delivered_articles(
+        db_path,
+        "schedule:a",
+        ["fresh", "old"],
+        job_id="job-2",
+        retention_days=7,
+        now=NOW,
+    )
+    persist_delivered_articles(
+        db_path, "schedule:b", ["other"], job_id="job-3", retention_days=7, now=NOW
+    )
+
+    statements: list[str] = []
+    original_connect = db_core.connect_db
+
+    def _traced_connect(path: str) -> sqlite3.Connection:
+        conn = original_connect(path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    with patch.object(db_core, "connect_db", _traced_connect):
+        seen = find_delivered_fingerprints(
+            db_path,
+            "schedule:a",
+            ["fresh", "old", "other", "new"],
+            retention_days=7,
+            now=NOW,
+        )
+
+    assert seen == {"fresh", "old"}
+    assert sum("delivered_articles" in statement for statement in statements) == 1
+    assert (
+        find_delivered_fingerprints(
+            db_path,
+            "schedule:a",
+            ["old"],
+            retention_days=1,
+            now=NOW + timedelta(days=2),
+        )
+        == set()
+    )
+
+
+def _fake_generate(request, repeated_counts: list[int] | None = None):
+    memory = request.article_memory
+    with use_article_memory(memory):
+        kept = apply_article_memory(_articles())
+        record_issue_articles(kept)
+    if repeated_counts is not None:
+        repeated_counts.append(memory.repeated)
+    return {
+        "status": "success",
+        "html_content": "<html><head><title>Issue</title></head></html>",
+        "title": "Issue",
+        "generation_stats": {},
+        "input_params": {},
+        "error": None,
+    }
+
+
+def _delivered(db_path: str, scope: str = "schedule:daily_1") -> set[str]:
+    fingerprints = [article["fingerprint"] for article in _articles()]
+    return find_delivered_fingerprints(db_path, scope, fingerprints, retention_days=30)
+
+
+def test_schedule_task_excludes_and_records_sent_articles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+    monkeypatch.setenv("ARTICLE_MEMORY_MODE", "exclude")
+    repeated_counts: list[int] = []
+    data = {"keywords": ["AI"], "email": "reader@example.com"}
+
+    with patch(
+        "tasks.generate_newsletter",
+        side_effect=lambda request: _fake_generate(request, repeated_counts),
+    ), patch("tasks.send_email_with_outbox", return_value={"skipped": False}):
+        generate_newsletter_task(
+            data, "schedule_daily_1_abc", send_email=True, database_path=db_path
+        )
+        generate_newsletter_task(
+            data, "schedule_daily_1_def", send_email=True, database_path=db_path
+        )
+
+    assert repeated_counts == [0, 3]
+    assert _delivered(db_path) == {a["fingerprint"] for a in _articles()}
+
+
+def test_unsent_issues_are_not_remembered(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+    data = {"keywords": ["AI"], "email": "reader@example.com"}
+
+    with patch("tasks.generate_newsletter", side_effect=_fake_generate), patch(
+        "tasks.send_email_with_outbox", side_effect=RuntimeError("smtp down")
+    ):
+        failed = generate_newsletter_task(
+            data, "schedule_daily_1_abc", send_email=True, database_path=db_path
+        )
+        draft = generate_newsletter_task(
+            {"keywords": ["AI"]}, "schedule_daily_1_def", database_path=db_path
+        )
+
+    assert failed["delivery_status"] == DELIVERY_STATUS_SEND_FAILED
+    assert draft["delivery_status"] == DELIVERY_STATUS_DRAFT
+    assert _delivered(db_path) == set()
+
+
+def test_pending_approval_issue_is_remembered_once_approved(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+    data = {"keywords": ["AI"], "email": "reader@example.com", "require_approval": True}
+
+    with patch("tasks.generate_newsletter", side_effect=_fake_generate):
+        pending = generate_newsletter_task(
+            data, "schedule_daily_1_abc", send_email=True, database_path=db_path
+        )
+
+    assert pending["delivery_status"] == DELIVERY_STATUS_PENDING_APPROVAL
+    assert _delivered(db_path) == set()
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    register_approval_routes(app, db_path)
+    response = app.test_client().post("/api/approvals/schedule_daily_1_abc/approve")
+
+    assert response.status_code == 200
+    assert _delivered(db_path) == {a["fingerprint"] for a in _articles()}
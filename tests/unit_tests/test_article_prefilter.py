@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from newsletter.scoring import DEFAULT_WEIGHTS, score_articles
+from newsletter_core.application.article_dates import stamp_article_dates
+from newsletter_core.application.article_prefilter import (
+    SCORING_STAGE_FIELD,
+    STAGE_LLM,
+    STAGE_PREFILTER,
+    bm25_scores,
+    lexical_tokens,
+    prefilter_articles,
+)
+
+pytestmark = [pytest.mark.unit]
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _articles() -> list[dict]:
+    return stamp_article_dates(
+        [
+            {
+                "title": "날씨 소식",
+                "snippet": "주말 내내 맑음",
+                "source": "블로그",
+                "date": "2026-03-11",
+            },
+            {
+                "title": "AI반도체 수출 급증",
+                "snippet": "반도체가 수출을 이끌었다",
+                "source": "블로그",
+                "date": "2026-03-10",
+            },
+            {
+                "title": "스포츠 결과",
+                "snippet": "AI 심판 도입",
+                "source": "블로그",
+                "date": "2026-03-01",
+            },
+        ],
+        NOW,
+    )
+
+
+def test_hangul_bigrams_match_particles_and_compounds() -> None:
+    assert lexical_tokens("AI반도체가") == ["ai", "반도", "도체", "체가"]
+
+    documents = [lexical_tokens(text) for text in ("반도체가 호황", "날씨 맑음")]
+    scores = bm25_scores(documents, lexical_tokens("반도체"))
+
+    assert scores[0] > 0 and scores[1] == 0
+
+
+def test_prefilter_keeps_top_k_and_stamps_audit_metadata() -> None:
+    articles = _articles()
+
+    result = prefilter_articles(
+        articles, ["AI", "반도체"], top_k=2, weights=DEFAULT_WEIGHTS, now=NOW
+    )
+
+    assert [a["title"] for a in result.candidates] == [
+        "AI반도체 수출 급증",
+        "스포츠 결과",
+    ]
+    assert [a["title"] for a in result.skipped] == ["날씨 소식"]
+    stages = [a[SCORING_STAGE_FIELD] for a in result.candidates + result.skipped]
+    assert [s["stage"] for s in stages] == [STAGE_LLM, STAGE_LLM, STAGE_PREFILTER]
+    assert [s["prefilter_rank"] for s in stages] == [1, 2, 3]
+    assert stages[0]["lexical_relevance"] == 1.0
+
+
+def test_score_articles_sends_only_prefiltered_candidates_to_llm() -> None:
+    articles = _articles()
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(
+        content='{"relevance":4,"impact":3,"novelty":3}'
+    )
+
+    ranked = score_articles(
+        articles,
+        "AI",
+        top_n=None,
+        weights=DEFAULT_WEIGHTS,
+        llm=llm,
+        prefilter_top_k=1,
+        query=["반도체"],
+    )
+
+    assert llm.invoke.call_count == 1
+    assert [a["title"] for a in ranked] == ["AI반도체 수출 급증"]
+    assert set(ranked[0]) >= {"scoring", "priority_score", SCORING_STAGE_FIELD}
+    assert articles[0][SCORING_STAGE_FIELD]["stage"] == STAGE_PREFILTER
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+
+from newsletter_core.application import graph_node_helpers
+from newsletter_core.application.article_store import ArticleStore
+from newsletter_core.application.graph_workflow import build_initial_graph_state
+
+pytestmark = [pytest.mark.unit]
+
+
+def _record(index: int, **overrides: object) -> dict:
+    record = {
+        "title": f"기사 {index}",
+        "url": f"https://news.example.com/{index}",
+        "link": f"https://news.example.com/{index}",
+        "snippet": "요약",
+        "content": "요약",
+        "source": "연합" + "뉴스",
+        "date": "2026-03-10",
+        "custom": {"rank": index},
+    }
+    record.update(overrides)
+    return record
+
+
+def test_round_trip_preserves_keys_order_and_values() -> None:
+    store = ArticleStore()
+    original = _record(1, scoring={"relevance": 5})
+
+    article_id = store.add(original)
+
+    assert list(store.record(article_id)) == list(original)
+    assert store.record(article_id) == original
+    assert store.get(article_id).get("custom") == {"rank": 1}
+    assert store.get(article_id).get("missing", "-") == "-"
+
+
+def test_shared_strings_are_held_once() -> None:
+    store = ArticleStore()
+    first, second = store.add_many([_record(1), _record(2)])
+    a, b = store.get(first), store.get(second)
+
+    assert a.source is b.source
+    assert a.layout is b.layout
+    assert a.content is a.snippet
+    assert a.link is a.url
+
+
+def test_commit_keeps_ids_of_checked_out_records_and_adds_new_ones() -> None:
+    store = ArticleStore()
+    ids = store.add_many([_record(1), _record(2), _record(3)])
+
+    records = store.records(ids)
+    records[2]["priority_score"] = 88.0
+    committed = store.commit([records[2], records[0], _record(4)])
+
+    assert committed == [ids[2], ids[0], 3]
+    assert store.record(ids[2])["priority_score"] == 88.0
+    assert store.commit([records[1]]) == [4]
+
+
+def test_graph_state_carries_article_ids_between_nodes() -> None:
+    state = build_initial_graph_state(
+        keywords=["AI"],
+        news_period_days=7,
+        domain=None,
+        template_style="compact",
+        email_compatible=False,
+        newsletter_topic="AI",
+        workflow_start=0.0,
+        theme_time=0.0,
+    )
+    state = graph_node_helpers.build_collect_success_state(
+        state, articles=[_record(1), _record(2)], elapsed=0.1
+    )
+
+    collected = graph_node_helpers.resolve_state_articles(state, "collected")
+    state = graph_node_helpers.build_process_success_state(
+        state, processed_articles=[collected[1]], elapsed=0.1
+    )
+    processed = graph_node_helpers.resolve_state_articles(state, "processed")
+    processed[0]["priority_score"] = 70.0
+    state = graph_node_helpers.build_score_success_state(
+        state, ranked_articles=processed, elapsed=0.1
+    )
+
+    assert state["collected_article_ids"] == [0, 1]
+    assert state["ranked_article_ids"] == [1]
+    assert state["ranked_articles"] is None
+    assert len(state["article_store"]) == 2
+    ranked = graph_node_helpers.resolve_state_articles(state, "ranked", checkout=False)
+    assert ranked[0]["title"] == "기사 2"
+    assert ranked[0]["priority_score"] == 70.0
+    assert ranked[0]["canonical_host"] == "news.example.com"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from newsletter.article_filter import remove_duplicate_articles
+from newsletter_core.application.article_dedupe import IncrementalArticleDeduper
+from newsletter_core.application.article_stream import (
+    BoundedArticleBuffer,
+    process_article_stream,
+)
+from newsletter_core.application.graph_node_helpers import (
+    filter_articles_for_processing,
+    sort_articles_by_graph_date_desc,
+)
+
+pytestmark = [pytest.mark.unit]
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _articles() -> list[dict[str, str]]:
+    return [
+        {"title": "반도체 수출 증가", "url": "https://a.com/1", "date": "2026-03-09"},
+        {"title": "오래된 기사", "url": "https://a.com/old", "date": "2026-01-01"},
+        {"title": "날짜 없는 기사", "url": "https://b.com/2", "date": "날짜 없음"},
+        {"title": "반도체 수출 증가", "url": "https://c.com/3", "date": "2026-03-10"},
+        {"title": "AI 칩 발표", "url": "https://m.a.com/4?utm_source=x", "date": ""},
+        {"title": "배터리 공장", "url": "https://a.com/5", "date": "2026-03-11"},
+        {"title": "이상한 날짜", "url": "https://d.com/6", "date": "not-a-date"},
+        {"title": "AI 칩 발표 재탕", "url": "https://a.com/4", "date": ""},
+    ]
+
+
+def test_process_article_stream_matches_batch_filter_dedupe_sort() -> None:
+    batch = sort_articles_by_graph_date_desc(
+        remove_duplicate_articles(
+            filter_articles_for_processing(
+                _articles(), news_period_days=7, current_time=NOW
+            )
+        )
+    )
+
+    result = process_article_stream(
+        iter(_articles()), news_period_days=7, current_time=NOW, max_articles=50
+    )
+
+    assert [a["title"] for a in result.articles] == [a["title"] for a in batch]
+    assert result.stats.received == 8
+    assert result.stats.expired == 1
+    assert result.stats.duplicate_reasons == {"title": 1, "url": 1}
+    assert result.articles[0]["fingerprint"]
+
+
+def test_process_article_stream_keeps_only_newest_articles_when_bounded() -> None:
+    articles = [
+        {
+            "title": f"기사 {day}",
+            "url": f"https://a.com/{day}",
+            "date": f"2026-03-{day:02d}",
+        }
+        for day in (5, 10, 7, 9, 6)
+    ]
+
+    result = process_article_stream(
+        articles, news_period_days=30, current_time=NOW, max_articles=2
+    )
+
+    assert [a["title"] for a in result.articles] == ["기사 10", "기사 9"]
+    assert result.stats.evicted == 3
+    assert result.stats.peak_buffered == 2
+
+
+def test_bounded_buffer_orders_undated_after_dated_in_legacy_order() -> None:
+    buffer = BoundedArticleBuffer(10)
+    buffer.push({"title": "bad"}, "unparseable", None)
+    buffer.push({"title": "missing"}, "missing", None)
+    buffer.push({"title": "dated"}, "recent", datetime(2026, 3, 1, tzinfo=timezone.utc))
+
+    assert [a["title"] for a in buffer.drain()] == ["dated", "missing", "bad"]
+    assert len(buffer) == 0
+
+
+def test_incremental_deduper_keeps_differentiating_word_exception() -> None:
+    deduper = IncrementalArticleDeduper()
+
+    assert deduper.check({"title": "삼성 HBM 양산", "url": "https://a.com/1"}) is None
+    assert deduper.check({"title": "삼성 HBM 양산!", "url": "https://a.com/2"}) == "title"
+    assert deduper.check({"title": "삼성 HBM 양산 발표", "url": "https://a.com/3"}) is None
+    assert deduper.check({"title": "", "url": ""}) == "empty"
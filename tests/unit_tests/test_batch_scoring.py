@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from newsletter.scoring import DEFAULT_WEIGHTS, score_articles
+from newsletter_core.application.batch_scoring import (
+    pack_batches,
+    parse_batch_scores,
+    score_in_batches,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def _articles(count: int) -> list[dict]:
+    return [{"title": f"기사 {i}", "snippet": "요약"} for i in range(1, count + 1)]
+
+
+def _requested_ids(prompt: str) -> list[int]:
+    return [int(value) for value in re.findall(r"\[id=(\d+)\]", prompt)]
+
+
+def test_parse_is_lenient_about_wrapping_but_strict_about_ids_and_ranges() -> None:
+    reply = """```json
+    [{"id": 1, "relevance": 5, "impact": 4, "novelty": 3},
+     {"id": "2", "relevance": 9, "impact": 4, "novelty": 3},
+     {"id": 7, "relevance": 2, "impact": 2, "novelty": 2},
+     {"id": 3, "relevance": 2, "impact": 2}]
+    ```"""
+
+    assert parse_batch_scores(reply, [1, 2, 3]) == {
+        1: {"relevance": 5, "impact": 4, "novelty": 3}
+    }
+    broken = '[{"id": 1, "relevance": 4, "impact": 4, "novelty": 4}, {"id": 2,'
+    assert list(parse_batch_scores(broken, [1, 2])) == [1]
+    single = '{"relevance": 3, "impact": 3, "novelty": 3}'
+    assert parse_batch_scores(single, [5]) == {
+        5: {"relevance": 3, "impact": 3, "novelty": 3}
+    }
+
+
+def test_batches_respect_article_count_and_token_budget() -> None:
+    entries = [(1, "a" * 40), (2, "b" * 40), (3, "가" * 15), (4, "c" * 40)]
+
+    batches = pack_batches(entries, max_articles=3, token_budget=20)
+
+    assert [[i for i, _ in batch] for batch in batches] == [[1, 2], [3], [4]]
+
+
+def test_missing_ids_are_reasked_and_only_failures_fall_back() -> None:
+    prompts: list[list[int]] = []
+
+    def _invoke(prompt: str) -> str:
+        ids = _requested_ids(prompt)
+        prompts.append(ids)
+        # first round drops article 2 and returns garbage for article 3
+        if len(prompts) == 1:
+            return json.dumps(
+                [{"id": 1, "relevance": 5, "impact": 5, "novelty": 5}]
+                + [{"id": 3, "relevance": "high", "impact": 1, "novelty": 1}]
+            )
+        return json.dumps([{"id": 2, "relevance": 2, "impact": 2, "novelty": 2}])
+
+    singles: list[str] = []
+
+    def _single(article: dict) -> dict:
+        singles.append(article["title"])
+        return {"relevance": 1, "impact": 1, "novelty": 1}
+
+    scores, report = score_in_batches(
+        _articles(3), "AI", _invoke, _single, batch_size=4
+    )
+
+    assert prompts == [[1, 2, 3], [2, 3]]
+    assert singles == ["기사 3"]
+    assert [s["relevance"] for s in scores] == [5, 2, 1]
+    assert (report.prompts, report.batched, report.reasked, report.fallback) == (
+        2,
+        1,
+        [2, 3],
+        [3],
+    )
+
+
+def test_score_articles_batches_prompts_and_keeps_scoring_contract() -> None:
+    llm = MagicMock()
+
+    def _reply(messages):
+        ids = _requested_ids(messages[0].content)
+        return AIMessage(
+            content=json.dumps(
+                [{"id": i, "relevance": 6 - i, "impact": 3, "novelty": 3} for i in ids]
+            )
+        )
+
+    llm.invoke.side_effect = _reply
+    articles = _articles(5)
+
+    ranked = score_articles(
+        articles, "AI", top_n=None, weights=DEFAULT_WEIGHTS, llm=llm, batch_size=3
+    )
+
+    assert llm.invoke.call_count == 2
+    assert articles[0]["scoring"] == {"relevance": 5, "impact": 3, "novelty": 3}
+    assert [a["title"] for a in ranked] == [f"기사 {i}" for i in range(1, 6)]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from newsletter import chains_summarization
+from newsletter_core.application.graph_composition import build_summarize_result_state
+from newsletter_core.application.graph_workflow import build_generation_info
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+class _SlowLLM:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def invoke(self, messages):
+        prompt = messages[0].content
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            # 먼저 요청된 카테고리가 가장 늦게 끝나도록 지연
+            time.sleep(0.15 if "카테고리A" in prompt else 0.05)
+            if "카테고리B" in prompt:
+                raise ConnectionError("connection reset")
+            title = "카테고리A" if "카테고리A" in prompt else "카테고리C"
+            return AIMessage(
+                content=f'```json\n{{"intro": "{title} 요약", "definitions": []}}\n```'
+            )
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_categories_are_summarized_concurrently_in_category_order(
+    monkeypatch,
+) -> None:
+    llm = _SlowLLM()
+    monkeypatch.setattr(chains_summarization, "get_llm", lambda **_: llm)
+    monkeypatch.setattr(chains_summarization, "_summary_concurrency", lambda: 3)
+    chain = chains_summarization.build_summarization_chain(
+        "{category_title}\n{category_articles}", is_compact=True
+    )
+    articles = [{"title": f"기사 {i}", "url": f"https://e.com/{i}"} for i in (1, 2)]
+
+    result = chain.invoke(
+        {
+            "categories_data": {
+                "categories": [
+                    {"title": "카테고리A", "article_indices": [1]},
+                    {"title": "카테고리B", "article_indices": [2]},
+                    {"title": "카테고리C", "article_indices": [1, 2]},
+                ]
+            },
+            "articles_data": {"articles": articles},
+        }
+    )
+
+    assert llm.peak == 3
+    sections = result["sections"]
+    assert [s["title"] for s in sections] == ["카테고리A", "카테고리B", "카테고리C"]
+    assert sections[0]["intro"] == "카테고리A 요약"
+    # 실패한 카테고리만 기본 구조로 대체
+    assert sections[1]["intro"] == "카테고리B에 대한 주요 동향입니다."
+    assert [s["url"] for s in sections[1]["articles"]] == ["https://e.com/2"]
+    latencies = result["category_latencies"]
+    assert [item["title"] for item in latencies] == ["카테고리A", "카테고리B", "카테고리C"]
+    assert latencies[0]["seconds"] >= 0.15
+
+
+def test_category_latencies_reach_generation_info() -> None:
+    latencies = [{"title": "카테고리A", "seconds": 1.25}]
+    state = build_summarize_result_state(
+        {"keywords": ["AI"], "domain": "AI", "step_times": {}},  # type: ignore[typeddict-item]
+        {"html": "<html></html>", "sections": [], "category_latencies": latencies},
+        plan={
+            "template_style": "compact",
+            "is_compact": True,
+            "article_count": 1,
+            "chain_payload": {},
+        },
+        generated_at=datetime(2026, 3, 11),
+        elapsed=2.0,
+    )
+
+    info = build_generation_info(state, None)
+
+    assert info["category_latencies"] == latencies
+    assert info["step_times"] == {"summarize": 2.0}
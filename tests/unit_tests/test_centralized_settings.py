@@ -108,8 +108,8 @@ class TestGetSettingsSingleton:
 
 
 @pytest.fixture(autouse=True)
-def clear_settings_cache_fixture():
-    """각 테스트 전후에 설정 캐시를 클리어"""
+def clear_settings_cache_fixture(restore_settings_test_mode):
+    """각 테스트 전후에 설정 캐시를 클리어 (테스트 모드는 모듈 밖으로 새지 않게 원복)"""
     clear_settings_cache()
     disable_test_mode()
     yield
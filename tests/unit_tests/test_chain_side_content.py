@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any
+
+import pytest
+
+from newsletter import chains, chains_rendering
+from newsletter.chains_rendering import _render_with_template
+from newsletter.template_manager import TemplateManager
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+class _StubRunnable:
+    def __init__(self, result: Any, wait_for: threading.Event | None = None) -> None:
+        self.result = result
+        self.wait_for = wait_for
+
+    def invoke(self, payload: Any) -> Any:
+        if self.wait_for is not None:
+            # 부가 생성 작업이 요약 단계와 겹쳐 실행되지 않으면 타임아웃
+            assert self.wait_for.wait(timeout=2)
+        return self.result
+
+
+def test_compact_side_content_runs_alongside_summarization(monkeypatch) -> None:
+    side_started = threading.Event()
+    received: dict[str, Any] = {}
+
+    def prepare(data):
+        side_started.set()
+        return {"newsletter_topic": "모빌리티", "food_for_thought": "생각해 볼 거리"}
+
+    def build(data, sections_data, side_content):
+        received.update(side_content)
+        return {"mode": "compact", "html": "<html></html>"}
+
+    monkeypatch.setattr(
+        chains,
+        "create_categorization_chain",
+        lambda is_compact=False: _StubRunnable({"categories": []}),
+    )
+    monkeypatch.setattr(
+        chains,
+        "create_summarization_chain",
+        lambda is_compact=False: _StubRunnable({"sections": []}, side_started),
+    )
+    monkeypatch.setattr(chains, "prepare_compact_side_content", prepare)
+    monkeypatch.setattr(chains, "build_compact_newsletter_result", build)
+
+    result = chains.get_newsletter_chain(is_compact=True).invoke(
+        {"articles": [{"title": "A"}], "keywords": "자율주행,배터리"}
+    )
+
+    assert result["mode"] == "compact"
+    assert received == {"newsletter_topic": "모빌리티", "food_for_thought": "생각해 볼 거리"}
+
+
+def test_detailed_rendering_uses_prepared_topic(monkeypatch) -> None:
+    calls: list[Any] = []
+
+    def extract(keywords):
+        calls.append(keywords)
+        return "배터리 산업"
+
+    monkeypatch.setattr(chains_rendering, "_get_common_theme_from_keywords", extract)
+    data = {
+        "composition": {},
+        "sections_data": {"sections": []},
+        "keywords": ["전고체", "리튬"],
+        "domain": "",
+    }
+
+    side_content = chains_rendering.prepare_detailed_side_content(data)
+    _, rendered = _render_with_template({**data, **side_content}, TemplateManager())
+
+    assert side_content == {"newsletter_topic": "배터리 산업"}
+    assert rendered["newsletter_topic"] == "배터리 산업"
+    # 주제 추출은 요약 단계와 동시에 한 번만 수행
+    assert calls == [["전고체", "리튬"]]
+    assert (
+        chains_rendering.prepare_detailed_side_content({**data, "domain": "AI"}) == {}
+    )
+
+
+def test_side_content_is_cancelled_when_a_stage_fails(monkeypatch) -> None:
+    class _FailingRunnable:
+        def invoke(self, payload: Any) -> Any:
+            raise RuntimeError("categorization failed")
+
+    side_future: Future[Any] = Future()
+    monkeypatch.setattr(
+        chains, "_start_side_content", lambda data, is_compact: side_future
+    )
+    monkeypatch.setattr(
+        chains,
+        "create_categorization_chain",
+        lambda is_compact=False: _FailingRunnable(),
+    )
+    monkeypatch.setattr(
+        chains,
+        "create_summarization_chain",
+        lambda is_compact=False: _StubRunnable({"sections": []}),
+    )
+
+    with pytest.raises(RuntimeError, match="categorization failed"):
+        chains.get_newsletter_chain(is_compact=True).invoke(
+            {"articles": [{"title": "A"}], "keywords": "AI"}
+        )
+
+    assert side_future.cancelled()
+
+
+def test_side_content_executor_is_sized_from_provider_limit(monkeypatch) -> None:
+    monkeypatch.setattr(chains, "_side_content_executor", None)
+    monkeypatch.setattr(
+        chains,
+        "get_llm_config",
+        lambda: {
+            "default_provider": "gemini",
+            "models": {"html_generation": {"provider": "openai", "model": "gpt-4o"}},
+            "provider_limits": {"openai": {"max_concurrency": 6}},
+        },
+    )
+
+    executor = chains._get_side_content_executor()
+    try:
+        assert executor._max_workers == 6
+        assert chains._get_side_content_executor() is executor
+    finally:
+        executor.shutdown(wait=False)
+
+
+def test_side_content_runs_inline_when_the_executor_has_not_started_it(
+    monkeypatch,
+) -> None:
+    caller = threading.current_thread()
+    ran_on: list[threading.Thread] = []
+
+    def prepare(data):
+        ran_on.append(threading.current_thread())
+        return {"newsletter_topic": "모빌리티", "food_for_thought": "생각해 볼 거리"}
+
+    queued: Future[Any] = Future()
+    monkeypatch.setattr(chains, "prepare_compact_side_content", prepare)
+
+    side_content = chains._join_side_content(queued, {"keywords": "AI"}, True)
+
+    assert side_content["newsletter_topic"] == "모빌리티"
+    assert ran_on == [caller]
+    assert queued.cancelled()
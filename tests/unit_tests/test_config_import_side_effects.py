@@ -9,6 +9,9 @@ import sys
 import dotenv
 import pytest
 
+# 모듈 캐시를 비운 뒤 원래 newsletter 모듈을 복원해 다른 모듈의 참조를 보존
+pytestmark = pytest.mark.usefixtures("restore_newsletter_modules")
+
 
 def _clear_module_cache() -> None:
     exact_names = {"newsletter"}
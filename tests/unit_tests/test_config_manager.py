@@ -3,6 +3,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
+import pytest
+
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
@@ -10,6 +12,9 @@ if str(project_root) not in sys.path:
 
 from newsletter.config_manager import ConfigManager  # noqa: E402
 
+# reset_for_testing(test_env)이 켠 테스트 모드를 다른 모듈로 흘리지 않음
+pytestmark = pytest.mark.usefixtures("restore_settings_test_mode")
+
 
 class TestConfigManager(unittest.TestCase):
     """ConfigManager 테스트"""
@@ -11,7 +11,9 @@ from db_source_policies import (  # noqa: E402
     SOURCE_POLICY_ALLOW,
     SOURCE_POLICY_BLOCK,
     create_source_policy,
+    delete_source_policy,
     get_active_source_policies,
+    get_source_policies_version,
     list_source_policies,
     update_source_policy,
 )
@@ -72,3 +74,22 @@ def test_get_active_source_policies_groups_allow_and_block(tmp_path: Path) -> No
     active = get_active_source_policies(str(db_path))
 
     assert active == {"allowlist": ["ft.com"], "blocklist": ["spam.example"]}
+
+
+def test_source_policies_version_changes_on_every_write(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+    versions = [get_source_policies_version(db_path)]
+
+    create_source_policy(db_path, "policy-block", "spam.example", SOURCE_POLICY_BLOCK)
+    versions.append(get_source_policies_version(db_path))
+    update_source_policy(
+        db_path, "policy-block", "spam.example", SOURCE_POLICY_BLOCK, is_active=False
+    )
+    versions.append(get_source_policies_version(db_path))
+    delete_source_policy(db_path, "policy-block")
+    versions.append(get_source_policies_version(db_path))
+    ensure_database_schema(db_path)
+
+    assert len(set(versions)) == 4
+    assert get_source_policies_version(db_path) == versions[-1]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from newsletter_core.application.fetch_sizing import (
+    FetchSizingPolicy,
+    FetchYieldTracker,
+    KeywordYield,
+    record_fetched_articles,
+    record_ranked_articles,
+    resolve_fetch_sizes,
+    use_fetch_tracker,
+)
+from newsletter_core.application.tools_search_flow import build_serper_search_plans
+from newsletter_core.application.tools_support import resolve_search_request
+
+WEB_DIR = Path(__file__).resolve().parents[2] / "web"
+if str(WEB_DIR) not in sys.path:
+    sys.path.insert(0, str(WEB_DIR))
+
+from db_keyword_yield import load_keyword_yields, record_keyword_yields  # noqa: E402
+from db_state import ensure_database_schema  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def _article(index: int) -> dict:
+    return {"title": f"기사 {index}", "url": f"https://news.example.com/{index}"}
+
+
+def test_policy_sizes_up_low_yield_and_down_high_yield_keywords() -> None:
+    policy = FetchSizingPolicy(min_results=5, max_results=20)
+
+    assert policy.size_for(10, None) == 10
+    assert policy.size_for(10, KeywordYield("sparse", 30, 3)) == 20
+    assert policy.size_for(10, KeywordYield("plenty", 30, 30)) == 6
+    assert policy.size_for(10, KeywordYield("typical", 30, 15)) == 10
+    # one run cannot swing the size far from the default
+    assert policy.size_for(10, KeywordYield("new", 10, 10)) == 7
+
+
+def test_tracker_measures_per_keyword_yield_of_ranked_articles() -> None:
+    calls: list[list[str]] = []
+
+    def _lookup(keywords):
+        calls.append(list(keywords))
+        return {"AI": (30.0, 3.0)}
+
+    tracker = FetchYieldTracker("schedule:daily", _lookup)
+    with use_fetch_tracker(tracker):
+        sizes = resolve_fetch_sizes(("AI", "반도체", "AI"), 10)
+        record_fetched_articles("AI", [_article(1), _article(2), _article(3)])
+        record_fetched_articles("반도체", [_article(3), _article(4)])
+        record_ranked_articles([_article(3), _article(4)])
+
+    assert calls == [["AI", "반도체"]]
+    assert sizes == {"AI": 20, "반도체": 10}
+    assert tracker.yields() == [
+        KeywordYield("AI", 3, 1),
+        KeywordYield("반도체", 2, 2),
+    ]
+    assert resolve_fetch_sizes(("AI",), 10) is None
+    assert FetchYieldTracker("adhoc", _lookup).yields() == []
+
+
+def test_search_plans_use_per_keyword_sizes_within_serper_cap() -> None:
+    plans = build_serper_search_plans(
+        resolve_search_request("AI, 반도체, 로봇", 10),
+        api_key="key",
+        num_results_by_keyword={"AI": 18, "반도체": 40},
+    )
+
+    assert [plan.num_results for plan in plans] == [18, 20, 10]
+    assert [json.loads(plan.payload)["num"] for plan in plans] == [18, 20, 10]
+
+
+def test_keyword_yields_are_decayed_per_scope(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage.db")
+    ensure_database_schema(db_path)
+
+    record_keyword_yields(db_path, "schedule:a", [("AI", 10, 2)], decay=0.5)
+    record_keyword_yields(
+        db_path, "schedule:a", [("AI", 10, 8), ("빈 키워드", 0, 0)], decay=0.5
+    )
+    record_keyword_yields(db_path, "schedule:b", [("AI", 10, 10)], decay=0.5)
+
+    history = load_keyword_yields(db_path, "schedule:a", ["AI", "빈 키워드", "로봇"])
+    assert history == {"AI": pytest.approx((15.0, 9.0))}
+    assert load_keyword_yields(db_path, "schedule:b", ["AI"]) == {"AI": (10.0, 10.0)}
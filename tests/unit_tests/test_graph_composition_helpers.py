@@ -68,7 +68,13 @@ def test_build_summarize_result_state_delegates_normalization_and_state_builder(
         return "<html>ok</html>", {"sections": []}, "AI Weekly"
 
     def _fake_success(
-        state, *, newsletter_html, category_summaries, newsletter_topic, elapsed
+        state,
+        *,
+        newsletter_html,
+        category_summaries,
+        newsletter_topic,
+        elapsed,
+        category_latencies=None,
     ):
         captured["success"] = (
             state,
@@ -76,6 +82,7 @@ def test_build_summarize_result_state_delegates_normalization_and_state_builder(
             category_summaries,
             newsletter_topic,
             elapsed,
+            category_latencies,
         )
         return _make_state(
             newsletter_html=newsletter_html,
@@ -112,6 +119,7 @@ def test_build_summarize_result_state_delegates_normalization_and_state_builder(
     assert captured["normalize"][1]["template_style"] == "compact"
     assert captured["normalize"][1]["article_count"] == 2
     assert captured["success"][1] == "<html>ok</html>"
+    assert captured["success"][5] is None
     assert updated["newsletter_topic"] == "AI Weekly"
 
 
@@ -231,3 +231,38 @@ def test_process_articles_node_delegates_filter_sort_and_state_helpers(
         {"title": "sorted", "date": "2026-03-10T09:00:00Z"}
     ]
     assert result["status"] == "scoring"
+
+
+@pytest.mark.unit
+def test_process_articles_node_passes_streamed_buffer_through(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    def _unexpected(*args, **kwargs):
+        raise AssertionError("streamed articles must not be filtered again")
+
+    monkeypatch.setattr(graph_module, "filter_articles_for_processing", _unexpected)
+    monkeypatch.setattr(graph_module, "sort_articles_by_graph_date_desc", _unexpected)
+
+    streamed = [{"title": "newest"}, {"title": "older"}]
+    result = graph_module.process_articles_node(
+        _make_state(
+            collected_articles=streamed,
+            article_stream_stats={
+                "received": 5,
+                "date_kept": 4,
+                "deduplicated": 2,
+                "evicted": 0,
+                "peak_buffered": 2,
+                "duplicate_reasons": {"url": 2},
+            },
+        )
+    )
+
+    assert result["processed_article_ids"] == [0, 1]
+    assert (
+        graph_node_helpers.resolve_state_articles(result, "processed", checkout=False)
+        == streamed
+    )
+    assert result["status"] == "scoring"
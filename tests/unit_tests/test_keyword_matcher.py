@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from newsletter_core.application.keyword_matcher import (
+    KeywordMatcher,
+    PositionalTokenIndex,
+    compile_keyword_matcher,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_ascii_keywords_respect_word_boundaries() -> None:
+    matcher = KeywordMatcher(["AI", "HBM"])
+
+    assert matcher.first_keyword("He said the chip was ready") is None
+    assert matcher.first_keyword("HBM3E 양산") is None
+    assert matcher.first_keyword("삼성, HBM을 양산") == "HBM"
+    assert matcher.first_keyword("생성형 AI가 확산") == "AI"
+
+
+def test_hangul_keywords_use_substring_semantics() -> None:
+    matcher = KeywordMatcher(["반도체"])
+
+    hit = matcher.match("차세대 AI반도체들의 경쟁")["반도체"]
+
+    assert (hit.start, hit.end) == (6, 9)
+
+
+def test_first_keyword_follows_keyword_priority_not_text_position() -> None:
+    matcher = KeywordMatcher(["배터리", "반도체"])
+
+    assert matcher.first_keyword("반도체 업황과 배터리 수요") == "배터리"
+
+
+def test_match_reports_every_keyword_once_with_synonyms_and_spaces() -> None:
+    matcher = KeywordMatcher(
+        ["AI반도체", "CXL"],
+        {"AI반도체": ["AI반도체", "인공지능 반도체"], "CXL": ["CXL"]},
+        ignore_spaces=True,
+    )
+
+    hits = matcher.match("인공지능반도체 시장과 CXL, 그리고 CXL 메모리")
+
+    assert list(hits) == ["AI반도체", "CXL"]
+    assert hits["AI반도체"].variant == "인공지능 반도체"
+    assert hits["CXL"].start == 12
+
+
+def test_proximity_fallback_matches_tokens_within_window() -> None:
+    matcher = KeywordMatcher(["인공지능 반도체"], proximity_window=5)
+
+    near = matcher.match("반도체 분야에서 인공지능 기술이 주목받고 있다")
+    far = matcher.match("반도체 a b c d e f 인공지능")
+
+    assert near["인공지능 반도체"].proximity is True
+    assert far == {}
+
+
+@pytest.mark.parametrize("window", [0, 1, 2, 5])
+def test_positional_window_matches_exhaustive_combinations(window: int) -> None:
+    text = "a x b y a z c b q c a r b"
+    words = text.split()
+    index = PositionalTokenIndex(text)
+
+    for tokens in (["a", "b"], ["a", "b", "c"], ["c", "q"], ["a", "missing"]):
+        positions = [[i for i, w in enumerate(words) if w == t] for t in tokens]
+        expected = any(
+            max(combo) - min(combo) <= window for combo in itertools.product(*positions)
+        )
+        assert (index.window(tokens, window) is not None) is expected
+
+
+def test_compile_keyword_matcher_reuses_automaton() -> None:
+    first = compile_keyword_matcher(("HBM", "CXL"))
+
+    assert compile_keyword_matcher(("HBM", "CXL")) is first
+
+
+def test_rss_match_entries_counts_first_priority_keyword_and_caps_results() -> None:
+    import newsletter.sources as sources_module
+
+    source = sources_module.RSSFeedSource("RSS", [])
+    entries = [
+        {"title": "AI 반도체 수출", "link": "https://a.com/1"},
+        {
+            "title": "Nvidia said",
+            "description": "no keyword",
+            "link": "https://a.com/2",
+        },
+        {"title": "메모리", "content": "AI 서버 수요", "link": "https://a.com/3"},
+        {"title": "반도체 공장", "link": "https://a.com/4"},
+    ]
+
+    output = source._match_entries(entries, ["AI", "반도체"], 2, "Feed")
+
+    assert [article["url"] for article in output.articles] == [
+        "https://a.com/1",
+        "https://a.com/3",
+    ]
+    assert output.keyword_counts == {"AI": 2, "반도체": 1}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+from typer.testing import CliRunner
+
+from newsletter.cli import app
+from newsletter.scoring import DEFAULT_WEIGHTS, SCORE_PROMPT_VERSION, score_articles
+from newsletter_core.application.article_identity import article_identity
+from newsletter_core.infrastructure.llm_score_cache import LlmScoreCache, ScoreCacheKey
+from newsletter_core.public.scoring import rerank_articles
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+KEY = ScoreCacheKey(domain="AI", model="gemini-2.5-flash", prompt_version="v1")
+
+
+def _articles() -> list[dict]:
+    return [
+        {"title": "첫 기사", "url": "https://example.com/a", "snippet": "요약"},
+        {"title": "둘째 기사", "url": "https://example.com/b", "snippet": "요약"},
+    ]
+
+
+def test_cache_is_keyed_by_model_and_prompt_version_and_expires(
+    tmp_path: Path,
+) -> None:
+    now = [1000.0]
+    cache = LlmScoreCache(
+        tmp_path / "scores.db", max_age_seconds=60, clock=lambda: now[0]
+    )
+    scores = {"relevance": 4, "impact": 3, "novelty": 2}
+
+    assert cache.put_many({"fp": scores}, KEY) == 1
+
+    assert cache.get_many(["fp", "other"], KEY) == {"fp": scores}
+    assert cache.get_many(["fp"], ScoreCacheKey("AI", "gpt-4o", "v1")) == {}
+    assert cache.get_many(["fp"], ScoreCacheKey("AI", KEY.model, "v2")) == {}
+    now[0] += 61
+    assert cache.get_many(["fp"], KEY) == {}
+
+
+def test_cached_scores_skip_the_llm_on_the_next_run(tmp_path: Path) -> None:
+    cache = LlmScoreCache(tmp_path / "scores.db")
+    llm = MagicMock(model="gemini-2.5-flash")
+    llm.invoke.return_value = AIMessage(
+        content='{"relevance":5,"impact":4,"novelty":3}'
+    )
+
+    score_articles(
+        _articles(),
+        "AI",
+        top_n=None,
+        weights=DEFAULT_WEIGHTS,
+        llm=llm,
+        score_cache=cache,
+    )
+    assert llm.invoke.call_count == 2
+
+    llm.invoke.reset_mock()
+    articles = _articles() + [
+        {"title": "새 기사", "url": "https://example.com/c", "snippet": "요약"}
+    ]
+    score_articles(
+        articles,
+        "AI",
+        top_n=None,
+        weights=DEFAULT_WEIGHTS,
+        llm=llm,
+        score_cache=cache,
+    )
+
+    assert llm.invoke.call_count == 1
+    assert articles[0]["scoring"] == {"relevance": 5, "impact": 4, "novelty": 3}
+
+
+@pytest.mark.parametrize("reply", ["점수를 매길 수 없습니다", '{"relevance": 5,}'])
+def test_unparseable_replies_are_not_cached(tmp_path: Path, reply: str) -> None:
+    cache = LlmScoreCache(tmp_path / "scores.db")
+    llm = MagicMock(model="gemini-2.5-flash")
+    llm.invoke.return_value = AIMessage(content=reply)
+    articles = _articles()
+
+    score_articles(
+        articles,
+        "AI",
+        top_n=None,
+        weights=DEFAULT_WEIGHTS,
+        llm=llm,
+        score_cache=cache,
+    )
+
+    assert articles[0]["scoring"] == {"relevance": 1, "impact": 1, "novelty": 1}
+    key = ScoreCacheKey("AI", "gemini-2.5-flash", SCORE_PROMPT_VERSION)
+    fingerprints = [article_identity(a).fingerprint for a in articles]
+    assert cache.get_many(fingerprints, key) == {}
+
+
+def test_rerank_uses_stored_scores_and_cli_reports_new_order(
+    tmp_path: Path,
+) -> None:
+    articles = [
+        {
+            "title": "관련성 높음",
+            "source": "블로그",
+            "scoring": {"relevance": 5, "impact": 1, "novelty": 1},
+        },
+        {
+            "title": "영향력 높음",
+            "source": "블로그",
+            "scoring": {"relevance": 1, "impact": 5, "novelty": 1},
+        },
+        {"title": "점수 없음", "source": "블로그"},
+    ]
+    weights = {
+        "relevance": 0.1,
+        "impact": 0.9,
+        "novelty": 0,
+        "source_tier": 0,
+        "recency": 0,
+    }
+
+    ranked = rerank_articles([dict(a) for a in articles], weights, top_n=None)
+
+    assert [a["title"] for a in ranked] == ["영향력 높음", "관련성 높음"]
+
+    scored_file = tmp_path / "AI_scored_articles.json"
+    scored_file.write_text(json.dumps(articles, ensure_ascii=False), "utf-8")
+    result = CliRunner().invoke(
+        app, ["rerank", str(scored_file), "-w", "relevance=1", "-w", "impact=0"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.index("관련성 높음") < result.output.index("영향력 높음")
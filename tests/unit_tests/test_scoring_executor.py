@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from newsletter.scoring import DEFAULT_WEIGHTS, score_articles
+from newsletter_core.application.article_prefilter import (
+    SCORING_STAGE_FIELD,
+    STAGE_HEURISTIC,
+)
+from newsletter_core.application.llm_concurrency import resolve_provider_concurrency
+from newsletter_core.application.scoring_executor import (
+    ScoringExecutor,
+    is_rate_limit_error,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def test_results_keep_input_order_under_the_concurrency_cap() -> None:
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _call(index: int):
+        def _run() -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01 * (5 - index))
+            with lock:
+                active -= 1
+            return index
+
+        return _run
+
+    executor: ScoringExecutor[int] = ScoringExecutor(2, deadline_seconds=None)
+
+    assert executor.map([_call(i) for i in range(5)]) == [0, 1, 2, 3, 4]
+    assert peak == 2
+    assert executor.report.completed == 5
+
+
+def test_rate_limited_calls_back_off_and_retry() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    attempts = []
+
+    def _call() -> str:
+        attempts.append(now[0])
+        if len(attempts) == 1:
+            raise _RateLimited("Too Many Requests")
+        return "ok"
+
+    executor: ScoringExecutor[str] = ScoringExecutor(
+        4, deadline_seconds=None, sleep=_sleep, clock=lambda: now[0]
+    )
+
+    assert executor.map([_call]) == ["ok"]
+    assert executor.report.rate_limited == 1
+    assert sleeps and attempts[1] >= 0.5
+    assert is_rate_limit_error(RuntimeError("429 RESOURCE_EXHAUSTED"))
+    assert not is_rate_limit_error(ValueError("bad json"))
+
+
+def test_deadline_falls_back_to_heuristic_scores() -> None:
+    release = threading.Event()
+    llm = MagicMock()
+
+    def _reply(messages):
+        if "느린 기사" in messages[0].content:
+            release.wait(5)
+        return AIMessage(content='{"relevance":5,"impact":5,"novelty":5}')
+
+    llm.invoke.side_effect = _reply
+    articles = [
+        {"title": "빠른 기사", "snippet": "요약"},
+        {
+            "title": "느린 기사",
+            "snippet": "요약",
+            SCORING_STAGE_FIELD: {"stage": "llm", "lexical_relevance": 0.5},
+        },
+    ]
+
+    try:
+        score_articles(
+            articles,
+            "AI",
+            top_n=None,
+            weights=DEFAULT_WEIGHTS,
+            llm=llm,
+            concurrency=2,
+            deadline_seconds=0.2,
+        )
+    finally:
+        release.set()
+
+    assert articles[0]["scoring"] == {"relevance": 5, "impact": 5, "novelty": 5}
+    assert articles[1]["scoring"] == {"relevance": 3.0, "impact": 1, "novelty": 1}
+    assert articles[1][SCORING_STAGE_FIELD]["stage"] == STAGE_HEURISTIC
+
+
+def test_concurrency_limit_follows_the_task_provider() -> None:
+    llm_config = {
+        "default_provider": "gemini",
+        "models": {"html_generation": {"provider": "openai", "model": "gpt-4o"}},
+        "provider_limits": {"openai": {"max_concurrency": 6}},
+    }
+
+    assert resolve_provider_concurrency(llm_config, "html_generation") == 6
+    assert resolve_provider_concurrency(llm_config, "article_scoring") == 4
+    assert resolve_provider_concurrency({}, "html_generation") == 4
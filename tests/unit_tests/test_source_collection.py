@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import newsletter.sources as sources_module
+import newsletter_core.infrastructure.feed_fetcher as feed_fetcher_module
+from newsletter_core.application.source_collection import (
+    SourceCollectionTask,
+    SourceTaskOutput,
+    run_source_collection,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def _task(name: str, delay: float = 0.0, count: int = 1) -> SourceCollectionTask:
+    def _fetch() -> SourceTaskOutput:
+        time.sleep(delay)
+        return SourceTaskOutput(
+            articles=[{"title": f"{name}-{index}"} for index in range(count)],
+            keyword_counts={"AI": count},
+        )
+
+    return SourceCollectionTask(name=name, fetch=_fetch)
+
+
+def test_run_source_collection_keeps_task_order_and_reports_yield() -> None:
+    result = run_source_collection(
+        [_task("slow", delay=0.05, count=2), _task("fast", count=1)],
+        max_workers=2,
+        source_timeout=5,
+        total_budget=5,
+    )
+
+    assert [article["title"] for article in result.articles] == [
+        "slow-0",
+        "slow-1",
+        "fast-0",
+    ]
+    assert [report.status for report in result.reports] == ["ok", "ok"]
+    assert [report.article_count for report in result.reports] == [2, 1]
+    assert result.reports[0].elapsed_seconds >= 0.05
+    assert result.keyword_counts == {"AI": 3}
+    assert result.budget_exhausted is False
+
+
+def test_run_source_collection_drops_sources_past_their_deadline() -> None:
+    release = threading.Event()
+
+    def _hang() -> SourceTaskOutput:
+        release.wait(2)
+        return SourceTaskOutput(articles=[{"title": "late"}])
+
+    try:
+        started = time.monotonic()
+        result = run_source_collection(
+            [SourceCollectionTask(name="hung", fetch=_hang), _task("ok")],
+            max_workers=2,
+            source_timeout=0.1,
+            total_budget=5,
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert elapsed < 1
+    assert [article["title"] for article in result.articles] == ["ok-0"]
+    assert result.reports[0].status == "timeout"
+    assert result.dropped_sources == ("hung",)
+
+
+def test_run_source_collection_isolates_errors_and_honours_budget() -> None:
+    release = threading.Event()
+
+    def _boom() -> SourceTaskOutput:
+        raise RuntimeError("feed down")
+
+    def _hang() -> SourceTaskOutput:
+        release.wait(2)
+        return SourceTaskOutput(articles=[])
+
+    try:
+        result = run_source_collection(
+            [
+                SourceCollectionTask(name="broken", fetch=_boom),
+                SourceCollectionTask(name="hung", fetch=_hang),
+                _task("queued"),
+            ],
+            max_workers=2,
+            source_timeout=10,
+            total_budget=0.2,
+        )
+    finally:
+        release.set()
+
+    statuses = {report.name: report.status for report in result.reports}
+    assert statuses["broken"] == "error"
+    assert statuses["hung"] == "timeout"
+    assert result.reports[0].error == "feed down"
+    assert result.budget_exhausted is True
+
+
+def test_news_source_manager_fans_out_rss_feeds_and_counts_keywords(
+    monkeypatch,
+) -> None:
+    feeds = {
+        "https://feed-a.example/rss": "AI 반도체 투자 확대",
+        "https://feed-b.example/rss": "날씨 소식",
+    }
+
+    class _FakeResponse:
+        status_code = 200
+        headers: dict[str, str] = {}
+
+        def __init__(self, url: str) -> None:
+            self.content = (
+                "<rss><channel><title>Feed</title><item>"
+                f"<title>{feeds[url]}</title><link>{url}/1</link>"
+                "<description>desc</description>"
+                "<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate>"
+                "</item></channel></rss>"
+            ).encode("utf-8")
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class _FakeClient:
+        def get(self, url: str, **_kwargs: Any) -> _FakeResponse:
+            return _FakeResponse(url)
+
+    monkeypatch.setattr(feed_fetcher_module, "get_http_client", _FakeClient)
+    monkeypatch.setenv("CONCURRENT_REQUESTS", "4")
+    manager = sources_module.NewsSourceManager()
+    manager.add_source(sources_module.RSSFeedSource("RSS", list(feeds)))
+
+    articles = manager.fetch_all_sources(["반도체"], 5)
+    result = manager.last_collection_result
+
+    assert [article["title"] for article in articles] == ["AI 반도체 투자 확대"]
+    assert result is not None
+    assert [report.name for report in result.reports] == [
+        "RSS:https://feed-a.example/rss",
+        "RSS:https://feed-b.example/rss",
+    ]
+    assert result.keyword_counts == {"반도체": 1}
+
+
+def test_rss_source_answers_from_fresh_news_index_without_network(
+    monkeypatch, tmp_path
+) -> None:
+    from newsletter_core.infrastructure.news_index import NewsIndex
+
+    class _OfflineClient:
+        def get(self, url: str, **_kwargs: Any) -> Any:
+            raise AssertionError(f"unexpected network fetch: {url}")
+
+    monkeypatch.setattr(feed_fetcher_module, "get_http_client", _OfflineClient)
+    index = NewsIndex(tmp_path / "news_index.db")
+    index.index_feed(
+        "https://feed-a.example/rss",
+        "Feed A",
+        [
+            {
+                "entry_key": "1",
+                "title": "AI 반도체 투자 확대",
+                "link": "https://feed-a.example/1",
+                "description": "desc",
+                "date": time.strftime("%Y-%m-%d"),
+            },
+            {
+                "entry_key": "2",
+                "title": "반도체 지난 기사",
+                "link": "https://feed-a.example/2",
+                "description": "desc",
+                "date": "2020-01-01",
+            },
+        ],
+    )
+    source = sources_module.RSSFeedSource(
+        "RSS",
+        ["https://feed-a.example/rss"],
+        news_index=index,
+        news_period_days=7,
+    )
+
+    tasks = source.collection_tasks(["반도체"], 5)
+    output = tasks[0].fetch()
+
+    assert [task.name for task in tasks] == ["RSS:index"]
+    assert [article["title"] for article in output.articles] == ["AI 반도체 투자 확대"]
+    assert output.articles[0]["source"] == "Feed A"
+    assert output.keyword_counts == {"반도체": 1}
+
+
+def test_rss_source_falls_back_to_live_fetch_when_index_is_stale(
+    monkeypatch, tmp_path
+) -> None:
+    from newsletter_core.infrastructure.news_index import NewsIndex
+
+    class _FakeResponse:
+        status_code = 200
+        headers: dict[str, str] = {}
+        content = (
+            "<rss><channel><title>Feed</title><item>"
+            "<title>반도체 실시간 기사</title><link>https://feed-a.example/9</link>"
+            "<description>desc</description></item></channel></rss>"
+        ).encode("utf-8")
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class _FakeClient:
+        def get(self, url: str, **_kwargs: Any) -> _FakeResponse:
+            return _FakeResponse()
+
+    monkeypatch.setattr(feed_fetcher_module, "get_http_client", _FakeClient)
+    clock = [0.0]
+    index = NewsIndex(tmp_path / "news_index.db", clock=lambda: clock[0])
+    index.index_feed("https://feed-a.example/rss", "Feed", [])
+    clock[0] = 7200.0
+    source = sources_module.RSSFeedSource(
+        "RSS", ["https://feed-a.example/rss"], news_index=index
+    )
+
+    articles = source.fetch_news(["반도체"], 5)
+
+    assert [article["title"] for article in articles] == ["반도체 실시간 기사"]
+    # 실시간 수집 결과가 인덱스에 반영됨
+    assert [hit.title for hit in index.search(["반도체"])] == ["반도체 실시간 기사"]
+
+
+def test_collect_command_passes_period_to_collection(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from typer.testing import CliRunner
+
+    import newsletter.cli as cli_module
+
+    calls: list[dict[str, Any]] = []
+
+    def _collect_articles(keywords: str, **kwargs: Any) -> list[dict[str, Any]]:
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(cli_module.news_collect, "collect_articles", _collect_articles)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli_module.app, ["collect", "AI", "--period", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert calls[0]["news_period_days"] == 3
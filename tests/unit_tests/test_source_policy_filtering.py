@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from newsletter_core.public.source_policies import filter_articles_by_source_policies
+from urllib.parse import urlparse
+
+from newsletter_core.public.source_policies import (
+    SourcePolicyRule,
+    compile_source_policies,
+    evaluate_source_policies,
+    filter_articles_by_source_policies,
+    normalize_source_pattern,
+)
 
 
 def test_source_policy_filtering_blocks_matching_domains() -> None:
@@ -45,3 +53,94 @@ def test_source_policy_filtering_respects_allowlist() -> None:
     )
 
     assert [item["title"] for item in filtered] == ["Allowed"]
+
+
+def _legacy_filter(
+    articles: list[dict], allowlist: list[str], blocklist: list[str]
+) -> list[dict]:
+    def _candidates(article: dict) -> set[str]:
+        values = {normalize_source_pattern(article.get("source", ""))}
+        values.add(normalize_source_pattern(urlparse(article.get("url", "")).netloc))
+        return {value for value in values if value}
+
+    def _matches(candidate: str, pattern: str) -> bool:
+        if "." in pattern:
+            return candidate == pattern or candidate.endswith(f".{pattern}")
+        return pattern in candidate
+
+    allow = [normalize_source_pattern(item) for item in allowlist]
+    block = [normalize_source_pattern(item) for item in blocklist]
+    kept = []
+    for article in articles:
+        candidates = _candidates(article)
+        if any(_matches(c, p) for c in candidates for p in block):
+            continue
+        if allow and not any(_matches(c, p) for c in candidates for p in allow):
+            continue
+        kept.append(article)
+    return kept
+
+
+def test_compiled_policies_match_pairwise_semantics() -> None:
+    hosts = [
+        "reuters.com",
+        "uk.reuters.com",
+        "notreuters.com",
+        "reuters.com.evil.example",
+        "news.ft.com",
+        "ft.com.cn",
+        "blog.spam.example",
+        "example.org",
+    ]
+    articles = [
+        {"title": host, "url": f"https://www.{host}/story", "source": source}
+        for host in hosts
+        for source in ("Reuters", "Financial Times", "Spam Daily", "")
+    ]
+    policy_sets = [
+        ([], ["spam.example", "evil"]),
+        (["reuters.com", "ft.com"], []),
+        (["https://www.Reuters.com/world", "times"], ["uk.reuters.com"]),
+        (["reuters"], ["com.cn", "example.org"]),
+    ]
+
+    for allowlist, blocklist in policy_sets:
+        assert filter_articles_by_source_policies(
+            articles, allowlist=allowlist, blocklist=blocklist
+        ) == _legacy_filter(articles, allowlist, blocklist)
+
+
+def test_evaluate_reports_the_rule_that_dropped_each_article() -> None:
+    articles = [
+        {"title": "sub", "url": "https://news.spam.example/a", "source": "Spam"},
+        {"title": "bare", "url": "https://clickbait.net/b", "source": "Clickbait"},
+        {"title": "off-list", "url": "https://example.org/c", "source": "Example"},
+        {"title": "ok", "url": "https://uk.reuters.com/d", "source": "Reuters"},
+    ]
+
+    result = evaluate_source_policies(
+        articles,
+        allowlist=["reuters.com"],
+        blocklist=["spam.example", "clickbait"],
+    )
+
+    assert [item["title"] for item in result.kept] == ["ok"]
+    assert [(decision.reason, decision.rule) for _, decision in result.dropped] == [
+        ("blocked", SourcePolicyRule("block", "spam.example")),
+        ("blocked", SourcePolicyRule("block", "clickbait")),
+        ("not_allowlisted", None),
+    ]
+    assert result.dropped[0][1].candidate == "news.spam.example"
+    assert result.drop_counts() == {
+        "block:spam.example": 1,
+        "block:clickbait": 1,
+        "allow:*": 1,
+    }
+
+
+def test_compiled_policies_are_reused_while_the_version_is_unchanged() -> None:
+    first = compile_source_policies(["ft.com"], ["spam"], version="db:1")
+
+    assert compile_source_policies(["ft.com"], ["spam"], version="db:1") is first
+    assert compile_source_policies(["ft.com"], ["spam"], version="db:2") is not first
+    assert compile_source_policies(["ft.com"], [], version="db:1") is not first
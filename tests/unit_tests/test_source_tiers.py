@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+import newsletter.config_manager as config_manager_module
+import newsletter_core.application.source_tiers as source_tiers_module
+from newsletter.scoring import _get_source_tier, _get_source_tier_info
+from newsletter_core.application.source_tiers import (
+    OTHER_TIER,
+    TIER1,
+    TIER2,
+    SourceTierClassifier,
+    article_source_tier,
+    get_source_tier_classifier,
+    stamp_source_tiers,
+)
+from newsletter_core.public.settings import get_major_news_sources
+
+pytestmark = [pytest.mark.unit]
+
+
+def _legacy_tier(source: str) -> str:
+    sources = get_major_news_sources()
+    if any(s.lower() in source.lower() for s in sources["tier1"]):
+        return "tier1"
+    if any(s.lower() in source.lower() for s in sources["tier2"]):
+        return "tier2"
+    return "other"
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "조선일보",
+        "매일경제 | 산업",
+        "reuters.com",
+        "THE ECONOMIST",
+        "뉴시스",
+        "ZDNet Korea",
+        "  전자신문 ",
+        "개인 블로그",
+        "",
+    ],
+)
+def test_classifier_matches_legacy_linear_scan(source: str) -> None:
+    assert get_source_tier_classifier().classify(source).key == _legacy_tier(source)
+
+
+def test_classifier_prefers_first_tier_and_memoizes_by_normalized_name() -> None:
+    classifier = SourceTierClassifier({"tier1": ["KBS"], "tier2": ["KBS 뉴스"]})
+
+    assert classifier.classify("KBS 뉴스") is TIER1
+    assert classifier.classify(" kbs 뉴스 ") is TIER1
+    assert list(classifier._memo) == ["kbs 뉴스"]
+    assert classifier.classify("블로그") is OTHER_TIER
+
+
+def test_scoring_tier_helpers_keep_scores_and_labels() -> None:
+    assert _get_source_tier("연합뉴스") == 1.0
+    assert _get_source_tier_info("뉴스1") == (0.6, "Tier 2 (보조 언론사)")
+    assert _get_source_tier_info("unknown") == (0.3, "Tier 3 (기타 소스)")
+
+
+def test_stamped_tier_is_reused_without_reclassifying(monkeypatch) -> None:
+    articles = stamp_source_tiers([{"source": "뉴스1"}, {"source": "블로그"}])
+
+    assert [article["source_tier"] for article in articles] == ["tier2", "other"]
+    assert articles[0]["source_tier_name"] == TIER2.label
+
+    def _fail(_source: object) -> None:
+        raise AssertionError("stamped article was classified again")
+
+    monkeypatch.setattr(source_tiers_module, "classify_source", _fail)
+    assert article_source_tier(articles[0]) is TIER2
+
+
+def test_classifier_is_rebuilt_after_config_reload(monkeypatch) -> None:
+    generation = config_manager_module.get_config_generation()
+    config_manager_module.ConfigManager.reset_for_testing()
+    assert config_manager_module.get_config_generation() == generation + 1
+
+    monkeypatch.setattr(source_tiers_module, "get_config_generation", lambda: 1)
+    first = get_source_tier_classifier()
+    assert get_source_tier_classifier() is first
+
+    monkeypatch.setattr(source_tiers_module, "get_config_generation", lambda: 2)
+    assert get_source_tier_classifier() is not first
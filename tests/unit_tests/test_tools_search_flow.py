@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+import time
+from typing import Any
+
 import newsletter.tools as tools_module
 from newsletter_core.application.tools_search_flow import (
     SerperKeywordFailure,
@@ -9,10 +13,14 @@ from newsletter_core.application.tools_search_flow import (
     SerperSearchRequestError,
     SerperSearchResponseDecodeError,
     SerperSearchSummary,
+    build_serper_batch_plans,
     build_serper_failure_log_messages,
     build_serper_keyword_log_messages,
     build_serper_search_plans,
+    execute_serper_batch_plans,
     execute_serper_search_plan,
+    execute_serper_search_plans,
+    iter_serper_search_plans,
     summarize_serper_search_reports,
 )
 from newsletter_core.application.tools_support import (
@@ -252,10 +260,14 @@ def test_legacy_search_news_articles_delegates_to_core_search_flow(
         return SearchRequest(keywords=("정제된 키워드",), num_results=3)
 
     def fake_build_serper_search_plans(
-        search_request: SearchRequest, *, api_key: str
+        search_request: SearchRequest,
+        *,
+        api_key: str,
+        num_results_by_keyword: dict[str, int] | None = None,
     ) -> tuple[SerperSearchPlan, ...]:
         calls["search_request"] = search_request
         calls["api_key"] = api_key
+        calls["num_results_by_keyword"] = num_results_by_keyword
         return (
             SerperSearchPlan(
                 keyword="정제된 키워드",
@@ -336,6 +348,7 @@ def test_legacy_search_news_articles_delegates_to_core_search_flow(
         keywords=("정제된 키워드",), num_results=3
     )
     assert calls["api_key"] == "dummy-tools-key"
+    assert calls["num_results_by_keyword"] is None
     assert calls["search_plan"] == SerperSearchPlan(
         keyword="정제된 키워드",
         num_results=3,
@@ -343,7 +356,7 @@ def test_legacy_search_news_articles_delegates_to_core_search_flow(
         headers={"X-API-KEY": "dummy-tools-key"},
         payload='{"q": "정제된 키워드"}',
     )
-    assert calls["executor"] is tools_module.execute_serper_search_request
+    assert calls["executor"] is tools_module.execute_cached_serper_search_request
     assert calls["reports"] == [
         SerperKeywordReport(
             keyword="정제된 키워드",
@@ -376,3 +389,115 @@ def test_legacy_search_news_articles_delegates_to_core_search_flow(
             "date": "2026-03-11",
         }
     ]
+
+
+def _news_payload(keyword: str) -> dict[str, Any]:
+    return {
+        "news": [
+            {
+                "title": f"{keyword} 기사",
+                "link": f"https://example.com/{keyword}",
+                "snippet": "요약",
+                "source": "테스트 소스",
+                "date": "2026-03-11",
+            }
+        ]
+    }
+
+
+def test_execute_serper_search_plans_runs_concurrently_in_keyword_order() -> None:
+    plans = build_serper_search_plans(
+        SearchRequest(keywords=("느림", "AI", "반도체"), num_results=3),
+        api_key="dummy",
+    )
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def executor(plan: SerperSearchPlan) -> dict[str, Any]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05 if plan.keyword == "느림" else 0.01)
+        with lock:
+            active -= 1
+        if plan.keyword == "AI":
+            raise SerperSearchRequestError("network boom")
+        return _news_payload(plan.keyword)
+
+    results = execute_serper_search_plans(plans, executor=executor, max_workers=2)
+
+    assert [result.keyword for result in results] == ["느림", "AI", "반도체"]
+    assert isinstance(results[0], SerperKeywordReport)
+    assert results[1] == SerperKeywordFailure(
+        keyword="AI", error_kind="request", message="network boom"
+    )
+    assert isinstance(results[2], SerperKeywordReport)
+    assert peak == 2
+
+
+def test_execute_serper_batch_plans_splits_responses_per_keyword() -> None:
+    plans = build_serper_search_plans(
+        SearchRequest(keywords=("AI", "반도체", "배터리"), num_results=3),
+        api_key="dummy",
+    )
+    batch_plans = build_serper_batch_plans(plans, batch_size=2)
+
+    assert [len(batch.search_plans) for batch in batch_plans] == [2, 1]
+    assert batch_plans[0].payload == f"[{plans[0].payload}, {plans[1].payload}]"
+
+    def executor(batch_plan: Any) -> list[Any]:
+        if len(batch_plan.search_plans) == 1:
+            return []
+        return [_news_payload(plan.keyword) for plan in batch_plan.search_plans]
+
+    results = execute_serper_batch_plans(batch_plans, executor=executor, max_workers=2)
+    summary = summarize_serper_search_reports(
+        [result for result in results if isinstance(result, SerperKeywordReport)]
+    )
+
+    assert [result.keyword for result in results] == ["AI", "반도체", "배터리"]
+    assert isinstance(results[2], SerperKeywordFailure)
+    assert results[2].error_kind == "json"
+    assert summary.keyword_article_counts == {"AI": 1, "반도체": 1}
+
+
+def test_legacy_search_news_articles_uses_batch_mode_when_configured(
+    monkeypatch,
+) -> None:
+    batch_sizes: list[int] = []
+    monkeypatch.setenv("SERPER_API_KEY", "dummy-tools-key")
+    monkeypatch.setenv("SERPER_BATCH_SIZE", "5")
+
+    def fake_batch_request(batch_plan: Any) -> list[Any]:
+        batch_sizes.append(len(batch_plan.search_plans))
+        return [_news_payload(plan.keyword) for plan in batch_plan.search_plans]
+
+    monkeypatch.setattr(
+        tools_module, "execute_cached_serper_batch_request", fake_batch_request
+    )
+
+    result = tools_module.search_news_articles.invoke(
+        {"keywords": "AI,반도체", "num_results": 3}
+    )
+
+    assert batch_sizes == [2]
+    assert [article["title"] for article in result] == ["AI 기사", "반도체 기사"]
+
+
+def test_iter_serper_search_plans_yields_results_in_completion_order() -> None:
+    plans = build_serper_search_plans(
+        SearchRequest(keywords=("느림", "AI"), num_results=3),
+        api_key="dummy",
+    )
+
+    def executor(plan: SerperSearchPlan) -> dict[str, Any]:
+        time.sleep(0.1 if plan.keyword == "느림" else 0.0)
+        return _news_payload(plan.keyword)
+
+    streamed = list(iter_serper_search_plans(plans, executor=executor, max_workers=2))
+    sequential = list(iter_serper_search_plans(plans, executor=executor))
+
+    assert [result.keyword for result in streamed] == ["AI", "느림"]
+    assert [result.keyword for result in sequential] == ["느림", "AI"]
@@ -7,7 +7,10 @@ import pytest
 import requests
 
 import newsletter_core.infrastructure.tools_search_runtime as runtime_adapters
-from newsletter_core.application.tools_search_flow import SerperSearchPlan
+from newsletter_core.application.tools_search_flow import (
+    SerperSearchPlan,
+    build_serper_batch_plans,
+)
 
 
 class _FakeResponse:
@@ -137,3 +140,58 @@ def test_decode_serper_response_json_normalizes_json_error() -> None:
     assert type(exc_info.value).__name__ == "SerperSearchResponseDecodeError"
     assert str(exc_info.value) == "Failed to decode Serper response JSON."
     assert exc_info.value.response_text == "not-json"
+
+
+def test_execute_serper_search_request_defaults_to_shared_http_client(
+    monkeypatch,
+) -> None:
+    calls: list[dict[str, Any]] = []
+
+    class _FakeClient:
+        def request(self, **kwargs: Any) -> _FakeResponse:
+            calls.append(kwargs)
+            return _FakeResponse(payload={"news": []})
+
+    monkeypatch.setattr(runtime_adapters, "get_http_client", lambda: _FakeClient())
+    search_plan = SerperSearchPlan(
+        keyword="AI",
+        num_results=3,
+        url="https://google.serper.dev/news",
+        headers={"X-API-KEY": "dummy"},
+        payload='{"q": "AI"}',
+    )
+
+    runtime_adapters.execute_serper_search_request(search_plan)
+    runtime_adapters.execute_serper_search_request(search_plan)
+
+    assert [call["url"] for call in calls] == [
+        "https://google.serper.dev/news",
+        "https://google.serper.dev/news",
+    ]
+
+
+def test_execute_serper_batch_request_posts_array_payload() -> None:
+    calls: dict[str, Any] = {}
+    plans = tuple(
+        SerperSearchPlan(
+            keyword=keyword,
+            num_results=3,
+            url="https://google.serper.dev/news",
+            headers={"X-API-KEY": "dummy"},
+            payload=json.dumps({"q": keyword, "gl": "kr", "num": 3}),
+        )
+        for keyword in ("AI", "chip")
+    )
+    batch_plan = build_serper_batch_plans(plans, batch_size=2)[0]
+
+    def fake_request(**kwargs: Any) -> _FakeResponse:
+        calls.update(kwargs)
+        return _FakeResponse(payload=[{"news": []}, {"news": [{"title": "x"}]}])
+
+    results = runtime_adapters.execute_serper_batch_request(
+        batch_plan, request=fake_request
+    )
+
+    assert calls["method"] == "POST"
+    assert [item["q"] for item in json.loads(calls["data"])] == ["AI", "chip"]
+    assert results == [{"news": []}, {"news": [{"title": "x"}]}]
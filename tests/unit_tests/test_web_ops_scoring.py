@@ -0,0 +1,60 @@
+"""Unit tests for the weight-only re-rank route."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+WEB_DIR = Path(__file__).resolve().parents[2] / "web"
+if str(WEB_DIR) not in sys.path:
+    sys.path.insert(0, str(WEB_DIR))
+
+from routes_ops_scoring import register_scoring_routes  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def _build_app() -> Flask:
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    register_scoring_routes(app)
+    return app
+
+
+def test_rerank_route_orders_posted_articles_by_new_weights() -> None:
+    articles = [
+        {"title": "A", "scoring": {"relevance": 5, "impact": 1, "novelty": 1}},
+        {"title": "B", "scoring": {"relevance": 1, "impact": 5, "novelty": 1}},
+    ]
+
+    payload = (
+        _build_app()
+        .test_client()
+        .post(
+            "/api/ops/scoring/rerank",
+            json={"articles": articles, "weights": {"impact": 2.0}, "top_n": 1},
+        )
+        .get_json()
+    )
+
+    assert payload["weights"]["impact"] == 2.0
+    assert [a["title"] for a in payload["articles"]] == ["B"]
+
+
+def test_rerank_route_rejects_paths_and_unknown_weights() -> None:
+    client = _build_app().test_client()
+
+    traversal = client.post(
+        "/api/ops/scoring/rerank", json={"file": "../secrets_scored_articles.json"}
+    )
+    unknown = client.post(
+        "/api/ops/scoring/rerank",
+        json={"articles": [], "weights": {"popularity": 1}},
+    )
+
+    assert traversal.status_code == 400
+    assert unknown.status_code == 400
+    assert "popularity" in unknown.get_json()["error"]
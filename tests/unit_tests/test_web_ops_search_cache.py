@@ -0,0 +1,52 @@
+"""Unit tests for the search cache statistics route."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+WEB_DIR = Path(__file__).resolve().parents[2] / "web"
+if str(WEB_DIR) not in sys.path:
+    sys.path.insert(0, str(WEB_DIR))
+
+from routes_ops_search_cache import register_search_cache_routes  # noqa: E402
+
+from newsletter_core.infrastructure.search_cache import SearchResultCache  # noqa: E402
+from newsletter_core.public import search_cache as public_search_cache  # noqa: E402
+
+pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
+
+
+def _build_app() -> Flask:
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    register_search_cache_routes(app)
+    return app
+
+
+def test_search_cache_route_reports_disabled_cache(monkeypatch) -> None:
+    monkeypatch.setenv("SEARCH_CACHE_ENABLED", "false")
+
+    response = _build_app().test_client().get("/api/ops/search-cache")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"enabled": False}
+
+
+def test_search_cache_route_reports_counters(monkeypatch, tmp_path: Path) -> None:
+    cache = SearchResultCache(tmp_path / "search_cache.db")
+    key = cache.key_for("serper", "AI", 10)
+    cache.lookup(key)
+    cache.store(key, {"news": []})
+    cache.lookup(key)
+    monkeypatch.setattr(public_search_cache, "get_search_cache", lambda: cache)
+
+    payload = _build_app().test_client().get("/api/ops/search-cache").get_json()
+
+    assert payload["enabled"] is True
+    assert (payload["hits"], payload["misses"], payload["entries"]) == (1, 1, 1)
+    assert payload["hit_rate"] == 0.5
+    assert payload["policy"]["ttl_seconds"] == 3600.0
@@ -11,6 +11,7 @@ if str(WEB_DIR) not in sys.path:
     sys.path.insert(0, str(WEB_DIR))
 
 from db_state import create_source_policy, ensure_database_schema  # noqa: E402
+
 from tasks import generate_newsletter_task  # noqa: E402
 
 pytestmark = [pytest.mark.unit, pytest.mark.mock_api]
@@ -55,4 +56,5 @@ def test_generate_newsletter_task_loads_active_source_policies(
     request = generate_mock.call_args.args[0]
     assert request.source_allowlist == ["reuters.com"]
     assert request.source_blocklist == ["spam.example"]
+    assert request.source_policy_version == f"{db_path}:2"
     assert result["status"] == "success"
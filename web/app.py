@@ -39,6 +39,8 @@ from web.routes_ops_dedupe_stats import register_dedupe_stats_routes
 from web.routes_ops_failed_jobs import register_failed_jobs_routes
 from web.routes_ops_quota_abuse import register_quota_abuse_routes
 from web.routes_ops_schedule_drift import register_schedule_drift_routes
+from web.routes_ops_scoring import register_scoring_routes
+from web.routes_ops_search_cache import register_search_cache_routes
 from web.routes_presets import register_preset_routes
 from web.routes_send_email import register_send_email_route
 from web.routes_source_policies import register_source_policy_routes
@@ -171,6 +173,8 @@ def _register_routes(app: Flask) -> None:
     register_schedule_drift_routes(app, DATABASE_PATH)
     register_dedupe_stats_routes(app, DATABASE_PATH)
     register_quota_abuse_routes(app, DATABASE_PATH)
+    register_search_cache_routes(app)
+    register_scoring_routes(app)
     register_send_email_route(app, DATABASE_PATH)
     register_approval_routes(app, DATABASE_PATH)
     register_email_api_routes(app)
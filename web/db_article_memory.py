@@ -0,0 +1,105 @@
+"""Delivered-article memory persistence for recurring schedules and presets."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Sequence, cast
+
+try:
+    import db_core as _db_core
+except ImportError:
+    from web import db_core as _db_core  # pragma: no cover
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    return cast(sqlite3.Connection, _db_core.connect_db(db_path))
+
+
+def _iso_utc(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _retention_cutoff(retention_days: int, now: datetime | None) -> str:
+    return _iso_utc((now or datetime.now(timezone.utc)) - timedelta(retention_days))
+
+
+def find_delivered_fingerprints(
+    db_path: str,
+    scope: str,
+    fingerprints: Sequence[str],
+    *,
+    retention_days: int,
+    now: datetime | None = None,
+) -> set[str]:
+    """Return the fingerprints already delivered in *scope* within retention.
+
+    All candidates go into one query through ``json_each`` so the lookup is a
+    single primary-key probe per fingerprint, whatever the batch size.
+    """
+    if not scope or not fingerprints:
+        return set()
+
+    conn = _connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT fingerprint
+            FROM delivered_articles
+            WHERE scope = ?
+              AND fingerprint IN (SELECT value FROM json_each(?))
+              AND delivered_at >= ?
+            """,
+            (
+                scope,
+                json.dumps(list(fingerprints)),
+                _retention_cutoff(retention_days, now),
+            ),
+        )
+        return {str(row[0]) for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+
+def record_delivered_articles(
+    db_path: str,
+    scope: str,
+    fingerprints: Iterable[str],
+    *,
+    job_id: str,
+    retention_days: int,
+    now: datetime | None = None,
+) -> int:
+    """Upsert the fingerprints of one issue and prune expired rows of *scope*."""
+    rows = list(
+        dict.fromkeys(fingerprint for fingerprint in fingerprints if fingerprint)
+    )
+    if not scope or not rows:
+        return 0
+
+    delivered_at = _iso_utc(now or datetime.now(timezone.utc))
+    conn = _connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            """
+            INSERT INTO delivered_articles (scope, fingerprint, job_id, delivered_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(scope, fingerprint) DO UPDATE SET
+                job_id = excluded.job_id,
+                delivered_at = excluded.delivered_at
+            """,
+            [(scope, fingerprint, job_id, delivered_at) for fingerprint in rows],
+        )
+        cursor.execute(
+            "DELETE FROM delivered_articles WHERE scope = ? AND delivered_at < ?",
+            (scope, _retention_cutoff(retention_days, now)),
+        )
+        conn.commit()
+        return len(rows)
+    finally:
+        conn.close()
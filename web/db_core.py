@@ -115,6 +115,53 @@ def _ensure_database_schema(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS source_policy_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute(
+        "INSERT OR IGNORE INTO source_policy_version (id, version) VALUES (1, 0)"
+    )
+    for trigger_event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_source_policies_version_{trigger_event.lower()}
+            AFTER {trigger_event} ON source_policies
+            BEGIN
+                UPDATE source_policy_version SET version = version + 1 WHERE id = 1;
+            END
+            """
+        )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS delivered_articles (
+            scope TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            job_id TEXT,
+            delivered_at TEXT NOT NULL,
+            PRIMARY KEY (scope, fingerprint)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS keyword_yield_stats (
+            scope TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            fetched REAL NOT NULL DEFAULT 0,
+            kept REAL NOT NULL DEFAULT 0,
+            runs INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (scope, keyword)
+        )
+        """
+    )
 
     cursor.execute(
         """
@@ -175,6 +222,9 @@ def _ensure_database_schema(conn: sqlite3.Connection) -> None:
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_source_policies_type_active ON source_policies(policy_type, is_active)"
     )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_delivered_articles_scope_delivered ON delivered_articles(scope, delivered_at)"
+    )
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_analytics_events_type_created ON analytics_events(event_type, created_at DESC)"
     )
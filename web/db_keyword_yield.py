@@ -0,0 +1,96 @@
+"""Per-keyword fetch yield history for adaptive fetch sizing."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Iterable, Sequence, cast
+
+try:
+    import db_core as _db_core
+except ImportError:
+    from web import db_core as _db_core  # pragma: no cover
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    return cast(sqlite3.Connection, _db_core.connect_db(db_path))
+
+
+def load_keyword_yields(
+    db_path: str, scope: str, keywords: Sequence[str]
+) -> dict[str, tuple[float, float]]:
+    """Return decayed ``(fetched, kept)`` totals for *keywords* in one query."""
+    if not scope or not keywords:
+        return {}
+
+    conn = _connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT keyword, fetched, kept
+            FROM keyword_yield_stats
+            WHERE scope = ?
+              AND keyword IN (SELECT value FROM json_each(?))
+            """,
+            (scope, json.dumps(list(keywords), ensure_ascii=False)),
+        )
+        return {
+            str(row[0]): (float(row[1]), float(row[2])) for row in cursor.fetchall()
+        }
+    finally:
+        conn.close()
+
+
+def record_keyword_yields(
+    db_path: str,
+    scope: str,
+    yields: Iterable[tuple[str, float, float]],
+    *,
+    decay: float,
+    now: datetime | None = None,
+) -> int:
+    """Fold one run's ``(keyword, fetched, kept)`` counts into the history.
+
+    Stored totals are multiplied by *decay* before the new counts are added,
+    so the yield follows recent runs while still smoothing single outliers.
+    """
+    rows = [
+        (keyword, float(fetched), float(kept))
+        for keyword, fetched, kept in yields
+        if keyword and fetched > 0
+    ]
+    if not scope or not rows:
+        return 0
+
+    updated_at = (
+        (now or datetime.now(timezone.utc))
+        .astimezone(timezone.utc)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+    conn = _connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            """
+            INSERT INTO keyword_yield_stats (
+                scope, keyword, fetched, kept, runs, updated_at
+            )
+            VALUES (?, ?, ?, ?, 1, ?)
+            ON CONFLICT(scope, keyword) DO UPDATE SET
+                fetched = keyword_yield_stats.fetched * ? + excluded.fetched,
+                kept = keyword_yield_stats.kept * ? + excluded.kept,
+                runs = keyword_yield_stats.runs + 1,
+                updated_at = excluded.updated_at
+            """,
+            [
+                (scope, keyword, fetched, kept, updated_at, decay, decay)
+                for keyword, fetched, kept in rows
+            ],
+        )
+        conn.commit()
+        return len(rows)
+    finally:
+        conn.close()
@@ -163,3 +163,15 @@ def get_active_source_policies(db_path: str) -> Dict[str, list[str]]:
         return {"allowlist": allowlist, "blocklist": blocklist}
     finally:
         conn.close()
+
+
+def get_source_policies_version(db_path: str) -> int:
+    """Return a counter that changes whenever a source policy row changes."""
+    conn = _connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT version FROM source_policy_version WHERE id = 1")
+        row = cursor.fetchone()
+        return int(row[0]) if row else 0
+    finally:
+        conn.close()
@@ -38,6 +38,16 @@ try:
 except ImportError:
     from web import db_source_policies as _db_source_policies  # pragma: no cover
 
+try:
+    import db_article_memory as _db_article_memory
+except ImportError:
+    from web import db_article_memory as _db_article_memory  # pragma: no cover
+
+try:
+    import db_keyword_yield as _db_keyword_yield
+except ImportError:
+    from web import db_keyword_yield as _db_keyword_yield  # pragma: no cover
+
 APPROVAL_STATUS_NOT_REQUESTED = _db_history.APPROVAL_STATUS_NOT_REQUESTED
 APPROVAL_STATUS_PENDING = _db_history.APPROVAL_STATUS_PENDING
 APPROVAL_STATUS_APPROVED = _db_history.APPROVAL_STATUS_APPROVED
@@ -96,6 +106,11 @@ create_source_policy = _db_source_policies.create_source_policy
 update_source_policy = _db_source_policies.update_source_policy
 delete_source_policy = _db_source_policies.delete_source_policy
 get_active_source_policies = _db_source_policies.get_active_source_policies
+get_source_policies_version = _db_source_policies.get_source_policies_version
+find_delivered_fingerprints = _db_article_memory.find_delivered_fingerprints
+record_delivered_articles = _db_article_memory.record_delivered_articles
+load_keyword_yields = _db_keyword_yield.load_keyword_yields
+record_keyword_yields = _db_keyword_yield.record_keyword_yields
 
 
 def _connect(db_path: str) -> sqlite3.Connection:
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+RSS Feed Prefetcher for Newsletter Generator
+Keeps the local news index warm so RSS collection can skip the network
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from typing import Any, List
+
+# Add current directory and project root to path (needed when run directly)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+_project_root = os.path.dirname(current_dir)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+try:
+    from ops_logging import log_info, log_warning
+except ImportError:
+    from web.ops_logging import log_info, log_warning  # pragma: no cover
+
+from newsletter_core.public.news_index import (
+    FeedPrefetchReport,
+    load_news_index_policy,
+    run_feed_prefetcher,
+)
+
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def log_prefetch_cycle(reports: List[FeedPrefetchReport]) -> None:
+    """한 주기의 피드별 결과를 운영 로그로 남깁니다."""
+    for report in reports:
+        if report.status == "error":
+            log_warning(
+                logger,
+                "feed_prefetch.feed_failed",
+                feed_url=report.feed_url,
+                error=report.error,
+            )
+    log_info(
+        logger,
+        "feed_prefetch.cycle_completed",
+        feeds=len(reports),
+        failed=sum(1 for report in reports if report.status == "error"),
+        indexed=sum(report.indexed_count for report in reports),
+    )
+
+
+def main() -> None:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Newsletter RSS Feed Prefetcher")
+    parser.add_argument("--once", action="store_true", help="Run once and exit")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Poll interval in seconds (default: RSS_PREFETCH_INTERVAL_SECONDS)",
+    )
+    args = parser.parse_args()
+
+    policy = load_news_index_policy()
+    if args.interval:
+        from dataclasses import replace
+
+        policy = replace(policy, prefetch_interval_seconds=args.interval)
+
+    stop_event = threading.Event()
+
+    def _request_stop(signum: int, _frame: Any) -> None:
+        log_info(logger, "feed_prefetch.stopping", signal=signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    log_info(
+        logger,
+        "feed_prefetch.started",
+        interval_seconds=policy.prefetch_interval_seconds,
+        once=args.once,
+    )
+    run_feed_prefetcher(
+        policy=policy,
+        stop_event=stop_event,
+        once=args.once,
+        on_cycle=log_prefetch_cycle,
+    )
+    log_info(logger, "feed_prefetch.stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ from typing import Any, cast
 from flask import Flask, jsonify, request
 from flask.typing import ResponseReturnValue
 
+from newsletter_core.public.article_memory import load_article_memory_retention_days
+
 try:
     from db_state import (
         APPROVAL_STATUS_APPROVED,
@@ -17,6 +19,7 @@ try:
         APPROVAL_STATUS_REJECTED,
         DELIVERY_STATUS_APPROVED,
         DELIVERY_STATUS_DRAFT,
+        record_delivered_articles,
         update_history_review_state,
     )
 except ImportError:
@@ -26,13 +29,14 @@ except ImportError:
         APPROVAL_STATUS_REJECTED,
         DELIVERY_STATUS_APPROVED,
         DELIVERY_STATUS_DRAFT,
+        record_delivered_articles,
         update_history_review_state,
     )
 
 try:
-    from ops_logging import log_exception, log_info
+    from ops_logging import log_exception, log_info, log_warning
 except ImportError:
-    from web.ops_logging import log_exception, log_info  # pragma: no cover
+    from web.ops_logging import log_exception, log_info, log_warning  # pragma: no cover
 
 try:
     from generation_route_support import (
@@ -65,6 +69,31 @@ def _parse_json(payload: str | None) -> dict[str, Any] | None:
     return None
 
 
+def _record_approved_articles(
+    database_path: str, job_id: str, result: dict[str, Any]
+) -> None:
+    """Remember the articles of an approved issue for its schedule/preset."""
+    pending = result.get("pending_article_memory")
+    if not isinstance(pending, dict) or not pending.get("scope"):
+        return
+    try:
+        record_delivered_articles(
+            database_path,
+            str(pending["scope"]),
+            [str(item) for item in pending.get("fingerprints") or []],
+            job_id=job_id,
+            retention_days=load_article_memory_retention_days(),
+        )
+    except sqlite3.Error as exc:
+        log_warning(
+            logger,
+            "approval.article_memory.record_failed",
+            job_id=job_id,
+            scope=pending["scope"],
+            error=str(exc),
+        )
+
+
 def register_approval_routes(app: Flask, database_path: str) -> None:
     """Register approval inbox routes on the given Flask app."""
 
@@ -187,6 +216,7 @@ def register_approval_routes(app: Flask, database_path: str) -> None:
                 rejected_at=None,
                 approval_note=note,
             )
+            _record_approved_articles(database_path, job_id, result)
             log_info(logger, "approval.item.approved", job_id=job_id)
             return jsonify(
                 {
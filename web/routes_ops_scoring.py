@@ -0,0 +1,91 @@
+"""Route registration for weight-only re-ranking of scored articles.
+
+Re-ranks a stored ``*_scored_articles.json`` set (or articles posted in the
+body) under new scoring weights using the raw LLM scores already saved on
+each article. Operators can try ``config.yml`` weight changes without paying
+for any LLM call.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from flask import Flask, jsonify, request
+from flask.typing import ResponseReturnValue
+
+from newsletter_core.public.scoring import (
+    load_scored_articles,
+    rerank_articles,
+    resolve_weights,
+    scored_articles_path,
+)
+
+try:
+    from ops_logging import log_exception, log_info
+except ImportError:
+    from web.ops_logging import log_exception, log_info  # pragma: no cover
+
+
+logger = logging.getLogger("web.routes_ops_scoring")
+
+_DEFAULT_TOP_N = 10
+_MAX_TOP_N = 200
+_RESULT_FIELDS = (
+    "title",
+    "url",
+    "source",
+    "date",
+    "scoring",
+    "priority_score",
+    "source_tier_name",
+)
+
+
+def _load_articles(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    if "articles" in payload:
+        articles = payload["articles"]
+        if not isinstance(articles, list) or not all(
+            isinstance(article, dict) for article in articles
+        ):
+            raise ValueError("articles must be a list of objects")
+        return articles
+    return load_scored_articles(scored_articles_path(payload.get("file", "")))
+
+
+def register_scoring_routes(app: Flask) -> None:
+    """Register the weight-only re-rank route on the given Flask app."""
+
+    @app.route("/api/ops/scoring/rerank", methods=["POST"])  # type: ignore[untyped-decorator]
+    def ops_scoring_rerank() -> ResponseReturnValue:
+        """Return articles re-ranked under the posted weights."""
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            return jsonify({"error": "JSON object body required"}), 400
+        try:
+            top_n = max(1, min(int(payload.get("top_n", _DEFAULT_TOP_N)), _MAX_TOP_N))
+            weights = resolve_weights(payload.get("weights"))
+            ranked = rerank_articles(_load_articles(payload), weights, top_n=top_n)
+        except FileNotFoundError:
+            return jsonify({"error": "Scored articles file not found"}), 404
+        except (TypeError, ValueError) as exc:
+            return jsonify({"error": str(exc)}), 400
+        except Exception as exc:
+            log_exception(logger, "ops.scoring.rerank_failed", exc)
+            return jsonify({"error": f"Re-ranking failed: {exc}"}), 500
+
+        log_info(
+            logger,
+            "ops.scoring.reranked",
+            articles=len(ranked),
+            file=payload.get("file"),
+        )
+        return jsonify(
+            {
+                "weights": weights,
+                "articles": [
+                    {key: article.get(key) for key in _RESULT_FIELDS}
+                    for article in ranked
+                ],
+            }
+        )
@@ -0,0 +1,47 @@
+"""Route registration for search response cache statistics.
+
+Exposes the cumulative hit/miss/eviction counters of the Serper/Naver search
+cache so operators can tell whether repeated schedules are being served from
+disk instead of paying for duplicate API calls.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+
+from newsletter_core.public.search_cache import get_search_cache_stats
+
+try:
+    from ops_logging import log_exception, log_info
+except ImportError:
+    from web.ops_logging import log_exception, log_info  # pragma: no cover
+
+
+logger = logging.getLogger("web.routes_ops_search_cache")
+
+
+def register_search_cache_routes(app: Flask) -> None:
+    """Register the search cache statistics route on the given Flask app."""
+
+    @app.route("/api/ops/search-cache", methods=["GET"])  # type: ignore[untyped-decorator]
+    def ops_search_cache() -> ResponseReturnValue:
+        """Return search cache counters and policy."""
+        try:
+            payload = get_search_cache_stats()
+            log_info(
+                logger,
+                "ops.search_cache.listed",
+                enabled=payload["enabled"],
+                hits=payload.get("hits"),
+                misses=payload.get("misses"),
+            )
+            return jsonify(payload)
+        except Exception as exc:
+            log_exception(logger, "ops.search_cache.list_failed", exc)
+            return (
+                jsonify({"error": f"Search cache lookup failed: {exc}"}),
+                500,
+            )
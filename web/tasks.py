@@ -10,6 +10,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict
 
+from newsletter_core.public.article_memory import (
+    ArticleMemory,
+    build_article_memory,
+    load_article_memory_retention_days,
+)
+from newsletter_core.public.fetch_sizing import (
+    YIELD_HISTORY_DECAY,
+    FetchYieldTracker,
+    build_fetch_tracker,
+)
 from newsletter_core.public.generation import (
     GenerateNewsletterRequest,
     NewsletterGenerationError,
@@ -24,8 +34,13 @@ try:
         DELIVERY_STATUS_PENDING_APPROVAL,
         DELIVERY_STATUS_SEND_FAILED,
         DELIVERY_STATUS_SENT,
+        find_delivered_fingerprints,
         get_active_source_policies,
         get_archive_entry,
+        get_source_policies_version,
+        load_keyword_yields,
+        record_delivered_articles,
+        record_keyword_yields,
         update_history_review_state,
         update_history_status,
     )
@@ -37,8 +52,13 @@ except ImportError:
         DELIVERY_STATUS_PENDING_APPROVAL,
         DELIVERY_STATUS_SEND_FAILED,
         DELIVERY_STATUS_SENT,
+        find_delivered_fingerprints,
         get_active_source_policies,
         get_archive_entry,
+        get_source_policies_version,
+        load_keyword_yields,
+        record_delivered_articles,
+        record_keyword_yields,
         update_history_review_state,
         update_history_status,
     )
@@ -83,7 +103,11 @@ def _resolve_database_path(database_path: str | None) -> str:
 
 
 def _build_request(
-    data: Dict[str, Any], source_policies: Dict[str, list[str]] | None = None
+    data: Dict[str, Any],
+    source_policies: Dict[str, list[str]] | None = None,
+    source_policy_version: str | None = None,
+    article_memory: ArticleMemory | None = None,
+    fetch_tracker: FetchYieldTracker | None = None,
 ) -> GenerateNewsletterRequest:
     policies = source_policies or {"allowlist": [], "blocklist": []}
     return GenerateNewsletterRequest(
@@ -95,6 +119,45 @@ def _build_request(
         suggest_count=int(data.get("suggest_count", 10)),
         source_allowlist=policies.get("allowlist") or [],
         source_blocklist=policies.get("blocklist") or [],
+        source_policy_version=source_policy_version,
+        article_memory=article_memory,
+        fetch_tracker=fetch_tracker,
+    )
+
+
+def _resolve_run_scope(data: Dict[str, Any], job_id: str) -> str:
+    """Preset or recurring-schedule scope of a run ("" for ad-hoc runs)."""
+    preset_id = str(data.get("preset_id") or "").strip()
+    if preset_id:
+        return f"preset:{preset_id}"
+    schedule_id = str(data.get("schedule_id") or "").strip()
+    if not schedule_id and job_id.startswith("schedule_"):
+        # schedule job IDs are "schedule_<schedule_id>_<digest>"
+        schedule_id = job_id[len("schedule_") :].rsplit("_", 1)[0]
+    return f"schedule:{schedule_id}" if schedule_id else ""
+
+
+def _build_article_memory(
+    db_path: str, data: Dict[str, Any], job_id: str
+) -> ArticleMemory | None:
+    scope = _resolve_run_scope(data, job_id)
+    retention_days = load_article_memory_retention_days()
+    return build_article_memory(
+        scope,
+        lambda fingerprints: find_delivered_fingerprints(
+            db_path, scope, fingerprints, retention_days=retention_days
+        ),
+    )
+
+
+def _build_fetch_tracker(
+    db_path: str, data: Dict[str, Any], job_id: str
+) -> FetchYieldTracker | None:
+    # ad-hoc 실행은 키워드 단위 공용 이력("adhoc")을 공유
+    scope = _resolve_run_scope(data, job_id) or "adhoc"
+    return build_fetch_tracker(
+        scope,
+        lambda keywords: load_keyword_yields(db_path, scope, keywords),
     )
 
 
@@ -163,7 +226,16 @@ def generate_newsletter_task(
 
     try:
         source_policies = get_active_source_policies(db_path)
-        request = _build_request(data, source_policies=source_policies)
+        policy_version = get_source_policies_version(db_path)
+        article_memory = _build_article_memory(db_path, data, job_id)
+        fetch_tracker = _build_fetch_tracker(db_path, data, job_id)
+        request = _build_request(
+            data,
+            source_policies=source_policies,
+            source_policy_version=f"{db_path}:{policy_version}",
+            article_memory=article_memory,
+            fetch_tracker=fetch_tracker,
+        )
         result = generate_newsletter(request)
         html_content = inject_archive_references(
             result["html_content"],
@@ -249,9 +321,54 @@ def generate_newsletter_task(
         elif response["delivery_status"] == DELIVERY_STATUS_DRAFT and approval_required:
             response["delivery_status"] = DELIVERY_STATUS_PENDING_APPROVAL
 
+        if approval_required and article_memory is not None:
+            response["pending_article_memory"] = {
+                "scope": article_memory.scope,
+                "fingerprints": article_memory.issue_fingerprints,
+            }
+
         if response["email_sent"]:
             response["delivery_status"] = DELIVERY_STATUS_SENT
 
+        # 실제로 발송된 호만 발송 기사로 기록 (승인 대기 호는 승인 시점에 기록)
+        if article_memory is not None and response["email_sent"]:
+            try:
+                record_delivered_articles(
+                    db_path,
+                    article_memory.scope,
+                    article_memory.issue_fingerprints,
+                    job_id=job_id,
+                    retention_days=load_article_memory_retention_days(),
+                )
+            except sqlite3.Error as exc:
+                log_warning(
+                    logger,
+                    "worker.article_memory.record_failed",
+                    job_id=job_id,
+                    scope=article_memory.scope,
+                    error=str(exc),
+                )
+
+        if fetch_tracker is not None:
+            try:
+                record_keyword_yields(
+                    db_path,
+                    fetch_tracker.scope,
+                    [
+                        (item.keyword, item.fetched, item.kept)
+                        for item in fetch_tracker.yields()
+                    ],
+                    decay=YIELD_HISTORY_DECAY,
+                )
+            except sqlite3.Error as exc:
+                log_warning(
+                    logger,
+                    "worker.fetch_sizing.record_failed",
+                    job_id=job_id,
+                    scope=fetch_tracker.scope,
+                    error=str(exc),
+                )
+
         update_history_status(
             db_path=db_path,
             job_id=job_id,